@@ -22,6 +22,7 @@ import { exec } from "child_process";
 import { promisify } from "util";
 import { WorkflowDataProvider } from "./dataProvider";
 import { getSkillsDir, getMemoryDir } from "./paths";
+import { EXECUTIONS_DIR, ExecutionLog, latestExecutionId } from "./skillExecutionLog";
 
 const execAsync = promisify(exec);
 
@@ -48,13 +49,6 @@ const STATS_FILE = path.join(
   "agent_stats.json"
 );
 
-const EXECUTION_FILE = path.join(
-  os.homedir(),
-  ".config",
-  "aa-workflow",
-  "skill_execution.json"
-);
-
 const CONFIG_FILE = path.join(
   os.homedir(),
   "src",
@@ -1117,13 +1111,13 @@ except Exception as e:
 
   private startExecutionWatcher() {
     try {
-      const dir = path.dirname(EXECUTION_FILE);
-      if (!fs.existsSync(dir)) {
-        fs.mkdirSync(dir, { recursive: true });
+      if (!fs.existsSync(EXECUTIONS_DIR)) {
+        fs.mkdirSync(EXECUTIONS_DIR, { recursive: true });
       }
 
-      this._executionWatcher = fs.watch(dir, (eventType, filename) => {
-        if (filename === "skill_execution.json") {
+      this._executionWatcher = fs.watch(EXECUTIONS_DIR, (eventType, filename) => {
+        // Status headers change on every step transition
+        if (filename && filename.toString().endsWith(".json")) {
           this.loadExecutionState();
         }
       });
@@ -1134,10 +1128,14 @@ except Exception as e:
 
   private loadExecutionState() {
     try {
-      if (fs.existsSync(EXECUTION_FILE)) {
-        const content = fs.readFileSync(EXECUTION_FILE, "utf-8");
-        const state = JSON.parse(content);
-        this.updateSkillExecution(state);
+      const executionId = latestExecutionId();
+      if (executionId) {
+        const log = new ExecutionLog(executionId);
+        const header = log.readHeader();
+        if (header) {
+          log.readNew();
+          this.updateSkillExecution({ ...header, events: log.events } as any);
+        }
       }
     } catch (e) {
       // File might be mid-write
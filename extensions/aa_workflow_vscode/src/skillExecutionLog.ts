@@ -0,0 +1,145 @@
+/**
+ * Skill Execution Log
+ *
+ * Reads the per-run files the MCP server writes for each skill execution:
+ *
+ *   ~/.config/aa-workflow/skill_executions/<executionId>.jsonl
+ *     Append-only event log, one JSON event per line, numbered by "seq".
+ *   ~/.config/aa-workflow/skill_executions/<executionId>.json
+ *     Small status header (skill, status, current step).
+ *
+ * ExecutionLog tails the event log from its last offset, so each change
+ * only costs reading what was appended. Events pushed over the event
+ * socket are merged in by sequence number without duplicates.
+ */
+
+import * as fs from "fs";
+import * as path from "path";
+import * as os from "os";
+
+export const EXECUTIONS_DIR = path.join(
+  os.homedir(),
+  ".config",
+  "aa-workflow",
+  "skill_executions"
+);
+
+export const EVENT_SOCKET = path.join(
+  os.homedir(),
+  ".config",
+  "aa-workflow",
+  "skill_events.sock"
+);
+
+export interface ExecutionHeader {
+  executionId: string;
+  skillName: string;
+  status: "running" | "success" | "failed" | "cancelled";
+  currentStepIndex: number;
+  totalSteps: number;
+  startTime: string;
+  endTime?: string;
+  eventsFile: string;
+}
+
+/**
+ * Get the execution id a header or event log file belongs to.
+ */
+export function executionIdFromFile(filename: string): string | undefined {
+  const match = /^(.+)\.(json|jsonl)$/.exec(filename);
+  return match ? match[1] : undefined;
+}
+
+/**
+ * Find the most recently updated execution.
+ */
+export function latestExecutionId(): string | undefined {
+  try {
+    let latest: string | undefined;
+    let latestMtime = 0;
+    for (const name of fs.readdirSync(EXECUTIONS_DIR)) {
+      if (!name.endsWith(".json")) {
+        continue;
+      }
+      const mtime = fs.statSync(path.join(EXECUTIONS_DIR, name)).mtimeMs;
+      if (mtime > latestMtime) {
+        latestMtime = mtime;
+        latest = executionIdFromFile(name);
+      }
+    }
+    return latest;
+  } catch (e) {
+    return undefined;
+  }
+}
+
+export class ExecutionLog {
+  public readonly events: any[] = [];
+  private _offset = 0;
+  private _partial = "";
+  private _lastSeq = 0;
+
+  constructor(public readonly executionId: string) {}
+
+  /**
+   * Read the status header (undefined if missing or mid-write).
+   */
+  public readHeader(): ExecutionHeader | undefined {
+    try {
+      const file = path.join(EXECUTIONS_DIR, `${this.executionId}.json`);
+      return JSON.parse(fs.readFileSync(file, "utf-8"));
+    } catch (e) {
+      return undefined;
+    }
+  }
+
+  /**
+   * Read events appended since the last call.
+   *
+   * @returns Number of new events
+   */
+  public readNew(): number {
+    const file = path.join(EXECUTIONS_DIR, `${this.executionId}.jsonl`);
+    let fd: number | undefined;
+    try {
+      const size = fs.statSync(file).size;
+      if (size <= this._offset) {
+        return 0;
+      }
+      const buffer = Buffer.alloc(size - this._offset);
+      fd = fs.openSync(file, "r");
+      fs.readSync(fd, buffer, 0, buffer.length, this._offset);
+      this._offset = size;
+
+      const lines = (this._partial + buffer.toString("utf-8")).split("\n");
+      this._partial = lines.pop() || "";
+      let added = 0;
+      for (const line of lines) {
+        if (line.trim() && this.addEvent(JSON.parse(line))) {
+          added++;
+        }
+      }
+      return added;
+    } catch (e) {
+      return 0;
+    } finally {
+      if (fd !== undefined) {
+        fs.closeSync(fd);
+      }
+    }
+  }
+
+  /**
+   * Add an event unless it was already seen.
+   */
+  public addEvent(event: any): boolean {
+    if (typeof event.seq === "number") {
+      if (event.seq <= this._lastSeq) {
+        return false;
+      }
+      this._lastSeq = event.seq;
+    }
+    this.events.push(event);
+    return true;
+  }
+}
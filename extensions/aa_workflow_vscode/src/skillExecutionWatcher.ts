@@ -4,17 +4,25 @@
  * Watches for skill execution events from the MCP server and updates
  * the flowchart panel in real-time.
  *
- * The MCP server writes execution state to:
- *   ~/.config/aa-workflow/skill_execution.json
- *
- * This file watches that file and dispatches events to the flowchart panel.
+ * The MCP server writes an append-only event log and a small status
+ * header per run to ~/.config/aa-workflow/skill_executions/ (see
+ * skillExecutionLog.ts). This watches that directory, reads only newly
+ * appended events, and dispatches them to the flowchart panel. It also
+ * listens on ~/.config/aa-workflow/skill_events.sock, where the server
+ * pushes events as they happen.
  */
 
 import * as vscode from "vscode";
 import * as fs from "fs";
-import * as path from "path";
-import * as os from "os";
+import * as net from "net";
 import { getCommandCenterPanel } from "./commandCenter";
+import {
+  EVENT_SOCKET,
+  EXECUTIONS_DIR,
+  ExecutionLog,
+  executionIdFromFile,
+  latestExecutionId,
+} from "./skillExecutionLog";
 
 // ============================================================================
 // Types
@@ -27,12 +35,17 @@ export interface SkillExecutionEvent {
     | "step_complete"
     | "step_failed"
     | "step_skipped"
+    | "step_cancelled"
     | "skill_complete"
+    | "skill_cancelled"
+    | "cache_hit"
     | "memory_read"
     | "memory_write"
     | "auto_heal"
     | "retry";
   timestamp: string;
+  executionId: string;
+  seq: number;
   skillName: string;
   stepIndex?: number;
   stepName?: string;
@@ -40,6 +53,7 @@ export interface SkillExecutionEvent {
     duration?: number;
     result?: string;
     error?: string;
+    reason?: string;
     memoryKey?: string;
     healingDetails?: string;
     retryCount?: number;
@@ -56,8 +70,9 @@ export interface SkillExecutionEvent {
 }
 
 export interface SkillExecutionState {
+  executionId: string;
   skillName: string;
-  status: "running" | "success" | "failed";
+  status: "running" | "success" | "failed" | "cancelled";
   currentStepIndex: number;
   totalSteps: number;
   startTime: string;
@@ -69,22 +84,18 @@ export interface SkillExecutionState {
 // Skill Execution Watcher
 // ============================================================================
 
+const MAX_TRACKED_EXECUTIONS = 20;
+
 export class SkillExecutionWatcher {
   private _watcher: fs.FSWatcher | undefined;
-  private _executionFilePath: string;
-  private _lastModified: number = 0;
+  private _socketServer: net.Server | undefined;
+  private _logs = new Map<string, ExecutionLog>();
+  private _processedEvents = 0;
   private _disposables: vscode.Disposable[] = [];
   private _statusBarItem: vscode.StatusBarItem;
   private _currentExecution: SkillExecutionState | undefined;
 
   constructor() {
-    this._executionFilePath = path.join(
-      os.homedir(),
-      ".config",
-      "aa-workflow",
-      "skill_execution.json"
-    );
-
     // Create status bar item for skill execution
     this._statusBarItem = vscode.window.createStatusBarItem(
       vscode.StatusBarAlignment.Left,
@@ -99,20 +110,19 @@ export class SkillExecutionWatcher {
    */
   public start(): void {
     // Ensure directory exists
-    const dir = path.dirname(this._executionFilePath);
-    if (!fs.existsSync(dir)) {
-      fs.mkdirSync(dir, { recursive: true });
+    if (!fs.existsSync(EXECUTIONS_DIR)) {
+      fs.mkdirSync(EXECUTIONS_DIR, { recursive: true });
     }
 
-    // Watch the execution file
+    // Watch the executions directory
     try {
-      // Use polling for cross-platform compatibility
       this._watcher = fs.watch(
-        dir,
+        EXECUTIONS_DIR,
         { persistent: false },
         (eventType, filename) => {
-          if (filename === "skill_execution.json") {
-            this._onFileChange();
+          const executionId = filename ? executionIdFromFile(filename.toString()) : undefined;
+          if (executionId) {
+            this._onExecutionChange(executionId);
           }
         }
       );
@@ -122,8 +132,66 @@ export class SkillExecutionWatcher {
       this._startPolling();
     }
 
+    this._startSocketServer();
+
     // Initial check
-    this._onFileChange();
+    const latest = latestExecutionId();
+    if (latest) {
+      this._onExecutionChange(latest);
+    }
+  }
+
+  /**
+   * Listen for events pushed by the MCP server
+   */
+  private _startSocketServer(): void {
+    try {
+      if (fs.existsSync(EVENT_SOCKET)) {
+        fs.unlinkSync(EVENT_SOCKET); // Stale socket from a previous window
+      }
+      this._socketServer = net.createServer((conn) => {
+        let partial = "";
+        conn.on("data", (chunk) => {
+          const lines = (partial + chunk.toString("utf-8")).split("\n");
+          partial = lines.pop() || "";
+          for (const line of lines) {
+            this._onPushedEvent(line);
+          }
+        });
+        conn.on("error", () => conn.destroy());
+      });
+      this._socketServer.on("error", (e) => console.error("[SkillWatcher] Event socket error:", e));
+      this._socketServer.listen(EVENT_SOCKET);
+    } catch (e) {
+      console.error("[SkillWatcher] Failed to listen for pushed events:", e);
+    }
+  }
+
+  private _onPushedEvent(line: string): void {
+    try {
+      if (!line.trim()) {
+        return;
+      }
+      const event: SkillExecutionEvent = JSON.parse(line);
+      if (this._getLog(event.executionId).addEvent(event)) {
+        this._onExecutionChange(event.executionId);
+      }
+    } catch (e) {
+      console.error("[SkillWatcher] Bad pushed event:", e);
+    }
+  }
+
+  private _getLog(executionId: string): ExecutionLog {
+    let log = this._logs.get(executionId);
+    if (!log) {
+      log = new ExecutionLog(executionId);
+      this._logs.set(executionId, log);
+      // Keep only recent runs; Map iterates in insertion order
+      while (this._logs.size > MAX_TRACKED_EXECUTIONS) {
+        this._logs.delete(this._logs.keys().next().value as string);
+      }
+    }
+    return log;
   }
 
   /**
@@ -131,7 +199,10 @@ export class SkillExecutionWatcher {
    */
   private _startPolling(): void {
     const pollInterval = setInterval(() => {
-      this._onFileChange();
+      const latest = latestExecutionId();
+      if (latest) {
+        this._onExecutionChange(latest);
+      }
     }, 500);
 
     this._disposables.push({
@@ -140,22 +211,28 @@ export class SkillExecutionWatcher {
   }
 
   /**
-   * Handle file change event
+   * Handle a change to an execution's header or event log
    */
-  private _onFileChange(): void {
+  private _onExecutionChange(executionId: string): void {
     try {
-      if (!fs.existsSync(this._executionFilePath)) {
+      const log = this._getLog(executionId);
+      log.readNew();
+      const header = log.readHeader();
+      if (!header) {
         return;
       }
-
-      const stat = fs.statSync(this._executionFilePath);
-      if (stat.mtimeMs <= this._lastModified) {
+      const previous = this._currentExecution;
+      if (
+        previous?.executionId === executionId &&
+        previous.status === header.status &&
+        previous.currentStepIndex === header.currentStepIndex &&
+        this._processedEvents === log.events.length
+      ) {
         return; // No change
       }
-      this._lastModified = stat.mtimeMs;
+      this._processedEvents = log.events.length;
 
-      const content = fs.readFileSync(this._executionFilePath, "utf-8");
-      const state: SkillExecutionState = JSON.parse(content);
+      const state: SkillExecutionState = { ...header, events: log.events };
 
       console.log(`[SkillWatcher] File changed: ${state.skillName} - status: ${state.status}, step: ${state.currentStepIndex}/${state.totalSteps}`);
 
@@ -177,8 +254,7 @@ export class SkillExecutionWatcher {
 
     // Check if this is a new skill (either starting or just completed that we haven't seen)
     const isNewSkill = !previousExecution ||
-      previousExecution.skillName !== state.skillName ||
-      previousExecution.startTime !== state.startTime;
+      previousExecution.executionId !== state.executionId;
 
     // Auto-open flowchart panel when a skill starts
     // Don't auto-open for completed skills on initial load (stale state)
@@ -252,6 +328,11 @@ export class SkillExecutionWatcher {
           case "step_skipped":
             step.status = "skipped";
             break;
+          case "step_cancelled":
+            step.status = "failed";
+            step.error = event.data?.reason;
+            step.duration = event.data?.duration;
+            break;
           case "memory_read":
             step.memoryRead = step.memoryRead || [];
             if (event.data?.memoryKey && !step.memoryRead.includes(event.data.memoryKey)) {
@@ -335,9 +416,9 @@ export class SkillExecutionWatcher {
 
       // Hide after 5 seconds
       setTimeout(() => this._hideStatusBar(), 5000);
-    } else if (state.status === "failed") {
+    } else if (state.status === "failed" || state.status === "cancelled") {
       this._statusBarItem.text = `$(error) ${state.skillName}`;
-      this._statusBarItem.tooltip = `Skill "${state.skillName}" failed - click to view details`;
+      this._statusBarItem.tooltip = `Skill "${state.skillName}" ${state.status} - click to view details`;
       this._statusBarItem.backgroundColor = new vscode.ThemeColor(
         "statusBarItem.errorBackground"
       );
@@ -363,6 +444,10 @@ export class SkillExecutionWatcher {
       this._watcher.close();
       this._watcher = undefined;
     }
+    if (this._socketServer) {
+      this._socketServer.close();
+      this._socketServer = undefined;
+    }
   }
 
   /**
@@ -61,7 +61,8 @@ except ImportError:
 try:
     PROJECT_ROOT = Path(__file__).parent.parent
     sys.path.insert(0, str(PROJECT_ROOT))
-    from server.debuggable import _check_known_issues_sync, _format_known_issues
+    from scripts.common.known_issues import check_known_issues as _check_known_issues_sync
+    from scripts.common.known_issues import format_known_issues as _format_known_issues
 
     KNOWN_ISSUES_AVAILABLE = True
 except ImportError:
@@ -96,15 +97,16 @@ try:
     sys.path.insert(0, str(PROJECT_ROOT / "tool_modules" / "aa_workflow" / "src"))
     sys.path.insert(0, str(PROJECT_ROOT))
 
-    import yaml as skill_yaml
     from skill_engine import SkillExecutor
 
+    from scripts.common.skill_catalog import get_skill_catalog
+
     SKILL_EXECUTOR_AVAILABLE = True
     SKILLS_DIR = Path(__file__).parent.parent / "skills"
 except ImportError as e:
     SKILL_EXECUTOR_AVAILABLE = False
     SkillExecutor = None
-    skill_yaml = None
+    get_skill_catalog = None
     SKILLS_DIR = None
     logger.debug(f"Skill executor not available: {e}")
 
@@ -1491,16 +1493,18 @@ Please verify the image exists before proceeding."""
             return f"Skill executor not available. Cannot run: {skill_name}"
 
         # Check if skill file exists
-        skill_file = SKILLS_DIR / f"{skill_name}.yaml"
-        if not skill_file.exists():
+        catalog = get_skill_catalog()
+        entry = catalog.get(skill_name)
+        if entry is None:
             # List available skills
-            available = [f.stem for f in SKILLS_DIR.glob("*.yaml")] if SKILLS_DIR.exists() else []
-            return f"❌ Skill not found: {skill_name}\n\nAvailable: {', '.join(sorted(available)) or 'none'}"
+            available = catalog.names()
+            return f"❌ Skill not found: {skill_name}\n\nAvailable: {', '.join(available) or 'none'}"
 
         # Load and execute the skill
         try:
-            with open(skill_file) as f:
-                skill = skill_yaml.safe_load(f)
+            if entry.error:
+                raise ValueError(entry.error)
+            skill = entry.data
 
             # Create executor and run
             executor = SkillExecutor(
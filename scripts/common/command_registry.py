@@ -17,7 +17,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import yaml
+from scripts.common.skill_catalog import SkillCatalog, get_skill_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -207,6 +207,7 @@ class CommandRegistry:
         """
         self.skills_dir = skills_dir or SKILLS_DIR
         self.tool_modules_dir = tool_modules_dir or TOOL_MODULES_DIR
+        self._catalog = get_skill_catalog() if skills_dir is None else SkillCatalog(skills_dir)
 
         # Caches
         self._skills_cache: dict[str, CommandInfo] | None = None
@@ -336,15 +337,15 @@ class CommandRegistry:
             logger.warning(f"Skills directory not found: {self.skills_dir}")
             return self._skills_cache
 
-        for skill_file in self.skills_dir.glob("*.yaml"):
-            try:
-                with open(skill_file) as f:
-                    skill_data = yaml.safe_load(f)
-
-                if not skill_data:
-                    continue
+        # Parsed once per file version by the shared skill catalog
+        for entry in self._catalog.entries():
+            if entry.error:
+                continue
 
-                name = skill_data.get("name", skill_file.stem)
+            skill_file = entry.path
+            try:
+                skill_data = entry.data
+                name = entry.name
                 description = skill_data.get("description", "")
 
                 # Clean up description (remove markdown, take first line)
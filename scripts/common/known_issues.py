@@ -0,0 +1,458 @@
+"""
+Known Issues - shared, cached matcher over learned error patterns.
+
+check_known_issues (tool and memory helper), skill error recovery,
+tool_exec and the Claude agent all look up tool errors in
+memory/learned/patterns.yaml and memory/learned/tool_fixes.yaml. The
+matcher parses both files once and keeps the result until either file
+changes (mtime or size), so a failing tool doesn't pay for YAML parsing.
+
+Lookups are a single pass over the error text: every pattern text from
+both files is compiled into one Aho-Corasick automaton, and tool fixes are
+also indexed by tool name.
+
+Pattern usage counters (``usage_stats`` in patterns.yaml) are kept in
+memory and written back in batches, so a burst of failures doesn't
+rewrite patterns.yaml, and invalidate the matcher, on every match.
+
+Usage:
+    from scripts.common.known_issues import check_known_issues, get_known_issues_matcher
+
+    matches = check_known_issues("bonfire_deploy", error_text)   # list of match dicts
+
+    matcher = get_known_issues_matcher()
+    for category, pattern in matcher.match_patterns("No route to host", categories=("auth_patterns",)):
+        print(category, pattern["fix"])
+    for fix in matcher.match_tool_fixes("bonfire_deploy", "manifest unknown"):
+        print(fix["fix_applied"])
+
+    get_pattern_usage_stats().record("auth_patterns", "no route to host", fixed=True)
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+LEARNED_DIR = PROJECT_ROOT / "memory" / "learned"
+
+# libyaml is several times faster than the pure-Python loader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Pattern categories checked when a caller doesn't name its own
+DEFAULT_CATEGORIES = ("error_patterns", "auth_patterns", "bonfire_patterns", "pipeline_patterns")
+
+# Write pattern usage counters this many seconds after the first unsaved one...
+STATS_FLUSH_INTERVAL = 60.0
+# ...or as soon as this many are pending
+STATS_FLUSH_THRESHOLD = 50
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton reporting which keywords occur in a text."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """Build the automaton.
+
+        Args:
+            keywords: Non-empty strings to search for
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[str]] = [[]]
+
+        for keyword in set(keywords):
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append(keyword)
+
+        # Breadth-first: failure links point to the longest proper suffix
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def find(self, text: str) -> set[str]:
+        """Get the keywords that occur in text."""
+        found: set[str] = set()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+def _load_yaml(path: Path) -> dict:
+    """Parse a YAML mapping, or return {} if missing or invalid."""
+    try:
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)  # nosec B506 - safe loader
+    except FileNotFoundError:
+        return {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Failed to load {path.name}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+class _Index:
+    """Parsed and indexed contents of patterns.yaml and tool_fixes.yaml."""
+
+    def __init__(self, patterns: dict, fixes: dict):
+        # lowercase pattern text -> [(category, position in category, pattern entry)]
+        self.patterns_by_text: dict[str, list[tuple[str, int, dict]]] = {}
+        for category, entries in patterns.items():
+            if not isinstance(entries, list):
+                continue
+            for position, entry in enumerate(entries):
+                text = entry.get("pattern") if isinstance(entry, dict) else None
+                if isinstance(text, str) and text:
+                    self.patterns_by_text.setdefault(text.lower(), []).append((category, position, entry))
+
+        # lowercase tool name / error pattern -> [(position, fix entry)]
+        self.fixes_by_tool: dict[str, list[tuple[int, dict]]] = {}
+        self.fixes_by_text: dict[str, list[tuple[int, dict]]] = {}
+        tool_fixes = fixes.get("tool_fixes")
+        for position, fix in enumerate(tool_fixes if isinstance(tool_fixes, list) else []):
+            if not isinstance(fix, dict):
+                continue
+            self.fixes_by_tool.setdefault(str(fix.get("tool_name", "")).lower(), []).append((position, fix))
+            text = fix.get("error_pattern")
+            if isinstance(text, str) and text:
+                self.fixes_by_text.setdefault(text.lower(), []).append((position, fix))
+
+        self.automaton = AhoCorasick([*self.patterns_by_text, *self.fixes_by_text])
+
+
+class KnownIssuesMatcher:
+    """Matches tool errors against learned patterns, reloading on file changes."""
+
+    def __init__(self, learned_dir: Path | None = None):
+        """Initialize the matcher.
+
+        Args:
+            learned_dir: Directory with patterns.yaml and tool_fixes.yaml
+                (defaults to project root/memory/learned)
+        """
+        self.learned_dir = learned_dir or LEARNED_DIR
+        self.patterns_file = self.learned_dir / "patterns.yaml"
+        self.fixes_file = self.learned_dir / "tool_fixes.yaml"
+        self._index: _Index | None = None
+        self._signature: tuple | None = None
+        self._lock = threading.Lock()
+
+    def _file_signature(self) -> tuple:
+        """(mtime_ns, size) of both files; None for a missing file."""
+        signature = []
+        for path in (self.patterns_file, self.fixes_file):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _get_index(self) -> _Index:
+        """Get the index, rebuilding it if either file changed."""
+        signature = self._file_signature()
+        index = self._index
+        if index is not None and signature == self._signature:
+            return index
+        with self._lock:
+            if self._index is None or signature != self._signature:
+                self._index = _Index(_load_yaml(self.patterns_file), _load_yaml(self.fixes_file))
+                self._signature = signature
+            return self._index
+
+    def match_patterns(
+        self, error_text: str, tool_name: str = "", categories: Iterable[str] = DEFAULT_CATEGORIES
+    ) -> list[tuple[str, dict]]:
+        """Find patterns.yaml entries whose text occurs in the error or tool name.
+
+        Matching is case-insensitive.
+
+        Args:
+            error_text: Error message text
+            tool_name: Name of the tool that failed
+            categories: Pattern categories to check, in result order
+
+        Returns:
+            (category, pattern entry) pairs, ordered by category then file order
+        """
+        order = {category: i for i, category in enumerate(categories)}
+        index = self._get_index()
+        found = index.automaton.find(error_text.lower() if error_text else "")
+        if tool_name:
+            found |= index.automaton.find(tool_name.lower())
+
+        matches = [
+            (order[category], position, category, entry)
+            for text in found
+            for category, position, entry in index.patterns_by_text.get(text, ())
+            if category in order
+        ]
+        matches.sort(key=lambda m: (m[0], m[1]))
+        return [(category, entry) for _, _, category, entry in matches]
+
+    def match_tool_fixes(self, tool_name: str = "", error_text: str = "") -> list[dict]:
+        """Find tool_fixes.yaml entries for this tool or whose error pattern occurs in the error.
+
+        Args:
+            tool_name: Name of the tool that failed
+            error_text: Error message text
+
+        Returns:
+            Fix entries in file order
+        """
+        index = self._get_index()
+        matches: dict[int, dict] = {}
+        if tool_name:
+            matches.update(index.fixes_by_tool.get(tool_name.lower(), ()))
+        if error_text:
+            for text in index.automaton.find(error_text.lower()):
+                matches.update(index.fixes_by_text.get(text, ()))
+        return [matches[position] for position in sorted(matches)]
+
+
+# Shared matchers, one per learned directory
+_matchers: dict[Path, KnownIssuesMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_known_issues_matcher(learned_dir: Path | None = None) -> KnownIssuesMatcher:
+    """Get or create the shared matcher for a learned directory."""
+    learned_dir = learned_dir or LEARNED_DIR
+    matcher = _matchers.get(learned_dir)
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.setdefault(learned_dir, KnownIssuesMatcher(learned_dir))
+    return matcher
+
+
+class PatternUsageStats:
+    """Usage counters for patterns.yaml entries, written to the file in batches.
+
+    Pending counts are merged into each pattern's ``usage_stats`` at most
+    STATS_FLUSH_INTERVAL seconds after the first one, immediately once
+    STATS_FLUSH_THRESHOLD are pending, and once more at interpreter exit.
+    """
+
+    def __init__(self, learned_dir: Path | None = None):
+        """Initialize the counters.
+
+        Args:
+            learned_dir: Directory with patterns.yaml (defaults to project root/memory/learned)
+        """
+        self.patterns_file = (learned_dir or LEARNED_DIR) / "patterns.yaml"
+        # (category, lowercase pattern text) -> [times matched, times fixed, last matched]
+        self._pending: dict[tuple[str, str], list] = {}
+        self._count = 0  # Updates not yet written
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        atexit.register(self.flush)
+
+    def record(self, category: str, pattern_text: str, matched: bool = True, fixed: bool = False) -> None:
+        """Count a match of a pattern and/or a successful fix for it.
+
+        Args:
+            category: Pattern category (e.g., "auth_patterns", "error_patterns")
+            pattern_text: The pattern text (case-insensitive)
+            matched: Whether the pattern was matched
+            fixed: Whether the fix succeeded
+        """
+        last_matched = datetime.now().isoformat() if matched else None
+        with self._lock:
+            self._add((category, pattern_text.lower()), int(matched), int(fixed), last_matched)
+            self._count += 1
+            if self._count >= STATS_FLUSH_THRESHOLD:
+                # Write from a thread so the caller doesn't pay for the I/O
+                self._schedule_flush(0)
+            elif self._flush_timer is None:
+                self._schedule_flush(STATS_FLUSH_INTERVAL)
+
+    def _add(self, key: tuple[str, str], matched: int, fixed: int, last_matched: str | None) -> None:
+        """Add to the pending counts (must be called with _lock held)."""
+        pending = self._pending.setdefault(key, [0, 0, None])
+        pending[0] += matched
+        pending[1] += fixed
+        if last_matched and (pending[2] is None or last_matched > pending[2]):
+            pending[2] = last_matched
+
+    def _schedule_flush(self, delay: float) -> None:
+        """Start the flush timer (must be called with _lock held)."""
+        timer = self._flush_timer
+        if timer is not None:
+            if timer.interval <= delay:
+                return
+            timer.cancel()
+        self._flush_timer = threading.Timer(delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush(self) -> bool:
+        """Merge pending counts into patterns.yaml now.
+
+        Returns:
+            True if the file was written
+        """
+        with self._save_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                pending, self._pending = self._pending, {}
+                self._count = 0
+            if not pending:
+                return False
+
+            try:
+                import fcntl
+
+                if not self.patterns_file.exists():
+                    return False
+                # Read-modify-write under a lock, as other processes update the file too
+                with open(self.patterns_file, "r+") as f:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                    try:
+                        patterns_data = yaml.safe_load(f.read()) or {}
+                        if not self._apply(patterns_data, pending):
+                            return False
+                        f.seek(0)
+                        f.truncate()
+                        yaml.dump(patterns_data, f, default_flow_style=False, sort_keys=False)
+                        return True
+                    finally:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            except Exception as e:
+                logger.warning(f"Failed to update pattern stats: {e}")
+                with self._lock:
+                    for key, (matched, fixed, last_matched) in pending.items():
+                        self._add(key, matched, fixed, last_matched)
+                return False
+
+    @staticmethod
+    def _apply(patterns_data: dict, pending: dict[tuple[str, str], list]) -> bool:
+        """Add pending counts to the patterns' usage_stats; True if any pattern was found."""
+        updated = False
+        for (category, pattern_text), (matched, fixed, last_matched) in pending.items():
+            entries = patterns_data.get(category)
+            for pattern in entries if isinstance(entries, list) else []:
+                if not isinstance(pattern, dict) or str(pattern.get("pattern", "")).lower() != pattern_text:
+                    continue
+                stats = pattern.setdefault("usage_stats", {"times_matched": 0, "times_fixed": 0, "success_rate": 0.0})
+                stats["times_matched"] = stats.get("times_matched", 0) + matched
+                stats["times_fixed"] = stats.get("times_fixed", 0) + fixed
+                if last_matched:
+                    stats["last_matched"] = last_matched
+                if stats["times_matched"] > 0:
+                    stats["success_rate"] = round(stats["times_fixed"] / stats["times_matched"], 2)
+                updated = True
+                break
+        return updated
+
+
+# Shared usage counters, one per learned directory
+_usage_stats: dict[Path, PatternUsageStats] = {}
+
+
+def get_pattern_usage_stats(learned_dir: Path | None = None) -> PatternUsageStats:
+    """Get or create the shared usage counters for a learned directory."""
+    learned_dir = learned_dir or LEARNED_DIR
+    stats = _usage_stats.get(learned_dir)
+    if stats is None:
+        with _matchers_lock:
+            stats = _usage_stats.setdefault(learned_dir, PatternUsageStats(learned_dir))
+    return stats
+
+
+def check_known_issues(
+    tool_name: str = "",
+    error_text: str = "",
+    categories: Iterable[str] = DEFAULT_CATEGORIES,
+    learned_dir: Path | None = None,
+) -> list[dict]:
+    """Check learned patterns and tool fixes for known issues matching this tool/error.
+
+    Args:
+        tool_name: Name of the tool that failed
+        error_text: Error message text
+        categories: patterns.yaml categories to check
+        learned_dir: Directory with patterns.yaml and tool_fixes.yaml
+
+    Returns:
+        Matches from patterns.yaml (source = category) followed by matches
+        from tool_fixes.yaml (source = "tool_fixes")
+    """
+    matcher = get_known_issues_matcher(learned_dir)
+    matches = [
+        {
+            "source": category,
+            "pattern": pattern.get("pattern"),
+            "meaning": pattern.get("meaning", ""),
+            "fix": pattern.get("fix", ""),
+            "commands": pattern.get("commands", []),
+        }
+        for category, pattern in matcher.match_patterns(error_text, tool_name, categories)
+    ]
+    matches.extend(
+        {
+            "source": "tool_fixes",
+            "tool_name": fix.get("tool_name"),
+            "pattern": fix.get("error_pattern", ""),
+            "fix": fix.get("fix_applied", ""),
+        }
+        for fix in matcher.match_tool_fixes(tool_name, error_text)
+    )
+    return matches
+
+
+def format_known_issues(matches: list) -> str:
+    """Format known issues for display."""
+    if not matches:
+        return ""
+
+    lines = ["\n## 💡 Known Issues Found!\n"]
+    for match in matches[:3]:  # Limit to 3
+        lines.append(f"**Pattern:** `{match.get('pattern', '?')}`")
+        if match.get("meaning"):
+            lines.append(f"*{match.get('meaning')}*")
+        if match.get("fix"):
+            lines.append(f"**Fix:** {match.get('fix')}")
+        if match.get("commands"):
+            lines.append("**Try:**")
+            for cmd in match.get("commands", [])[:2]:
+                lines.append(f"- `{cmd}`")
+        lines.append("")
+
+    return "\n".join(lines)
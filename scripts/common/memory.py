@@ -530,7 +530,8 @@ def check_known_issues(tool_name: str = "", error_text: str = "") -> Dict[str, A
     Check memory for known issues matching this tool/error.
 
     This is the synchronous version for use in skill compute blocks.
-    It searches patterns.yaml and tool_fixes.yaml for matching patterns.
+    It searches patterns.yaml and tool_fixes.yaml for matching patterns,
+    using the shared matcher (files are only re-read when they change).
 
     Args:
         tool_name: Name of the tool that failed (e.g., "gitlab_mr_list")
@@ -548,65 +549,15 @@ def check_known_issues(tool_name: str = "", error_text: str = "") -> Dict[str, A
                 print(f"Known fix: {match.get('fix')}")
     """
     matches = []
-    error_lower = error_text.lower() if error_text else ""
-    tool_lower = tool_name.lower() if tool_name else ""
-
     try:
-        # Check patterns.yaml
-        patterns_file = MEMORY_DIR / "learned" / "patterns.yaml"
-        if patterns_file.exists():
-            with open(patterns_file) as f:
-                patterns = yaml.safe_load(f) or {}
-
-            # Check all pattern categories
-            for category in [
-                "error_patterns",
-                "auth_patterns",
-                "bonfire_patterns",
-                "pipeline_patterns",
-                "network_patterns",
-            ]:
-                for pattern in patterns.get(category, []):
-                    pattern_text = pattern.get("pattern", "").lower()
-                    if pattern_text and (pattern_text in error_lower or pattern_text in tool_lower):
-                        matches.append(
-                            {
-                                "source": category,
-                                "pattern": pattern.get("pattern"),
-                                "meaning": pattern.get("meaning", ""),
-                                "fix": pattern.get("fix", ""),
-                                "commands": pattern.get("commands", []),
-                            }
-                        )
-
-        # Check tool_fixes.yaml
-        fixes_file = MEMORY_DIR / "learned" / "tool_fixes.yaml"
-        if fixes_file.exists():
-            with open(fixes_file) as f:
-                fixes = yaml.safe_load(f) or {}
-
-            for fix in fixes.get("tool_fixes", []):
-                if tool_name and fix.get("tool_name", "").lower() == tool_lower:
-                    matches.append(
-                        {
-                            "source": "tool_fixes",
-                            "tool_name": fix.get("tool_name"),
-                            "pattern": fix.get("error_pattern", ""),
-                            "fix": fix.get("fix_applied", ""),
-                        }
-                    )
-                elif error_text:
-                    fix_pattern = fix.get("error_pattern", "").lower()
-                    if fix_pattern and fix_pattern in error_lower:
-                        matches.append(
-                            {
-                                "source": "tool_fixes",
-                                "tool_name": fix.get("tool_name"),
-                                "pattern": fix.get("error_pattern", ""),
-                                "fix": fix.get("fix_applied", ""),
-                            }
-                        )
+        from scripts.common.known_issues import check_known_issues as match_known_issues
 
+        matches = match_known_issues(
+            tool_name,
+            error_text,
+            categories=("error_patterns", "auth_patterns", "bonfire_patterns", "pipeline_patterns", "network_patterns"),
+            learned_dir=MEMORY_DIR / "learned",
+        )
     except Exception as e:
         logger.debug(f"Error checking known issues: {e}")
 
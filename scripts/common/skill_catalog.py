@@ -0,0 +1,364 @@
+"""
+Skill Catalog - shared, cached view of skills/*.yaml.
+
+skill_run, skill_list, the scheduler, SkillToolDiscovery, the @me command
+registry and the skill test runner all need parsed skill definitions.
+The catalog parses each file once (with the libyaml C loader when
+available), keeps the result until the file's mtime changes, and
+precomputes the derived data those callers ask for: description, inputs,
+tools referenced and memory operations.
+
+Parsed skill dicts are shared between callers and must be treated as
+read-only.
+
+Usage:
+    from scripts.common.skill_catalog import get_skill_catalog
+
+    catalog = get_skill_catalog()
+    skill = catalog.load("start_work")          # parsed YAML dict or None
+    entry = catalog.get("start_work")           # SkillEntry with derived data
+    for entry in catalog.entries():             # all skills, sorted by file
+        print(entry.name, entry.description, sorted(entry.tools))
+"""
+
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+SKILLS_DIR = PROJECT_ROOT / "skills"
+
+# libyaml is several times faster than the pure-Python loader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Marker added to a skill's tool set when it has compute blocks
+COMPUTE_MARKER = "__has_compute_block__"
+
+# Memory tool patterns
+MEMORY_READ_TOOLS = {"memory_read", "memory_query", "check_known_issues", "knowledge_query"}
+MEMORY_WRITE_TOOLS = {"memory_write", "memory_update", "memory_append", "memory_session_log", "learn_tool_fix"}
+
+# Patterns for compute blocks
+_MEMORY_READ_PATTERNS = [
+    re.compile(r'memory\.read_memory\(["\']([^"\']+)["\']'),
+    re.compile(r"memory\.check_known_issues"),
+    re.compile(r'read_memory\(["\']([^"\']+)["\']'),
+]
+_MEMORY_WRITE_PATTERNS = [
+    re.compile(r'memory\.write_memory\(["\']([^"\']+)["\']'),
+    re.compile(r'memory\.append_to_list\(["\']([^"\']+)["\']'),
+    re.compile(r"memory_session_log"),
+    re.compile(r'write_memory\(["\']([^"\']+)["\']'),
+]
+
+
+def parse_skill_file(path: Path) -> Any:
+    """Parse a skill YAML file with the fastest available safe loader.
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)  # nosec B506 - safe loader
+
+
+def extract_tools(steps: list, tools: set[str] | None = None) -> set[str]:
+    """Extract all tool references from skill steps.
+
+    Looks for:
+    - step.tool: direct tool calls
+    - step.tools: list of tools
+    - step.parallel[].tool: parallel tool calls
+    - step.then[]/else[]: conditional branches
+    - step.loop.do[]: loop body
+    - step.compute: flagged with COMPUTE_MARKER (may have dynamic calls)
+
+    Args:
+        steps: List of step dictionaries
+        tools: Set to add discovered tools to (created if not given)
+
+    Returns:
+        Set of tool names
+    """
+    if tools is None:
+        tools = set()
+
+    for step in steps:
+        if not isinstance(step, dict):
+            continue
+
+        # Direct tool reference
+        if "tool" in step:
+            tools.add(step["tool"])
+
+        # List of tools
+        if "tools" in step:
+            tools.update(step["tools"])
+
+        # Parallel tools
+        if isinstance(step.get("parallel"), list):
+            extract_tools(step["parallel"], tools)
+
+        # Conditional branches
+        for branch in ["then", "else"]:
+            if isinstance(step.get(branch), list):
+                extract_tools(step[branch], tools)
+
+        # Loop iterations
+        if "loop" in step and isinstance(step.get("do", []), list):
+            extract_tools(step.get("do", []), tools)
+
+        # Compute blocks may call tools dynamically - flag for NPU
+        if "compute" in step:
+            tools.add(COMPUTE_MARKER)
+
+    return tools
+
+
+def extract_memory_operations(steps: list) -> dict:
+    """Extract memory read/write operations from skill steps.
+
+    Looks for:
+    - memory_* tool calls (memory_read, memory_write, memory_session_log, etc.)
+    - memory.read_memory() / memory.write_memory() in compute blocks
+    - check_known_issues / learn_tool_fix calls
+
+    Args:
+        steps: List of step dictionaries
+
+    Returns:
+        Dict with 'reads' and 'writes' lists
+    """
+    reads = []
+    writes = []
+
+    for step in steps:
+        if not isinstance(step, dict):
+            continue
+
+        # Check tool calls
+        tool = step.get("tool", "")
+        if tool in MEMORY_READ_TOOLS:
+            key = step.get("args", {}).get("key", "")
+            reads.append({"tool": tool, "key": key, "step": step.get("name", "")})
+        elif tool in MEMORY_WRITE_TOOLS:
+            key = step.get("args", {}).get("key", "")
+            writes.append({"tool": tool, "key": key, "step": step.get("name", "")})
+
+        # Check compute blocks for memory operations
+        compute = step.get("compute", "")
+        if compute:
+            for pattern in _MEMORY_READ_PATTERNS:
+                for match in pattern.findall(compute):
+                    if isinstance(match, str) and match:
+                        reads.append({"source": "compute", "key": match, "step": step.get("name", "")})
+                    elif pattern.pattern == r"memory\.check_known_issues":
+                        reads.append({"source": "compute", "key": "learned/patterns", "step": step.get("name", "")})
+
+            for pattern in _MEMORY_WRITE_PATTERNS:
+                for match in pattern.findall(compute):
+                    if isinstance(match, str) and match:
+                        writes.append({"source": "compute", "key": match, "step": step.get("name", "")})
+                    elif "memory_session_log" in pattern.pattern:
+                        writes.append({"source": "compute", "key": "sessions/today", "step": step.get("name", "")})
+
+        # Recursively check nested structures
+        for branch in ["then", "else", "parallel"]:
+            if branch in step and isinstance(step[branch], list):
+                nested = extract_memory_operations(step[branch])
+                reads.extend(nested.get("reads", []))
+                writes.extend(nested.get("writes", []))
+
+    return {"reads": _dedupe_ops(reads), "writes": _dedupe_ops(writes)}
+
+
+def _dedupe_ops(ops: list[dict]) -> list[dict]:
+    """Deduplicate memory operations by (tool or source, key)."""
+    seen = set()
+    unique = []
+    for op in ops:
+        key = (op.get("tool", op.get("source", "")), op.get("key", ""))
+        if key not in seen:
+            seen.add(key)
+            unique.append(op)
+    return unique
+
+
+@dataclass
+class SkillEntry:
+    """A parsed skill file plus data derived from it."""
+
+    stem: str  # File name without .yaml
+    path: Path
+    mtime: float
+    data: dict = field(default_factory=dict)  # Parsed YAML (read-only)
+    error: str = ""  # Parse error, if the file could not be loaded
+
+    # Derived data
+    name: str = ""
+    description: str = ""
+    inputs: list[dict] = field(default_factory=list)
+    input_names: list[str] = field(default_factory=list)
+    step_count: int = 0
+    tools: frozenset[str] = frozenset()
+    memory_ops: dict = field(default_factory=lambda: {"reads": [], "writes": []})
+
+    @property
+    def has_compute(self) -> bool:
+        """Whether the skill has compute blocks."""
+        return COMPUTE_MARKER in self.tools
+
+
+def _build_entry(path: Path, mtime: float) -> SkillEntry:
+    """Parse a skill file and precompute its derived data."""
+    entry = SkillEntry(stem=path.stem, path=path, mtime=mtime, name=path.stem)
+    try:
+        data = parse_skill_file(path)
+    except (OSError, yaml.YAMLError) as e:
+        entry.error = str(e)
+        return entry
+
+    if not isinstance(data, dict):
+        entry.error = "Skill file is empty or not a mapping"
+        return entry
+
+    steps = data.get("steps") or []
+    inputs = [i for i in data.get("inputs") or [] if isinstance(i, dict)]
+
+    entry.data = data
+    entry.name = data.get("name", path.stem)
+    entry.description = data.get("description", "")
+    entry.inputs = inputs
+    entry.input_names = [i["name"] for i in inputs if i.get("name")]
+    entry.step_count = len(steps)
+    entry.tools = frozenset(extract_tools(steps))
+    entry.memory_ops = extract_memory_operations(steps)
+    return entry
+
+
+class SkillCatalog:
+    """Cache of parsed skill files, invalidated per file by mtime."""
+
+    def __init__(self, skills_dir: Path | None = None):
+        """Initialize the catalog.
+
+        Args:
+            skills_dir: Path to skills directory (defaults to project root/skills)
+        """
+        self.skills_dir = skills_dir or SKILLS_DIR
+        # Keyed by skill file stem (plain strings keep warm lookups cheap)
+        self._entries: dict[str, SkillEntry] = {}
+        self._lock = threading.Lock()
+
+    def _entry_for(self, stem: str, mtime: float | None = None) -> SkillEntry | None:
+        """Get the cached entry for a skill file, re-parsing it if it changed."""
+        path = None
+        if mtime is None:
+            path = self.skills_dir / f"{stem}.yaml"
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                with self._lock:
+                    self._entries.pop(stem, None)
+                return None
+
+        entry = self._entries.get(stem)
+        if entry is not None and entry.mtime == mtime:
+            return entry
+
+        entry = _build_entry(path or self.skills_dir / f"{stem}.yaml", mtime)
+        if entry.error:
+            logger.warning(f"Failed to load skill {stem}.yaml: {entry.error}")
+        with self._lock:
+            self._entries[stem] = entry
+        return entry
+
+    def get(self, skill_name: str) -> SkillEntry | None:
+        """Get a skill by file name (without .yaml).
+
+        Args:
+            skill_name: Skill file stem (e.g., "start_work")
+
+        Returns:
+            SkillEntry (check ``error`` for parse failures), or None if missing
+        """
+        return self._entry_for(skill_name)
+
+    def find(self, skill_name: str) -> SkillEntry | None:
+        """Get a skill by file name, falling back to its ``name:`` field."""
+        entry = self.get(skill_name)
+        if entry is not None:
+            return entry
+        for entry in self.entries():
+            if not entry.error and entry.name == skill_name:
+                return entry
+        return None
+
+    def load(self, skill_name: str) -> dict | None:
+        """Get the parsed definition of a skill.
+
+        Args:
+            skill_name: Skill file stem (e.g., "start_work")
+
+        Returns:
+            Parsed skill dict (shared, do not modify), or None if the skill
+            does not exist or cannot be parsed
+        """
+        entry = self.get(skill_name)
+        if entry is None or entry.error:
+            return None
+        return entry.data
+
+    def _scan(self) -> dict[str, float]:
+        """List skill file stems with their mtimes."""
+        files: dict[str, float] = {}
+        try:
+            with os.scandir(self.skills_dir) as it:
+                for dirent in it:
+                    if dirent.name.endswith(".yaml") and dirent.is_file():
+                        files[dirent.name[:-5]] = dirent.stat().st_mtime
+        except OSError:
+            pass
+        return files
+
+    def entries(self) -> list[SkillEntry]:
+        """Get entries for every skill file, sorted by file name."""
+        files = self._scan()
+        entries = [self._entry_for(stem, files[stem]) for stem in sorted(files)]
+
+        # Forget files that were removed
+        with self._lock:
+            for stale in self._entries.keys() - files.keys():
+                del self._entries[stale]
+        return [entry for entry in entries if entry is not None]
+
+    def names(self) -> list[str]:
+        """List available skill file names (without .yaml)."""
+        return sorted(self._scan())
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Singleton catalog for the default skills directory
+_catalog: SkillCatalog | None = None
+
+
+def get_skill_catalog() -> SkillCatalog:
+    """Get or create the shared skill catalog."""
+    global _catalog
+    if _catalog is None:
+        _catalog = SkillCatalog()
+    return _catalog
@@ -12,6 +12,10 @@ Usage:
     python scripts/skill_test_runner.py --skill start_work # Test specific skill
     python scripts/skill_test_runner.py --list             # List all skills
     python scripts/skill_test_runner.py --dry-run          # Show what would run
+
+    # Record a real run through the skill engine, then replay it offline
+    python scripts/skill_test_runner.py --skill start_work --record --inputs '{"issue_key": "AAP-12345"}'
+    python scripts/skill_test_runner.py --skill start_work --replay --latency recorded
 """
 
 import argparse
@@ -34,6 +38,7 @@ TOOL_MODULES_DIR = PROJECT_ROOT / "tool_modules"
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from scripts.common.skill_catalog import get_skill_catalog  # noqa: E402
 from server.utils import run_cmd  # noqa: E402
 from tool_modules.aa_workflow.src.agent_stats import (  # noqa: E402
     record_memory_read,
@@ -41,6 +46,13 @@ from tool_modules.aa_workflow.src.agent_stats import (  # noqa: E402
     record_skill_execution,
     record_tool_call,
 )
+from tool_modules.aa_workflow.src.skill_replay import (  # noqa: E402
+    LATENCY_ZERO,
+    RecordingExecutor,
+    ReplayExecutor,
+    SkillRecording,
+    fixture_path,
+)
 
 
 @dataclass
@@ -294,62 +306,45 @@ class SkillRunner:
         self.dry_run = dry_run
         self.exclusions = load_exclusions()
         self.executor = ToolExecutor(dry_run=dry_run)
+        self.catalog = get_skill_catalog()
 
     def list_skills(self) -> list[dict]:
         """List all available skills."""
         skills = []
-        for path in sorted(SKILLS_DIR.glob("*.yaml")):
-            try:
-                with open(path) as f:
-                    skill = yaml.safe_load(f)
-
-                name = skill.get("name", path.stem)
-                excluded = name in self.exclusions["excluded_skills"]
-
-                skills.append(
-                    {
-                        "name": name,
-                        "file": path.name,
-                        "description": skill.get("description", "")[:80],
-                        "excluded": excluded,
-                        "steps": len(skill.get("steps", [])),
-                    }
-                )
-            except Exception as e:
+        for entry in self.catalog.entries():
+            if entry.error:
                 skills.append(
                     {
-                        "name": path.stem,
-                        "file": path.name,
-                        "description": f"ERROR: {e}",
+                        "name": entry.stem,
+                        "file": entry.path.name,
+                        "description": f"ERROR: {entry.error}",
                         "excluded": False,
                         "steps": 0,
                     }
                 )
+                continue
+
+            skills.append(
+                {
+                    "name": entry.name,
+                    "file": entry.path.name,
+                    "description": entry.description[:80],
+                    "excluded": entry.name in self.exclusions["excluded_skills"],
+                    "steps": entry.step_count,
+                }
+            )
 
         return skills
 
     def load_skill(self, skill_name: str) -> dict | None:
-        """Load a skill by name."""
-        # Try exact match first
-        skill_file = SKILLS_DIR / f"{skill_name}.yaml"
-        if not skill_file.exists():
-            # Try finding by name in files
-            for path in SKILLS_DIR.glob("*.yaml"):
-                try:
-                    with open(path) as f:
-                        skill = yaml.safe_load(f)
-                    if skill and skill.get("name") == skill_name:
-                        return skill
-                except yaml.YAMLError:
-                    continue
+        """Load a skill by file name, or by its name: field."""
+        entry = self.catalog.find(skill_name)
+        if entry is None:
             return None
-
-        try:
-            with open(skill_file) as f:
-                return yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            print(f"    ⚠️  YAML parse error in {skill_name}: {e}")
+        if entry.error:
+            print(f"    ⚠️  YAML parse error in {skill_name}: {entry.error}")
             return None
+        return entry.data
 
     async def run_skill(self, skill_name: str, inputs: dict = None) -> SkillResult:
         """Run a skill and return results."""
@@ -449,6 +444,61 @@ class SkillRunner:
 
         return result
 
+    async def record_skill(self, skill_name: str, inputs: dict = None) -> SkillResult:
+        """Run a skill through the skill engine, saving its tool calls as a replay fixture."""
+        result = SkillResult(skill_name=skill_name, success=False)
+        if skill_name in self.exclusions["excluded_skills"]:
+            result.error = "EXCLUDED (production-impacting)"
+            return result
+
+        skill = self.load_skill(skill_name)
+        if not skill:
+            result.error = f"Skill not found: {skill_name}"
+            return result
+
+        print(f"\n  🔴 Recording skill: {skill_name}")
+        executor = RecordingExecutor(skill, inputs or {}, emit_events=False)
+        print(await executor.execute())
+
+        path = fixture_path(skill_name)
+        executor.recording.save(path)
+        print(f"\n  💾 Saved {len(executor.recording.calls)} tool calls to {path.relative_to(PROJECT_ROOT)}")
+
+        result.steps_total = len(executor.step_results)
+        result.steps_passed = len([r for r in executor.step_results if r.get("success")])
+        result.steps_failed = result.steps_total - result.steps_passed
+        result.success = result.steps_failed == 0
+        return result
+
+    async def replay_skill(self, skill_name: str, inputs: dict = None, latency: str = LATENCY_ZERO) -> SkillResult:
+        """Replay a skill from its recorded fixture."""
+        result = SkillResult(skill_name=skill_name, success=False)
+        skill = self.load_skill(skill_name)
+        if not skill:
+            result.error = f"Skill not found: {skill_name}"
+            return result
+
+        path = fixture_path(skill_name)
+        try:
+            recording = SkillRecording.load(path)
+        except (OSError, ValueError) as e:
+            result.error = f"No recording for {skill_name}: {e}"
+            return result
+
+        print(f"\n  ▶️  Replaying skill: {skill_name} ({len(recording.calls)} recorded calls, latency: {latency})")
+        executor = ReplayExecutor(skill, recording, inputs=inputs, latency=latency)
+        start = time.perf_counter()
+        print(await executor.execute())
+        print(f"\n  ⏱️  Replayed in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+        for tool_name, _ in executor.misses:
+            print(f"    ⚠️  Not in recording: {tool_name}")
+        result.steps_total = len(executor.step_results)
+        result.steps_passed = len([r for r in executor.step_results if r.get("success")])
+        result.steps_failed = result.steps_total - result.steps_passed
+        result.success = result.steps_failed == 0 and not executor.misses
+        return result
+
     async def run_all(self, skill_filter: str = None) -> list[SkillResult]:
         """Run all (or filtered) skills."""
         skills = self.list_skills()
@@ -514,10 +564,31 @@ async def main():
     parser.add_argument("--skill", "-s", help="Run specific skill")
     parser.add_argument("--list", "-l", action="store_true", help="List all skills")
     parser.add_argument("--dry-run", "-n", action="store_true", help="Dry run")
+    parser.add_argument("--record", action="store_true", help="Run --skill for real and save a replay fixture")
+    parser.add_argument("--replay", action="store_true", help="Replay --skill from its fixture")
+    parser.add_argument("--inputs", default=None, help="Skill inputs as JSON (with --record/--replay)")
+    parser.add_argument("--latency", choices=["zero", "recorded"], default=LATENCY_ZERO, help="Replay latency")
     args = parser.parse_args()
 
+    if args.record or args.replay:
+        if not args.skill:
+            parser.error("--record and --replay need --skill")
+        try:
+            inputs = json.loads(args.inputs) if args.inputs else None
+        except json.JSONDecodeError as e:
+            parser.error(f"--inputs is not valid JSON: {e}")
+
     runner = SkillRunner(dry_run=args.dry_run)
 
+    if args.record or args.replay:
+        if args.record:
+            result = await runner.record_skill(args.skill, inputs)
+        else:
+            result = await runner.replay_skill(args.skill, inputs, args.latency)
+        if result.error:
+            print(f"\n  ❌ {result.error}")
+        sys.exit(0 if result.success else 1)
+
     if args.list:
         skills = runner.list_skills()
         print("\n📋 Available Skills:\n")
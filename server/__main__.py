@@ -6,9 +6,18 @@ Usage:
     python -m server --agent devops      # Load devops persona
     python -m server --tools git,jira    # Load specific tool modules
     python -m server --all               # Load all tools (may exceed limits)
+    python -m server --profile-startup   # Report where startup time goes, then exit
 """
 
-from .main import main
+import sys
+
+if "--profile-startup" in sys.argv:
+    # Start before importing anything else, so every import is timed
+    from .startup_profiler import start_startup_profile
+
+    start_startup_profile()
+
+from .main import main  # noqa: E402
 
 if __name__ == "__main__":
     main()
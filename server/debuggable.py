@@ -24,7 +24,7 @@ import inspect
 import logging
 import re
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 from mcp.types import TextContent
 
@@ -367,7 +367,7 @@ def wrap_all_tools(server, tools_module) -> int:
     return count
 
 
-def wrap_server_tools_runtime(server) -> int:
+def wrap_server_tools_runtime(server, names: Iterable[str] | None = None) -> int:
     """
     Wrap all registered server tools with debug hint functionality at runtime.
 
@@ -376,6 +376,10 @@ def wrap_server_tools_runtime(server) -> int:
 
     Call this AFTER all tools have been registered with the server.
 
+    Args:
+        server: FastMCP server
+        names: Only wrap these tools (e.g. ones registered since the last call)
+
     Returns:
         Number of tools wrapped.
     """
@@ -395,10 +399,14 @@ def wrap_server_tools_runtime(server) -> int:
         return 0
 
     tools = tool_manager._tools
+    if names is not None:
+        names = set(names)
 
     for tool_name, tool_info in tools.items():
         if tool_name.startswith("_") or tool_name == "debug_tool":
             continue
+        if names is not None and tool_name not in names:
+            continue
 
         # Get the original handler
         original_handler = tool_info.fn if hasattr(tool_info, "fn") else None
@@ -2,15 +2,82 @@
 
 Provides a consistent interface for making authenticated HTTP requests
 to services like Prometheus, Alertmanager, Kibana, and Quay.
+
+APIClients share one connection pool per event loop (and TLS/redirect
+setting), so a client created per tool call still reuses open
+connections. warm_connections() opens them ahead of time, e.g. during a
+skill's pre-flight.
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any, Literal
+from urllib.parse import urlsplit
 
 import httpx
 
 Method = Literal["GET", "POST", "DELETE", "PUT", "PATCH"]
 
+# Idle pooled connections are kept this long (httpx default is 5s), long
+# enough for a warmed connection to survive until the step that uses it.
+KEEPALIVE_EXPIRY = 60.0
+
+# (loop, verify_ssl, follow_redirects) -> shared client
+_shared_clients: dict[tuple[asyncio.AbstractEventLoop, bool, bool], httpx.AsyncClient] = {}
+
+
+def get_shared_client(verify_ssl: bool = True, follow_redirects: bool = True) -> httpx.AsyncClient:
+    """Get the pooled client for the running event loop.
+
+    Args:
+        verify_ssl: Verify TLS certificates
+        follow_redirects: Follow HTTP redirects
+
+    Returns:
+        Shared httpx.AsyncClient (not to be closed by callers)
+    """
+    loop = asyncio.get_running_loop()
+    key = (loop, verify_ssl, follow_redirects)
+    client = _shared_clients.get(key)
+    if client is None or client.is_closed:
+        # Drop pools whose event loop is gone
+        for stale in [k for k in _shared_clients if k[0].is_closed()]:
+            del _shared_clients[stale]
+        client = httpx.AsyncClient(
+            follow_redirects=follow_redirects,
+            verify=verify_ssl,
+            limits=httpx.Limits(keepalive_expiry=KEEPALIVE_EXPIRY),
+        )
+        _shared_clients[key] = client
+    return client
+
+
+async def warm_connections(urls: list[str], timeout: float = 5.0, verify_ssl: bool = True) -> dict[str, bool]:
+    """Open pooled connections (DNS, TCP, TLS) to each URL's host concurrently.
+
+    Any HTTP response counts as warmed; the status code doesn't matter.
+
+    Args:
+        urls: Service URLs (only scheme, host and port are used)
+        timeout: Per-connection timeout in seconds
+        verify_ssl: Verify TLS certificates
+
+    Returns:
+        Origin URL -> whether a connection was opened
+    """
+    client = get_shared_client(verify_ssl=verify_ssl)
+    origins = sorted({f"{parts.scheme}://{parts.netloc}" for parts in map(urlsplit, urls) if parts.netloc})
+
+    async def warm(origin: str) -> bool:
+        try:
+            await client.head(origin, timeout=timeout)
+            return True
+        except httpx.HTTPError:
+            return False
+
+    results = await asyncio.gather(*(warm(origin) for origin in origins))
+    return dict(zip(origins, results))
+
 
 @dataclass
 class APIClient:
@@ -31,6 +98,8 @@ class APIClient:
     follow_redirects: bool = True
     verify_ssl: bool = True
     extra_headers: dict[str, str] = field(default_factory=dict)
+    # Use the shared connection pool (False: private client, closed by close())
+    shared: bool = True
 
     # Auth error message templates
     auth_error_msg: str = "Authentication required. Refresh your cluster credentials."
@@ -59,6 +128,8 @@ class APIClient:
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
+        if self.shared:
+            return get_shared_client(self.verify_ssl, self.follow_redirects)
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 timeout=self.timeout,
@@ -68,7 +139,7 @@ class APIClient:
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client (shared pools stay open)."""
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
@@ -129,6 +200,7 @@ class APIClient:
                 headers=request_headers,
                 params=params,
                 json=json,
+                timeout=self.timeout,
             )
             return self._handle_response(response)
         except httpx.TimeoutException:
@@ -0,0 +1,243 @@
+"""Lazy Tool Registration - list a module's tools now, import the module on first call.
+
+Importing a tools module is the slow part of server startup and persona
+switches: each one pulls in its dependencies (Google API clients, lancedb,
+jinja, ...) whether or not the session ever calls one of its tools.
+
+The first time a module is imported, the schemas of the tools it registered
+are recorded with the tool manifest (see tool_discovery), keyed on the
+mtimes and sizes of the files in the module's src/ directory. From then on,
+register_module() adds a stub per tool with the recorded name, description
+and schemas, without importing anything. The first call to any of a
+module's stubs imports the module, replaces all of its stubs with the real
+tools and runs the real tool. If the module's files change, the next
+register_module() imports it eagerly and records fresh schemas.
+
+Usage:
+    from server.lazy_tools import register_module
+
+    tool_names = register_module(server, "gitlab_basic", tools_file)
+"""
+
+import importlib.util
+import logging
+import threading
+from functools import cached_property
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools.base import Tool
+from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata, func_metadata
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from server.tool_discovery import get_manifest_cache
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
+logger = logging.getLogger(__name__)
+
+# Imported tools modules, reused while their files are unchanged:
+# (tools file, signature) -> module
+_imported: dict[tuple[str, str], ModuleType] = {}
+_imported_lock = threading.Lock()
+
+
+def module_signature(tools_file: Path) -> list[list]:
+    """Signature of a tools module's source files: [[name, mtime_ns, size], ...]."""
+    signature = []
+    for path in sorted(tools_file.parent.glob("*.py")):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature.append([path.name, stat.st_mtime_ns, stat.st_size])
+    return signature
+
+
+def _import_tools_file(name: str, tools_file: Path, signature: list) -> ModuleType:
+    """Import a tools file, or reuse the module if this process already imported it unchanged.
+
+    Raises:
+        ValueError: If the file can't be imported as a module
+    """
+    key = (str(tools_file), repr(signature))
+    with _imported_lock:
+        module = _imported.get(key)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(f"aa_{name}_tools", tools_file)
+            if spec is None or spec.loader is None:
+                raise ValueError(f"Could not create spec for {name}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _imported[key] = module
+    return module
+
+
+def _tool_schema(tool: Tool) -> dict:
+    """What a stub needs to list a tool exactly like the real one."""
+    return {
+        "name": tool.name,
+        "title": tool.title,
+        "description": tool.description,
+        "parameters": tool.parameters,
+        "output_schema": tool.output_schema,
+        "annotations": tool.annotations.model_dump(exclude_none=True) if tool.annotations else None,
+        "meta": tool.meta,
+    }
+
+
+def _register_tools(server: "FastMCP", name: str, tools_file: Path, signature: list) -> list[str]:
+    """Import a tools module and run its register_tools(); record the schemas.
+
+    Returns:
+        Names of the tools it added
+
+    Raises:
+        ValueError: If the module can't be imported or has no register_tools
+    """
+    module = _import_tools_file(name, tools_file, signature)
+    if not hasattr(module, "register_tools"):
+        raise ValueError(f"Module aa_{name} has no register_tools function")
+
+    tools = server._tool_manager._tools
+    before = set(tools)
+    module.register_tools(server)
+    added = [tool_name for tool_name in tools if tool_name not in before]
+
+    cache = get_manifest_cache()
+    cache.set_schemas(name, signature, [_tool_schema(tools[tool_name]) for tool_name in added])
+    cache.save()
+    return added
+
+
+async def _stub() -> None:
+    """Placeholder handler; LazyTool.run never calls it."""
+
+
+_stub_metadata: FuncMetadata | None = None
+
+
+def _get_stub_metadata() -> FuncMetadata:
+    global _stub_metadata
+    if _stub_metadata is None:
+        _stub_metadata = func_metadata(_stub)
+    return _stub_metadata
+
+
+class LazyTool(Tool):
+    """Stub for a tool whose module hasn't been imported yet."""
+
+    module: Any = Field(exclude=True)  # LazyModule
+    recorded_output_schema: dict[str, Any] | None = Field(default=None, exclude=True)
+
+    @cached_property
+    def output_schema(self) -> dict[str, Any] | None:
+        return self.recorded_output_schema
+
+    async def run(self, arguments: dict[str, Any], context: Any = None, convert_result: bool = False) -> Any:
+        """Import the module, then run the real tool."""
+        tool = self.module.load(self.name)
+        return await tool.run(arguments, context=context, convert_result=convert_result)
+
+
+class LazyModule:
+    """A tools module registered as stubs, imported on first call."""
+
+    def __init__(self, server: "FastMCP", name: str, tools_file: Path, debug_wrap: bool = False):
+        self.server = server
+        self.name = name
+        self.tools_file = tools_file
+        self.debug_wrap = debug_wrap
+        self.loaded = False
+        self.stubs: dict[str, LazyTool] = {}
+
+    def add_stubs(self, schemas: list[dict]) -> list[str]:
+        """Register a stub per recorded tool, skipping names already registered."""
+        tools = self.server._tool_manager._tools
+        for schema in schemas:
+            if schema["name"] in tools:
+                continue
+            annotations = schema.get("annotations")
+            stub = LazyTool(
+                fn=_stub,
+                name=schema["name"],
+                title=schema.get("title"),
+                description=schema.get("description") or "",
+                parameters=schema.get("parameters") or {},
+                fn_metadata=_get_stub_metadata(),
+                is_async=True,
+                annotations=ToolAnnotations(**annotations) if annotations else None,
+                meta=schema.get("meta"),
+                module=self,
+                recorded_output_schema=schema.get("output_schema"),
+            )
+            tools[stub.name] = stub
+            self.stubs[stub.name] = stub
+        return list(self.stubs)
+
+    def load(self, tool_name: str) -> Tool:
+        """Import the module (once) and get the real tool.
+
+        Raises:
+            ToolError: If the module can't be imported or didn't register the tool
+        """
+        tools = self.server._tool_manager._tools
+        if not self.loaded:
+            # Stubs would shadow the real tools (add_tool keeps existing names)
+            removed = {name: stub for name, stub in self.stubs.items() if tools.get(name) is stub}
+            for name in removed:
+                del tools[name]
+            try:
+                added = _register_tools(self.server, self.name, self.tools_file, module_signature(self.tools_file))
+            except Exception as e:
+                for name, stub in removed.items():
+                    tools.setdefault(name, stub)
+                raise ToolError(f"Error loading module {self.name} for {tool_name}: {e}") from e
+            self.loaded = True
+            logger.info(f"Loaded {self.name} tools on first call ({tool_name})")
+
+            if self.debug_wrap:
+                from server.debuggable import wrap_server_tools_runtime
+
+                wrap_server_tools_runtime(self.server, added)
+
+        tool = tools.get(tool_name)
+        if tool is None or isinstance(tool, LazyTool):
+            raise ToolError(f"Module {self.name} did not register {tool_name}")
+        return tool
+
+
+def register_module(
+    server: "FastMCP",
+    name: str,
+    tools_file: Path,
+    lazy: bool = True,
+    debug_wrap: bool = False,
+) -> list[str]:
+    """Register a tools module's tools, as stubs if its schemas are recorded.
+
+    Args:
+        server: FastMCP server to register with
+        name: Module load name (e.g. "gitlab_basic")
+        tools_file: The module's tools file
+        lazy: Register stubs when possible (False always imports the module)
+        debug_wrap: Wrap real tools with debug hints when a stub's module loads
+
+    Returns:
+        Names of the tools (or stubs) registered
+
+    Raises:
+        ValueError: If the module is imported and has no register_tools
+    """
+    signature = module_signature(tools_file)
+    schemas = get_manifest_cache().get_schemas(name, signature) if lazy else None
+    if schemas is None:
+        return _register_tools(server, name, tools_file, signature)
+
+    names = LazyModule(server, name, tools_file, debug_wrap).add_stubs(schemas)
+    logger.debug(f"Registered {len(names)} {name} tools lazily")
+    return names
@@ -18,6 +18,13 @@ Usage:
 
     # Disable scheduler:
     python -m server --agent developer --no-scheduler
+
+    # Import all tool modules at startup (default: on first tool call,
+    # once a module's tool schemas have been recorded):
+    python -m server --agent developer --eager-tools
+
+    # Report where startup time goes (imports, register_tools, debug wrapping):
+    python -m server --agent developer --eager-tools --profile-startup
 """
 
 import argparse
@@ -86,6 +93,10 @@ TOOL_MODULES = {
     "concur": 8,  # Expense automation (GOMO + Concur)
 }
 
+# Modules always imported at startup: workflow provides the core tools
+# (persona_load, session_start, skill_run) and sets up shared state
+EAGER_MODULES = {"workflow"}
+
 
 def load_agent_config(agent_name: str) -> list[str] | None:
     """Load tool modules from an agent config file."""
@@ -168,17 +179,23 @@ def _get_tools_file_path(tool_name: str) -> Path:
         return module_dir / "src" / "tools.py"
 
 
-def _load_single_tool_module(tool_name: str, server: FastMCP) -> bool:
+def _load_single_tool_module(tool_name: str, server: FastMCP, lazy: bool = False) -> bool:
     """
     Load a single tool module and register its tools.
 
     Args:
         tool_name: Tool module name
         server: FastMCP server instance
+        lazy: Register stubs from the recorded schemas and import the module
+              on first call (see server.lazy_tools)
 
     Returns:
         True if loaded successfully, False otherwise
     """
+    from .lazy_tools import LazyTool, register_module
+    from .profiler import profile_span
+    from .startup_profiler import REGISTER
+
     logger = logging.getLogger(__name__)
 
     tools_file = _get_tools_file_path(tool_name)
@@ -187,51 +204,50 @@ def _load_single_tool_module(tool_name: str, server: FastMCP) -> bool:
         logger.warning(f"Tools file not found: {tools_file}")
         return False
 
-    import importlib.util
-
-    spec = importlib.util.spec_from_file_location(f"aa_{tool_name}_tools", tools_file)
-    if spec is None or spec.loader is None:
-        logger.warning(f"Could not create spec for {tool_name}")
+    try:
+        with profile_span(tool_name, REGISTER):
+            names = register_module(server, tool_name, tools_file, lazy=lazy, debug_wrap=True)
+    except ValueError as e:
+        logger.warning(str(e))
         return False
 
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-
-    if hasattr(module, "register_tools"):
-        module.register_tools(server)
-        logger.info(f"Loaded {tool_name} tools")
-        return True
-    else:
-        logger.warning(f"Module aa_{tool_name} has no register_tools function")
-        return False
+    stubs = [n for n in names if isinstance(server._tool_manager.get_tool(n), LazyTool)]
+    logger.info(f"Loaded {tool_name} tools" + (f" ({len(stubs)} deferred until first call)" if stubs else ""))
+    return True
 
 
 def _register_debug_for_module(server: FastMCP, tool_name: str):
     """
     Register debug tools for a single loaded module.
 
+    Source locations come from the tool manifest, so the module isn't
+    re-read (or imported, if its tools are still stubs).
+
     Args:
         server: FastMCP server instance
         tool_name: Tool module name
     """
-    import importlib.util
-
-    from .debuggable import wrap_all_tools
+    from .debuggable import TOOL_REGISTRY
+    from .tool_discovery import discover_tools_from_file
 
     tools_file = _get_tools_file_path(tool_name)
 
-    if not tools_file.exists():
-        return
-
-    spec = importlib.util.spec_from_file_location(f"aa_{tool_name}_tools_debug", tools_file)
-    if spec and spec.loader:
-        module = importlib.util.module_from_spec(spec)
-        wrap_all_tools(server, module)
+    for info in discover_tools_from_file(tools_file, tool_name):
+        TOOL_REGISTRY.setdefault(
+            info.name,
+            {
+                "source_file": info.source_file,
+                "start_line": info.line_number,
+                "end_line": info.end_line,
+                "func_name": info.name,
+            },
+        )
 
 
 def create_mcp_server(
     name: str = "aa_workflow",
     tools: list[str] | None = None,
+    lazy: bool = True,
 ) -> FastMCP:
     """
     Create and configure an MCP server with the specified tools.
@@ -240,6 +256,9 @@ def create_mcp_server(
         name: Server name for identification
         tools: List of tool module names to load (e.g., ["git", "jira"])
                If None, loads all available tools
+        lazy: Register tools from modules imported before as stubs and
+              import each module on its first tool call (EAGER_MODULES
+              are always imported)
 
     Returns:
         Configured FastMCP server instance
@@ -264,7 +283,7 @@ def create_mcp_server(
             continue
 
         try:
-            if _load_single_tool_module(tool_name, server):
+            if _load_single_tool_module(tool_name, server, lazy=lazy and tool_name not in EAGER_MODULES):
                 loaded_modules.append(tool_name)
         except Exception as e:
             logger.error(f"Error loading {tool_name}: {e}")
@@ -272,15 +291,20 @@ def create_mcp_server(
     # Register debug_tool and wrap all tools with auto-fix hints
     try:
         from .debuggable import register_debug_tool, wrap_server_tools_runtime
+        from .profiler import profile_span
+        from .startup_profiler import DEBUG
+        from .tool_discovery import get_manifest_cache
 
-        register_debug_tool(server)
+        with profile_span("debug_tool", DEBUG):
+            register_debug_tool(server)
 
-        # Register all loaded tools in the debug registry (for source lookup)
-        for tool_name in loaded_modules:
-            _register_debug_for_module(server, tool_name)
+            # Register all loaded tools in the debug registry (for source lookup)
+            for tool_name in loaded_modules:
+                _register_debug_for_module(server, tool_name)
+            get_manifest_cache().save()
 
-        # Wrap all tools at runtime to add debug hints on failure
-        wrapped_count = wrap_server_tools_runtime(server)
+            # Wrap all tools at runtime to add debug hints on failure
+            wrapped_count = wrap_server_tools_runtime(server)
 
         logger.info(f"Registered debug_tool and wrapped {wrapped_count} tools for auto-fixing")
     except Exception as e:
@@ -439,6 +463,12 @@ async def run_mcp_server(server: FastMCP, enable_scheduler: bool = True):
         # Cleanup scheduler on shutdown
         if scheduler_started:
             await stop_scheduler()
+        try:
+            from tool_modules.aa_workflow.src.agent_stats import flush_agent_stats
+
+            flush_agent_stats()
+        except Exception as e:
+            logger.warning(f"Error flushing agent stats: {e}")
 
 
 def run_web_server(server: FastMCP, host: str = "127.0.0.1", port: int = 8765):
@@ -523,10 +553,36 @@ Examples:
         action="store_true",
         help="Disable the cron scheduler subsystem",
     )
+    parser.add_argument(
+        "--eager-tools",
+        action="store_true",
+        help="Import every tool module at startup instead of on first call",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report import, tool registration and debug wrapping times, then exit (1 if over budget)",
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        default=None,
+        help="Startup budget in ms for --profile-startup (default: server.startup_budget_ms in config.json)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the --profile-startup report as JSON",
+    )
 
     args = parser.parse_args()
     logger = setup_logging(web_mode=args.web)
 
+    if args.profile_startup:
+        from .startup_profiler import start_startup_profile
+
+        start_startup_profile()  # Already running when started via python -m server
+
     # Determine tools to load
     if args.agent:
         # Load from agent config
@@ -561,7 +617,12 @@ Examples:
             logger.info(f"Loading default agent '{default_agent}' with ~{estimated} tools: {tools}")
 
     try:
-        server = create_mcp_server(name=server_name, tools=tools)
+        server = create_mcp_server(name=server_name, tools=tools, lazy=not args.eager_tools)
+
+        if args.profile_startup:
+            from .startup_profiler import finish_startup_profile
+
+            sys.exit(finish_startup_profile(args.startup_budget, as_json=args.json))
 
         if args.web:
             run_web_server(server, host=args.host, port=args.port)
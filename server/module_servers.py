@@ -0,0 +1,202 @@
+"""Module Server Registry.
+
+Process-wide cache of tool modules loaded outside the main MCP server.
+
+Skill steps (SkillExecutor), tool_exec, the scheduler and claude_agent all
+call tools from modules that are not registered on the running server.
+Instead of creating a fresh FastMCP and re-executing ``tools_basic.py`` on
+every call, each module is loaded once into its own FastMCP instance and
+reused. Entries are keyed by module name and the tools file mtime, so an
+edited module is reloaded on its next use. preload() imports several
+modules at once in worker threads, e.g. before a skill's first step.
+
+Usage:
+    from server.module_servers import get_module_registry
+
+    registry = get_module_registry()
+    result = await registry.call_tool("gitlab", "gitlab_mr_list", {"project": "backend"})
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from mcp.server.fastmcp import FastMCP
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TOOL_MODULES_DIR = PROJECT_ROOT / "tool_modules"
+
+
+@dataclass
+class LoadedModule:
+    """A tool module registered on its own FastMCP server."""
+
+    module: str
+    tools_file: Path
+    mtime: float
+    server: FastMCP
+    tool_count: int = 0
+
+
+class ModuleServerRegistry:
+    """Cache of per-module FastMCP servers, keyed by module and file mtime."""
+
+    def __init__(self, tool_modules_dir: Path = TOOL_MODULES_DIR):
+        """Initialize an empty registry.
+
+        Args:
+            tool_modules_dir: Directory containing the aa_* tool modules
+        """
+        self.tool_modules_dir = tool_modules_dir
+        self._modules: dict[str, LoadedModule] = {}
+        self._lock = threading.Lock()
+        # One load lock per module, so different modules import concurrently
+        self._load_locks: dict[str, threading.Lock] = {}
+        self.loads = 0
+        self.hits = 0
+
+    def get_tools_file(self, module: str) -> Path | None:
+        """Find the tools file for a module (tools_basic.py, then legacy tools.py).
+
+        Args:
+            module: Module name without the aa_ prefix (e.g., "gitlab")
+
+        Returns:
+            Path to the tools file, or None if the module does not exist
+        """
+        src_dir = self.tool_modules_dir / f"aa_{module}" / "src"
+        for name in ("tools_basic.py", "tools.py"):
+            tools_file = src_dir / name
+            if tools_file.exists():
+                return tools_file
+        return None
+
+    def get_server(self, module: str) -> FastMCP:
+        """Get the FastMCP server for a module, loading it on first use.
+
+        The module is re-imported only if its tools file changed since it
+        was loaded.
+
+        Args:
+            module: Module name without the aa_ prefix (e.g., "gitlab")
+
+        Returns:
+            FastMCP server with the module's tools registered
+
+        Raises:
+            FileNotFoundError: If the module has no tools file
+            ImportError: If the module cannot be loaded
+        """
+        tools_file = self.get_tools_file(module)
+        if tools_file is None:
+            raise FileNotFoundError(
+                f"Module not found: {module} (checked {self.tool_modules_dir / f'aa_{module}' / 'src'})"
+            )
+        mtime = tools_file.stat().st_mtime
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(module, threading.Lock())
+        with load_lock:
+            with self._lock:
+                entry = self._modules.get(module)
+                if entry and entry.tools_file == tools_file and entry.mtime == mtime:
+                    self.hits += 1
+                    return entry.server
+
+            entry = self._load(module, tools_file, mtime)
+            with self._lock:
+                self._modules[module] = entry
+            return entry.server
+
+    def _load(self, module: str, tools_file: Path, mtime: float) -> LoadedModule:
+        """Import a tools file and register its tools on a new FastMCP."""
+        spec = importlib.util.spec_from_file_location(f"aa_{module}_tools_cached", tools_file)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load: {module}")
+
+        loaded_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loaded_module)
+
+        server = FastMCP(f"module-{module}")
+        tool_count = 0
+        if hasattr(loaded_module, "register_tools"):
+            tool_count = loaded_module.register_tools(server) or 0
+
+        with self._lock:
+            self.loads += 1
+        logger.debug(f"Loaded module server {module} ({tool_count} tools) from {tools_file}")
+        return LoadedModule(module=module, tools_file=tools_file, mtime=mtime, server=server, tool_count=tool_count)
+
+    async def call_tool(self, module: str, tool_name: str, args: dict[str, Any]) -> Any:
+        """Call a tool on a module's cached server.
+
+        Args:
+            module: Module name without the aa_ prefix
+            tool_name: Tool to call
+            args: Tool arguments
+
+        Returns:
+            Raw FastMCP call_tool result
+        """
+        return await self.get_server(module).call_tool(tool_name, args)
+
+    async def preload(self, modules: list[str]) -> dict[str, str | None]:
+        """Load several modules concurrently, each in a worker thread.
+
+        Already-loaded modules are cache hits, so preloading is cheap to
+        repeat.
+
+        Args:
+            modules: Module names without the aa_ prefix
+
+        Returns:
+            Module name -> error message, or None if it loaded
+        """
+
+        def load(module: str) -> str | None:
+            try:
+                self.get_server(module)
+                return None
+            except Exception as e:
+                return str(e)
+
+        errors = await asyncio.gather(*(asyncio.to_thread(load, module) for module in modules))
+        return dict(zip(modules, errors))
+
+    def invalidate(self, module: str | None = None) -> None:
+        """Drop a cached module (or all modules) so it is reloaded on next use."""
+        with self._lock:
+            if module is None:
+                self._modules.clear()
+            else:
+                self._modules.pop(module, None)
+
+    def get_status(self) -> dict:
+        """Get registry status for diagnostics."""
+        with self._lock:
+            return {
+                "modules": {name: entry.tool_count for name, entry in self._modules.items()},
+                "loads": self.loads,
+                "hits": self.hits,
+            }
+
+
+# Global instance, shared by everything in this process
+_registry: ModuleServerRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_module_registry() -> ModuleServerRegistry:
+    """Get the process-wide module server registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModuleServerRegistry()
+    return _registry
@@ -2,7 +2,7 @@
 
 Enables loading different persona toolsets mid-session by:
 1. Removing current tools (except core workflow tools)
-2. Loading new persona's tool modules
+2. Loading new persona's tool modules (as stubs, see server.lazy_tools)
 3. Notifying the client that tools changed
 
 Usage:
@@ -12,7 +12,6 @@ Usage:
     await loader.switch_persona("devops", ctx)
 """
 
-import importlib.util
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
@@ -113,43 +112,31 @@ class PersonaLoader:
 
     async def _load_tool_module(self, module_name: str) -> list[str]:
         """Load a tool module and return list of tool names added."""
-        module_dir = TOOL_MODULES_DIR / f"aa_{module_name}"
+        # "git_basic" / "git_extra" load aa_git's tools_basic.py / tools_extra.py
+        base_name, tools_name = module_name, "tools_basic.py"
+        for suffix in ("_basic", "_extra"):
+            if module_name.endswith(suffix):
+                base_name, tools_name = module_name[: -len(suffix)], f"tools{suffix}.py"
+        module_dir = TOOL_MODULES_DIR / f"aa_{base_name}"
 
         # Try tools_basic.py first (new structure), then tools.py (legacy)
-        tools_file = module_dir / "src" / "tools_basic.py"
-        if not tools_file.exists():
+        tools_file = module_dir / "src" / tools_name
+        if not tools_file.exists() and tools_name == "tools_basic.py":
             tools_file = module_dir / "src" / "tools.py"
 
         if not tools_file.exists():
             logger.warning(f"Tools file not found: {module_dir / 'src'}")
             return []
 
-        try:
-            spec = importlib.util.spec_from_file_location(f"aa_{module_name}_tools_dynamic", tools_file)
-            if spec is None or spec.loader is None:
-                return []
-
-            module = importlib.util.module_from_spec(spec)
-
-            # Get tools before loading
-            tools_before = set(await self.server.list_tools())
+        from server.lazy_tools import register_module
 
-            # Load the module (registers tools with server)
-            spec.loader.exec_module(module)
-
-            if hasattr(module, "register_tools"):
-                module.register_tools(self.server)
-
-            # Get tools after loading
-            tools_after = set(await self.server.list_tools())
-            new_tools = tools_after - tools_before
+        try:
+            # Stubs if the module's tool schemas are recorded; imported on first call
+            new_tool_names = register_module(self.server, module_name, tools_file)
 
-            # Track which tools came from this module and extract names
-            new_tool_names = []
-            for tool in new_tools:
-                tool_name = tool.name if hasattr(tool, "name") else str(tool)
+            # Track which tools came from this module
+            for tool_name in new_tool_names:
                 self._tool_to_module[tool_name] = module_name
-                new_tool_names.append(tool_name)
 
             self.loaded_modules.add(module_name)
             logger.info(f"Loaded {module_name}: {len(new_tool_names)} tools")
@@ -0,0 +1,194 @@
+"""Hierarchical timing profiler.
+
+Records a tree of timed spans for one run (e.g. a skill executed with
+``profile=True``) and exports it as a text report or as Chrome trace JSON
+(load it in chrome://tracing or https://ui.perfetto.dev).
+
+The active profiler and the current parent span live in a context variable,
+so spans opened anywhere below the run - the skill engine, tool code,
+``run_cmd`` - nest under the step that caused them, including across
+asyncio tasks and ``asyncio.to_thread``. When no profiler is active,
+``profile_span`` is a no-op.
+
+Usage:
+    from server.profiler import Profiler, profile_span
+
+    profiler = Profiler("start_work")
+    with profiler.activate():
+        with profile_span("step 1: get_issue", "step", lane=1):
+            with profile_span("subprocess", "subprocess", cmd="rh-issue"):
+                ...
+    print(profiler.render_tree())
+    profiler.write_chrome_trace(Path("start_work.trace.json"))
+"""
+
+import contextlib
+import json
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+
+@dataclass
+class Span:
+    """A timed region of a profiled run."""
+
+    name: str
+    category: str = ""
+    start: float = 0.0  # time.perf_counter() seconds
+    end: float | None = None
+    lane: int = 0  # Chrome trace thread id; concurrent steps get their own lane
+    args: dict[str, Any] = field(default_factory=dict)
+    children: list["Span"] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Span duration in seconds (up to now if still open)."""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+# (profiler, current parent span) for the running context
+_current: ContextVar[tuple["Profiler", Span] | None] = ContextVar("profiler_current", default=None)
+
+
+class Profiler:
+    """Collects the span tree of one profiled run."""
+
+    def __init__(self, name: str):
+        """Initialize a profiler.
+
+        Args:
+            name: Name of the root span (e.g. the skill name)
+        """
+        self.root = Span(name=name, category="run", start=time.perf_counter())
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator["Profiler"]:
+        """Make this the active profiler for the enclosed code."""
+        token = _current.set((self, self.root))
+        try:
+            yield self
+        finally:
+            self.root.end = time.perf_counter()
+            _current.reset(token)
+
+    def to_chrome_trace(self) -> dict:
+        """Export spans in the Chrome trace event format."""
+        pid = os.getpid()
+        origin = self.root.start
+        events: list[dict] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": self.root.name}},
+        ]
+
+        def add(span: Span) -> None:
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category or "span",
+                    "ph": "X",
+                    "ts": round((span.start - origin) * 1e6, 1),
+                    "dur": round(span.duration * 1e6, 1),
+                    "pid": pid,
+                    "tid": span.lane,
+                    "args": {k: str(v) for k, v in span.args.items()},
+                }
+            )
+            for child in span.children:
+                add(child)
+
+        add(self.root)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        """Write the Chrome trace JSON to path."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
+
+    def render_tree(self, min_ms: float = 0.0) -> str:
+        """Render the span tree as indented text.
+
+        Sibling spans with the same name (e.g. one call_tool per foreach
+        item) are merged into one line with a call count.
+
+        Args:
+            min_ms: Hide merged spans shorter than this
+
+        Returns:
+            One line per span: name, total time, count and share of the run
+        """
+        total = self.root.duration or 1e-9
+        lines = [f"{self.root.name}  {self.root.duration * 1000:.1f}ms"]
+
+        def render(spans: list[Span], depth: int) -> None:
+            groups: dict[str, list[Span]] = {}
+            for span in spans:
+                groups.setdefault(span.name, []).append(span)
+            for name, group in groups.items():
+                elapsed = sum(s.duration for s in group)
+                if elapsed * 1000 < min_ms:
+                    continue
+                count = f" ×{len(group)}" if len(group) > 1 else ""
+                lines.append(f"{'  ' * depth}{name}{count}  {elapsed * 1000:.1f}ms ({elapsed / total:.0%})")
+                render([c for s in group for c in s.children], depth + 1)
+
+        render(self.root.children, 1)
+        return "\n".join(lines)
+
+
+class _NoSpan:
+    """Shared no-op context manager used when nothing is being profiled."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+@contextlib.contextmanager
+def _span(profiler: Profiler, parent: Span, name: str, category: str, lane: int | None, args: dict) -> Iterator[Span]:
+    span = Span(
+        name=name,
+        category=category,
+        start=time.perf_counter(),
+        lane=parent.lane if lane is None else lane,
+        args=args,
+    )
+    parent.children.append(span)
+    token = _current.set((profiler, span))
+    try:
+        yield span
+    finally:
+        span.end = time.perf_counter()
+        _current.reset(token)
+
+
+def profile_span(name: str, category: str = "", lane: int | None = None, **args: Any):
+    """Time the enclosed code as a child of the current span.
+
+    Args:
+        name: Span name shown in the report
+        category: Span category (e.g. "step", "tool", "subprocess")
+        lane: Chrome trace lane; defaults to the parent's
+        **args: Extra details attached to the trace event
+
+    Returns:
+        Context manager (a no-op when no profiler is active)
+    """
+    current = _current.get()
+    if current is None:
+        return _NO_SPAN
+    return _span(current[0], current[1], name, category, lane, args)
+
+
+def is_profiling() -> bool:
+    """Whether a profiler is active in the current context."""
+    return _current.get() is not None
@@ -0,0 +1,253 @@
+"""Shell Worker Pool - long-lived bash processes for commands that need the shell.
+
+run_cmd() execs commands directly with the captured shell environment (see
+get_shell_environment() in server.utils). Shell functions and aliases from
+the rc files (like ``kube``) can't be exec'd, so without a pool each of them
+starts a bash that sources every rc file first.
+
+With ``"shell_workers": N`` in the "server" section of config.json, those
+commands run on up to N long-lived bash workers instead. Each worker sources
+the rc files once when it starts, then runs one request at a time in a
+subshell, so a request's cd and exports never leak into the next one.
+
+Protocol: a request is one line of bash written to the worker's stdin. The
+command's output is framed on the worker's stdout and stderr by a random
+per-request token, which ends each stream:
+
+    stdout: <output> NUL <token> <exit status, 3 digits>
+    stderr: <output> NUL <token>
+
+A worker whose request times out or is cancelled is stopped along with
+everything it started (SIGTERM, then SIGKILL) and replaced on the next
+request. Workers also exit
+on their own when the server does (their stdin closes).
+
+Usage:
+    from server.shell_pool import get_shell_pool
+
+    pool = get_shell_pool()  # None unless shell_workers is configured
+    if pool:
+        returncode, stdout, stderr = await pool.run(["kube", "s"], cwd=None, env=None, timeout=60)
+"""
+
+import asyncio
+import re
+import secrets
+import shlex
+import subprocess
+from pathlib import Path
+from typing import cast
+
+from server.utils import (
+    _build_shell_sources,
+    _kill_process_group,
+    _shell_rc_signature,
+    _terminate_process_group,
+    get_shell_environment,
+    load_config,
+)
+
+# Time allowed for a new worker to source the rc files
+WORKER_START_TIMEOUT = 30
+
+READ_SIZE = 65536
+
+_ENV_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class ShellWorkerError(RuntimeError):
+    """A shell worker exited or broke the protocol."""
+
+
+async def _read_frame(reader: asyncio.StreamReader, end: bytes, trailer: int = 0) -> tuple[bytes, bytes]:
+    """Read a stream up to a frame end, plus a fixed-size trailer after it.
+
+    Returns:
+        Tuple of (data before the frame end, trailer)
+
+    Raises:
+        ShellWorkerError: If the stream ends first
+    """
+    buffer = bytearray()
+    searched = 0
+    while True:
+        index = buffer.find(end, searched)
+        if index >= 0 and len(buffer) >= index + len(end) + trailer:
+            start = index + len(end)
+            stop = start + trailer
+            return bytes(buffer[:index]), bytes(buffer[start:stop])
+        if index < 0:
+            searched = max(0, len(buffer) - len(end) + 1)
+        chunk = await reader.read(READ_SIZE)
+        if not chunk:
+            raise ShellWorkerError("Shell worker exited")
+        buffer += chunk
+
+
+class ShellWorker:
+    """One long-lived bash process with the rc files sourced."""
+
+    def __init__(self, proc: asyncio.subprocess.Process, rc_signature: tuple):
+        self.proc = proc
+        self.rc_signature = rc_signature
+        self._stdin = cast(asyncio.StreamWriter, proc.stdin)
+        self._stdout = cast(asyncio.StreamReader, proc.stdout)
+        self._stderr = cast(asyncio.StreamReader, proc.stderr)
+
+    @classmethod
+    async def start(cls) -> "ShellWorker":
+        """Start bash with the shell environment and source the rc files.
+
+        Raises:
+            ShellWorkerError: If bash exits or takes too long sourcing the rc files
+        """
+        home = Path.home()
+        rc_signature = _shell_rc_signature(home)
+        proc = await asyncio.create_subprocess_exec(
+            "bash",
+            "--noprofile",
+            "--norc",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=get_shell_environment(home),
+            start_new_session=True,
+        )
+        worker = cls(proc, rc_signature)
+        try:
+            await worker._request("; ".join(_build_shell_sources(home)) or "true", WORKER_START_TIMEOUT)
+        except BaseException:
+            await worker.close()
+            raise
+        return worker
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.returncode is None
+
+    async def _request(self, script: str, timeout: float | None) -> tuple[int, str, str]:
+        """Send one line of bash and read its framed output."""
+        token = secrets.token_hex(8)
+        frame = f"printf '\\0%s%03d' {token} $__status; printf '\\0%s' {token} >&2"
+        try:
+            self._stdin.write(f"{script} </dev/null; __status=$?; {frame}\n".encode())
+            await self._stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise ShellWorkerError("Shell worker exited") from e
+
+        end = b"\0" + token.encode()
+        (stdout, status), (stderr, _) = await asyncio.wait_for(
+            asyncio.gather(_read_frame(self._stdout, end, trailer=3), _read_frame(self._stderr, end)),
+            timeout,
+        )
+        return int(status), stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+    async def run(
+        self,
+        cmd: list[str],
+        cwd: str | None,
+        env: dict[str, str] | None,
+        timeout: float | None,
+    ) -> tuple[int, str, str]:
+        """Run a command in a subshell of this worker.
+
+        Raises:
+            ValueError: If an env name isn't a valid shell variable name
+            ShellWorkerError: If the worker exited
+            asyncio.TimeoutError: If the command ran longer than timeout
+        """
+        parts = []
+        if cwd:
+            parts.append(f"cd -- {shlex.quote(cwd)}")
+        for name, value in (env or {}).items():
+            if not _ENV_NAME.match(name):
+                raise ValueError(f"Invalid environment variable name: {name!r}")
+            parts.append(f"export {name}={shlex.quote(value)}")
+        parts.append(" ".join(shlex.quote(arg) for arg in cmd))
+        return await self._request(f"( {' && '.join(parts)} )", timeout)
+
+    async def close(self) -> None:
+        """Stop the worker and anything it started: SIGTERM, then SIGKILL."""
+        await asyncio.shield(asyncio.ensure_future(_terminate_process_group(self.proc)))
+
+
+class ShellPool:
+    """Up to `size` shell workers, started on demand and reused."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.loop = asyncio.get_running_loop()
+        self._idle: list[ShellWorker] = []
+        self._slots = asyncio.Semaphore(size)
+        self.started = 0
+
+    async def _acquire(self) -> ShellWorker:
+        """Get an idle worker whose rc files are unchanged, or start one."""
+        rc_signature = _shell_rc_signature(Path.home())
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.alive and worker.rc_signature == rc_signature:
+                return worker
+            await worker.close()
+        self.started += 1
+        return await ShellWorker.start()
+
+    async def run(
+        self,
+        cmd: list[str],
+        cwd: str | None,
+        env: dict[str, str] | None,
+        timeout: float | None,
+    ) -> tuple[int, str, str]:
+        """Run a command on a worker.
+
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: If the command ran longer than timeout
+            asyncio.CancelledError: If the awaiting task was cancelled
+            ShellWorkerError: If the worker exited mid-command
+        """
+        async with self._slots:
+            worker = await self._acquire()
+            try:
+                result = await worker.run(cmd, cwd, env, timeout)
+            except ValueError:
+                self._idle.append(worker)
+                raise
+            except BaseException as e:
+                await worker.close()  # Mid-request: its streams are out of sync
+                if isinstance(e, asyncio.TimeoutError):
+                    raise subprocess.TimeoutExpired(cmd, timeout or 0) from None
+                raise
+            self._idle.append(worker)
+            return result
+
+    async def close(self) -> None:
+        """Kill all idle workers."""
+        while self._idle:
+            await self._idle.pop().close()
+
+
+_shell_pool: ShellPool | None = None
+
+
+def get_shell_pool() -> ShellPool | None:
+    """Get the shell worker pool for the running event loop.
+
+    Returns:
+        The pool, or None unless "shell_workers" is set in the "server" config section
+    """
+    global _shell_pool
+    size = int(load_config().get("server", {}).get("shell_workers", 0) or 0)
+    if size <= 0:
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _shell_pool is None or _shell_pool.loop is not loop or _shell_pool.size != size:
+        if _shell_pool is not None:
+            for worker in _shell_pool._idle:
+                _kill_process_group(worker.proc)
+        _shell_pool = ShellPool(size)
+    return _shell_pool
@@ -0,0 +1,260 @@
+"""Startup Profiler - where ``python -m server`` spends its time before it is ready.
+
+``python -m server --profile-startup`` builds the server exactly as it
+would otherwise (same --agent/--tools/--eager-tools flags), then prints a
+report and exits instead of serving:
+
+- every module imported during startup, with its own and cumulative
+  import time, slowest first,
+- each tool module's registration (importing its tools file and running
+  ``register_tools``; only stubs for lazily loaded modules),
+- debug tool registration and wrapping.
+
+A Chrome trace of the whole startup is written to
+~/.config/aa-workflow/profiles/ (imports nest under the tool module that
+pulled them in).
+
+The run exits with status 1 if startup took longer than the startup budget
+or any tool module's registration took longer than the module budget
+("server" section of config.json, --startup-budget on the command line),
+so tests and CI can catch import-time regressions in tool_modules/*.
+
+Usage:
+    python -m server --agent developer --eager-tools --profile-startup
+    python -m server --tools git_basic --profile-startup --startup-budget 1500 --json
+"""
+
+import contextlib
+import importlib.abc
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from server.profiler import Profiler, Span, profile_span
+
+PROFILES_DIR = Path.home() / ".config" / "aa-workflow" / "profiles"
+
+# Budgets used when config.json has no "server" section
+DEFAULT_STARTUP_BUDGET_MS = 5000.0
+DEFAULT_MODULE_BUDGET_MS = 1500.0
+
+# Span categories
+IMPORT = "import"
+REGISTER = "register"
+DEBUG = "debug"
+
+
+class _TimedLoader:
+    """Loader proxy that times module execution as a profiler span."""
+
+    def __init__(self, loader: Any, name: str):
+        self._loader = loader
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        with profile_span(self._name, IMPORT):
+            self._loader.exec_module(module)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path finder that wraps every found module's loader in a _TimedLoader."""
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, fullname)
+        return spec
+
+
+@dataclass
+class StartupReport:
+    """Timings of one server startup."""
+
+    total_ms: float
+    imports: list[tuple[str, float, float]] = field(default_factory=list)  # (module, self ms, cumulative ms)
+    register_ms: dict[str, float] = field(default_factory=dict)  # tool module -> registration ms
+    debug_ms: float = 0.0
+    budget_ms: float | None = None
+    module_budget_ms: float | None = None
+
+    def violations(self) -> list[str]:
+        """Budgets this startup went over."""
+        problems = []
+        if self.budget_ms is not None and self.total_ms > self.budget_ms:
+            problems.append(f"startup took {self.total_ms:.0f}ms (budget {self.budget_ms:.0f}ms)")
+        if self.module_budget_ms is not None:
+            for module, elapsed in self.register_ms.items():
+                if elapsed > self.module_budget_ms:
+                    problems.append(f"{module} took {elapsed:.0f}ms to register (budget {self.module_budget_ms:.0f}ms)")
+        return problems
+
+    def format(self, top: int = 25) -> str:
+        """Render the report as text."""
+        lines = [f"## Startup profile: {self.total_ms:.0f}ms", ""]
+
+        lines.append("### Tool modules")
+        for module, elapsed in sorted(self.register_ms.items(), key=lambda item: -item[1]):
+            lines.append(f"  {elapsed:8.1f}ms  {module}")
+        lines.append(f"  {self.debug_ms:8.1f}ms  (debug registration and wrapping)")
+        lines.append("")
+
+        imported = sum(self_ms for _, self_ms, _ in self.imports)
+        lines.append(f"### Imports ({len(self.imports)} modules, {imported:.0f}ms, top {top} by own time)")
+        lines.append("      self   cumulative  module")
+        for module, self_ms, cumulative_ms in self.imports[:top]:
+            lines.append(f"  {self_ms:8.1f}ms {cumulative_ms:8.1f}ms  {module}")
+
+        problems = self.violations()
+        if problems:
+            lines.append("")
+            lines.append("### ❌ Over budget")
+            lines.extend(f"  - {problem}" for problem in problems)
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form (for --json)."""
+        data = asdict(self)
+        data["violations"] = self.violations()
+        return data
+
+
+def _collect_imports(span: Span, imports: list[tuple[str, float, float]]) -> None:
+    """Walk the span tree, recording each import span's own and cumulative time."""
+    for child in span.children:
+        _collect_imports(child, imports)
+    if span.category == IMPORT:
+        children_ms = sum(child.duration for child in span.children) * 1000
+        cumulative_ms = span.duration * 1000
+        imports.append((span.name, max(cumulative_ms - children_ms, 0.0), cumulative_ms))
+
+
+def _collect(span: Span, category: str) -> list[Span]:
+    """All spans of a category below span, outermost only."""
+    if span.category == category:
+        return [span]
+    return [found for child in span.children for found in _collect(child, category)]
+
+
+class StartupProfiler:
+    """Times imports, tool module registration and debug wrapping during startup."""
+
+    def __init__(self):
+        self.profiler = Profiler("startup")
+        self._timer = _ImportTimer()
+        self._stack: contextlib.ExitStack | None = None
+
+    def start(self) -> "StartupProfiler":
+        """Start timing imports and startup spans in the current context."""
+        self._stack = contextlib.ExitStack()
+        self._stack.enter_context(self.profiler.activate())
+        sys.meta_path.insert(0, self._timer)
+        self._stack.callback(sys.meta_path.remove, self._timer)
+        return self
+
+    def stop(self, budget_ms: float | None = None, module_budget_ms: float | None = None) -> StartupReport:
+        """Stop timing and build the report.
+
+        Args:
+            budget_ms: Budget for the whole startup
+            module_budget_ms: Budget for each tool module's registration
+
+        Returns:
+            Report with imports sorted by their own time, slowest first
+        """
+        if self._stack is not None:
+            self._stack.close()
+            self._stack = None
+
+        root = self.profiler.root
+        imports: list[tuple[str, float, float]] = []
+        _collect_imports(root, imports)
+        imports.sort(key=lambda item: -item[1])
+
+        register_ms: dict[str, float] = {}
+        for span in _collect(root, REGISTER):
+            register_ms[span.name] = register_ms.get(span.name, 0.0) + span.duration * 1000
+
+        return StartupReport(
+            total_ms=root.duration * 1000,
+            imports=imports,
+            register_ms=register_ms,
+            debug_ms=sum(span.duration for span in _collect(root, DEBUG)) * 1000,
+            budget_ms=budget_ms,
+            module_budget_ms=module_budget_ms,
+        )
+
+    def write_trace(self) -> Path:
+        """Write the startup's Chrome trace under PROFILES_DIR."""
+        path = PROFILES_DIR / f"startup-{datetime.now().strftime('%Y%m%d-%H%M%S')}.trace.json"
+        return self.profiler.write_chrome_trace(path)
+
+
+_startup_profiler: StartupProfiler | None = None
+
+
+def start_startup_profile() -> StartupProfiler:
+    """Start the process-wide startup profiler (as early as possible)."""
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler().start()
+    return _startup_profiler
+
+
+def get_startup_profiler() -> StartupProfiler | None:
+    """Get the running startup profiler, if --profile-startup started one."""
+    return _startup_profiler
+
+
+def get_budgets(startup_budget_ms: float | None = None) -> tuple[float, float]:
+    """Get (startup budget, per-module budget) in ms from config.json, with overrides.
+
+    Args:
+        startup_budget_ms: Command-line override of the startup budget
+    """
+    from server.utils import load_config
+
+    config = load_config().get("server", {})
+    budget = startup_budget_ms or config.get("startup_budget_ms", DEFAULT_STARTUP_BUDGET_MS)
+    module_budget = config.get("module_budget_ms", DEFAULT_MODULE_BUDGET_MS)
+    return float(budget), float(module_budget)
+
+
+def finish_startup_profile(startup_budget_ms: float | None = None, as_json: bool = False) -> int:
+    """Stop the startup profiler, print its report and write its trace.
+
+    Args:
+        startup_budget_ms: Command-line override of the startup budget
+        as_json: Print the report as JSON instead of text
+
+    Returns:
+        Process exit status: 0 within budget, 1 over budget
+    """
+    profiler = start_startup_profile()  # No-op if server.__main__ already started it
+    budget, module_budget = get_budgets(startup_budget_ms)
+    report = profiler.stop(budget, module_budget)
+
+    if as_json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.format())
+        try:
+            print(f"\nTrace: {profiler.write_trace()}")
+        except OSError as e:
+            print(f"\nCould not write trace: {e}")
+    return 1 if report.violations() else 0
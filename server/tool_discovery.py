@@ -23,9 +23,22 @@ Tools register themselves at import time, eliminating hardcoded tool lists.
             ...
 
         return registry.count
+
+## Persisted manifest
+
+Before a module is loaded, its tools are found by AST-parsing its tools
+files. The parse results are saved to ~/.config/aa-workflow/tool_manifest.json,
+keyed on each file's mtime and size, with a content hash as a second check.
+A new process reads the manifest from that file and re-parses only the
+files that changed. The same file holds the tool schemas recorded by
+server.lazy_tools.
 """
 
+import hashlib
+import json
 import logging
+import os
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -37,6 +50,10 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).parent.parent
 TOOL_MODULES_DIR = PROJECT_ROOT / "tool_modules"
 
+# Parsed tools files, persisted across processes
+MANIFEST_CACHE_FILE = Path.home() / ".config" / "aa-workflow" / "tool_manifest.json"
+MANIFEST_CACHE_VERSION = 2
+
 
 class ToolTier(str, Enum):
     """Tool tier classification."""
@@ -55,6 +72,7 @@ class ToolInfo:
     description: str = ""
     source_file: str = ""
     line_number: int = 0
+    end_line: int = 0
 
 
 @dataclass
@@ -236,29 +254,13 @@ def list_modules() -> list[str]:
 # ============== Fallback Discovery ==============
 
 
-def discover_tools_from_file(filepath: Path, module: str) -> list[ToolInfo]:
-    """Scan a Python file for tool registrations (fallback method).
-
-    This is used when tools haven't been loaded yet but we need to know
-    what's available. It parses the file looking for @registry.tool() decorators.
-
-    Args:
-        filepath: Path to the tools file
-        module: Module name
-
-    Returns:
-        List of discovered ToolInfo objects
-    """
+def _parse_tools_source(source: bytes, filepath: Path, module: str) -> list[ToolInfo]:
+    """Find the @registry.tool() functions in a tools file's source."""
     import ast
 
-    if not filepath.exists():
-        return []
-
     try:
-        with open(filepath) as f:
-            source = f.read()
         tree = ast.parse(source)
-    except (SyntaxError, OSError) as e:
+    except (SyntaxError, ValueError) as e:
         logger.warning(f"Could not parse {filepath}: {e}")
         return []
 
@@ -293,6 +295,7 @@ def discover_tools_from_file(filepath: Path, module: str) -> list[ToolInfo]:
                             description=first_line,
                             source_file=str(filepath),
                             line_number=node.lineno,
+                            end_line=node.end_lineno or node.lineno,
                         )
                     )
                     break  # Found the decorator, move to next function
@@ -300,6 +303,181 @@ def discover_tools_from_file(filepath: Path, module: str) -> list[ToolInfo]:
     return tools
 
 
+class ManifestCache:
+    """Parsed tools files, persisted to disk and reused while the files are unchanged."""
+
+    def __init__(self, cache_file: Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_file: JSON file to persist to (defaults to MANIFEST_CACHE_FILE)
+        """
+        self.cache_file = cache_file or MANIFEST_CACHE_FILE
+        self.parses = 0  # Files parsed by this process
+        self._files: dict[str, dict] | None = None  # path -> {mtime_ns, size, sha256, tools}
+        self._schemas: dict[str, dict] = {}  # load name -> {signature, tools}
+        self._seen: set[str] = set()
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def _load(self) -> dict[str, dict]:
+        """Read the cache file (once per process)."""
+        if self._files is None:
+            try:
+                data = json.loads(self.cache_file.read_text())
+                valid = isinstance(data, dict) and data.get("version") == MANIFEST_CACHE_VERSION
+                self._files = data["files"] if valid and isinstance(data.get("files"), dict) else {}
+                self._schemas = data["schemas"] if valid and isinstance(data.get("schemas"), dict) else {}
+            except (OSError, ValueError) as e:
+                if not isinstance(e, FileNotFoundError):
+                    logger.debug(f"Ignoring tool manifest cache {self.cache_file}: {e}")
+                self._files = {}
+        return self._files
+
+    def tools_for_file(self, filepath: Path, module: str) -> list[ToolInfo]:
+        """Get a tools file's tools, parsing it only if it changed since it was cached."""
+        key = str(filepath)
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return []
+
+        with self._lock:
+            files = self._load()
+            self._seen.add(key)
+            entry = files.get(key)
+            if entry is None or (entry.get("mtime_ns"), entry.get("size")) != (stat.st_mtime_ns, stat.st_size):
+                entry = self._refresh(filepath, entry, stat, module)
+                if entry is None:
+                    return []
+                files[key] = entry
+
+        tier = ToolTier.BASIC if "basic" in filepath.name else ToolTier.EXTRA
+        return [
+            ToolInfo(
+                name=tool["name"],
+                module=module,
+                tier=tier,
+                description=tool.get("description", ""),
+                source_file=key,
+                line_number=tool.get("line_number", 0),
+                end_line=tool.get("end_line", 0),
+            )
+            for tool in entry["tools"]
+        ]
+
+    def _refresh(self, filepath: Path, entry: dict | None, stat: os.stat_result, module: str) -> dict | None:
+        """Re-read a file whose mtime or size changed; re-parse it only if its content did."""
+        try:
+            source = filepath.read_bytes()
+        except OSError as e:
+            logger.warning(f"Could not read {filepath}: {e}")
+            return None
+
+        digest = hashlib.sha256(source).hexdigest()
+        if entry is None or entry.get("sha256") != digest:
+            self.parses += 1
+            tools = [
+                {
+                    "name": info.name,
+                    "description": info.description,
+                    "line_number": info.line_number,
+                    "end_line": info.end_line,
+                }
+                for info in _parse_tools_source(source, filepath, module)
+            ]
+        else:
+            tools = entry["tools"]  # Touched, not changed
+
+        self._dirty = True
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest, "tools": tools}
+
+    def get_schemas(self, name: str, signature: list) -> list[dict] | None:
+        """Get the tool schemas recorded for a tools module.
+
+        Args:
+            name: Module load name (e.g. "gitlab_basic")
+            signature: Current signature of the module's source files
+
+        Returns:
+            Recorded schemas, or None if none were recorded for this signature
+        """
+        with self._lock:
+            self._load()
+            entry = self._schemas.get(name)
+            if isinstance(entry, dict) and entry.get("signature") == signature:
+                return entry.get("tools")
+            return None
+
+    def set_schemas(self, name: str, signature: list, tools: list[dict]) -> None:
+        """Record the tool schemas a tools module registered."""
+        with self._lock:
+            self._load()
+            if self._schemas.get(name) != {"signature": signature, "tools": tools}:
+                self._schemas[name] = {"signature": signature, "tools": tools}
+                self._dirty = True
+
+    def save(self, prune_under: Path | None = None) -> bool:
+        """Write the cache file if anything changed.
+
+        Args:
+            prune_under: Directory that was fully scanned; cached files under it
+                that weren't looked up since the last save are dropped
+
+        Returns:
+            True if the file was written
+        """
+        with self._lock:
+            files = self._load()
+            if prune_under is not None:
+                prefix = str(prune_under) + os.sep
+                for key in [k for k in files if k.startswith(prefix) and k not in self._seen]:
+                    del files[key]
+                    self._dirty = True
+            self._seen = set()
+            if not self._dirty:
+                return False
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+                data = {"version": MANIFEST_CACHE_VERSION, "files": files, "schemas": self._schemas}
+                tmp_file.write_text(json.dumps(data, default=str))
+                tmp_file.replace(self.cache_file)
+            except OSError as e:
+                logger.debug(f"Failed to write tool manifest cache: {e}")
+                return False
+            self._dirty = False
+            return True
+
+
+_manifest_cache: ManifestCache | None = None
+
+
+def get_manifest_cache() -> ManifestCache:
+    """Get or create the process-wide manifest cache."""
+    global _manifest_cache
+    if _manifest_cache is None:
+        _manifest_cache = ManifestCache()
+    return _manifest_cache
+
+
+def discover_tools_from_file(filepath: Path, module: str) -> list[ToolInfo]:
+    """Scan a Python file for tool registrations (fallback method).
+
+    This is used when tools haven't been loaded yet but we need to know
+    what's available. It parses the file looking for @registry.tool() decorators,
+    or reuses the persisted result if the file hasn't changed.
+
+    Args:
+        filepath: Path to the tools file
+        module: Module name
+
+    Returns:
+        List of discovered ToolInfo objects
+    """
+    return get_manifest_cache().tools_for_file(filepath, module)
+
+
 def discover_module_tools(module: str) -> dict[str, list[str]]:
     """Discover all tools in a module by scanning files.
 
@@ -365,7 +543,7 @@ def build_full_manifest() -> dict[str, list[str]]:
     # Otherwise, scan all modules
     manifest = {}
 
-    for module_dir in TOOL_MODULES_DIR.iterdir():
+    for module_dir in sorted(TOOL_MODULES_DIR.iterdir()):
         if not module_dir.is_dir() or not module_dir.name.startswith("aa_"):
             continue
 
@@ -377,6 +555,7 @@ def build_full_manifest() -> dict[str, list[str]]:
         if all_tools:
             manifest[module_name] = all_tools
 
+    get_manifest_cache().save(prune_under=TOOL_MODULES_DIR)
     return manifest
 
 
@@ -385,13 +564,17 @@ def build_full_manifest() -> dict[str, list[str]]:
 # Auto-detect module from tool name prefix
 _MODULE_PREFIXES: dict[str, str] | None = None
 
+# Tool name -> module for every scanned tool
+_TOOL_MODULES: dict[str, str] | None = None
 
-def _build_prefix_map() -> dict[str, str]:
+
+def _build_prefix_map(all_tools: dict[str, list[str]] | None = None) -> dict[str, str]:
     """Build a mapping of tool prefixes to modules."""
     prefixes = {}
 
     # Get all tools from manifest or discovery
-    all_tools = build_full_manifest()
+    if all_tools is None:
+        all_tools = build_full_manifest()
 
     for module, tools in all_tools.items():
         for tool_name in tools:
@@ -408,22 +591,35 @@ def _build_prefix_map() -> dict[str, str]:
 def get_module_for_tool(tool_name: str) -> str | None:
     """Get the module a tool belongs to, using prefix matching as fallback.
 
+    Tools not loaded yet are looked up in the scanned manifest (see
+    build_full_manifest) by name, then by prefix for tools it doesn't list.
+
     Args:
         tool_name: Name of the tool
 
     Returns:
         Module name or None
     """
-    global _MODULE_PREFIXES
+    global _MODULE_PREFIXES, _TOOL_MODULES
 
     # First check the manifest
     module = TOOL_MANIFEST.get_tool_module(tool_name)
     if module:
         return module
 
-    # Build prefix map if needed
-    if _MODULE_PREFIXES is None:
-        _MODULE_PREFIXES = _build_prefix_map()
+    # Build the scanned tool and prefix maps if needed
+    if _MODULE_PREFIXES is None or _TOOL_MODULES is None:
+        all_tools = build_full_manifest()
+        tool_modules: dict[str, str] = {}
+        for module, tools in all_tools.items():
+            for name in tools:
+                tool_modules.setdefault(name, module)
+        _TOOL_MODULES = tool_modules
+        _MODULE_PREFIXES = _build_prefix_map(all_tools)
+
+    module = _TOOL_MODULES.get(tool_name)
+    if module:
+        return module
 
     # Try prefix matching
     for prefix, module in _MODULE_PREFIXES.items():
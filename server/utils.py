@@ -5,13 +5,23 @@ eliminating code duplication and ensuring consistent behavior.
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 import os
+import secrets
+import shutil
+import signal
 import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 from typing import cast
 
+from server.profiler import profile_span
+
 logger = logging.getLogger(__name__)
 
 
@@ -273,9 +283,30 @@ def get_cluster_short_name(environment: str) -> str:
     return KUBECONFIG_MAP.get(environment.lower(), environment.lower())
 
 
+# How long a successful auth check is trusted before `oc whoami` runs again.
+# Every kubectl/bonfire/prometheus call checks auth first; within a skill
+# they share one check per environment.
+AUTH_CHECK_TTL = 60.0
+
+# (environment, kubeconfig) -> (kubeconfig mtime_ns, monotonic expiry)
+_auth_valid_until: dict[tuple[str, str], tuple[int, float]] = {}
+
+
+def invalidate_cluster_auth(environment: str | None = None) -> None:
+    """Forget cached auth checks for one environment (or all)."""
+    if environment is None:
+        _auth_valid_until.clear()
+        return
+    for key in [k for k in _auth_valid_until if k[0] == environment.lower()]:
+        del _auth_valid_until[key]
+
+
 async def check_cluster_auth(environment: str) -> bool:
     """Check if cluster authentication is valid.
 
+    A successful check is cached for AUTH_CHECK_TTL seconds, or until the
+    kubeconfig changes.
+
     Args:
         environment: Environment name (stage, production, ephemeral, etc.)
 
@@ -284,25 +315,33 @@ async def check_cluster_auth(environment: str) -> bool:
     """
     kubeconfig = get_kubeconfig(environment)
 
-    if not os.path.exists(kubeconfig):
+    try:
+        mtime_ns = os.stat(kubeconfig).st_mtime_ns
+    except OSError:
         logger.info(f"Kubeconfig not found: {kubeconfig}")
         return False
 
+    key = (environment.lower(), kubeconfig)
+    cached = _auth_valid_until.get(key)
+    if cached and cached[0] == mtime_ns and time.monotonic() < cached[1]:
+        return True
+
     # Quick auth check using oc whoami
     try:
-        result = await asyncio.to_thread(
-            subprocess.run,
-            ["oc", "whoami"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            env={**os.environ, "KUBECONFIG": kubeconfig},
-        )
-        if result.returncode == 0:
-            logger.info(f"Auth valid for {environment}: {result.stdout.strip()}")
+        with profile_span("auth_check", "auth", environment=environment):
+            returncode, stdout, stderr = await _run_process(
+                ["oc", "whoami"],
+                None,
+                {**os.environ, "KUBECONFIG": kubeconfig},
+                10,
+            )
+        if returncode == 0:
+            logger.info(f"Auth valid for {environment}: {stdout.strip()}")
+            _auth_valid_until[key] = (mtime_ns, time.monotonic() + AUTH_CHECK_TTL)
             return True
         else:
-            logger.info(f"Auth check failed for {environment}: {result.stderr.strip()}")
+            logger.info(f"Auth check failed for {environment}: {stderr.strip()}")
+            _auth_valid_until.pop(key, None)
             return False
     except Exception as e:
         logger.info(f"Auth check error for {environment}: {e}")
@@ -322,15 +361,17 @@ async def refresh_cluster_auth(environment: str) -> bool:
     """
     short_name = get_cluster_short_name(environment)
     logger.info(f"Refreshing {environment} auth via kube-clean {short_name} && kube {short_name}")
+    invalidate_cluster_auth(environment)
 
-    # First clean stale config
-    clean_success, _, clean_stderr = await run_cmd_shell(["kube-clean", short_name], timeout=30)
-    if not clean_success:
-        logger.warning(f"kube-clean {short_name} failed: {clean_stderr}")
-        # Continue anyway - kube might still work
+    with profile_span("auth_refresh", "auth", environment=environment):
+        # First clean stale config
+        clean_success, _, clean_stderr = await run_cmd_shell(["kube-clean", short_name], timeout=30)
+        if not clean_success:
+            logger.warning(f"kube-clean {short_name} failed: {clean_stderr}")
+            # Continue anyway - kube might still work
 
-    # Run kube to trigger OAuth flow (opens browser)
-    success, _, stderr = await run_cmd_shell(["kube", short_name], timeout=120)
+        # Run kube to trigger OAuth flow (opens browser)
+        success, _, stderr = await run_cmd_shell(["kube", short_name], timeout=120)
     if success:
         logger.info(f"Auth refresh succeeded for {environment}")
         return True
@@ -477,9 +518,312 @@ def get_repo_config(repo: str) -> dict:
     return {}
 
 
+# ==================== Concurrency Limits ====================
+
+# How many commands may run at once, per binary, per cluster (run_kubectl)
+# and per GitLab host (run_glab). "default" applies to clusters or hosts not
+# listed. Overridden per entry by the "concurrency" section of config.json.
+DEFAULT_CONCURRENCY: dict[str, dict[str, int]] = {
+    "binaries": {"bonfire": 2, "oc": 4, "kubectl": 8, "glab": 4},
+    "clusters": {"default": 8},
+    "gitlab_hosts": {"default": 6},
+}
+
+_CONCURRENCY_PREFIXES = {"binaries": "binary", "clusters": "cluster", "gitlab_hosts": "gitlab"}
+
+
+class ConcurrencyLimit:
+    """A named semaphore that records how long callers queue for it."""
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.waiting = 0
+        self.acquired = 0
+        self.queued = 0  # Acquisitions that had to wait
+        self.wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    @contextlib.asynccontextmanager
+    async def hold(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block, queueing if all are taken."""
+        if self._semaphore.locked():
+            start = time.monotonic()
+            self.waiting += 1
+            try:
+                with profile_span(f"queue {self.name}", "queue"):
+                    await self._semaphore.acquire()
+            finally:
+                self.waiting -= 1
+            waited_ms = (time.monotonic() - start) * 1000
+            self.queued += 1
+            self.wait_ms += waited_ms
+            self.max_wait_ms = max(self.max_wait_ms, waited_ms)
+        else:
+            await self._semaphore.acquire()
+
+        self.acquired += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        return _combined_stats([self])
+
+
+def _combined_stats(limits: list[ConcurrencyLimit]) -> dict:
+    """Stats of one named limit, summed over the event loops it was used on."""
+    acquired = sum(limit.acquired for limit in limits)
+    return {
+        "limit": limits[0].limit,
+        "in_flight": sum(limit.in_flight for limit in limits),
+        "waiting": sum(limit.waiting for limit in limits),
+        "acquired": acquired,
+        "queued": sum(limit.queued for limit in limits),
+        "avg_wait_ms": round(sum(limit.wait_ms for limit in limits) / acquired, 1) if acquired else 0.0,
+        "max_wait_ms": round(max(limit.max_wait_ms for limit in limits), 1),
+    }
+
+
+class ConcurrencyLimiter:
+    """Registry of named concurrency limits ("binary:oc", "cluster:stage", ...).
+
+    Limits are created on first use from DEFAULT_CONCURRENCY and the
+    "concurrency" section of config.json; names without a limit aren't
+    limited. Semaphores can't be shared across event loops, so each loop
+    gets its own set; limits of closed loops are dropped.
+    """
+
+    def __init__(self, config: dict | None = None):
+        self.config = {kind: dict(limits) for kind, limits in DEFAULT_CONCURRENCY.items()}
+        for kind, limits in (config or {}).items():
+            if kind in self.config and isinstance(limits, dict):
+                self.config[kind].update(limits)
+        self._limits: dict[asyncio.AbstractEventLoop, dict[str, ConcurrencyLimit]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, name: str) -> ConcurrencyLimit | None:
+        """Get the limit for a binary, cluster or GitLab host.
+
+        Args:
+            kind: "binaries", "clusters" or "gitlab_hosts"
+            name: Binary name, environment name or GitLab host
+
+        Returns:
+            The limit, or None if it isn't limited
+        """
+        limits = self.config.get(kind, {})
+        limit = limits.get(name, limits.get("default"))
+        if not limit or limit <= 0:
+            return None
+
+        loop = asyncio.get_running_loop()
+        key = f"{_CONCURRENCY_PREFIXES.get(kind, kind)}:{name}"
+        with self._lock:
+            loop_limits = self._limits.get(loop)
+            if loop_limits is None:
+                for closed in [other for other in self._limits if other.is_closed()]:
+                    del self._limits[closed]
+                loop_limits = self._limits[loop] = {}
+            if key not in loop_limits:
+                loop_limits[key] = ConcurrencyLimit(key, int(limit))
+            return loop_limits[key]
+
+    def hold(self, kind: str, name: str) -> contextlib.AbstractAsyncContextManager:
+        """Hold a slot of a limit for the duration of an ``async with`` block.
+
+        Unlimited names don't wait.
+        """
+        limit = self.get(kind, name)
+        return limit.hold() if limit else contextlib.nullcontext()
+
+    def stats(self) -> dict[str, dict]:
+        """Queue-wait and usage stats per limit used so far, summed over event loops."""
+        by_name: dict[str, list[ConcurrencyLimit]] = {}
+        with self._lock:
+            for loop_limits in self._limits.values():
+                for name, limit in loop_limits.items():
+                    by_name.setdefault(name, []).append(limit)
+        return {name: _combined_stats(limits) for name, limits in sorted(by_name.items())}
+
+
+_concurrency_limiter: ConcurrencyLimiter | None = None
+
+
+def get_concurrency_limiter() -> ConcurrencyLimiter:
+    """Get the concurrency limiter configured from config.json."""
+    global _concurrency_limiter
+    if _concurrency_limiter is None:
+        _concurrency_limiter = ConcurrencyLimiter(load_config().get("concurrency", {}))
+    return _concurrency_limiter
+
+
 # ==================== Command Execution ====================
 
 
+# Time a cancelled or timed-out command's process group gets to exit after
+# SIGTERM before it is sent SIGKILL
+TERMINATE_GRACE = 2.0
+
+
+def _signal_group(pgid: int, sig: int) -> bool:
+    """Send a signal to a process group; False if the group no longer exists."""
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _kill_process_group(proc: asyncio.subprocess.Process) -> None:
+    """Kill a process started with start_new_session=True and all its children."""
+    _signal_group(proc.pid, signal.SIGKILL)
+
+
+def _log_teardown(pid: int, killed: bool, elapsed: float) -> None:
+    if killed:
+        logger.warning(f"Process group {pid} ignored SIGTERM, killed after {elapsed * 1000:.0f}ms")
+    else:
+        logger.info(f"Process group {pid} exited on SIGTERM in {elapsed * 1000:.0f}ms")
+
+
+async def _terminate_process_group(proc: asyncio.subprocess.Process, grace: float | None = None) -> float:
+    """Stop a process started with start_new_session=True and all its children.
+
+    Sends SIGTERM to the whole process group, so grandchildren (bash ->
+    bonfire -> oc) can clean up too, then SIGKILL to whatever is left after
+    the grace period. Teardown time is logged and profiled.
+
+    Args:
+        proc: Process to stop
+        grace: Seconds to wait after SIGTERM (default: TERMINATE_GRACE)
+
+    Returns:
+        Seconds the teardown took
+    """
+    grace = TERMINATE_GRACE if grace is None else grace
+    start = time.monotonic()
+    killed = False
+    with profile_span("teardown", "subprocess", pid=proc.pid):
+        signalled = _signal_group(proc.pid, signal.SIGTERM)
+        if signalled:
+            deadline = start + grace
+            while _signal_group(proc.pid, 0) and time.monotonic() < deadline:
+                await asyncio.sleep(0.02)
+            killed = _signal_group(proc.pid, signal.SIGKILL)
+        try:
+            await asyncio.wait_for(proc.wait(), 5)
+        except asyncio.TimeoutError:
+            logger.warning(f"Process {proc.pid} did not exit after SIGKILL")
+    elapsed = time.monotonic() - start
+    if signalled:
+        _log_teardown(proc.pid, killed, elapsed)
+    return elapsed
+
+
+def _terminate_process_group_sync(proc: subprocess.Popen, grace: float | None = None) -> float:
+    """Synchronous _terminate_process_group() for run_cmd_sync()."""
+    grace = TERMINATE_GRACE if grace is None else grace
+    start = time.monotonic()
+    killed = False
+    signalled = _signal_group(proc.pid, signal.SIGTERM)
+    if signalled:
+        deadline = start + grace
+        while _signal_group(proc.pid, 0) and time.monotonic() < deadline:
+            proc.poll()  # Reap the leader, or it stays in the group as a zombie
+            time.sleep(0.02)
+        killed = _signal_group(proc.pid, signal.SIGKILL)
+    try:
+        proc.wait(5)
+    except subprocess.TimeoutExpired:
+        logger.warning(f"Process {proc.pid} did not exit after SIGKILL")
+    elapsed = time.monotonic() - start
+    if signalled:
+        _log_teardown(proc.pid, killed, elapsed)
+    return elapsed
+
+
+async def _run_process(
+    cmd: list[str],
+    cwd: str | None,
+    env: dict[str, str],
+    timeout: float | None,
+) -> tuple[int, str, str]:
+    """Run a process in its own session and collect its output.
+
+    The process gets its own process group, so a timeout or a cancelled
+    awaiting task (e.g. a skill step timeout) stops the command and anything
+    it spawned (bash -> kubectl, bonfire -> oc, ...) instead of leaving them
+    running in the background: SIGTERM first, SIGKILL after TERMINATE_GRACE.
+    The teardown finishes even if the task is cancelled again meanwhile.
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command ran longer than timeout
+        asyncio.CancelledError: If the awaiting task was cancelled
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        env=env,
+        start_new_session=True,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+        await asyncio.shield(asyncio.ensure_future(_terminate_process_group(proc)))
+        if isinstance(e, asyncio.TimeoutError):
+            raise subprocess.TimeoutExpired(cmd, timeout or 0) from None
+        raise
+
+    return proc.returncode or 0, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+async def _execute(
+    cmd: list[str],
+    cwd: str | None,
+    env: dict[str, str] | None,
+    timeout: float | None,
+    use_shell: bool,
+) -> tuple[int, str, str]:
+    """Run a command for run_cmd()/run_cmd_full().
+
+    Waits for a slot of the binary's concurrency limit, if it has one.
+    Commands that need bash (shell functions and aliases from the rc files)
+    run on the shell worker pool when one is configured; everything else is
+    exec'd directly.
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+    """
+    async with get_concurrency_limiter().hold("binaries", Path(cmd[0]).name):
+        if use_shell:
+            await _refresh_shell_environment()
+            from server.shell_pool import get_shell_pool
+
+            pool = get_shell_pool()
+            if pool is not None:
+                run_env = get_shell_environment()
+                if env:
+                    run_env.update(env)
+                if not shutil.which(cmd[0], path=run_env.get("PATH")):
+                    return await pool.run(cmd, cwd, env, timeout)
+
+        shell_cmd, run_env, run_cwd = _build_command(cmd, cwd, env, use_shell)
+        return await _run_process(shell_cmd, run_cwd, run_env, timeout)
+
+
 async def run_cmd(
     cmd: list[str],
     cwd: str | None = None,
@@ -494,6 +838,8 @@ async def run_cmd(
     - User's shell environment (~/.bashrc vars like JIRA_JPAT, KUBECONFIG)
     - Proper PATH with ~/bin
     - GUI access (DISPLAY, XAUTHORITY) for browser-based auth
+    - No more concurrent runs of a binary than its concurrency limit
+      (see get_concurrency_limiter())
 
     Args:
         cmd: Command and arguments as list
@@ -501,7 +847,8 @@ async def run_cmd(
         env: Additional environment variables (merged with shell env)
         timeout: Timeout in seconds
         check: Raise exception on non-zero exit
-        use_shell: If True (default), run through bash with sourced configs.
+        use_shell: If True (default), run with the environment of the user's shell
+                   (rc files sourced once, see get_shell_environment()).
                    Set to False only for simple commands that don't need shell env.
 
     Returns:
@@ -520,56 +867,22 @@ async def run_cmd(
         # Simple command that doesn't need shell (rare)
         success, output = await run_cmd(["git", "status"], use_shell=False)
     """
-    import shlex
-
     try:
-        home = Path.home()
+        with profile_span(f"subprocess {Path(cmd[0]).name}", "subprocess", cmd=" ".join(cmd)[:200]):
+            returncode, stdout, stderr = await _execute(cmd, cwd, env, timeout, use_shell)
 
-        if use_shell:
-            # Build command string with proper quoting
-            cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
-            if cwd:
-                cmd_str = f"cd {shlex.quote(cwd)} && {cmd_str}"
-
-            # Source shell configs
-            sources = _build_shell_sources(home)
-            if sources:
-                cmd_str = f"{'; '.join(sources)}; {cmd_str}"
-
-            shell_cmd = ["bash", "-c", cmd_str]
-            run_env = _prepare_shell_environment(home)
-            run_cwd = None  # cwd is handled in the command string
-        else:
-            shell_cmd = cmd
-            run_env = os.environ.copy()
-            run_cwd = cwd
-
-        # Merge any additional env vars
-        if env:
-            run_env.update(env)
-
-        result = await asyncio.to_thread(
-            subprocess.run,
-            shell_cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=run_cwd,
-            env=run_env,
-        )
-
-        output = result.stdout
-        if result.returncode != 0:
-            output = result.stderr or result.stdout or "Command failed"
+        output = stdout
+        if returncode != 0:
+            output = stderr or stdout or "Command failed"
             if check:
-                raise subprocess.CalledProcessError(result.returncode, cmd, output)
+                raise subprocess.CalledProcessError(returncode, cmd, output)
             return False, output
 
         return True, output
     except subprocess.TimeoutExpired:
         return False, f"Command timed out after {timeout}s"
     except FileNotFoundError:
-        return False, f"Command not found: {cmd[0]}"
+        return False, _not_found_message(cmd, cwd)
     except subprocess.CalledProcessError:
         raise
     except Exception as e:
@@ -592,51 +905,20 @@ async def run_cmd_full(
         cwd: Working directory
         env: Additional environment variables (merged with shell env)
         timeout: Timeout in seconds
-        use_shell: If True (default), run through bash with sourced configs.
+        use_shell: If True (default), run with the user's shell environment.
 
     Returns:
         Tuple of (success, stdout, stderr)
     """
-    import shlex
-
     try:
-        home = Path.home()
-
-        if use_shell:
-            cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
-            if cwd:
-                cmd_str = f"cd {shlex.quote(cwd)} && {cmd_str}"
-
-            sources = _build_shell_sources(home)
-            if sources:
-                cmd_str = f"{'; '.join(sources)}; {cmd_str}"
-
-            shell_cmd = ["bash", "-c", cmd_str]
-            run_env = _prepare_shell_environment(home)
-            run_cwd = None
-        else:
-            shell_cmd = cmd
-            run_env = os.environ.copy()
-            run_cwd = cwd
-
-        if env:
-            run_env.update(env)
-
-        result = await asyncio.to_thread(
-            subprocess.run,
-            shell_cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=run_cwd,
-            env=run_env,
-        )
+        with profile_span(f"subprocess {Path(cmd[0]).name}", "subprocess", cmd=" ".join(cmd)[:200]):
+            returncode, stdout, stderr = await _execute(cmd, cwd, env, timeout, use_shell)
 
-        return result.returncode == 0, result.stdout, result.stderr
+        return returncode == 0, stdout, stderr
     except subprocess.TimeoutExpired:
         return False, "", f"Command timed out after {timeout}s"
     except FileNotFoundError:
-        return False, "", f"Command not found: {cmd[0]}"
+        return False, "", _not_found_message(cmd, cwd)
     except Exception as e:
         return False, "", str(e)
 
@@ -657,78 +939,62 @@ def run_cmd_sync(
         cwd: Working directory
         env: Additional environment variables (merged with shell env)
         timeout: Timeout in seconds
-        use_shell: If True (default), run through bash with sourced configs.
+        use_shell: If True (default), run with the user's shell environment.
 
     Returns:
         Tuple of (success, output) - stderr is merged with stdout on failure
     """
-    import shlex
-
     try:
-        home = Path.home()
+        shell_cmd, run_env, run_cwd = _build_command(cmd, cwd, env, use_shell)
 
-        if use_shell:
-            cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
-            if cwd:
-                cmd_str = f"cd {shlex.quote(cwd)} && {cmd_str}"
-
-            sources = _build_shell_sources(home)
-            if sources:
-                cmd_str = f"{'; '.join(sources)}; {cmd_str}"
-
-            shell_cmd = ["bash", "-c", cmd_str]
-            run_env = _prepare_shell_environment(home)
-            run_cwd = None
-        else:
-            shell_cmd = cmd
-            run_env = os.environ.copy()
-            run_cwd = cwd
-
-        if env:
-            run_env.update(env)
-
-        result = subprocess.run(
+        with subprocess.Popen(
             shell_cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout,
             cwd=run_cwd,
             env=run_env,
-        )
-
-        output = result.stdout
-        if result.returncode != 0:
-            output = result.stderr or result.stdout or "Command failed"
+            start_new_session=True,
+        ) as proc:
+            try:
+                stdout, stderr = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                _terminate_process_group_sync(proc)
+                raise
+
+        output = stdout
+        if proc.returncode != 0:
+            output = stderr or stdout or "Command failed"
             return False, output
 
         return True, output
     except subprocess.TimeoutExpired:
         return False, f"Command timed out after {timeout}s"
     except FileNotFoundError:
-        return False, f"Command not found: {cmd[0]}"
+        return False, _not_found_message(cmd, cwd)
     except Exception as e:
         return False, str(e)
 
 
-def _build_shell_sources(home: Path) -> list[str]:
-    """Build list of shell config source commands.
+def _shell_rc_files(home: Path) -> list[Path]:
+    """Shell config files sourced before running a command, in order.
 
     Args:
         home: User home directory
 
     Returns:
-        List of source commands for bash configs
+        Existing rc files
     """
-    sources = []
+    files = []
 
     bashrc = home / ".bashrc"
     if bashrc.exists():
-        sources.append(f"source {bashrc} 2>/dev/null")
+        files.append(bashrc)
 
     # Source the bashrc.d loader which loads all scripts.d/*.sh files
     bashrc_d_loader = home / ".bashrc.d" / "00-loader.sh"
     if bashrc_d_loader.exists():
-        sources.append(f"source {bashrc_d_loader} 2>/dev/null")
+        files.append(bashrc_d_loader)
 
     # IMPORTANT: Also source all .sh files in bashrc.d root directly
     # These define functions like 'kube' for kubernetes auth
@@ -738,9 +1004,21 @@ def _build_shell_sources(home: Path) -> list[str]:
     if bashrc_d.is_dir():
         for script in sorted(bashrc_d.glob("*.sh")):
             if script.name != "00-loader.sh":  # Already sourced above
-                sources.append(f"source {script} 2>/dev/null")
+                files.append(script)
 
-    return sources
+    return files
+
+
+def _build_shell_sources(home: Path) -> list[str]:
+    """Build list of shell config source commands.
+
+    Args:
+        home: User home directory
+
+    Returns:
+        List of source commands for bash configs
+    """
+    return [f"source {path} 2>/dev/null" for path in _shell_rc_files(home)]
 
 
 def _prepare_shell_environment(home: Path) -> dict[str, str]:
@@ -800,6 +1078,513 @@ def _prepare_shell_environment(home: Path) -> dict[str, str]:
     return env
 
 
+# ==================== Shell Environment Snapshot ====================
+
+# Sourcing ~/.bashrc and ~/.bashrc.d/* takes hundreds of milliseconds, so
+# instead of doing it for every command, the environment it produces is
+# captured once (env -0 after sourcing) and commands are exec'd directly with
+# it. The snapshot is kept in memory only (it holds tokens like JIRA_JPAT) and
+# is captured again when any rc file changes. If bash fails, commands use the
+# environment without rc files until a retry SHELL_ENV_RETRY_SECONDS later.
+
+SHELL_ENV_TIMEOUT = 30
+SHELL_ENV_RETRY_SECONDS = 10
+
+# Variables describing the capturing bash process itself, not the user's shell
+_SHELL_ENV_EXCLUDE = {"_", "PWD", "OLDPWD", "SHLVL"}
+
+_shell_env: tuple[tuple, dict[str, str]] | None = None  # (rc signature, env)
+_shell_env_failure: tuple[tuple, float, dict[str, str]] | None = None  # (rc signature, time, fallback env)
+_shell_env_lock = threading.Lock()
+
+
+def _shell_rc_signature(home: Path) -> tuple:
+    """(path, mtime_ns, size) of every rc file, including the loader's scripts.d/*.sh."""
+    files = _shell_rc_files(home)
+    scripts_d = home / ".bashrc.d" / "scripts.d"
+    if scripts_d.is_dir():
+        files.extend(sorted(scripts_d.glob("*.sh")))
+
+    signature = []
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _capture_shell_environment(home: Path, base_env: dict[str, str]) -> dict[str, str] | None:
+    """Source the rc files in bash and capture the resulting environment.
+
+    Anything the rc files print comes before a random marker, and only the
+    env -0 output after it is parsed.
+
+    Returns:
+        The environment, or None if bash failed
+    """
+    sources = _build_shell_sources(home)
+    if not sources:
+        return base_env
+
+    marker = secrets.token_hex(16)
+    try:
+        result = subprocess.run(
+            ["bash", "-c", "; ".join([*sources, f"printf '\\0%s\\0' {marker}", "env -0"])],
+            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            env=base_env,
+            timeout=SHELL_ENV_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"Could not capture shell environment: {e}")
+        return None
+    if result.returncode != 0:
+        logger.warning(f"Could not capture shell environment: exit {result.returncode}")
+        return None
+    _, found, env_output = result.stdout.partition(f"\0{marker}\0".encode())
+    if not found:
+        logger.warning("Could not capture shell environment: no output from env")
+        return None
+
+    env = {}
+    for entry in env_output.split(b"\0"):
+        name, sep, value = entry.partition(b"=")
+        if sep and name:
+            env[name.decode(errors="replace")] = value.decode(errors="replace")
+    for name in _SHELL_ENV_EXCLUDE:
+        env.pop(name, None)
+    return env
+
+
+def _shell_environment_fresh(home: Path) -> bool:
+    """Whether the snapshot was captured from the current rc files."""
+    snapshot = _shell_env
+    return snapshot is not None and snapshot[0] == _shell_rc_signature(home)
+
+
+def get_shell_environment(home: Path | None = None) -> dict[str, str]:
+    """Get the user's shell environment (after sourcing rc files).
+
+    Captured on first use and again whenever an rc file changes. If the
+    capture fails, the environment without rc files is used and the capture
+    is retried SHELL_ENV_RETRY_SECONDS later.
+
+    Args:
+        home: User home directory (default: current user's)
+
+    Returns:
+        Copy of the environment, safe to modify
+    """
+    global _shell_env, _shell_env_failure
+    home = home or Path.home()
+    with _shell_env_lock:
+        signature = _shell_rc_signature(home)
+        if _shell_env is not None and _shell_env[0] == signature:
+            return dict(_shell_env[1])
+
+        failure = _shell_env_failure
+        if failure is not None and failure[0] == signature and time.monotonic() - failure[1] < SHELL_ENV_RETRY_SECONDS:
+            return dict(failure[2])
+
+        start = time.monotonic()
+        base_env = _prepare_shell_environment(home)
+        env = _capture_shell_environment(home, base_env)
+        if env is None:
+            _shell_env_failure = (signature, time.monotonic(), base_env)
+            return dict(base_env)
+        _shell_env, _shell_env_failure = (signature, env), None
+        logger.debug(f"Captured shell environment in {(time.monotonic() - start) * 1000:.0f}ms")
+        return dict(env)
+
+
+def invalidate_shell_environment() -> None:
+    """Drop the snapshot, so the next command captures the environment again."""
+    global _shell_env, _shell_env_failure
+    with _shell_env_lock:
+        _shell_env = _shell_env_failure = None
+
+
+async def _refresh_shell_environment() -> None:
+    """Capture the environment in a thread if it's stale, keeping the event loop free."""
+    if not _shell_environment_fresh(Path.home()):
+        await asyncio.to_thread(get_shell_environment)
+
+
+def _build_command(
+    cmd: list[str],
+    cwd: str | None,
+    env: dict[str, str] | None,
+    use_shell: bool,
+) -> tuple[list[str], dict[str, str], str | None]:
+    """Build what to exec for a command.
+
+    With use_shell, the command runs directly with the shell environment
+    snapshot. Commands that aren't executables on its PATH (functions or
+    aliases from the rc files, like 'kube') run through bash with the rc
+    files sourced.
+
+    Args:
+        cmd: Command and arguments as list
+        cwd: Working directory
+        env: Additional environment variables (merged with shell env)
+        use_shell: Use the user's shell environment
+
+    Returns:
+        Tuple of (command to exec, environment, working directory)
+    """
+    import shlex
+
+    if not use_shell:
+        run_env = os.environ.copy()
+        if env:
+            run_env.update(env)
+        return cmd, run_env, cwd
+
+    home = Path.home()
+    run_env = get_shell_environment(home)
+    if env:
+        run_env.update(env)
+
+    executable = shutil.which(cmd[0], path=run_env.get("PATH"))
+    if executable:
+        return [executable, *cmd[1:]], run_env, cwd
+
+    cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
+    if cwd:
+        cmd_str = f"cd {shlex.quote(cwd)} && {cmd_str}"
+    sources = _build_shell_sources(home)
+    if sources:
+        cmd_str = f"{'; '.join(sources)}; {cmd_str}"
+    return ["bash", "-c", cmd_str], run_env, None  # cwd is handled in the command string
+
+
+def _not_found_message(cmd: list[str], cwd: str | None) -> str:
+    """Error for a FileNotFoundError from exec: missing command or missing cwd."""
+    if cwd and not os.path.isdir(cwd):
+        return f"Directory not found: {cwd}"
+    return f"Command not found: {cmd[0]}"
+
+
+# ==================== Streaming Command Output ====================
+
+STREAM_READ_SIZE = 65536
+
+# Longer lines are split, so a runaway line can't grow the read buffer
+STREAM_MAX_LINE = 1024 * 1024
+
+# Characters of stderr kept (the end) when streaming
+STREAM_STDERR_LENGTH = 5000
+
+
+class OutputBuffer:
+    """Bounded buffer of output lines, keeping the head, the tail or both.
+
+    Holds about max_length characters however much output is added, so a
+    multi-hundred-MB log costs no more memory than the part that is kept.
+
+    Args:
+        max_length: Maximum characters kept
+        mode: "head" keeps the first lines, "tail" keeps the last lines (as
+              in truncate_output()), "both" keeps half of each
+        line_filter: Only lines (without their newline) for which this
+                     returns True are kept
+    """
+
+    def __init__(
+        self,
+        max_length: int = 20000,
+        mode: str = "tail",
+        line_filter: Callable[[str], bool] | None = None,
+    ):
+        if mode not in ("head", "tail", "both"):
+            raise ValueError(f"Invalid mode: {mode!r} (expected head, tail or both)")
+        self.mode = mode
+        self.line_filter = line_filter
+        self.head_limit = {"head": max_length, "tail": 0, "both": max_length // 2}[mode]
+        self.tail_limit = max_length - self.head_limit
+        self._head: list[str] = []
+        self._head_length = 0
+        self._head_full = self.head_limit == 0
+        self._tail: deque[str] = deque()
+        self._tail_length = 0
+        self.lines = 0  # Lines that passed the filter
+        self.dropped = 0  # Of those, lines not kept
+        self.truncated = False
+
+    def add(self, line: str) -> None:
+        """Add a line (with its newline, if any)."""
+        self.extend([line])
+
+    def extend(self, lines: list[str]) -> None:
+        """Add lines (with their newlines, if any).
+
+        Once the head is full, only the lines that can still end up in the
+        tail are looked at, so adding a large batch costs little more than
+        the part of it that is kept.
+        """
+        if self.line_filter is not None:
+            lines = [line for line in lines if self.line_filter(line.rstrip("\n"))]
+        self.lines += len(lines)
+
+        index = 0
+        while not self._head_full and index < len(lines) and self._add_head(lines[index]):
+            index += 1
+        if index == len(lines):
+            return
+        if self.tail_limit == 0:
+            self.dropped += len(lines) - index
+            self.truncated = True
+            return
+
+        start = len(lines)
+        length = 0
+        while start > index and length <= self.tail_limit:
+            start -= 1
+            length += len(lines[start])
+        if start > index:
+            self.dropped += start - index
+            self.truncated = True
+        for line in lines[start:]:
+            self._add_tail(line)
+
+    def _add_head(self, line: str) -> bool:
+        """Add a line to the head; False once it doesn't fit."""
+        if self._head_length + len(line) <= self.head_limit:
+            self._head.append(line)
+            self._head_length += len(line)
+            return True
+        self._head_full = True
+        if self._head:
+            return False
+        # A first line longer than the head
+        room = self.head_limit
+        self._head.append(line[0:room])
+        self._head_length = room
+        self.truncated = True
+        return True
+
+    def _add_tail(self, line: str) -> None:
+        overflow = len(line) - self.tail_limit
+        if overflow > 0:
+            line = line[overflow:]
+            self.truncated = True
+        self._tail.append(line)
+        self._tail_length += len(line)
+        while self._tail_length > self.tail_limit:
+            self._tail_length -= len(self._tail.popleft())
+            self.dropped += 1
+            self.truncated = True
+
+    def text(self) -> str:
+        """The kept output, with a note where lines were dropped."""
+        head = "".join(self._head)
+        tail = "".join(self._tail)
+        if not self.truncated:
+            return head + tail
+        note = f"... (truncated, {self.dropped} of {self.lines} lines not shown)"
+        if self.mode == "head":
+            return f"{head}\n\n{note}"
+        if self.mode == "tail":
+            return f"{note}\n\n{tail}"
+        return f"{head}\n\n{note}\n\n{tail}"
+
+
+class CommandStream:
+    """A running command whose stdout is read line by line (see stream_cmd()).
+
+    Iterate with ``async for line in stream`` (lines keep their newline),
+    or over ``stream.batches()`` for a list of lines per read, which is
+    much cheaper for large output. After iteration, returncode is set and
+    stderr holds the end of stderr.
+    """
+
+    def __init__(self, proc: asyncio.subprocess.Process, cmd: list[str], timeout: float | None):
+        self.proc = proc
+        self.cmd = cmd
+        self.timeout = timeout
+        self.returncode: int | None = None
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self._stderr = OutputBuffer(STREAM_STDERR_LENGTH, mode="tail")
+        self._stderr_task = asyncio.create_task(self._drain_stderr())
+
+    @property
+    def stderr(self) -> str:
+        return self._stderr.text()
+
+    def _remaining(self) -> float | None:
+        """Seconds left before the timeout.
+
+        Raises:
+            subprocess.TimeoutExpired: If the timeout has passed
+        """
+        if self._deadline is None:
+            return None
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(self.cmd, self.timeout or 0)
+        return remaining
+
+    async def _read_lines(self, reader: asyncio.StreamReader, deadline: bool) -> AsyncIterator[list[str]]:
+        """Read a stream, yielding the complete lines of each read."""
+        pending = bytearray()
+        while True:
+            if deadline:
+                try:
+                    chunk = await asyncio.wait_for(reader.read(STREAM_READ_SIZE), self._remaining())
+                except asyncio.TimeoutError:
+                    raise subprocess.TimeoutExpired(self.cmd, self.timeout or 0) from None
+            else:
+                chunk = await reader.read(STREAM_READ_SIZE)
+            if not chunk:
+                break
+            pending += chunk
+            cut = pending.rfind(b"\n") + 1
+            if cut:
+                lines = pending[:cut].decode(errors="replace").split("\n")
+                lines.pop()  # Empty, after the last newline
+                yield [line + "\n" for line in lines]
+                del pending[:cut]
+            if len(pending) >= STREAM_MAX_LINE:
+                yield [pending.decode(errors="replace")]
+                pending.clear()
+        if pending:
+            yield [pending.decode(errors="replace")]
+
+    async def _drain_stderr(self) -> None:
+        async for lines in self._read_lines(cast(asyncio.StreamReader, self.proc.stderr), deadline=False):
+            self._stderr.extend(lines)
+
+    async def batches(self) -> AsyncIterator[list[str]]:
+        """Iterate over stdout a list of lines at a time.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command ran longer than its timeout
+        """
+        async for lines in self._read_lines(cast(asyncio.StreamReader, self.proc.stdout), deadline=True):
+            yield lines
+        await self._stderr_task
+        try:
+            self.returncode = await asyncio.wait_for(self.proc.wait(), self._remaining())
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(self.cmd, self.timeout or 0) from None
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        async for lines in self.batches():
+            for line in lines:
+                yield line
+
+    async def close(self) -> None:
+        """Stop the command and its children if still running (see _terminate_process_group())."""
+        if self.proc.returncode is None:
+            await asyncio.shield(asyncio.ensure_future(_terminate_process_group(self.proc)))
+        if not self._stderr_task.done():
+            self._stderr_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._stderr_task
+
+
+@contextlib.asynccontextmanager
+async def stream_cmd(
+    cmd: list[str],
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+    timeout: int | None = 300,
+    use_shell: bool = True,
+) -> AsyncIterator[CommandStream]:
+    """Run a command and read its stdout as it is produced.
+
+    Same environment handling and concurrency limits as run_cmd(). Leaving
+    the block stops the command (and its process group) if it is still
+    running, so callers can stop reading early.
+
+    Args:
+        cmd: Command and arguments as list
+        cwd: Working directory
+        env: Additional environment variables (merged with shell env)
+        timeout: Timeout in seconds for the whole command
+        use_shell: If True (default), run with the user's shell environment.
+
+    Yields:
+        CommandStream to iterate over
+
+    Raises:
+        FileNotFoundError: If the command doesn't exist
+        subprocess.TimeoutExpired: While iterating, if the command ran longer than timeout
+
+    Example:
+        async with stream_cmd(["kubectl", "logs", "-f", pod]) as stream:
+            async for line in stream:
+                if "Traceback" in line:
+                    break
+    """
+    async with get_concurrency_limiter().hold("binaries", Path(cmd[0]).name):
+        if use_shell:
+            await _refresh_shell_environment()
+        shell_cmd, run_env, run_cwd = _build_command(cmd, cwd, env, use_shell)
+        proc = await asyncio.create_subprocess_exec(
+            *shell_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=run_cwd,
+            env=run_env,
+            start_new_session=True,
+        )
+        stream = CommandStream(proc, cmd, timeout)
+        try:
+            yield stream
+        finally:
+            await stream.close()
+
+
+async def run_cmd_bounded(
+    cmd: list[str],
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+    timeout: int = 300,
+    use_shell: bool = True,
+    max_length: int = 20000,
+    mode: str = "tail",
+    line_filter: Callable[[str], bool] | None = None,
+) -> tuple[bool, str]:
+    """Run a command, keeping at most max_length characters of its output.
+
+    Use this instead of run_cmd() + truncate_output() for commands that can
+    print a lot (logs, CI traces): output is streamed into an OutputBuffer,
+    so memory stays bounded however much the command prints.
+
+    Args:
+        cmd: Command and arguments as list
+        cwd: Working directory
+        env: Additional environment variables (merged with shell env)
+        timeout: Timeout in seconds
+        use_shell: If True (default), run with the user's shell environment.
+        max_length: Maximum characters of output kept
+        mode: "head", "tail" (default) or "both" (see OutputBuffer)
+        line_filter: Only keep lines for which this returns True
+
+    Returns:
+        Tuple of (success, output) - the end of stderr on failure, like run_cmd()
+    """
+    output = OutputBuffer(max_length, mode, line_filter)
+    try:
+        with profile_span(f"subprocess {Path(cmd[0]).name}", "subprocess", cmd=" ".join(cmd)[:200]):
+            async with stream_cmd(cmd, cwd, env, timeout, use_shell) as stream:
+                async for lines in stream.batches():
+                    output.extend(lines)
+
+        if stream.returncode != 0:
+            return False, stream.stderr or output.text() or "Command failed"
+        return True, output.text()
+    except subprocess.TimeoutExpired:
+        return False, f"Command timed out after {timeout}s"
+    except FileNotFoundError:
+        return False, _not_found_message(cmd, cwd)
+    except Exception as e:
+        return False, str(e)
+
+
 async def run_cmd_shell(
     cmd: list[str],
     cwd: str | None = None,
@@ -869,6 +1654,7 @@ async def run_kubectl(
     timeout: int = 60,
     environment: str | None = None,
     auto_auth: bool = True,
+    max_length: int = 0,
 ) -> tuple[bool, str]:
     """Run kubectl command with proper kubeconfig.
 
@@ -880,6 +1666,8 @@ async def run_kubectl(
         environment: Environment name (used if kubeconfig not provided)
         auto_auth: If True, check and refresh auth before running (default: True)
                    Opens browser for SSO if credentials are stale.
+        max_length: If set, stream the output and keep only its last max_length
+                    characters (for logs)
 
     Returns:
         Tuple of (success, output)
@@ -915,10 +1703,15 @@ async def run_kubectl(
     if namespace:
         cmd.extend(["-n", namespace])
 
-    success, output = await run_cmd(cmd, timeout=timeout)
+    async with get_concurrency_limiter().hold("clusters", resolved_env or "default"):
+        if max_length:
+            success, output = await run_cmd_bounded(cmd, timeout=timeout, max_length=max_length, mode="tail")
+        else:
+            success, output = await run_cmd(cmd, timeout=timeout)
 
     # Add hint on auth failures (even though we pre-checked, token could expire mid-operation)
     if not success and is_auth_error(output) and resolved_env:
+        invalidate_cluster_auth(resolved_env)
         hint = get_auth_hint(resolved_env)
         output = f"{output}\n\n{hint}"
 
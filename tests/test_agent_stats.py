@@ -0,0 +1,103 @@
+"""Tests for buffered agent stats persistence."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+AGENT_STATS_FILE = Path(__file__).parent.parent / "tool_modules" / "aa_workflow" / "src" / "agent_stats.py"
+
+
+@pytest.fixture
+def agent_stats(tmp_path, monkeypatch):
+    """Load agent_stats.py directly, persisting under tmp_path."""
+    spec = importlib.util.spec_from_file_location("agent_stats", AGENT_STATS_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "STATS_FILE", tmp_path / "agent_stats.json")
+    monkeypatch.setattr(module, "STATS_DIR", tmp_path)
+    yield module
+    # Drop pending changes so the exit-time flush doesn't write outside tmp_path
+    if module._stats is not None:
+        if module._stats._flush_timer is not None:
+            module._stats._flush_timer.cancel()
+        module._stats._dirty = 0
+
+
+class TestBufferedPersistence:
+    """Tests for debounced stats writes."""
+
+    def test_records_are_not_written_immediately(self, agent_stats):
+        agent_stats.record_tool_call("jira_view_issue", True, 120)
+        agent_stats.record_memory_read("state/current_work")
+        assert not agent_stats.STATS_FILE.exists()
+
+        stats = agent_stats.get_agent_stats()
+        assert stats.get_lifetime_stats()["tool_calls"] == 1
+        assert stats._flush_timer is not None
+
+    def test_flush_writes_pending_changes(self, agent_stats):
+        agent_stats.record_tool_call("jira_view_issue", True, 120)
+        stats = agent_stats.get_agent_stats()
+        assert stats.flush() is True
+        assert stats._flush_timer is None
+
+        saved = json.loads(agent_stats.STATS_FILE.read_text())
+        assert saved["tools"]["jira_view_issue"]["calls"] == 1
+        assert stats.flush() is False  # Nothing pending
+
+    def test_threshold_triggers_flush(self, agent_stats, monkeypatch):
+        monkeypatch.setattr(agent_stats, "FLUSH_THRESHOLD", 3)
+        stats = agent_stats.get_agent_stats()
+        for _ in range(3):
+            agent_stats.record_memory_write()
+        stats._flush_timer.join(timeout=2)
+
+        saved = json.loads(agent_stats.STATS_FILE.read_text())
+        assert saved["lifetime"]["memory_writes"] == 3
+        assert stats._dirty == 0
+
+    def test_timer_flush(self, agent_stats, monkeypatch):
+        monkeypatch.setattr(agent_stats, "FLUSH_INTERVAL", 0.05)
+        agent_stats.record_skill_execution("coffee", True, 1000)
+        agent_stats.get_agent_stats()._flush_timer.join(timeout=2)
+
+        saved = json.loads(agent_stats.STATS_FILE.read_text())
+        assert saved["skills"]["coffee"]["executions"] == 1
+
+    def test_flush_agent_stats_without_instance(self, agent_stats):
+        agent_stats.flush_agent_stats()
+        assert not agent_stats.STATS_FILE.exists()
+
+
+class TestLatency:
+    """Tests for latency histograms in agent stats."""
+
+    def test_latency_recorded_per_tool_and_day(self, agent_stats):
+        for ms in (10, 20, 3000):
+            agent_stats.record_tool_call("jira_view_issue", True, ms)
+        stats = agent_stats.get_agent_stats()
+
+        lifetime = stats.get_latency_report("tools")
+        assert lifetime["jira_view_issue"]["count"] == 3
+        assert lifetime["jira_view_issue"]["p99"] > 2000
+        assert stats.get_latency_report("tools", days=1) == lifetime
+        assert stats.get_today_stats()["tool_latency"]["jira_view_issue"]
+
+    def test_days_merge_daily_histograms(self, agent_stats):
+        agent_stats.record_skill_execution("coffee", True, 1000)
+        stats = agent_stats.get_agent_stats()
+        stats._stats["daily"]["2000-01-01"] = {"skill_latency": {"coffee": [0, 5]}}
+        assert stats.get_latency_report("skills", days=1)["coffee"]["count"] == 1
+        assert stats.get_latency_report("skills")["coffee"]["count"] == 1
+
+    def test_summary_includes_top_tool_latency(self, agent_stats):
+        agent_stats.record_tool_call("gitlab_mr_list", True, 250)
+        summary = agent_stats.get_agent_stats().get_summary()
+        assert summary["tool_latency"]["gitlab_mr_list"]["count"] == 1
+        assert summary["skill_latency"] == {}
+
+    def test_invalid_kind(self, agent_stats):
+        with pytest.raises(ValueError):
+            agent_stats.get_agent_stats().get_latency_report("memory")
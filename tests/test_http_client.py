@@ -1,6 +1,16 @@
 """Tests for server.http_client module."""
 
-from server.http_client import APIClient, alertmanager_client, kibana_client, prometheus_client, quay_client
+import asyncio
+
+from server.http_client import (
+    APIClient,
+    alertmanager_client,
+    get_shared_client,
+    kibana_client,
+    prometheus_client,
+    quay_client,
+    warm_connections,
+)
 
 
 class TestAPIClient:
@@ -74,3 +84,58 @@ class TestFactoryFunctions:
 
         client_with_token = quay_client("my-token")
         assert client_with_token.bearer_token == "my-token"
+
+
+class TestSharedPool:
+    """Tests for the shared connection pool and warm-up."""
+
+    async def test_clients_share_pool(self):
+        client = APIClient(base_url="https://example.com")
+        shared = await client._get_client()
+        assert shared is get_shared_client()
+        await client.close()
+        assert not shared.is_closed
+
+        private = APIClient(base_url="https://example.com", shared=False)
+        own = await private._get_client()
+        assert own is not shared
+        await private.close()
+        assert own.is_closed
+
+    async def test_warmed_connection_reused(self):
+        connections = []
+
+        async def handle(reader, writer):
+            connections.append(writer)
+            try:
+                while request := await reader.readuntil(b"\r\n\r\n"):
+                    body = b"" if request.startswith(b"HEAD") else b"{}"
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n" + body
+                    )
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, asyncio.CancelledError, ConnectionError):
+                pass
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            origin = f"http://127.0.0.1:{port}"
+            assert await warm_connections([f"{origin}/api/v1", origin]) == {origin: True}
+            assert len(connections) == 1
+
+            client = APIClient(base_url=f"{origin}/api/v1")
+            assert await client.get("/query") == (True, {})
+            assert len(connections) == 1
+        finally:
+            for writer in connections:
+                writer.close()
+            server.close()
+            await server.wait_closed()
+
+    async def test_warm_unreachable(self):
+        server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        server.close()
+        await server.wait_closed()
+        assert await warm_connections([f"http://127.0.0.1:{port}"], timeout=1) == {f"http://127.0.0.1:{port}": False}
@@ -0,0 +1,185 @@
+"""Tests for the shared known-issues matcher."""
+
+import os
+
+import pytest
+import yaml
+
+from scripts.common.known_issues import (
+    AhoCorasick,
+    KnownIssuesMatcher,
+    PatternUsageStats,
+    check_known_issues,
+    format_known_issues,
+)
+
+PATTERNS_YAML = """
+auth_patterns:
+  - pattern: No route to host
+    meaning: Cannot reach internal cluster
+    fix: Connect to VPN
+    commands: [vpn_connect()]
+  - pattern: token expired
+    fix: Refresh credentials
+error_patterns:
+  - pattern: route to
+    fix: Check networking
+  - pattern: bonfire
+    fix: Tool name pattern
+jira_cli_patterns:
+  - pattern: Issue does not exist
+    description: Wrong key
+    solution: Check the key
+notes: "not a pattern list"
+"""
+
+TOOL_FIXES_YAML = """
+tool_fixes:
+  - tool_name: bonfire_deploy
+    error_pattern: manifest unknown
+    fix_applied: Use full SHA
+  - tool_name: quay_get_tag
+    error_pattern: manifest unknown
+    fix_applied: Check tag
+  - tool_name: bonfire_deploy
+    error_pattern: timed out
+    fix_applied: Increase timeout
+"""
+
+
+@pytest.fixture
+def learned_dir(tmp_path):
+    """Create a learned directory with patterns and tool fixes."""
+    (tmp_path / "patterns.yaml").write_text(PATTERNS_YAML)
+    (tmp_path / "tool_fixes.yaml").write_text(TOOL_FIXES_YAML)
+    return tmp_path
+
+
+class TestAhoCorasick:
+    """Tests for the keyword automaton."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("ushers", {"he", "she", "hers"}),
+            ("his", {"his"}),
+            ("hxs", set()),
+            ("", set()),
+        ],
+    )
+    def test_find(self, text, expected):
+        assert AhoCorasick(["he", "she", "his", "hers", ""]).find(text) == expected
+
+    def test_overlapping_suffixes(self):
+        automaton = AhoCorasick(["abcd", "bc", "c"])
+        assert automaton.find("xabcx") == {"bc", "c"}
+        assert automaton.find("abcd") == {"abcd", "bc", "c"}
+
+
+class TestKnownIssuesMatcher:
+    """Tests for pattern and tool fix lookups."""
+
+    def test_patterns_in_category_order(self, learned_dir):
+        matcher = KnownIssuesMatcher(learned_dir)
+        matches = matcher.match_patterns("ssh: NO ROUTE TO HOST", categories=("auth_patterns", "error_patterns"))
+        assert [(c, p["pattern"]) for c, p in matches] == [
+            ("auth_patterns", "No route to host"),
+            ("error_patterns", "route to"),
+        ]
+        matches = matcher.match_patterns("no route to host", categories=("error_patterns", "auth_patterns"))
+        assert [c for c, _ in matches] == ["error_patterns", "auth_patterns"]
+
+    def test_tool_name_matches_patterns(self, learned_dir):
+        matcher = KnownIssuesMatcher(learned_dir)
+        matches = matcher.match_patterns("", "bonfire_deploy", categories=("error_patterns",))
+        assert [p["fix"] for _, p in matches] == ["Tool name pattern"]
+
+    def test_unlisted_categories_ignored(self, learned_dir):
+        matcher = KnownIssuesMatcher(learned_dir)
+        assert matcher.match_patterns("Issue does not exist") == []
+        assert matcher.match_patterns("Issue does not exist", categories=("jira_cli_patterns",))
+
+    def test_tool_fixes_by_tool_and_error(self, learned_dir):
+        matcher = KnownIssuesMatcher(learned_dir)
+        fixes = matcher.match_tool_fixes("bonfire_deploy", "")
+        assert [f["fix_applied"] for f in fixes] == ["Use full SHA", "Increase timeout"]
+
+        fixes = matcher.match_tool_fixes("bonfire_deploy", "Error: manifest unknown")
+        assert [f["fix_applied"] for f in fixes] == ["Use full SHA", "Check tag", "Increase timeout"]
+
+        fixes = matcher.match_tool_fixes("", "MANIFEST UNKNOWN")
+        assert [f["fix_applied"] for f in fixes] == ["Use full SHA", "Check tag"]
+
+    def test_reload_on_change(self, learned_dir):
+        matcher = KnownIssuesMatcher(learned_dir)
+        assert matcher.match_patterns("quota exceeded") == []
+        index = matcher._get_index()
+        assert matcher._get_index() is index  # Unchanged files are not re-parsed
+
+        path = learned_dir / "patterns.yaml"
+        path.write_text(PATTERNS_YAML + "pipeline_patterns:\n  - pattern: quota exceeded\n")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+        assert [c for c, _ in matcher.match_patterns("quota exceeded")] == ["pipeline_patterns"]
+
+    def test_missing_files(self, tmp_path):
+        matcher = KnownIssuesMatcher(tmp_path)
+        assert matcher.match_patterns("anything") == []
+        assert matcher.match_tool_fixes("bonfire_deploy", "anything") == []
+
+
+class TestPatternUsageStats:
+    """Tests for batched pattern usage counters."""
+
+    def test_counts_written_on_flush(self, learned_dir):
+        stats = PatternUsageStats(learned_dir)
+        path = learned_dir / "patterns.yaml"
+        stats.record("auth_patterns", "No Route To Host")
+        stats.record("auth_patterns", "no route to host")
+        stats.record("auth_patterns", "no route to host", matched=False, fixed=True)
+        stats.record("auth_patterns", "unknown pattern")
+        assert path.read_text() == PATTERNS_YAML  # Nothing written until a flush
+
+        assert stats.flush()
+        usage = yaml.safe_load(path.read_text())["auth_patterns"][0]["usage_stats"]
+        assert (usage["times_matched"], usage["times_fixed"], usage["success_rate"]) == (2, 1, 0.5)
+        assert "last_matched" in usage
+        assert not stats.flush()  # Nothing pending
+
+    def test_missing_file(self, tmp_path):
+        stats = PatternUsageStats(tmp_path)
+        stats.record("auth_patterns", "no route to host")
+        assert not stats.flush()
+
+
+class TestCheckKnownIssues:
+    """Tests for the match dict helpers."""
+
+    def test_match_dicts(self, learned_dir):
+        matches = check_known_issues("bonfire_deploy", "token expired", learned_dir=learned_dir)
+        assert [(m["source"], m["pattern"]) for m in matches] == [
+            ("error_patterns", "bonfire"),
+            ("auth_patterns", "token expired"),
+            ("tool_fixes", "manifest unknown"),
+            ("tool_fixes", "timed out"),
+        ]
+        assert matches[1] == {
+            "source": "auth_patterns",
+            "pattern": "token expired",
+            "meaning": "",
+            "fix": "Refresh credentials",
+            "commands": [],
+        }
+        assert matches[2] == {
+            "source": "tool_fixes",
+            "tool_name": "bonfire_deploy",
+            "pattern": "manifest unknown",
+            "fix": "Use full SHA",
+        }
+
+    def test_format(self, learned_dir):
+        matches = check_known_issues("", "No route to host", learned_dir=learned_dir)
+        text = format_known_issues(matches)
+        assert "**Pattern:** `No route to host`" in text
+        assert "- `vpn_connect()`" in text
+        assert format_known_issues([]) == ""
@@ -0,0 +1,63 @@
+"""Tests for fixed-bucket latency histograms."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+HISTOGRAM_FILE = Path(__file__).parent.parent / "tool_modules" / "aa_workflow" / "src" / "latency_histogram.py"
+
+
+@pytest.fixture(scope="module")
+def hist():
+    """Load latency_histogram.py directly (it has no MCP dependencies)."""
+    spec = importlib.util.spec_from_file_location("latency_histogram", HISTOGRAM_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestLatencyHistogram:
+    """Tests for recording, merging and percentiles."""
+
+    def test_buckets_sorted(self, hist):
+        assert hist.LATENCY_BUCKETS_MS == sorted(set(hist.LATENCY_BUCKETS_MS))
+        assert hist.LATENCY_BUCKETS_MS[0] == 1
+        assert hist.LATENCY_BUCKETS_MS[-1] == 600_000
+
+    @pytest.mark.parametrize("ms,upper", [(0, 1), (1, 1), (1.5, 2), (95, 100), (101, 200), (4000, 5000)])
+    def test_bucket_upper_bounds(self, hist, ms, upper):
+        assert hist.LATENCY_BUCKETS_MS[hist.bucket_index(ms)] == upper
+
+    def test_record_only_grows_as_needed(self, hist):
+        histogram = []
+        hist.record_latency(histogram, 4)
+        assert histogram == [0, 0, 0, 1]
+        hist.record_latency(histogram, 2)
+        assert histogram == [0, 1, 0, 1]
+        hist.record_latency(histogram, 10**9)
+        assert len(histogram) == len(hist.LATENCY_BUCKETS_MS) + 1
+
+    def test_merge(self, hist):
+        assert hist.merge_histograms([1, 2], [0, 1, 5], []) == [1, 3, 5]
+        assert hist.merge_histograms() == []
+
+    def test_percentiles(self, hist):
+        histogram = []
+        for ms in [5] * 90 + [2500] * 9 + [40_000]:
+            hist.record_latency(histogram, ms)
+        summary = hist.summarize_histogram(histogram)
+        assert summary["count"] == 100
+        assert 3 < summary["p50"] <= 5
+        assert summary["p90"] == 5
+        assert 2000 < summary["p99"] <= 3000
+        assert hist.percentile(histogram, 100) == 50_000
+
+    def test_empty(self, hist):
+        assert hist.percentile([], 50) is None
+        assert hist.summarize_histogram([0, 0]) == {"count": 0, "p50": None, "p90": None, "p99": None}
+
+    def test_overflow_bucket(self, hist):
+        histogram = []
+        hist.record_latency(histogram, 10**7)
+        assert hist.percentile(histogram, 50) == 600_000
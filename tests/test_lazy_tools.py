@@ -0,0 +1,135 @@
+"""Tests for lazy tool registration."""
+
+import os
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from server import lazy_tools, tool_discovery
+from server.lazy_tools import LazyTool, register_module
+
+TOOLS_SOURCE = '''
+from pathlib import Path
+
+from mcp.server.fastmcp import Context, FastMCP
+
+LOG = Path(__file__).with_name("calls.log")
+
+
+def register_tools(server: FastMCP) -> int:
+    with open(LOG, "a") as f:
+        f.write("register\\n")
+
+    @server.tool()
+    async def demo_echo(text: str, times: int = 1, ctx: Context | None = None) -> str:
+        """Echo text."""
+        return text * times
+
+    @server.tool()
+    async def demo_context(ctx: Context) -> str:
+        """Report whether a context was injected."""
+        return type(ctx).__name__
+
+    return 2
+'''
+
+
+@pytest.fixture
+def tools_file(tmp_path, monkeypatch):
+    """Demo tools module with a fresh manifest cache."""
+    path = tmp_path / "aa_demo" / "src" / "tools_basic.py"
+    path.parent.mkdir(parents=True)
+    path.write_text(TOOLS_SOURCE)
+    monkeypatch.setattr(tool_discovery, "MANIFEST_CACHE_FILE", tmp_path / "tool_manifest.json")
+    monkeypatch.setattr(tool_discovery, "_manifest_cache", None)
+    monkeypatch.setattr(lazy_tools, "_imported", {})
+    return path
+
+
+def registrations(tools_file):
+    log = tools_file.with_name("calls.log")
+    return log.read_text().count("register") if log.exists() else 0
+
+
+def is_stub(server, name):
+    return isinstance(server._tool_manager.get_tool(name), LazyTool)
+
+
+class TestRegisterModule:
+    """Tests for eager and lazy registration."""
+
+    async def test_first_registration_imports_and_records(self, tools_file):
+        server = FastMCP("test")
+        assert register_module(server, "demo", tools_file) == ["demo_echo", "demo_context"]
+        assert registrations(tools_file) == 1
+        assert not is_stub(server, "demo_echo")
+        assert tool_discovery.get_manifest_cache().get_schemas("demo", lazy_tools.module_signature(tools_file))
+
+    async def test_stubs_list_like_real_tools(self, tools_file):
+        eager = FastMCP("eager")
+        register_module(eager, "demo", tools_file)
+
+        lazy = FastMCP("lazy")
+        assert register_module(lazy, "demo", tools_file) == ["demo_echo", "demo_context"]
+        assert registrations(tools_file) == 1
+        assert is_stub(lazy, "demo_echo")
+        assert await lazy.list_tools() == await eager.list_tools()
+
+    async def test_first_call_loads_module(self, tools_file):
+        register_module(FastMCP("first"), "demo", tools_file)
+        lazy_tools._imported.clear()  # As in a new process
+
+        server = FastMCP("test")
+        register_module(server, "demo", tools_file)
+        result = await server.call_tool("demo_echo", {"text": "ab", "times": 2})
+        assert result[0][0].text == "abab"
+        assert registrations(tools_file) == 2
+        assert not is_stub(server, "demo_echo")
+        assert not is_stub(server, "demo_context")  # Whole module replaced
+
+        result = await server.call_tool("demo_context", {})
+        assert result[0][0].text == "Context"
+        assert registrations(tools_file) == 2
+
+    async def test_changed_module_imported_eagerly(self, tools_file):
+        register_module(FastMCP("first"), "demo", tools_file)
+        tools_file.write_text(TOOLS_SOURCE.replace('"""Echo text."""', '"""Echo text back."""'))
+        stat = tools_file.stat()
+        os.utime(tools_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        server = FastMCP("test")
+        register_module(server, "demo", tools_file)
+        assert not is_stub(server, "demo_echo")
+        assert server._tool_manager.get_tool("demo_echo").description == "Echo text back."
+
+    async def test_not_lazy(self, tools_file):
+        register_module(FastMCP("first"), "demo", tools_file)
+        server = FastMCP("test")
+        register_module(server, "demo", tools_file, lazy=False)
+        assert not is_stub(server, "demo_echo")
+
+    async def test_existing_tools_kept(self, tools_file):
+        register_module(FastMCP("first"), "demo", tools_file)
+        server = FastMCP("test")
+
+        @server.tool()
+        async def demo_echo() -> str:
+            """Already here."""
+            return ""
+
+        assert register_module(server, "demo", tools_file) == ["demo_context"]
+        assert server._tool_manager.get_tool("demo_echo").description == "Already here."
+
+    async def test_failed_import_restores_stubs(self, tools_file):
+        register_module(FastMCP("first"), "demo", tools_file)
+        lazy_tools._imported.clear()
+
+        server = FastMCP("test")
+        register_module(server, "demo", tools_file)
+        tools_file.write_text("raise ImportError('no lancedb')\n")  # Broken after startup
+
+        with pytest.raises(ToolError, match="no lancedb"):
+            await server.call_tool("demo_echo", {"text": "x"})
+        assert is_stub(server, "demo_echo")
+        assert is_stub(server, "demo_context")
@@ -0,0 +1,84 @@
+"""Tests for the process-wide module server registry."""
+
+import os
+
+import pytest
+
+from server.module_servers import ModuleServerRegistry
+
+DEMO_TOOLS = '''
+from mcp.server.fastmcp import FastMCP
+
+
+def register_tools(server: FastMCP) -> int:
+    @server.tool()
+    async def demo_echo(text: str) -> str:
+        """Echo text back."""
+        return "{prefix}" + text
+
+    return 1
+'''
+
+
+@pytest.fixture
+def modules_dir(tmp_path):
+    """Create a tool_modules directory with one demo module."""
+    src = tmp_path / "aa_demo" / "src"
+    src.mkdir(parents=True)
+    (src / "tools_basic.py").write_text(DEMO_TOOLS.format(prefix="v1:"))
+    return tmp_path
+
+
+class TestModuleServerRegistry:
+    """Tests for ModuleServerRegistry."""
+
+    def test_loads_once(self, modules_dir):
+        registry = ModuleServerRegistry(modules_dir)
+        first = registry.get_server("demo")
+        second = registry.get_server("demo")
+        assert first is second
+        assert registry.loads == 1
+        assert registry.hits == 1
+        assert registry.get_status()["modules"] == {"demo": 1}
+
+    async def test_call_tool(self, modules_dir):
+        registry = ModuleServerRegistry(modules_dir)
+        result = await registry.call_tool("demo", "demo_echo", {"text": "hi"})
+        content = result[0] if isinstance(result, tuple) else result
+        assert content[0].text == "v1:hi"
+
+    async def test_reloads_when_file_changes(self, modules_dir):
+        registry = ModuleServerRegistry(modules_dir)
+        first = registry.get_server("demo")
+
+        tools_file = modules_dir / "aa_demo" / "src" / "tools_basic.py"
+        tools_file.write_text(DEMO_TOOLS.format(prefix="v2:"))
+        stat = tools_file.stat()
+        os.utime(tools_file, (stat.st_atime, stat.st_mtime + 5))
+
+        assert registry.get_server("demo") is not first
+        assert registry.loads == 2
+        result = await registry.call_tool("demo", "demo_echo", {"text": "hi"})
+        content = result[0] if isinstance(result, tuple) else result
+        assert content[0].text == "v2:hi"
+
+    def test_invalidate(self, modules_dir):
+        registry = ModuleServerRegistry(modules_dir)
+        registry.get_server("demo")
+        registry.invalidate("demo")
+        registry.get_server("demo")
+        assert registry.loads == 2
+
+    def test_missing_module(self, modules_dir):
+        registry = ModuleServerRegistry(modules_dir)
+        assert registry.get_tools_file("nope") is None
+        with pytest.raises(FileNotFoundError):
+            registry.get_server("nope")
+
+    async def test_preload(self, modules_dir):
+        registry = ModuleServerRegistry(modules_dir)
+        errors = await registry.preload(["demo", "nope"])
+        assert errors["demo"] is None
+        assert "Module not found" in errors["nope"]
+        assert await registry.preload(["demo"]) == {"demo": None}
+        assert registry.loads == 1
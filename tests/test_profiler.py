@@ -0,0 +1,85 @@
+"""Tests for the hierarchical timing profiler."""
+
+import asyncio
+import json
+
+from server.profiler import Profiler, is_profiling, profile_span
+
+
+class TestProfileSpan:
+    """Tests for span nesting."""
+
+    def test_noop_when_inactive(self):
+        assert not is_profiling()
+        with profile_span("anything") as span:
+            assert span is None
+
+    def test_nested_spans(self):
+        profiler = Profiler("run")
+        with profiler.activate():
+            assert is_profiling()
+            with profile_span("outer", "step", lane=2):
+                with profile_span("inner", "tool", cmd="ls"):
+                    pass
+        assert not is_profiling()
+
+        outer = profiler.root.children[0]
+        assert outer.name == "outer"
+        assert outer.lane == 2
+        inner = outer.children[0]
+        assert (inner.name, inner.lane, inner.args) == ("inner", 2, {"cmd": "ls"})
+        assert inner.end is not None and inner.duration <= outer.duration
+
+    async def test_spans_follow_tasks_and_threads(self):
+        profiler = Profiler("run")
+
+        def in_thread():
+            with profile_span("thread_work"):
+                pass
+
+        async def step(n):
+            with profile_span(f"step {n}", lane=n):
+                await asyncio.sleep(0.01)
+                await asyncio.to_thread(in_thread)
+
+        with profiler.activate():
+            await asyncio.gather(step(1), step(2))
+
+        assert [s.name for s in profiler.root.children] == ["step 1", "step 2"]
+        for span in profiler.root.children:
+            assert [c.name for c in span.children] == ["thread_work"]
+
+
+class TestExport:
+    """Tests for the text report and Chrome trace."""
+
+    def make_profile(self):
+        profiler = Profiler("my_skill")
+        with profiler.activate():
+            with profile_span("step 1: view", "step", lane=1):
+                for _ in range(3):
+                    with profile_span("call_tool", "tool"):
+                        pass
+        return profiler
+
+    def test_render_tree_merges_siblings(self):
+        lines = self.make_profile().render_tree().splitlines()
+        assert lines[0].startswith("my_skill  ")
+        assert lines[1].startswith("  step 1: view  ")
+        assert lines[2].startswith("    call_tool ×3  ")
+        assert len(lines) == 3
+
+    def test_render_tree_min_ms(self):
+        tree = self.make_profile().render_tree(min_ms=1000)
+        assert tree.splitlines() == [tree.splitlines()[0]]
+
+    def test_chrome_trace(self, tmp_path):
+        path = self.make_profile().write_chrome_trace(tmp_path / "out" / "trace.json")
+        trace = json.loads(path.read_text())
+
+        events = trace["traceEvents"]
+        assert events[0]["ph"] == "M"
+        complete = [e for e in events if e["ph"] == "X"]
+        assert [e["name"] for e in complete] == ["my_skill", "step 1: view"] + ["call_tool"] * 3
+        assert all(e["ts"] >= 0 and e["dur"] >= 0 for e in complete)
+        assert complete[-1]["tid"] == 1
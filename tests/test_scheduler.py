@@ -0,0 +1,45 @@
+"""Tests for the cron scheduler."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("apscheduler")
+
+from scripts.common import skill_catalog  # noqa: E402
+from scripts.common.skill_catalog import SkillCatalog  # noqa: E402
+from tool_modules.aa_workflow.src.scheduler import CronScheduler  # noqa: E402
+from tool_modules.aa_workflow.src.skill_engine import SkillExecutor  # noqa: E402
+
+SLOW_SKILL = """
+name: slow_skill
+steps:
+  - name: wait
+    tool: slow_tool
+    output: waited
+"""
+
+
+@pytest.fixture
+def slow_skill(monkeypatch, tmp_path):
+    """A skill whose only tool call outlasts the job timeout."""
+    (tmp_path / "slow_skill.yaml").write_text(SLOW_SKILL)
+    catalog = SkillCatalog(tmp_path)
+    monkeypatch.setattr(skill_catalog, "get_skill_catalog", lambda: catalog)
+
+    async def exec_tool(self, tool_name, args):
+        await asyncio.sleep(10)
+        return {"success": True, "result": "done"}
+
+    monkeypatch.setattr(SkillExecutor, "_exec_tool", exec_tool)
+
+
+class TestExecuteJob:
+    """Tests for running a scheduled job."""
+
+    async def test_timeout_is_failure(self, slow_skill):
+        scheduler = CronScheduler()
+        await scheduler._execute_job("nightly", "slow_skill", {}, notify=[], timeout=0.05)
+        entry = scheduler.execution_log.get_for_job("nightly")[-1]
+        assert entry["success"] is False
+        assert entry["error"] == "Skill timed out after 0.05s"
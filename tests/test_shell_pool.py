@@ -0,0 +1,79 @@
+"""Tests for the shell worker pool."""
+
+import pytest
+
+from server import shell_pool, utils
+from server.shell_pool import get_shell_pool
+from server.utils import run_cmd, run_cmd_full
+
+FUNCTIONS = """
+greet() { echo "hello $1 from $PWD ${GREETING:-}"; }
+fail() { echo out; echo err >&2; return 3; }
+big() { head -c 200000 /dev/zero | tr '\\0' a; }
+slow() { sleep 30; }
+"""
+
+
+@pytest.fixture
+async def pool_home(tmp_path, monkeypatch):
+    """Home whose rc files define shell functions, with a 2-worker pool configured."""
+    home = tmp_path / "home"
+    (home / ".bashrc.d").mkdir(parents=True)
+    (home / ".bashrc").write_text(f"echo x >> {tmp_path / 'sourced'}\n")
+    (home / ".bashrc.d" / "functions.sh").write_text(FUNCTIONS)
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setattr(utils, "_shell_env", None)
+    monkeypatch.setattr(utils, "_shell_env_failure", None)
+    monkeypatch.setattr(shell_pool, "load_config", lambda: {"server": {"shell_workers": 2}})
+    monkeypatch.setattr(shell_pool, "_shell_pool", None)
+    yield home
+    if shell_pool._shell_pool is not None:
+        await shell_pool._shell_pool.close()
+
+
+def times_sourced(home):
+    return len((home.parent / "sourced").read_text().splitlines())
+
+
+class TestShellPool:
+    """Tests for running shell functions on pooled workers."""
+
+    async def test_workers_reused(self, pool_home):
+        for _ in range(3):
+            assert await run_cmd(["greet", "a b"], cwd=str(pool_home)) == (True, f"hello a b from {pool_home} \n")
+        assert get_shell_pool().started == 1
+        assert times_sourced(pool_home) == 2  # Environment snapshot + one worker
+
+    async def test_cwd_and_env_do_not_leak(self, pool_home, tmp_path):
+        pool = get_shell_pool()
+        _, first, _ = await pool.run(["greet"], cwd=str(tmp_path), env={"GREETING": "hi"}, timeout=10)
+        _, second, _ = await pool.run(["greet"], cwd=None, env=None, timeout=10)
+        assert first == f"hello  from {tmp_path} hi\n"
+        assert tmp_path.name not in second and "hi" not in second
+        assert pool.started == 1
+
+    async def test_status_and_streams(self, pool_home):
+        assert await run_cmd_full(["fail"]) == (False, "out\n", "err\n")
+        assert await get_shell_pool().run(["fail"], None, None, 10) == (3, "out\n", "err\n")
+        success, output = await run_cmd(["big"])
+        assert success and output == "a" * 200000
+
+    async def test_timeout_replaces_worker(self, pool_home):
+        success, output = await run_cmd(["slow"], timeout=1)
+        assert not success
+        assert "timed out" in output
+        assert await run_cmd(["greet"], cwd=str(pool_home)) == (True, f"hello  from {pool_home} \n")
+        assert get_shell_pool().started == 2
+
+    async def test_invalid_env_name(self, pool_home):
+        success, output = await run_cmd(["greet"], env={"NOT-VALID": "x"})
+        assert not success
+        assert "Invalid environment variable name" in output
+
+    async def test_executables_not_pooled(self, pool_home):
+        assert await run_cmd(["echo", "direct"]) == (True, "direct\n")
+        assert get_shell_pool().started == 0
+
+    async def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.setattr(shell_pool, "load_config", lambda: {})
+        assert get_shell_pool() is None
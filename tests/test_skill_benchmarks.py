@@ -0,0 +1,57 @@
+"""Benchmarks for the skill engine, replaying the 10 largest skills.
+
+Each skill replays its fixture (tests/fixtures/skill_replays/) with zero
+latency, so the numbers are the engine's own overhead: templating,
+conditions, compute blocks and output formatting. The fixtures are
+synthetic: hand-written tool outputs in the shape the real tools return,
+chosen so each skill takes its main path. Re-record one against real tools
+with ``skill_test_runner.py --skill X --record``.
+
+Run with: make bench (needs pytest-benchmark)
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from scripts.common import memory  # noqa: E402
+from scripts.common.skill_catalog import get_skill_catalog  # noqa: E402
+from tool_modules.aa_workflow.src.skill_replay import ReplayExecutor, SkillRecording, fixture_path  # noqa: E402
+
+LARGEST_SKILLS = 10
+
+
+def largest_skills() -> list[str]:
+    """Names of the skills with the most steps."""
+    entries = [entry for entry in get_skill_catalog().entries() if not entry.error]
+    entries.sort(key=lambda entry: (-entry.step_count, entry.name))
+    return [entry.name for entry in entries[:LARGEST_SKILLS]]
+
+
+@pytest.fixture(autouse=True)
+def isolated_memory(monkeypatch, tmp_path):
+    """Keep compute blocks' memory writes out of the real memory directory."""
+    monkeypatch.setattr(memory, "MEMORY_DIR", tmp_path)
+
+
+@pytest.mark.parametrize("skill_name", largest_skills())
+def test_replay(benchmark, skill_name):
+    skill = get_skill_catalog().load(skill_name)
+    path = fixture_path(skill_name)
+    assert path.exists(), f"No replay fixture for {skill_name}"
+    recording = SkillRecording.load(path)
+
+    def replay():
+        # Calls gated on local config (repo paths, installed linters) may
+        # not be in the fixture; they get an empty result
+        executor = ReplayExecutor(skill, recording, default_result="")
+        output = asyncio.run(executor.execute())
+        return executor, output
+
+    executor, output = benchmark(replay)
+    unconditional = {index for index, step in enumerate(skill["steps"]) if not step.get("condition")}
+    assert unconditional <= executor.steps_run  # Reached the end of the skill
+    assert "Skill failed at step" not in output
+    assert executor.unused_calls == []  # Took the path the fixture was written for
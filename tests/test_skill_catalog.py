@@ -0,0 +1,118 @@
+"""Tests for the shared skill catalog."""
+
+import os
+
+import pytest
+
+from scripts.common.skill_catalog import COMPUTE_MARKER, SkillCatalog, extract_memory_operations, extract_tools
+
+SKILL_YAML = """
+name: {name}
+description: Demo skill
+inputs:
+  - name: issue_key
+    required: true
+  - name: verbose
+steps:
+  - name: get_issue
+    tool: jira_view_issue
+    args:
+      issue_key: "{{{{ inputs.issue_key }}}}"
+  - name: check
+    tool: check_known_issues
+  - name: summarize
+    compute: |
+      memory.write_memory("state/current_work", {{}})
+      result = 1
+  - name: branch
+    then:
+      - tool: gitlab_mr_list
+"""
+
+
+@pytest.fixture
+def skills_path(tmp_path):
+    """Create a skills directory with one demo skill."""
+    (tmp_path / "demo.yaml").write_text(SKILL_YAML.format(name="demo_skill"))
+    return tmp_path
+
+
+def bump_mtime(path):
+    """Move a file's mtime forward so the change is always visible."""
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+
+
+class TestSkillCatalog:
+    """Tests for SkillCatalog caching and derived data."""
+
+    def test_derived_data(self, skills_path):
+        entry = SkillCatalog(skills_path).get("demo")
+        assert entry.name == "demo_skill"
+        assert entry.description == "Demo skill"
+        assert entry.input_names == ["issue_key", "verbose"]
+        assert entry.step_count == 4
+        assert entry.tools == {"jira_view_issue", "check_known_issues", "gitlab_mr_list", COMPUTE_MARKER}
+        assert entry.has_compute
+        assert entry.memory_ops["reads"][0]["tool"] == "check_known_issues"
+        assert entry.memory_ops["writes"][0]["key"] == "state/current_work"
+
+    def test_parsed_once(self, skills_path):
+        catalog = SkillCatalog(skills_path)
+        assert catalog.load("demo") is catalog.load("demo")
+        assert catalog.entries()[0] is catalog.get("demo")
+
+    def test_reparsed_when_file_changes(self, skills_path):
+        catalog = SkillCatalog(skills_path)
+        first = catalog.get("demo")
+
+        skill_file = skills_path / "demo.yaml"
+        skill_file.write_text(SKILL_YAML.format(name="renamed"))
+        bump_mtime(skill_file)
+
+        second = catalog.get("demo")
+        assert second is not first
+        assert second.name == "renamed"
+
+    def test_added_and_removed_files(self, skills_path):
+        catalog = SkillCatalog(skills_path)
+        assert catalog.names() == ["demo"]
+
+        (skills_path / "other.yaml").write_text(SKILL_YAML.format(name="other"))
+        assert [e.stem for e in catalog.entries()] == ["demo", "other"]
+
+        (skills_path / "other.yaml").unlink()
+        assert catalog.get("other") is None
+        assert [e.stem for e in catalog.entries()] == ["demo"]
+
+    def test_find_by_name_field(self, skills_path):
+        catalog = SkillCatalog(skills_path)
+        assert catalog.find("demo_skill").stem == "demo"
+        assert catalog.find("missing") is None
+
+    def test_parse_error(self, skills_path):
+        (skills_path / "broken.yaml").write_text("name: [unclosed")
+        catalog = SkillCatalog(skills_path)
+        entry = catalog.get("broken")
+        assert entry.error
+        assert catalog.load("broken") is None
+
+    def test_real_skills_parse(self, skills_dir):
+        entries = SkillCatalog(skills_dir).entries()
+        assert entries
+        assert not [e.stem for e in entries if e.error]
+
+
+class TestExtraction:
+    """Tests for tool and memory operation extraction."""
+
+    def test_extract_tools_ignores_parallel_flag(self):
+        steps = [{"tool": "gitlab_mr_list", "parallel": True}, {"parallel": [{"tool": "jira_view_issue"}]}]
+        assert extract_tools(steps) == {"gitlab_mr_list", "jira_view_issue"}
+
+    def test_memory_ops_deduplicated(self):
+        steps = [
+            {"name": "a", "tool": "memory_read", "args": {"key": "state/current_work"}},
+            {"name": "b", "tool": "memory_read", "args": {"key": "state/current_work"}},
+        ]
+        assert len(extract_memory_operations(steps)["reads"]) == 1
@@ -0,0 +1,79 @@
+"""Tests for skill checkpoint storage."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+SKILL_CHECKPOINT_FILE = Path(__file__).parent.parent / "tool_modules" / "aa_workflow" / "src" / "skill_checkpoint.py"
+
+
+@pytest.fixture
+def checkpoints(tmp_path, monkeypatch):
+    """Load skill_checkpoint.py directly, writing checkpoints to a temp dir."""
+    spec = importlib.util.spec_from_file_location("skill_checkpoint", SKILL_CHECKPOINT_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "CHECKPOINT_DIR", tmp_path)
+    return module
+
+
+class TestSkillCheckpoint:
+    """Tests for saving and loading checkpoints."""
+
+    def test_round_trip(self, checkpoints):
+        saved = checkpoints.SkillCheckpoint(
+            skill_name="deploy",
+            fingerprint="abc",
+            inputs={"mr_id": 1},
+            next_step=3,
+            context={"namespace": "ephemeral-1"},
+            step_results=[{"step": "reserve", "success": True}],
+        )
+        assert checkpoints.save_checkpoint(saved)
+
+        loaded = checkpoints.load_checkpoint("deploy", {"mr_id": 1})
+        assert loaded.next_step == 3
+        assert loaded.context == {"namespace": "ephemeral-1"}
+        assert loaded.updated
+        assert checkpoints.load_checkpoint("deploy", {"mr_id": 2}) is None
+
+        checkpoints.clear_checkpoint("deploy", {"mr_id": 1})
+        assert checkpoints.load_checkpoint("deploy", {"mr_id": 1}) is None
+
+    def test_one_checkpoint_per_inputs(self, checkpoints):
+        for mr_id, next_step in ((1, 2), (2, 5)):
+            saved = checkpoints.SkillCheckpoint(
+                skill_name="deploy", fingerprint="abc", inputs={"mr_id": mr_id}, next_step=next_step
+            )
+            assert checkpoints.save_checkpoint(saved)
+
+        assert checkpoints.load_checkpoint("deploy", {"mr_id": 1}).next_step == 2
+        assert checkpoints.load_checkpoint("deploy", {"mr_id": 2}).next_step == 5
+        assert checkpoints.load_checkpoint("deploy").inputs == {"mr_id": 2}  # Most recent
+        assert checkpoints.load_checkpoint("other") is None
+
+    def test_unreadable_checkpoint_ignored(self, checkpoints):
+        checkpoints.checkpoint_path("broken", {}).write_text("{not json")
+        assert checkpoints.load_checkpoint("broken", {}) is None
+        assert checkpoints.load_checkpoint("broken") is None
+
+    def test_split_context(self, checkpoints):
+        context = {"config": {}, "inputs": {}, "ns": "x", "items": [1], "handle": object()}
+        context_json, unsaved = checkpoints.split_context(context)
+        assert json.loads(context_json) == {"ns": "x", "items": [1]}
+        assert unsaved == {"handle"}
+
+    def test_presplit_context_saved(self, checkpoints):
+        context_json, _ = checkpoints.split_context({"ns": "x", "handle": object()})
+        saved = checkpoints.SkillCheckpoint(skill_name="deploy", fingerprint="abc", inputs={}, next_step=1)
+        assert checkpoints.save_checkpoint(saved, context_json)
+        assert checkpoints.load_checkpoint("deploy", {}).context == {"ns": "x"}
+
+    def test_fingerprint_tracks_steps(self, checkpoints):
+        skill = {"name": "a", "steps": [{"name": "s", "tool": "t"}]}
+        same = {"name": "a", "description": "changed", "steps": [{"tool": "t", "name": "s"}]}
+        other = {"name": "a", "steps": [{"name": "s", "tool": "u"}]}
+        assert checkpoints.skill_fingerprint(skill) == checkpoints.skill_fingerprint(same)
+        assert checkpoints.skill_fingerprint(skill) != checkpoints.skill_fingerprint(other)
@@ -0,0 +1,638 @@
+"""Tests for the skill execution engine."""
+
+import asyncio
+
+import pytest
+import yaml
+
+from scripts.common import known_issues
+from tool_modules.aa_workflow.src import skill_checkpoint, skill_engine, skill_preflight
+from tool_modules.aa_workflow.src.skill_engine import SkillExecutor
+from tool_modules.aa_workflow.src.tool_cache import ToolResultCache
+
+
+def make_executor(steps=None, inputs=None, **kwargs):
+    """Create an executor for an in-memory skill without VS Code events."""
+    skill = {"name": "test_skill", "steps": steps or []}
+    return SkillExecutor(skill, inputs or {}, emit_events=False, **kwargs)
+
+
+class TestTemplates:
+    """Tests for template rendering and the compiled template cache."""
+
+    def test_template_renders_context(self):
+        executor = make_executor(inputs={"issue_key": "AAP-1"})
+        executor.context["mr"] = {"iid": 42}
+        assert executor._template("{{ inputs.issue_key }} !{{ mr.iid }}") == "AAP-1 !42"
+
+    def test_plain_text_passthrough(self):
+        executor = make_executor()
+        assert executor._template("no templates") == "no templates"
+        assert executor._template(5) == 5
+
+    def test_custom_filters(self):
+        executor = make_executor(inputs={"issue_key": "AAP-1"})
+        rendered = executor._template("{{ inputs.issue_key | jira_link }}")
+        assert rendered.startswith("[AAP-1](")
+
+    def test_template_dict(self):
+        executor = make_executor(inputs={"a": "x"})
+        args = {"k": "{{ inputs.a }}", "n": {"k": "{{ inputs.a }}"}, "l": ["{{ inputs.a }}", 1]}
+        result = executor._template_dict(args)
+        assert result == {"k": "x", "n": {"k": "x"}, "l": ["x", 1]}
+
+    def test_compiled_code_shared_across_executors(self):
+        source = "{{ inputs.value }}-shared-cache-test"
+        first = make_executor(inputs={"value": "a"})
+        assert first._template(source) == "a-shared-cache-test"
+
+        hits = skill_engine._compile_template.cache_info().hits
+        second = make_executor(inputs={"value": "b"})
+        assert second._template(source) == "b-shared-cache-test"
+        assert skill_engine._compile_template.cache_info().hits == hits + 1
+
+    def test_template_error_returns_source(self):
+        executor = make_executor()
+        assert executor._template("{{ broken") == "{{ broken"
+
+
+class TestConditions:
+    """Tests for condition evaluation."""
+
+    @pytest.mark.parametrize(
+        "condition,expected",
+        [
+            ("count > 1", True),
+            ("count > 5", False),
+            ("{{ count == 3 }}", True),
+            ("missing", False),
+            ("items and items | length == 2", True),
+        ],
+    )
+    def test_eval_condition(self, condition, expected):
+        executor = make_executor()
+        executor.context.update({"count": 3, "items": [1, 2]})
+        assert executor._eval_condition(condition) is expected
+
+    def test_conditions_precompiled_on_load(self):
+        condition = "precompiled_flag == 'precompile-test'"
+        make_executor(steps=[{"name": "a", "condition": condition, "compute": "result = 1"}])
+        hits = skill_engine._compile_template.cache_info().hits
+        skill_engine._compile_template(skill_engine._condition_source(condition))
+        assert skill_engine._compile_template.cache_info().hits == hits + 1
+
+
+class FakeToolExecutor(SkillExecutor):
+    """Executor whose tool calls are answered in-process, tracking concurrency."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = []
+        self.failing_ids = {"2"}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _exec_tool(self, tool_name, args):
+        self.calls.append(args)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if args.get("mr_id") in self.failing_ids:
+            return {"success": False, "error": "not found"}
+        return {"success": True, "result": f"MR {args['mr_id']}", "duration": 0.01}
+
+
+def make_fake_executor(steps, inputs=None, **kwargs):
+    """Create a FakeToolExecutor for an in-memory skill."""
+    skill = {"name": "test_skill", "steps": steps}
+    return FakeToolExecutor(skill, inputs or {}, emit_events=False, **kwargs)
+
+
+class TestForeach:
+    """Tests for foreach steps."""
+
+    FOREACH_STEP = {
+        "name": "view",
+        "foreach": "mrs",
+        "as": "mr",
+        "max_concurrency": 2,
+        "tool": "gitlab_mr_view",
+        "args": {"mr_id": "{{ mr.iid }}"},
+        "output": "details",
+    }
+
+    async def test_results_in_item_order_with_errors(self):
+        executor = make_fake_executor([self.FOREACH_STEP])
+        executor.context["mrs"] = [{"iid": i} for i in range(1, 6)]
+        result = await executor.execute()
+
+        details = executor.context["details"]
+        assert [d["item"]["iid"] for d in details] == [1, 2, 3, 4, 5]
+        assert details[0] == {"item": {"iid": 1}, "success": True, "result": "MR 1"}
+        assert details[1] == {"item": {"iid": 2}, "success": False, "error": "not found"}
+        assert "4 succeeded, ❌ 1 failed" in result
+        assert "mr" not in executor.context
+
+    async def test_max_concurrency(self):
+        executor = make_fake_executor([self.FOREACH_STEP])
+        executor.context["mrs"] = [{"iid": i} for i in range(10)]
+        await executor.execute()
+        assert len(executor.calls) == 10
+        assert executor.max_in_flight == 2
+
+    async def test_on_error_fail_stops_skill(self):
+        steps = [{**self.FOREACH_STEP, "on_error": "fail"}, {"name": "after", "compute": "result = 1"}]
+        executor = make_fake_executor(steps)
+        executor.context["mrs"] = [{"iid": 1}, {"iid": 2}]
+        result = await executor.execute()
+        assert "Skill failed at step 1" in result
+        assert "after" not in executor.context
+
+    async def test_expression_and_literal_sources(self):
+        executor = make_fake_executor([{**self.FOREACH_STEP, "foreach": "{{ mrs[:2] }}"}])
+        executor.context["mrs"] = [{"iid": 1}, {"iid": 3}, {"iid": 4}]
+        await executor.execute()
+        assert [d["result"] for d in executor.context["details"]] == ["MR 1", "MR 3"]
+
+        executor = make_fake_executor([{**self.FOREACH_STEP, "foreach": [{"iid": 7}]}])
+        await executor.execute()
+        assert executor.context["details"][0]["result"] == "MR 7"
+
+    async def test_missing_source_is_empty(self):
+        executor = make_fake_executor([self.FOREACH_STEP])
+        await executor.execute()
+        assert executor.context["details"] == []
+
+    async def test_non_list_source_reported(self):
+        executor = make_fake_executor([self.FOREACH_STEP])
+        executor.context["mrs"] = "not a list"
+        result = await executor.execute()
+        assert "foreach must resolve to a list" in result
+
+    async def test_auto_heal_once_then_retry(self, monkeypatch):
+        class ExpiredTokenExecutor(FakeToolExecutor):
+            logged_in = False
+
+            async def _exec_tool(self, tool_name, args):
+                if tool_name == "kube_login":
+                    self.calls.append(tool_name)
+                    self.logged_in = True
+                    return {"success": True, "result": "logged in"}
+                if not self.logged_in:
+                    self.calls.append(args)
+                    return {"success": False, "error": "401 Unauthorized"}
+                return await super()._exec_tool(tool_name, args)
+
+        async def no_memory_log(*args, **kwargs):
+            pass
+
+        monkeypatch.setattr(SkillExecutor, "_log_auto_heal_to_memory", no_memory_log)
+        skill = {"name": "test_skill", "steps": [{**self.FOREACH_STEP, "on_error": "auto_heal"}]}
+        executor = ExpiredTokenExecutor(skill, {}, emit_events=False)
+        executor.context["mrs"] = [{"iid": i} for i in range(1, 5)]
+        await executor.execute()
+
+        assert executor.calls.count("kube_login") == 1
+        assert [d["success"] for d in executor.context["details"]] == [True, False, True, True]
+        assert executor.context["details"][1]["error"] == "not found"
+
+
+class TestToolCache:
+    """Tests for cache_ttl on tool steps."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        cache = ToolResultCache()
+        monkeypatch.setattr(skill_engine, "get_tool_cache", lambda: cache)
+
+    STEP = {"name": "list", "tool": "gitlab_mr_list", "args": {"mr_id": "{{ inputs.mr }}"}, "output": "mrs"}
+
+    async def test_second_run_served_from_cache(self):
+        first = make_fake_executor([{**self.STEP, "cache_ttl": 60}])
+        first.inputs["mr"] = 1
+        await first.execute()
+
+        second = make_fake_executor([{**self.STEP, "cache_ttl": 60}])
+        second.inputs["mr"] = 1
+        result = await second.execute()
+        assert second.calls == []
+        assert second.context["mrs"] == "MR 1"
+        assert "Cached" in result
+        assert second.step_results[0]["cached"]
+
+    async def test_different_args_miss(self):
+        for mr in (1, 3):
+            executor = make_fake_executor([{**self.STEP, "cache_ttl": 60}])
+            executor.inputs["mr"] = mr
+            await executor.execute()
+            assert len(executor.calls) == 1
+
+    async def test_not_cached_without_ttl(self):
+        for _ in range(2):
+            executor = make_fake_executor([self.STEP])
+            executor.inputs["mr"] = 1
+            await executor.execute()
+            assert len(executor.calls) == 1
+
+    async def test_failures_not_cached(self):
+        for _ in range(2):
+            executor = make_fake_executor([{**self.STEP, "cache_ttl": 60, "on_error": "continue"}])
+            executor.inputs["mr"] = 2
+            await executor.execute()
+            assert len(executor.calls) == 1
+
+    async def test_error_text_not_cached(self, monkeypatch):
+        async def error_text(self, tool_name, args):
+            self.calls.append(args)
+            return {"success": True, "result": "❌ GitLab API error: 502", "duration": 0.01}
+
+        monkeypatch.setattr(FakeToolExecutor, "_exec_tool", error_text)
+        for _ in range(2):
+            executor = make_fake_executor([{**self.STEP, "cache_ttl": 60}])
+            executor.inputs["mr"] = 1
+            await executor.execute()
+            assert len(executor.calls) == 1
+            assert not executor.step_results[0]["cached"]
+
+    def test_config_default_only_for_read_only_tools(self):
+        executor = make_executor()
+        executor.config = {"skills": {"cache_ttl": {"gitlab_mr_list": 90, "gitlab_mr_merge": 90}}}
+        assert executor._cache_ttl({"tool": "gitlab_mr_list"}) == 90
+        assert executor._cache_ttl({"tool": "gitlab_mr_list", "cache_ttl": 0}) == 0
+        assert executor._cache_ttl({"tool": "gitlab_mr_merge"}) == 0
+        assert executor._cache_ttl({"tool": "jira_search"}) == 0
+
+
+class TestSharedSkill:
+    """Runs must not modify the (catalog-shared) skill dict."""
+
+    async def test_defaults_copied_per_run(self):
+        skill = {
+            "name": "test_skill",
+            "inputs": [{"name": "labels", "default": ["a"]}],
+            "defaults": {"repos": ["x"]},
+            "steps": [{"name": "grow", "compute": "inputs['labels'].append('b')\ndefaults['repos'].append('y')"}],
+        }
+        for _ in range(2):
+            executor = SkillExecutor(skill, {}, emit_events=False)
+            await executor.execute()
+            assert executor.inputs["labels"] == ["a", "b"]
+            assert executor.context["defaults"] == {"repos": ["x", "y"]}
+        assert skill["inputs"][0]["default"] == ["a"]
+        assert skill["defaults"] == {"repos": ["x"]}
+
+
+class TestErrorPatterns:
+    """Tests for known-pattern hints on failed tool steps."""
+
+    async def test_patterns_not_reparsed_per_failure(self, tmp_path, monkeypatch):
+        (tmp_path / "patterns.yaml").write_text("error_patterns:\n  - pattern: not found\n    fix: Check the MR id\n")
+        monkeypatch.setattr(known_issues, "LEARNED_DIR", tmp_path)
+        loads = []
+        load_yaml = known_issues._load_yaml
+        monkeypatch.setattr(known_issues, "_load_yaml", lambda path: loads.append(path) or load_yaml(path))
+
+        for _ in range(3):
+            executor = make_fake_executor([{"name": "view", "tool": "gitlab_mr_view", "args": {"mr_id": "2"}}])
+            assert "**Fix:** Check the MR id" in await executor.execute()
+
+        assert loads.count(tmp_path / "patterns.yaml") == 1
+        # Usage counts are batched, not written back per failure
+        assert known_issues.get_pattern_usage_stats().flush()
+        patterns = yaml.safe_load((tmp_path / "patterns.yaml").read_text())
+        assert patterns["error_patterns"][0]["usage_stats"]["times_matched"] == 3
+
+
+class TestCheckpoint:
+    """Tests for checkpointing and resuming skill runs."""
+
+    @pytest.fixture(autouse=True)
+    def checkpoint_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(skill_checkpoint, "CHECKPOINT_DIR", tmp_path)
+        return tmp_path
+
+    STEPS = [
+        {"name": "reserve", "tool": "bonfire_reserve", "args": {"mr_id": "1"}, "output": "namespace"},
+        {"name": "note", "compute": "result = namespace + ' ready'", "output": "note"},
+        {"name": "test", "tool": "bonfire_test", "args": {"mr_id": "{{ inputs.mr }}"}, "output": "tests"},
+        {"name": "report", "compute": "result = note + ', ' + tests", "output": "report"},
+    ]
+
+    async def test_resume_from_failed_step(self):
+        first = make_fake_executor(self.STEPS, inputs={"mr": "2"}, checkpoint=True)
+        assert "Skill failed at step 3" in await first.execute()
+        assert skill_checkpoint.load_checkpoint("test_skill").next_step == 2
+
+        second = make_fake_executor(self.STEPS, inputs={"mr": "2"}, resume=True)
+        second.failing_ids = set()
+        result = await second.execute()
+        assert "Resumed at step 3" in result
+        assert [c["mr_id"] for c in second.calls] == ["2"]
+        assert second.context["report"] == "MR 1 ready, MR 2"
+        assert skill_checkpoint.load_checkpoint("test_skill") is None
+
+    async def test_changed_inputs_start_over(self):
+        first = make_fake_executor(self.STEPS, inputs={"mr": "2"}, checkpoint=True)
+        await first.execute()
+
+        second = make_fake_executor(self.STEPS, inputs={"mr": "3"}, resume=True)
+        result = await second.execute()
+        assert "No checkpoint found for these inputs" in result
+        assert len(second.calls) == 2
+
+    async def test_overlapping_runs_keep_their_checkpoints(self):
+        first = make_fake_executor(self.STEPS, inputs={"mr": "2"}, checkpoint=True)
+        other = make_fake_executor(self.STEPS, inputs={"mr": "3"}, checkpoint=True)
+        other.failing_ids = {"3"}
+        await asyncio.gather(first.execute(), other.execute())
+
+        resumed = make_fake_executor(self.STEPS, inputs={"mr": "2"}, resume=True)
+        resumed.failing_ids = set()
+        assert "Resumed at step 3" in await resumed.execute()
+        assert skill_checkpoint.load_checkpoint("test_skill", {"mr": "3"}).next_step == 2
+
+    async def test_changed_skill_starts_over(self):
+        first = make_fake_executor(self.STEPS, inputs={"mr": "2"}, checkpoint=True)
+        await first.execute()
+
+        second = make_fake_executor(self.STEPS[:3], inputs={"mr": "2"}, resume=True)
+        assert "Skill changed" in await second.execute()
+
+    async def test_unsaveable_output_reruns(self):
+        steps = [
+            {"name": "handle", "compute": "result = re.compile('x')", "output": "handle"},
+            {"name": "test", "tool": "bonfire_test", "args": {"mr_id": "2"}, "output": "tests"},
+        ]
+        first = make_fake_executor(steps, checkpoint=True)
+        await first.execute()
+        assert skill_checkpoint.load_checkpoint("test_skill").next_step == 0
+
+
+class SlowToolExecutor(FakeToolExecutor):
+    """Fake executor whose tools take args["sleep"] seconds."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cancelled_tools = []
+
+    async def _exec_tool(self, tool_name, args):
+        try:
+            await asyncio.sleep(float(args.get("sleep", 0)))
+        except asyncio.CancelledError:
+            self.cancelled_tools.append(tool_name)
+            raise
+        return {"success": True, "result": tool_name, "duration": 0}
+
+
+class TestTimeouts:
+    """Tests for step and skill timeouts."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [(30, 30.0), ("45", 45.0), ("30s", 30.0), ("5m", 300.0), ("1h", 3600.0), (0, None), (None, None), ("x", None)],
+    )
+    def test_parse_timeout(self, value, expected):
+        assert skill_engine.parse_timeout(value) == expected
+
+    def make(self, steps, **kwargs):
+        return SlowToolExecutor({"name": "test_skill", "steps": steps}, {}, emit_events=False, **kwargs)
+
+    async def test_step_timeout_fails_step(self):
+        steps = [
+            {"name": "hang", "tool": "kubectl_logs", "args": {"sleep": 5}, "timeout": 0.1},
+            {"name": "after", "compute": "result = 1"},
+        ]
+        executor = self.make(steps)
+        result = await executor.execute()
+        assert "Timed out after 0.1s" in result
+        assert "Skill failed at step 1" in result
+        assert executor.cancelled_tools == ["kubectl_logs"]
+        assert executor.step_results[0]["timed_out"]
+        assert "after" not in executor.context
+
+    async def test_step_timeout_with_continue(self):
+        steps = [
+            {"name": "hang", "tool": "kubectl_logs", "args": {"sleep": 5}, "timeout": 0.1, "on_error": "continue"},
+            {"name": "after", "compute": "result = 1"},
+        ]
+        executor = self.make(steps)
+        await executor.execute()
+        assert executor.context["after"] == 1
+
+    @pytest.mark.parametrize("on_error,fatal", [(None, False), ("continue", False), ("fail", True)])
+    async def test_foreach_step_timeout(self, on_error, fatal):
+        hang = {"name": "hang", "tool": "kubectl_logs", "foreach": [1, 2], "args": {"sleep": 5}, "timeout": 0.1}
+        if on_error:
+            hang["on_error"] = on_error
+        executor = self.make([hang, {"name": "after", "compute": "result = 1"}])
+        result = await executor.execute()
+        assert "Timed out after 0.1s" in result
+        assert ("Skill failed at step 1" in result) == fatal
+        assert ("after" in executor.context) == (not fatal)
+
+    async def test_skill_timeout_cancels_running_steps(self):
+        steps = [
+            {"name": "fast", "tool": "gitlab_mr_list", "args": {"sleep": 0}},
+            {"name": "hang", "tool": "bonfire_deploy", "args": {"sleep": 5}},
+        ]
+        executor = self.make(steps, timeout="0.2s")
+        start = asyncio.get_running_loop().time()
+        result = await executor.execute()
+        assert asyncio.get_running_loop().time() - start < 2
+        assert "Skill timed out after 0.2s" in result
+        assert executor.timeout_error == "Skill timed out after 0.2s"
+        assert executor.cancelled_tools == ["bonfire_deploy"]
+        assert executor.context["fast"] == "gitlab_mr_list"
+
+    async def test_skill_timeout_from_definition(self):
+        executor = self.make([], timeout=None)
+        assert executor.timeout is None
+        executor = SlowToolExecutor({"name": "s", "steps": [], "timeout": "2m"}, {}, emit_events=False)
+        assert executor.timeout == 120.0
+
+
+class TestStream:
+    """Tests for streaming the transcript step by step."""
+
+    STEPS = [
+        {"name": "fast", "tool": "gitlab_mr_list", "args": {"sleep": 0}},
+        {"name": "slow", "tool": "bonfire_deploy", "args": {"sleep": 0.3}},
+    ]
+
+    def make(self):
+        return SlowToolExecutor({"name": "test_skill", "steps": self.STEPS}, {}, emit_events=False)
+
+    async def test_chunk_per_step(self):
+        executor = self.make()
+        chunks = []
+        async for chunk in executor.stream():
+            if chunk.kind == "step" and chunk.step_index == 0:
+                assert "slow" not in executor.context  # Yielded before step 2 finished
+            chunks.append(chunk)
+
+        assert [(c.kind, c.step_index, c.completed_steps) for c in chunks] == [
+            ("start", None, 0),
+            ("step", 0, 1),
+            ("step", 1, 2),
+            ("end", None, 2),
+        ]
+        assert {c.total_steps for c in chunks} == {2}
+        assert chunks[1].message == "Step 1: fast"
+        assert "Step 1: fast" in chunks[1].text
+        assert "Completed in" in chunks[-1].text
+
+        transcript = await self.make().execute()
+        assert transcript.startswith("\n".join(c.text for c in chunks[:3]) + "\n")
+
+    async def test_closing_stream_cancels_run(self):
+        executor = self.make()
+        stream = executor.stream()
+        async for chunk in stream:
+            if chunk.kind == "step":
+                break
+        await stream.aclose()
+        assert executor.cancelled_tools == ["bonfire_deploy"]
+
+    async def test_progress_notifications(self):
+        class FakeContext:
+            def __init__(self, fail=False):
+                self.calls = []
+                self.fail = fail
+
+            async def report_progress(self, progress, total=None, message=None):
+                self.calls.append((progress, total, message))
+                if self.fail:
+                    raise ValueError("Context is not available outside of a request")
+
+        ctx = FakeContext()
+        result = await skill_engine._execute_with_progress(self.make(), ctx)
+        assert "Step 2: slow" in result
+        assert ctx.calls == [
+            (0, 2, "Starting test_skill"),
+            (1, 2, "Step 1: fast"),
+            (2, 2, "Step 2: slow"),
+            (2, 2, "Completed: 2 succeeded, 0 failed"),
+        ]
+
+        ctx = FakeContext(fail=True)
+        await skill_engine._execute_with_progress(self.make(), ctx)
+        assert len(ctx.calls) == 1
+
+
+class TestProfile:
+    """Tests for profile=True runs."""
+
+    async def test_profile_report_and_trace(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(skill_engine, "PROFILES_DIR", tmp_path)
+        steps = [
+            {"name": "list", "compute": "result = [{'iid': 1}, {'iid': 3}]", "output": "mrs"},
+            {"name": "view", "foreach": "mrs", "as": "mr", "tool": "gitlab_mr_view", "args": {"mr_id": "{{ mr.iid }}"}},
+        ]
+        executor = make_fake_executor(steps, profile=True)
+        result = await executor.execute()
+
+        assert "### ⏱️ Profile" in result
+        assert "step 1: list" in result
+        assert "compute_exec" in result
+        assert "tool gitlab_mr_view ×2" in result
+
+        traces = list(tmp_path.glob("test_skill-*.trace.json"))
+        assert len(traces) == 1
+        assert str(traces[0]) in result
+
+    async def test_no_profile_by_default(self):
+        executor = make_fake_executor([{"name": "a", "compute": "result = 1"}])
+        assert executor.profiler is None
+        assert "Profile" not in await executor.execute()
+
+
+class TestPreflight:
+    """Tests for running the pre-flight phase before the first step."""
+
+    @pytest.fixture
+    def preflights(self, monkeypatch):
+        """Record pre-flight runs instead of warming anything."""
+        runs = []
+
+        class FakePreflight:
+            def __init__(self, skill, render=None):
+                self.skill = skill
+                self.render = render
+
+            async def run(self):
+                runs.append(self.render("{{ inputs.env }}"))
+                return skill_preflight.PreflightReport(modules={"k8s": None})
+
+        monkeypatch.setattr(skill_engine, "SkillPreflight", FakePreflight)
+        return runs
+
+    async def test_runs_before_steps(self, preflights):
+        executor = make_fake_executor([{"name": "a", "compute": "result = 1"}], preflight=True)
+        executor.inputs["env"] = "stage"
+        await executor.execute()
+        assert preflights == ["stage"]
+        assert executor.preflight_report.modules == {"k8s": None}
+
+    async def test_disabled(self, preflights):
+        steps = [{"name": "a", "compute": "result = 1"}]
+        await make_fake_executor(steps).execute()
+        skill = {"name": "test_skill", "steps": steps, "preflight": False}
+        await FakeToolExecutor(skill, {}, emit_events=False, preflight=True).execute()
+        assert preflights == []
+
+
+class TestCompute:
+    """Tests for compute block execution and its caches."""
+
+    def test_output_name_preferred(self):
+        executor = make_executor()
+        assert executor._exec_compute_internal("summary = 1\nresult = 2", "summary") == 1
+
+    def test_result_fallback(self):
+        executor = make_executor()
+        executor.context["items"] = [1, 2, 3]
+        assert executor._exec_compute_internal("result = sum(items)", "total") == 6
+
+    def test_return_line_fallback(self):
+        executor = make_executor()
+        code = "def double(v):\n    return v * 2\nvalue = 21"
+        executor.context["v"] = 4
+        assert executor._exec_compute_internal(code, "other") == 8
+
+    def test_invalid_return_line_only_fails_when_used(self):
+        executor = make_executor()
+        code = "def pair():\n    return (1,\n            2)\nresult = pair()"
+        assert executor._exec_compute_internal(code, "out") == (1, 2)
+
+    def test_templated_compute(self):
+        executor = make_executor(inputs={"n": 5})
+        assert executor._exec_compute_internal("result = {{ inputs.n }} + 1", "out") == 6
+
+    def test_sandbox_globals(self):
+        executor = make_executor()
+        assert executor._exec_compute_internal("result = re.sub('a', 'b', 'aa')", "out") == "bb"
+
+    def test_sandbox_globals_built_once(self):
+        executor = make_executor()
+        executor._exec_compute_internal("result = 1", "out")
+        assert skill_engine._compute_globals() is skill_engine._compute_globals()
+        assert skill_engine._compute_globals.cache_info().misses == 1
+
+    def test_sandbox_builtins_not_shared(self):
+        executor = make_executor()
+        executor._exec_compute_internal("__builtins__['len'] = lambda value: -1", "out")
+        assert executor._exec_compute_internal("result = len('abc')", "out") == 3
+
+    def test_compute_precompiled_on_load(self):
+        code = "result = 'precompiled compute block'"
+        make_executor(steps=[{"name": "a", "compute": code}])
+        hits = skill_engine._compile_compute.cache_info().hits
+        skill_engine._compile_compute(code)
+        assert skill_engine._compile_compute.cache_info().hits == hits + 1
+
+    def test_compute_error_reported(self):
+        executor = make_executor()
+        assert executor._exec_compute("result = 1 / 0", "out").startswith("<compute error:")
@@ -0,0 +1,128 @@
+"""Tests for the append-only skill execution event log."""
+
+import importlib.util
+import json
+import os
+import socket
+from pathlib import Path
+
+import pytest
+
+EVENTS_FILE = Path(__file__).parent.parent / "tool_modules" / "aa_workflow" / "src" / "skill_execution_events.py"
+
+STEPS = [{"name": "fetch", "tool": "gitlab_mr_list"}, {"name": "report", "compute": "result = 1"}]
+
+
+@pytest.fixture
+def events(tmp_path, monkeypatch):
+    """Load skill_execution_events.py directly, writing under tmp_path."""
+    spec = importlib.util.spec_from_file_location("skill_execution_events", EVENTS_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "EXECUTIONS_DIR", tmp_path / "executions")
+    monkeypatch.setattr(module, "EVENT_SOCKET", tmp_path / "events.sock")
+    return module
+
+
+def read_log(emitter):
+    return [json.loads(line) for line in emitter.events_file.read_text().splitlines()]
+
+
+def read_status(emitter):
+    return json.loads(emitter.status_file.read_text())
+
+
+class TestEventLog:
+    """Tests for the per-run event log and status header."""
+
+    def test_events_appended_in_order(self, events):
+        emitter = events.SkillExecutionEmitter("my_skill", STEPS)
+        emitter.skill_start()
+        emitter.step_start(0)
+        emitter.step_complete(0, 12, "ok")
+        emitter.skill_complete(True, 20)
+
+        log = read_log(emitter)
+        assert [e["type"] for e in log] == ["skill_start", "step_start", "step_complete", "skill_complete"]
+        assert [e["seq"] for e in log] == [1, 2, 3, 4]
+        assert {e["executionId"] for e in log} == {emitter.execution_id}
+        assert log[2]["stepName"] == "fetch"
+
+        status = read_status(emitter)
+        assert status["status"] == "success"
+        assert status["totalSteps"] == 2
+        assert status["endTime"] is not None
+        assert status["eventsFile"] == emitter.events_file.name
+        assert "events" not in status
+
+    def test_status_rewritten_only_on_change(self, events):
+        emitter = events.SkillExecutionEmitter("my_skill", STEPS)
+        emitter.step_start(0)
+        mtime = emitter.status_file.stat().st_mtime_ns
+        os.utime(emitter.status_file, ns=(0, 0))
+        emitter.memory_read(0, "state/current_work")
+        assert emitter.status_file.stat().st_mtime_ns == 0
+        emitter.step_start(1)
+        assert emitter.status_file.stat().st_mtime_ns >= mtime
+        assert read_status(emitter)["currentStepIndex"] == 1
+
+    def test_concurrent_runs_use_separate_files(self, events):
+        first = events.SkillExecutionEmitter("my_skill", STEPS)
+        second = events.SkillExecutionEmitter("my_skill", STEPS)
+        first.skill_start()
+        second.skill_start()
+        second.step_start(1)
+        assert first.events_file != second.events_file
+        assert len(read_log(first)) == 1
+        assert len(read_log(second)) == 2
+
+    def test_events_after_completion_are_kept(self, events):
+        emitter = events.SkillExecutionEmitter("my_skill", STEPS)
+        emitter.skill_cancelled("Skill timed out after 5s", 5000)
+        emitter.skill_complete(False, 5001)
+        assert [e["type"] for e in read_log(emitter)] == ["skill_cancelled", "skill_complete"]
+        assert read_status(emitter)["status"] == "failed"
+
+    def test_prune_keeps_running_and_newest(self, events):
+        runs = [events.SkillExecutionEmitter(f"skill_{i}", STEPS) for i in range(4)]
+        for i, run in enumerate(runs):
+            run.skill_start()
+            if i != 0:
+                run.skill_complete(True, 1)
+            os.utime(run.status_file, (i, i))
+
+        assert events.prune_executions(keep=1) == 2
+        assert runs[0].status_file.exists()  # still running
+        assert runs[3].status_file.exists()  # newest
+        assert not runs[1].status_file.exists()
+        assert not runs[1].events_file.exists()
+
+
+class TestEventSocket:
+    """Tests for the optional push channel."""
+
+    def test_events_pushed_to_listener(self, events):
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(events.EVENT_SOCKET))
+        server.listen(1)
+        try:
+            emitter = events.SkillExecutionEmitter("my_skill", STEPS)
+            conn, _ = server.accept()
+            emitter.skill_start()
+            emitter.skill_complete(True, 1)
+            conn.settimeout(2)
+            received = b""
+            while received.count(b"\n") < 2:
+                received += conn.recv(65536)
+            conn.close()
+        finally:
+            server.close()
+
+        pushed = [json.loads(line) for line in received.decode().splitlines()]
+        assert pushed == read_log(emitter)
+
+    def test_no_listener(self, events):
+        emitter = events.SkillExecutionEmitter("my_skill", STEPS)
+        assert emitter._push is None
+        emitter.skill_start()
+        assert len(read_log(emitter)) == 1
@@ -0,0 +1,158 @@
+"""Tests for skill step dependency analysis (parallel step execution)."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SKILL_GRAPH_FILE = Path(__file__).parent.parent / "tool_modules" / "aa_workflow" / "src" / "skill_graph.py"
+
+
+@pytest.fixture(scope="module")
+def graph():
+    """Load skill_graph.py directly (it has no MCP dependencies)."""
+    spec = importlib.util.spec_from_file_location("skill_graph", SKILL_GRAPH_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestToolClassification:
+    """Tests for read-only tool detection."""
+
+    @pytest.mark.parametrize(
+        "tool",
+        ["gitlab_mr_list", "jira_view_issue", "kubectl_get_pods", "gitlab_commit_list", "memory_read"],
+    )
+    def test_read_only_tools(self, graph, tool):
+        assert graph.is_read_only_tool(tool)
+
+    @pytest.mark.parametrize(
+        "tool",
+        ["gitlab_mr_create", "git_checkout", "jira_set_status", "bonfire_deploy", "vpn_connect", "make_target"],
+    )
+    def test_mutating_tools(self, graph, tool):
+        assert not graph.is_read_only_tool(tool)
+
+
+class TestNameExtraction:
+    """Tests for context name extraction."""
+
+    def test_template_names(self, graph):
+        names = graph.template_names("MR {{ mr.iid }} for {{ inputs.issue_key | upper }} '{{ 'x' }}'")
+        assert names == {"mr", "inputs"}
+
+    def test_template_names_plain_text(self, graph):
+        assert graph.template_names("no templates here") == set()
+
+    def test_condition_names(self, graph):
+        assert graph.condition_names("not mr_info and inputs.force") == {"mr_info", "inputs"}
+
+    def test_compute_names(self, graph):
+        code = "items = []\nfor x in mrs:\n    items.append(x)\nctx['k'] = 1\nresult = items"
+        reads, mutated, opaque = graph.compute_names(code)
+        assert "mrs" in reads
+        assert mutated == {"items", "ctx"}
+        assert not opaque
+
+    def test_compute_names_opaque(self, graph):
+        _, _, opaque = graph.compute_names("result = locals().get('thing')")
+        assert opaque
+
+    def test_compute_names_unparseable(self, graph):
+        reads, mutated, _ = graph.compute_names("result = foo(")
+        assert "foo" in reads
+        assert "foo" in mutated
+
+
+class TestStepGraph:
+    """Tests for dependency graph construction."""
+
+    def test_independent_reads_overlap(self, graph):
+        steps = [
+            {"name": "a", "tool": "gitlab_mr_list", "output": "mrs", "on_error": "continue"},
+            {"name": "b", "tool": "jira_view_issue", "output": "issue", "on_error": "continue"},
+            {"name": "c", "compute": "result = len(mrs) + len(issue)", "output": "summary"},
+        ]
+        nodes = graph.build_step_graph(steps)
+        assert nodes[0].concurrent and nodes[1].concurrent
+        assert nodes[1].deps == set()
+        assert nodes[2].deps == {0, 1}
+
+    def test_data_dependency(self, graph):
+        steps = [
+            {"name": "a", "tool": "gitlab_mr_list", "output": "mrs", "on_error": "continue"},
+            {"name": "b", "tool": "gitlab_mr_view", "args": {"id": "{{ mrs.first }}"}, "on_error": "continue"},
+        ]
+        nodes = graph.build_step_graph(steps)
+        assert nodes[1].deps == {0}
+
+    def test_mutating_tool_is_barrier(self, graph):
+        steps = [
+            {"name": "a", "tool": "gitlab_mr_list", "on_error": "continue"},
+            {"name": "b", "tool": "git_checkout", "on_error": "continue"},
+            {"name": "c", "tool": "jira_view_issue", "on_error": "continue"},
+        ]
+        nodes = graph.build_step_graph(steps)
+        assert nodes[1].barrier
+        assert nodes[1].deps == {0}
+        assert nodes[2].deps == {1}
+
+    def test_fatal_step_gates_later_steps(self, graph):
+        steps = [
+            {"name": "a", "tool": "gitlab_mr_list"},
+            {"name": "b", "tool": "jira_view_issue"},
+        ]
+        nodes = graph.build_step_graph(steps)
+        assert nodes[0].fatal
+        assert nodes[1].deps == {0}
+
+    def test_parallel_override(self, graph):
+        steps = [
+            {"name": "a", "tool": "gitlab_mr_create", "parallel": True, "on_error": "continue"},
+            {"name": "b", "tool": "gitlab_mr_list", "parallel": False, "on_error": "continue"},
+        ]
+        nodes = graph.build_step_graph(steps)
+        assert nodes[0].concurrent
+        assert nodes[1].barrier
+
+    def test_then_is_barrier(self, graph):
+        steps = [
+            {"name": "a", "tool": "gitlab_mr_list", "on_error": "continue"},
+            {"name": "done", "then": [{"return": "early"}]},
+            {"name": "b", "tool": "jira_view_issue", "on_error": "continue"},
+        ]
+        nodes = graph.build_step_graph(steps)
+        assert nodes[1].deps == {0}
+        assert nodes[2].deps == {1}
+
+    def test_foreach_step(self, graph):
+        step = {
+            "name": "view",
+            "foreach": "my_mrs",
+            "as": "mr",
+            "tool": "gitlab_mr_view",
+            "args": {"project": "{{ resolved.project }}", "mr_id": "{{ mr.iid }} {{ loop_index }}"},
+            "output": "details",
+        }
+        node = graph.analyze_step(step, 0)
+        assert node.kind == "foreach"
+        assert node.reads == {"my_mrs", "resolved"}
+        assert node.writes == {"details"}
+        assert node.concurrent
+        assert not node.fatal
+        assert graph.analyze_step({**step, "on_error": "fail"}, 0).fatal
+
+    def test_serial(self, graph):
+        steps = [{"name": str(i), "tool": "gitlab_mr_list", "on_error": "continue"} for i in range(3)]
+        nodes = graph.build_step_graph(steps, serial=True)
+        assert [n.deps for n in nodes] == [set(), {0}, {1}]
+
+    def test_all_skills_build(self, graph, skills_dir):
+        """Every shipped skill should produce a graph whose deps point backwards."""
+        import yaml
+
+        for skill_file in skills_dir.glob("*.yaml"):
+            skill = yaml.safe_load(skill_file.read_text()) or {}
+            for node in graph.build_step_graph(skill.get("steps", [])):
+                assert all(dep < node.index for dep in node.deps), skill_file.name
@@ -0,0 +1,145 @@
+"""Tests for the skill pre-flight phase."""
+
+import pytest
+
+from server import tool_discovery
+from server.module_servers import ModuleServerRegistry
+from tool_modules.aa_workflow.src import skill_preflight
+from tool_modules.aa_workflow.src.skill_preflight import SkillPreflight, iter_tool_steps
+
+K8S_TOOLS = '''
+from mcp.server.fastmcp import FastMCP
+
+
+def register_tools(server: FastMCP) -> int:
+    @server.tool()
+    async def kubectl_get_pods(namespace: str, environment: str = "stage") -> str:
+        """List pods."""
+        return namespace
+
+    return 1
+'''
+
+PROMETHEUS_TOOLS = '''
+from mcp.server.fastmcp import FastMCP
+
+
+def register_tools(server: FastMCP) -> int:
+    @server.tool()
+    async def prometheus_alerts(environment: str = "stage") -> str:
+        """List alerts."""
+        return environment
+
+    return 1
+'''
+
+TOOL_MODULES = {"kubectl_get_pods": "k8s", "prometheus_alerts": "prometheus", "broken_tool": "broken"}
+
+
+class FakeDiscovery:
+    """Stands in for SkillToolDiscovery on an in-memory skill."""
+
+    def discover_tools(self, skill_name):
+        return set(TOOL_MODULES) | {"__has_compute_block__"}
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Registry over k8s and prometheus demo modules (and a broken one)."""
+    for module, source in (("k8s", K8S_TOOLS), ("prometheus", PROMETHEUS_TOOLS), ("broken", "raise ImportError()")):
+        src = tmp_path / f"aa_{module}" / "src"
+        src.mkdir(parents=True)
+        (src / "tools_basic.py").write_text(source)
+    return ModuleServerRegistry(tmp_path)
+
+
+@pytest.fixture
+def services(monkeypatch):
+    """Record auth checks, refreshes and warmed URLs instead of running them."""
+    calls = {"check": [], "refresh": [], "warm": []}
+    valid = {"stage"}
+
+    async def check_cluster_auth(environment):
+        calls["check"].append(environment)
+        return environment in valid
+
+    async def ensure_cluster_auth(environment, auto_refresh=True):
+        calls["refresh"].append(environment)
+        return True, ""
+
+    async def warm_connections(urls, timeout=5.0):
+        calls["warm"].extend(urls)
+        return {url: True for url in urls}
+
+    monkeypatch.setattr(tool_discovery, "get_module_for_tool", TOOL_MODULES.get)
+    monkeypatch.setattr(skill_preflight, "check_cluster_auth", check_cluster_auth)
+    monkeypatch.setattr(skill_preflight, "ensure_cluster_auth", ensure_cluster_auth)
+    monkeypatch.setattr(skill_preflight, "warm_connections", warm_connections)
+    monkeypatch.setattr(skill_preflight, "get_service_url", lambda service, env: f"https://{service}.{env}.example")
+    return calls
+
+
+async def run_preflight(steps, registry, inputs=None):
+    inputs = inputs or {}
+    render = lambda text: text.replace("{{ inputs.env }}", inputs.get("env", ""))  # noqa: E731
+    preflight = SkillPreflight({"name": "demo", "steps": steps}, render, registry, FakeDiscovery())
+    return await preflight.run()
+
+
+class TestIterToolSteps:
+    """Tests for walking nested tool steps."""
+
+    def test_conditional_flags(self):
+        steps = [
+            {"name": "a", "tool": "t1"},
+            {"name": "b", "tool": "t2", "condition": "x"},
+            {"name": "c", "parallel": [{"tool": "t3"}]},
+            {"name": "d", "compute": "result = 1", "then": [{"tool": "t4"}]},
+            {"name": "e", "loop": "items", "do": [{"tool": "t5"}]},
+        ]
+        assert [(step["tool"], conditional) for step, conditional in iter_tool_steps(steps)] == [
+            ("t1", False),
+            ("t2", True),
+            ("t3", False),
+            ("t4", True),
+            ("t5", True),
+        ]
+
+
+class TestSkillPreflight:
+    """Tests for module, auth and connection warm-up."""
+
+    async def test_imports_modules_and_checks_auth_once(self, registry, services):
+        steps = [
+            {"name": "pods", "tool": "kubectl_get_pods", "args": {"namespace": "a"}},
+            {"name": "more_pods", "tool": "kubectl_get_pods", "args": {"namespace": "b"}},
+            {"name": "alerts", "tool": "prometheus_alerts"},
+        ]
+        report = await run_preflight(steps, registry)
+        assert report.modules == {"k8s": None, "prometheus": None}
+        assert registry.loads == 2
+        assert services["check"] == ["stage"]  # Tool defaults, one check
+        assert services["refresh"] == []
+        assert report.auth == {"stage": True}
+        assert services["warm"] == ["https://prometheus.stage.example"]
+
+    async def test_refreshes_only_for_unconditional_steps(self, registry, services):
+        steps = [
+            {"name": "prod", "tool": "kubectl_get_pods", "args": {"environment": "{{ inputs.env }}"}},
+            {"name": "eph", "tool": "kubectl_get_pods", "args": {"environment": "ephemeral"}, "condition": "x"},
+        ]
+        report = await run_preflight(steps, registry, {"env": "production"})
+        assert sorted(services["check"]) == ["ephemeral", "production"]
+        assert services["refresh"] == ["production"]
+        assert report.auth == {"production": True, "ephemeral": False}
+
+    async def test_unresolved_environment_skipped(self, registry, services):
+        steps = [{"name": "pods", "tool": "kubectl_get_pods", "args": {"environment": "{{ prev.env }}"}}]
+        report = await run_preflight(steps, registry)
+        assert report.modules == {"k8s": None}
+        assert services["check"] == []
+
+    async def test_load_errors_reported(self, registry, services):
+        report = await run_preflight([{"name": "x", "tool": "broken_tool"}], registry)
+        assert report.modules["broken"] is not None
+        assert "0/1 modules" in report.summary()
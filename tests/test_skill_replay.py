@@ -0,0 +1,160 @@
+"""Tests for skill record/replay."""
+
+import time
+
+import pytest
+
+from tool_modules.aa_workflow.src.skill_engine import SkillExecutor
+from tool_modules.aa_workflow.src.skill_replay import (
+    LATENCY_RECORDED,
+    RecordedCall,
+    RecordingExecutor,
+    ReplayExecutor,
+    SkillRecording,
+    fixture_path,
+)
+
+SKILL = {
+    "name": "demo_skill",
+    "inputs": [{"name": "issue_key", "required": True}],
+    "steps": [
+        {
+            "name": "issue",
+            "tool": "jira_view_issue",
+            "args": {"issue_key": "{{ inputs.issue_key }}"},
+            "output": "issue",
+        },
+        {"name": "summary", "compute": "result = issue.upper()", "output": "summary"},
+        {"name": "branch", "tool": "git_branch_create", "args": {"name": "{{ summary }}"}, "output": "branch"},
+    ],
+    "outputs": [{"name": "report", "value": "{{ summary }} on {{ branch }}"}],
+}
+
+
+@pytest.fixture
+def live_tools(monkeypatch):
+    """Answer SkillExecutor tool calls in-process, as a live run would."""
+    calls = []
+
+    async def exec_tool(self, tool_name, args):
+        calls.append((tool_name, args))
+        return {"success": True, "result": f"{tool_name}:{'|'.join(map(str, args.values()))}", "duration": 0.05}
+
+    monkeypatch.setattr(SkillExecutor, "_exec_tool", exec_tool)
+    return calls
+
+
+async def record(inputs):
+    executor = RecordingExecutor(SKILL, inputs, emit_events=False)
+    output = await executor.execute()
+    return executor.recording, output
+
+
+class TestRecording:
+    """Tests for capturing tool calls."""
+
+    async def test_records_calls(self, live_tools):
+        recording, _ = await record({"issue_key": "AAP-1"})
+        assert recording.skill_name == "demo_skill"
+        assert recording.inputs == {"issue_key": "AAP-1"}
+        assert [(c.tool, c.args) for c in recording.calls] == [
+            ("jira_view_issue", {"issue_key": "AAP-1"}),
+            ("git_branch_create", {"name": "JIRA_VIEW_ISSUE:AAP-1"}),
+        ]
+        assert recording.calls[0].result["result"] == "jira_view_issue:AAP-1"
+
+    async def test_save_load_roundtrip(self, live_tools, tmp_path):
+        recording, _ = await record({"issue_key": "AAP-1"})
+        path = fixture_path("demo_skill", tmp_path)
+        recording.save(path)
+        assert SkillRecording.load(path) == recording
+
+    def test_load_invalid(self, tmp_path):
+        path = tmp_path / "bad.json"
+        path.write_text('{"calls": []}')
+        with pytest.raises(ValueError):
+            SkillRecording.load(path)
+
+
+class TestReplay:
+    """Tests for replaying recorded tool calls."""
+
+    async def test_replay_matches_live_output(self, live_tools):
+        recording, live_output = await record({"issue_key": "AAP-1"})
+        live_tools.clear()
+
+        replay = ReplayExecutor(SKILL, recording)
+        replay_output = await replay.execute()
+        assert live_tools == []  # No live tool calls
+        assert replay.misses == []
+        assert replay.context["branch"] == "git_branch_create:JIRA_VIEW_ISSUE:AAP-1"
+        strip_timing = lambda text: [line for line in text.splitlines() if "⏱️" not in line]  # noqa: E731
+        assert strip_timing(replay_output) == strip_timing(live_output)
+
+    async def test_changed_args_fall_back_to_tool_order(self):
+        recording = SkillRecording(
+            "demo_skill",
+            {"issue_key": "AAP-1"},
+            [
+                RecordedCall("jira_view_issue", {"issue_key": "AAP-1"}, {"success": True, "result": "first"}),
+                RecordedCall("git_branch_create", {"name": "old"}, {"success": True, "result": "b1"}),
+            ],
+        )
+        replay = ReplayExecutor(SKILL, recording, inputs={"issue_key": "AAP-2"})
+        await replay.execute()
+        assert replay.context["issue"] == "first"
+        assert replay.context["branch"] == "b1"
+        assert replay.misses == []
+
+    async def test_exact_args_preferred(self):
+        recording = SkillRecording(
+            "demo_skill",
+            calls=[
+                RecordedCall("jira_view_issue", {"issue_key": "AAP-9"}, {"success": True, "result": "nine"}),
+                RecordedCall("jira_view_issue", {"issue_key": "AAP-1"}, {"success": True, "result": "one"}),
+            ],
+        )
+        replay = ReplayExecutor(SKILL, recording, inputs={"issue_key": "AAP-1"})
+        assert (await replay._exec_tool("jira_view_issue", {"issue_key": "AAP-1"}))["result"] == "one"
+        assert (await replay._exec_tool("jira_view_issue", {"issue_key": "AAP-1"}))["result"] == "nine"
+        assert not (await replay._exec_tool("jira_view_issue", {"issue_key": "AAP-1"}))["success"]
+        assert len(replay.misses) == 1
+
+    async def test_default_result_for_misses(self):
+        replay = ReplayExecutor(SKILL, None, inputs={"issue_key": "AAP-1"}, default_result="ok")
+        await replay.execute()
+        assert replay.context["summary"] == "OK"
+        assert [tool for tool, _ in replay.misses] == ["jira_view_issue", "git_branch_create"]
+
+    async def test_steps_run_and_unused_calls(self):
+        skill = {
+            **SKILL,
+            "steps": [*SKILL["steps"], {"name": "never", "condition": "false", "tool": "jira_view_issue"}],
+        }
+        recording = SkillRecording(
+            "demo_skill",
+            {"issue_key": "AAP-1"},
+            [
+                RecordedCall("jira_view_issue", {"issue_key": "AAP-1"}, {"success": True, "result": "one"}),
+                RecordedCall("git_branch_create", {"name": "ONE"}, {"success": True, "result": "b1"}),
+                RecordedCall("jira_view_issue", {"issue_key": "AAP-1"}, {"success": True, "result": "unused"}),
+            ],
+        )
+        replay = ReplayExecutor(skill, recording)
+        await replay.execute()
+        assert replay.steps_run == {0, 1, 2}
+        assert [call.result["result"] for call in replay.unused_calls] == ["unused"]
+
+    async def test_recorded_latency(self, live_tools):
+        recording, _ = await record({"issue_key": "AAP-1"})
+
+        start = time.perf_counter()
+        await ReplayExecutor(SKILL, recording).execute()
+        zero = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await ReplayExecutor(SKILL, recording, latency=LATENCY_RECORDED).execute()
+        recorded = time.perf_counter() - start
+
+        assert recorded >= 0.1  # Two calls recorded at 50ms each
+        assert zero < recorded
@@ -0,0 +1,99 @@
+"""Tests for the startup profiler and its budgets."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from server.profiler import profile_span
+from server.startup_profiler import REGISTER, StartupProfiler, StartupReport, get_budgets
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def slow_package(tmp_path, monkeypatch):
+    """Importable package whose modules import each other."""
+    package = tmp_path / "slowpkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("from slowpkg import child\n")
+    (package / "child.py").write_text("import time\n\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in ("slowpkg", "slowpkg.child"):
+        sys.modules.pop(name, None)
+
+
+def run_profile(*args):
+    """Run python -m server --profile-startup --json with the given arguments."""
+    result = subprocess.run(
+        [sys.executable, "-m", "server", "--profile-startup", "--json", *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    return result.returncode, json.loads(result.stdout)
+
+
+class TestStartupProfiler:
+    """Tests for timing imports and registration."""
+
+    def test_imports_timed(self, slow_package):
+        profiler = StartupProfiler().start()
+        with profile_span("demo", REGISTER):
+            import slowpkg  # noqa: F401
+        report = profiler.stop()
+
+        imports = {module: (self_ms, cumulative_ms) for module, self_ms, cumulative_ms in report.imports}
+        assert imports["slowpkg.child"][0] >= 20
+        assert imports["slowpkg"][1] >= imports["slowpkg.child"][1]
+        assert imports["slowpkg"][0] < imports["slowpkg.child"][0]
+        assert report.imports[0][0] == "slowpkg.child"  # Slowest own time first
+        assert report.register_ms["demo"] >= imports["slowpkg"][1]
+
+    def test_stop_removes_import_hook(self):
+        profiler = StartupProfiler().start()
+        profiler.stop()
+        assert profiler._timer not in sys.meta_path
+
+
+class TestStartupReport:
+    """Tests for budgets and the text report."""
+
+    def test_violations(self):
+        report = StartupReport(
+            total_ms=900,
+            register_ms={"git_basic": 100, "slack": 700},
+            budget_ms=1000,
+            module_budget_ms=500,
+        )
+        assert report.violations() == ["slack took 700ms to register (budget 500ms)"]
+
+        report.budget_ms = 800
+        assert len(report.violations()) == 2
+        assert "Over budget" in report.format()
+
+    def test_no_budgets(self):
+        assert StartupReport(total_ms=1e6, register_ms={"slack": 1e6}).violations() == []
+
+    def test_cli_budget_overrides_config(self):
+        assert get_budgets(1234)[0] == 1234
+
+
+class TestProfileStartup:
+    """Startup of a real server stays within budget."""
+
+    def test_within_budget(self):
+        status, report = run_profile("--tools", "workflow,git_basic,gitlab_basic", "--eager-tools")
+        assert report["violations"] == []
+        assert status == 0
+        assert set(report["register_ms"]) == {"workflow", "git_basic", "gitlab_basic"}
+        assert report["imports"]
+
+    def test_over_budget_fails(self):
+        status, report = run_profile("--tools", "git_basic", "--startup-budget", "1")
+        assert status == 1
+        assert report["violations"]
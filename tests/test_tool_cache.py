@@ -0,0 +1,64 @@
+"""Tests for the content-addressed tool result cache."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+TOOL_CACHE_FILE = Path(__file__).parent.parent / "tool_modules" / "aa_workflow" / "src" / "tool_cache.py"
+
+
+@pytest.fixture(scope="module")
+def tool_cache():
+    """Load tool_cache.py directly (it has no MCP dependencies)."""
+    spec = importlib.util.spec_from_file_location("tool_cache", TOOL_CACHE_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestToolResultCache:
+    """Tests for ToolResultCache."""
+
+    def test_key_ignores_arg_order(self, tool_cache):
+        first = tool_cache.make_cache_key("jira_search", {"jql": "x", "limit": 5})
+        second = tool_cache.make_cache_key("jira_search", {"limit": 5, "jql": "x"})
+        assert first == second
+        assert first != tool_cache.make_cache_key("jira_search", {"jql": "y", "limit": 5})
+        assert first != tool_cache.make_cache_key("gitlab_mr_list", {"jql": "x", "limit": 5})
+
+    def test_hit_and_miss(self, tool_cache):
+        cache = tool_cache.ToolResultCache()
+        assert cache.get("jira_search", {"jql": "x"}, 60) is None
+        cache.put("jira_search", {"jql": "x"}, "AAP-1")
+        hit = cache.get("jira_search", {"jql": "x"}, 60)
+        assert hit.result == "AAP-1"
+        assert hit.age >= 0
+        assert cache.get_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_ttl_applied_at_lookup(self, tool_cache, monkeypatch):
+        cache = tool_cache.ToolResultCache()
+        now = [1000.0]
+        monkeypatch.setattr(tool_cache.time, "monotonic", lambda: now[0])
+        cache.put("jira_search", {}, "old")
+        now[0] += 90
+        assert cache.get("jira_search", {}, 60) is None
+        assert cache.get("jira_search", {}, 120).result == "old"
+
+    def test_lru_eviction(self, tool_cache):
+        cache = tool_cache.ToolResultCache(max_entries=2)
+        cache.put("t", {"n": 1}, "1")
+        cache.put("t", {"n": 2}, "2")
+        cache.get("t", {"n": 1}, 60)
+        cache.put("t", {"n": 3}, "3")
+        assert cache.get("t", {"n": 2}, 60) is None
+        assert cache.get("t", {"n": 1}, 60).result == "1"
+
+    def test_invalidate_by_tool(self, tool_cache):
+        cache = tool_cache.ToolResultCache()
+        cache.put("a", {}, "1")
+        cache.put("b", {}, "2")
+        assert cache.invalidate("a") == 1
+        assert cache.get("a", {}, 60) is None
+        assert cache.get("b", {}, 60).result == "2"
+        assert cache.invalidate() == 1
@@ -0,0 +1,144 @@
+"""Tests for tool discovery and the persisted tool manifest."""
+
+import json
+import os
+
+import pytest
+
+from server import tool_discovery
+from server.tool_discovery import ManifestCache, build_full_manifest, get_module_for_tool
+
+TOOLS_TEMPLATE = """
+def register_tools(server):
+    registry = ToolRegistry(server)
+{functions}
+    return registry.count
+"""
+
+FUNCTION_TEMPLATE = '''
+    @registry.tool()
+    async def {name}() -> str:
+        """Run {name}."""
+        return ""
+'''
+
+
+def write_tools(modules_dir, module, filename, names):
+    """Write a tools file registering the given tool names."""
+    path = modules_dir / f"aa_{module}" / "src" / filename
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(TOOLS_TEMPLATE.format(functions="".join(FUNCTION_TEMPLATE.format(name=n) for n in names)))
+    return path
+
+
+def bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+
+@pytest.fixture
+def modules_dir(tmp_path, monkeypatch):
+    """Tool modules directory with a fresh manifest cache and empty tool manifest."""
+    modules_dir = tmp_path / "tool_modules"
+    write_tools(modules_dir, "quay", "tools_basic.py", ["quay_get_tag", "quay_list_tags"])
+    write_tools(modules_dir, "quay", "tools_extra.py", ["quay_delete_tag"])
+    write_tools(modules_dir, "docker", "tools_basic.py", ["docker_compose_up"])
+    write_tools(modules_dir, "git", "tools_basic.py", ["docker_build", "git_status"])
+
+    monkeypatch.setattr(tool_discovery, "TOOL_MODULES_DIR", modules_dir)
+    monkeypatch.setattr(tool_discovery, "MANIFEST_CACHE_FILE", tmp_path / "tool_manifest.json")
+    monkeypatch.setattr(tool_discovery, "_manifest_cache", None)
+    monkeypatch.setattr(tool_discovery, "_MODULE_PREFIXES", None)
+    monkeypatch.setattr(tool_discovery, "_TOOL_MODULES", None)
+    monkeypatch.setattr(tool_discovery, "TOOL_MANIFEST", tool_discovery.ToolManifest())
+    return modules_dir
+
+
+def new_process():
+    """Drop the in-process cache, as a new server process would start without it."""
+    tool_discovery._manifest_cache = None
+    return tool_discovery.get_manifest_cache()
+
+
+EXPECTED = {
+    "docker": ["docker_compose_up"],
+    "git": ["docker_build", "git_status"],
+    "quay": ["quay_get_tag", "quay_list_tags", "quay_delete_tag"],
+}
+
+
+class TestManifestCache:
+    """Tests for persisting parsed tools files."""
+
+    def test_cold_then_warm(self, modules_dir, tmp_path):
+        assert build_full_manifest() == EXPECTED
+        assert tool_discovery.get_manifest_cache().parses == 4
+        assert (tmp_path / "tool_manifest.json").exists()
+
+        cache = new_process()
+        assert build_full_manifest() == EXPECTED
+        assert cache.parses == 0
+
+    def test_only_changed_files_reparsed(self, modules_dir):
+        build_full_manifest()
+        path = write_tools(modules_dir, "quay", "tools_extra.py", ["quay_delete_tag", "quay_copy_tag"])
+        bump_mtime(path)
+
+        cache = new_process()
+        assert build_full_manifest()["quay"] == ["quay_get_tag", "quay_list_tags", "quay_delete_tag", "quay_copy_tag"]
+        assert cache.parses == 1
+
+    def test_touched_file_not_reparsed(self, modules_dir):
+        build_full_manifest()
+        bump_mtime(modules_dir / "aa_git" / "src" / "tools_basic.py")
+
+        cache = new_process()
+        assert build_full_manifest() == EXPECTED
+        assert cache.parses == 0
+        assert not cache.save()  # New mtime was persisted by build_full_manifest
+
+    def test_removed_module_pruned(self, modules_dir, tmp_path):
+        build_full_manifest()
+        removed = modules_dir / "aa_docker" / "src" / "tools_basic.py"
+        removed.unlink()
+
+        new_process()
+        assert "docker" not in build_full_manifest()
+        files = json.loads((tmp_path / "tool_manifest.json").read_text())["files"]
+        assert str(removed) not in files
+        assert len(files) == 3
+
+    @pytest.mark.parametrize("content", ["not json", '{"version": 0, "files": {}}', "[]"])
+    def test_invalid_cache_ignored(self, modules_dir, tmp_path, content):
+        (tmp_path / "tool_manifest.json").write_text(content)
+        assert build_full_manifest() == EXPECTED
+        assert tool_discovery.get_manifest_cache().parses == 4
+
+    def test_tool_info_from_cache(self, modules_dir, tmp_path):
+        path = modules_dir / "aa_quay" / "src" / "tools_extra.py"
+        cache = ManifestCache(tmp_path / "cache.json")
+        cache.tools_for_file(path, "quay")
+        assert cache.save()
+
+        cache = ManifestCache(tmp_path / "cache.json")
+        (info,) = cache.tools_for_file(path, "quay")
+        assert cache.parses == 0
+        assert (info.name, info.module, info.tier, info.description) == (
+            "quay_delete_tag",
+            "quay",
+            tool_discovery.ToolTier.EXTRA,
+            "Run quay_delete_tag.",
+        )
+        assert info.line_number == 6
+
+
+class TestGetModuleForTool:
+    """Tests for resolving a tool's module before its module is loaded."""
+
+    def test_scanned_name_before_prefix(self, modules_dir):
+        assert get_module_for_tool("docker_compose_up") == "docker"
+        assert get_module_for_tool("docker_build") == "git"
+
+    def test_prefix_fallback(self, modules_dir):
+        assert get_module_for_tool("quay_new_tool") == "quay"
+        assert get_module_for_tool("unknown") is None
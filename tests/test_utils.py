@@ -1,14 +1,25 @@
 """Tests for shared utilities in server/utils.py."""
 
+import asyncio
+import os
+import subprocess
+import time
 from pathlib import Path
 
+import pytest
+
+from server import utils
 from server.utils import (
+    check_cluster_auth,
     get_kubeconfig,
     get_project_root,
     get_section_config,
     get_username,
+    invalidate_cluster_auth,
     load_config,
     resolve_repo_path,
+    run_cmd,
+    run_cmd_full,
 )
 
 
@@ -80,6 +91,51 @@ class TestGetKubeconfig:
         assert "config" in result
 
 
+class TestClusterAuthCache:
+    """Tests for reusing successful cluster auth checks."""
+
+    @pytest.fixture
+    def whoami(self, tmp_path, monkeypatch):
+        """Count `oc whoami` runs against a temporary kubeconfig."""
+        kubeconfig = tmp_path / "config.s"
+        kubeconfig.write_text("apiVersion: v1\n")
+        calls = []
+
+        async def run(cmd, cwd, env, timeout):
+            calls.append(cmd)
+            return 0, "me\n", ""
+
+        monkeypatch.setattr(utils, "get_kubeconfig", lambda environment, namespace="": str(kubeconfig))
+        monkeypatch.setattr(utils, "_run_process", run)
+        invalidate_cluster_auth()
+        yield calls, kubeconfig
+        invalidate_cluster_auth()
+
+    async def test_check_cached(self, whoami):
+        calls, _ = whoami
+        assert await check_cluster_auth("stage")
+        assert await check_cluster_auth("stage")
+        assert len(calls) == 1
+
+    async def test_invalidated(self, whoami, monkeypatch):
+        calls, kubeconfig = whoami
+        await check_cluster_auth("stage")
+        invalidate_cluster_auth("stage")
+        await check_cluster_auth("stage")
+        assert len(calls) == 2
+
+        stat = kubeconfig.stat()
+        os.utime(kubeconfig, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        await check_cluster_auth("stage")
+        assert len(calls) == 3
+
+        monkeypatch.setattr(utils, "AUTH_CHECK_TTL", 0)
+        invalidate_cluster_auth()
+        await check_cluster_auth("stage")
+        await check_cluster_auth("stage")
+        assert len(calls) == 5
+
+
 class TestGetUsername:
     """Tests for get_username function."""
 
@@ -112,3 +168,316 @@ class TestResolveRepoPath:
         result = resolve_repo_path(".")
         result_path = Path(result) if isinstance(result, str) else result
         assert result_path.exists()
+
+
+def _pid_alive(pid: int, wait: float = 2.0) -> bool:
+    """Check whether pid is still running, allowing time for a killed orphan to be reaped."""
+    deadline = time.time() + wait
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                if f.read().rsplit(")", 1)[1].split()[0] == "Z":
+                    return False  # Killed, waiting for init to reap it
+        except OSError:
+            pass
+        if time.time() >= deadline:
+            return True
+        time.sleep(0.05)
+
+
+class TestRunCmd:
+    """Tests for run_cmd/run_cmd_full process handling."""
+
+    async def test_success_and_failure(self):
+        assert await run_cmd(["echo", "hi"], use_shell=False) == (True, "hi\n")
+        assert await run_cmd(["bash", "-c", "echo oops >&2; exit 2"], use_shell=False) == (False, "oops\n")
+        assert await run_cmd_full(["bash", "-c", "echo out; echo err >&2"], use_shell=False) == (True, "out\n", "err\n")
+
+    async def test_command_not_found(self):
+        success, output = await run_cmd(["definitely-not-a-command-xyz"], use_shell=False)
+        assert not success
+        assert "Command not found" in output
+
+    async def test_timeout_kills_process_group(self, tmp_path):
+        pid_file = tmp_path / "child.pid"
+        script = f"sleep 30 & echo $! > {pid_file}; wait"
+        start = time.time()
+        success, output = await run_cmd(["bash", "-c", script], timeout=1, use_shell=False)
+        assert not success
+        assert "timed out" in output
+        assert time.time() - start < 10
+        assert not _pid_alive(int(pid_file.read_text()))
+
+    async def test_cancellation_kills_process_group(self, tmp_path):
+        pid_file = tmp_path / "child.pid"
+        script = f"sleep 30 & echo $! > {pid_file}; wait"
+        task = asyncio.create_task(run_cmd(["bash", "-c", script], use_shell=False))
+        for _ in range(100):
+            if pid_file.exists() and pid_file.read_text().strip():
+                break
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not _pid_alive(int(pid_file.read_text()))
+
+    async def test_sigterm_before_sigkill(self, tmp_path, caplog):
+        cleaned = tmp_path / "cleaned"
+        script = f"trap 'echo yes > {cleaned}; exit 0' TERM; sleep 30 & wait"
+        with caplog.at_level("INFO", logger="server.utils"):
+            success, _ = await run_cmd(["bash", "-c", script], timeout=1, use_shell=False)
+        assert not success
+        assert cleaned.read_text() == "yes\n"
+        assert "exited on SIGTERM in" in caplog.text
+
+    async def test_sigkill_after_grace(self, tmp_path, monkeypatch, caplog):
+        monkeypatch.setattr(utils, "TERMINATE_GRACE", 0.3)
+        pid_file = tmp_path / "child.pid"
+        script = f"trap '' TERM; sleep 30 & echo $! > {pid_file}; wait"
+        start = time.time()
+        await run_cmd(["bash", "-c", script], timeout=1, use_shell=False)
+        assert 1.3 <= time.time() - start < 5
+        assert not _pid_alive(int(pid_file.read_text()))
+        assert "ignored SIGTERM" in caplog.text
+
+    def test_sync_timeout_kills_process_group(self, tmp_path):
+        pid_file = tmp_path / "child.pid"
+        script = f"sleep 30 & echo $! > {pid_file}; wait"
+        success, output = utils.run_cmd_sync(["bash", "-c", script], timeout=1, use_shell=False)
+        assert (success, output) == (False, "Command timed out after 1s")
+        assert not _pid_alive(int(pid_file.read_text()))
+
+
+@pytest.fixture
+def shell_home(tmp_path, monkeypatch):
+    """Home directory with a .bashrc that counts how often it is sourced."""
+    home = tmp_path / "home"
+    home.mkdir()
+    (home / ".bashrc").write_text(f"echo x >> {tmp_path / 'sourced'}\nexport AA_TEST_TOKEN=one\n")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setattr(utils, "_shell_env", None)
+    monkeypatch.setattr(utils, "_shell_env_failure", None)
+    return home
+
+
+def _times_sourced(home):
+    sourced = home.parent / "sourced"
+    return len(sourced.read_text().splitlines()) if sourced.exists() else 0
+
+
+class TestShellEnvironment:
+    """Tests for running commands with the shell environment snapshot."""
+
+    async def test_rc_files_sourced_once(self, shell_home):
+        assert await run_cmd(["printenv", "AA_TEST_TOKEN"]) == (True, "one\n")
+        assert await run_cmd_full(["printenv", "AA_TEST_TOKEN"]) == (True, "one\n", "")
+        assert utils.run_cmd_sync(["printenv", "AA_TEST_TOKEN"]) == (True, "one\n")
+        assert _times_sourced(shell_home) == 1
+
+    async def test_rc_change_recaptures(self, shell_home):
+        await run_cmd(["true"])
+        bashrc_d = shell_home / ".bashrc.d"
+        bashrc_d.mkdir()
+        (bashrc_d / "token.sh").write_text("export AA_TEST_TOKEN=two\n")
+
+        assert await run_cmd(["printenv", "AA_TEST_TOKEN"]) == (True, "two\n")
+        assert _times_sourced(shell_home) == 2
+
+    async def test_extra_env_and_cwd(self, shell_home, tmp_path):
+        success, output = await run_cmd(
+            ["bash", "-c", "echo $AA_TEST_TOKEN $PWD"], cwd=str(tmp_path), env={"AA_TEST_TOKEN": "x"}
+        )
+        assert (success, output) == (True, f"x {tmp_path}\n")
+
+    async def test_shell_function_runs_through_bash(self, shell_home):
+        bashrc_d = shell_home / ".bashrc.d"
+        bashrc_d.mkdir()
+        (bashrc_d / "greet.sh").write_text('greet() { echo "hello $1 from $PWD"; }\n')
+
+        assert await run_cmd(["greet", "a b"], cwd=str(shell_home)) == (True, f"hello a b from {shell_home}\n")
+
+    async def test_missing_cwd(self, shell_home):
+        assert await run_cmd(["ls"], cwd=str(shell_home / "missing")) == (
+            False,
+            f"Directory not found: {shell_home / 'missing'}",
+        )
+
+    def test_rc_output_not_parsed_as_env(self, shell_home):
+        (shell_home / ".bashrc").write_text("printf 'Welcome back'\nexport AA_TEST_TOKEN=one\n")
+        env = utils.get_shell_environment()
+        assert env["AA_TEST_TOKEN"] == "one"
+        assert not any("Welcome" in name for name in env)
+
+    def test_failure_not_cached(self, shell_home, monkeypatch):
+        (shell_home / ".bashrc").write_text("export AA_TEST_TOKEN=one\nexit 1\n")
+        monkeypatch.delenv("AA_TEST_TOKEN", raising=False)
+        now = [1000.0]
+        monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+        captures = []
+        capture = utils._capture_shell_environment
+        monkeypatch.setattr(utils, "_capture_shell_environment", lambda *args: captures.append(1) or capture(*args))
+
+        assert "AA_TEST_TOKEN" not in utils.get_shell_environment()
+        assert "AA_TEST_TOKEN" not in utils.get_shell_environment()  # Within the backoff
+        assert len(captures) == 1
+
+        now[0] += utils.SHELL_ENV_RETRY_SECONDS
+        assert "AA_TEST_TOKEN" not in utils.get_shell_environment()
+        assert len(captures) == 2
+
+
+class TestOutputBuffer:
+    """Tests for bounded head/tail output buffers."""
+
+    LINES = [f"line {i}\n" for i in range(100)]  # 7-8 characters each
+
+    def fill(self, buffer):
+        for line in self.LINES:
+            buffer.add(line)
+        return buffer
+
+    def test_within_limit(self):
+        assert self.fill(utils.OutputBuffer(10000)).text() == "".join(self.LINES)
+
+    def test_tail(self):
+        buffer = self.fill(utils.OutputBuffer(40, mode="tail"))
+        assert buffer.text() == "... (truncated, 95 of 100 lines not shown)\n\n" + "".join(self.LINES[-5:])
+
+    def test_head(self):
+        buffer = self.fill(utils.OutputBuffer(40, mode="head"))
+        assert buffer.text() == "".join(self.LINES[:5]) + "\n\n... (truncated, 95 of 100 lines not shown)"
+
+    def test_both(self):
+        text = self.fill(utils.OutputBuffer(80, mode="both")).text()
+        assert text.startswith("".join(self.LINES[:5]))
+        assert text.endswith("".join(self.LINES[-4:]))
+
+    def test_line_filter(self):
+        buffer = self.fill(utils.OutputBuffer(10000, line_filter=lambda line: line.endswith("7")))
+        assert buffer.text() == "".join(line for line in self.LINES if line.strip().endswith("7"))
+
+    def test_long_line(self):
+        buffer = utils.OutputBuffer(10, mode="tail")
+        buffer.add("x" * 100 + "END\n")
+        assert buffer.text().endswith("xxxxxxEND\n")
+
+    @pytest.mark.parametrize("mode", ["head", "tail", "both"])
+    def test_batches_match_lines(self, mode):
+        batched = utils.OutputBuffer(100, mode=mode)
+        for start in range(0, 100, 30):
+            batched.extend(self.LINES[start : start + 30])
+        assert batched.text() == self.fill(utils.OutputBuffer(100, mode=mode)).text()
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            utils.OutputBuffer(mode="middle")
+
+
+class TestStreamCmd:
+    """Tests for streaming command output."""
+
+    async def test_lines_and_status(self):
+        async with utils.stream_cmd(
+            ["bash", "-c", "printf 'a\\nb\\nc'; echo oops >&2; exit 4"], use_shell=False
+        ) as stream:
+            lines = [line async for line in stream]
+        assert lines == ["a\n", "b\n", "c"]
+        assert stream.returncode == 4
+        assert stream.stderr == "oops\n"
+
+    async def test_bounded_memory(self):
+        import tracemalloc
+
+        script = "yes 'some log line that repeats' | head -c 20000000"
+        tracemalloc.start()
+        try:
+            success, output = await utils.run_cmd_bounded(["bash", "-c", script], use_shell=False, max_length=1000)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert success
+        assert output.startswith("... (truncated")
+        assert len(output) < 1100
+        assert peak < 5_000_000
+
+    async def test_failure_and_timeout(self):
+        assert await utils.run_cmd_bounded(["bash", "-c", "echo bad >&2; exit 1"], use_shell=False) == (False, "bad\n")
+        success, output = await utils.run_cmd_bounded(["sleep", "30"], timeout=1, use_shell=False)
+        assert (success, output) == (False, "Command timed out after 1s")
+
+    async def test_early_exit_kills_command(self, tmp_path):
+        pid_file = tmp_path / "child.pid"
+        script = f"sleep 30 & echo $! > {pid_file}; while true; do echo tick; sleep 0.01; done"
+        async with utils.stream_cmd(["bash", "-c", script], use_shell=False) as stream:
+            async for _ in stream:
+                break
+        assert not _pid_alive(int(pid_file.read_text()))
+
+
+class TestConcurrencyLimiter:
+    """Tests for named concurrency limits."""
+
+    async def test_limits_and_records_waits(self):
+        limit = utils.ConcurrencyLimiter({"binaries": {"bonfire": 2}}).get("binaries", "bonfire")
+        running = []
+
+        async def work():
+            async with limit.hold():
+                running.append(limit.in_flight)
+                await asyncio.sleep(0.1)
+
+        await asyncio.gather(*(work() for _ in range(4)))
+        assert max(running) == 2
+        stats = limit.stats()
+        assert (stats["acquired"], stats["queued"], stats["in_flight"]) == (4, 2, 0)
+        assert stats["max_wait_ms"] >= 80
+
+    async def test_configuration(self):
+        limiter = utils.ConcurrencyLimiter({"clusters": {"stage": 2}, "binaries": {"oc": 0}})
+        assert limiter.get("clusters", "stage").limit == 2
+        assert limiter.get("clusters", "ephemeral").limit == utils.DEFAULT_CONCURRENCY["clusters"]["default"]
+        assert limiter.get("binaries", "oc") is None  # 0 disables the default
+        assert limiter.get("binaries", "ls") is None
+        assert limiter.get("binaries", "bonfire").name == "binary:bonfire"
+
+    async def test_limits_per_event_loop(self):
+        limiter = utils.ConcurrencyLimiter({"binaries": {"bonfire": 1}})
+        limit = limiter.get("binaries", "bonfire")
+
+        async def use_in_other_loop():
+            other = limiter.get("binaries", "bonfire")
+            async with other.hold():
+                pass
+            return other
+
+        async with limit.hold():
+            other = await asyncio.to_thread(asyncio.run, use_in_other_loop())
+            assert other is not limit
+            assert limiter.get("binaries", "bonfire") is limit  # Still held, not reset
+        stats = limiter.stats()["binary:bonfire"]
+        assert (stats["limit"], stats["acquired"], stats["in_flight"]) == (1, 2, 0)
+
+    async def test_cancelled_wait_releases_nothing(self):
+        limit = utils.ConcurrencyLimit("binary:oc", 1)
+        async with limit.hold():
+            waiter = asyncio.create_task(limit.hold().__aenter__())
+            await asyncio.sleep(0.01)
+            assert limit.waiting == 1
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        assert limit.waiting == 0
+        async with limit.hold():
+            assert limit.in_flight == 1
+
+    async def test_run_cmd_acquires_binary_limit(self, monkeypatch):
+        limiter = utils.ConcurrencyLimiter({"binaries": {"sleep": 1}})
+        monkeypatch.setattr(utils, "_concurrency_limiter", limiter)
+        start = time.time()
+        await asyncio.gather(*(run_cmd(["sleep", "0.2"], use_shell=False) for _ in range(2)))
+        assert time.time() - start >= 0.4
+        assert limiter.stats()["binary:sleep"]["queued"] == 1
@@ -21,7 +21,14 @@ __project_root__ = PROJECT_ROOT  # Module initialization
 
 from server.auto_heal_decorator import auto_heal
 from server.tool_registry import ToolRegistry
-from server.utils import get_gitlab_host, get_section_config, run_cmd, truncate_output
+from server.utils import (
+    get_concurrency_limiter,
+    get_gitlab_host,
+    get_section_config,
+    run_cmd,
+    run_cmd_bounded,
+    truncate_output,
+)
 
 # Use shared implementation from utils
 GITLAB_HOST = get_gitlab_host()
@@ -87,7 +94,7 @@ def parse_gitlab_url(url_or_id: str) -> tuple[str | None, str | None]:
 
 
 async def run_glab(
-    args: list[str], repo: str | None = None, cwd: str | None = None, timeout: int = 60
+    args: list[str], repo: str | None = None, cwd: str | None = None, timeout: int = 60, max_length: int = 0
 ) -> tuple[bool, str]:
     """
     Run glab command and return (success, output).
@@ -97,6 +104,8 @@ async def run_glab(
         repo: GitLab project path (used with --repo if no cwd)
         cwd: Local directory to run from (preferred over --repo)
         timeout: Command timeout in seconds
+        max_length: If set, stream the output and keep only its last max_length
+                    characters (for logs)
     """
     cmd = ["glab"] + args
 
@@ -113,8 +122,12 @@ async def run_glab(
         else:
             cmd.extend(["--repo", repo])
 
-    # Use unified run_cmd with GITLAB_HOST env var
-    return await run_cmd(cmd, cwd=run_cwd, env={"GITLAB_HOST": GITLAB_HOST}, timeout=timeout)
+    # Use unified run_cmd with GITLAB_HOST env var, within the host's concurrency limit
+    env = {"GITLAB_HOST": GITLAB_HOST}
+    async with get_concurrency_limiter().hold("gitlab_hosts", GITLAB_HOST):
+        if max_length:
+            return await run_cmd_bounded(cmd, cwd=run_cwd, env=env, timeout=timeout, max_length=max_length, mode="tail")
+        return await run_cmd(cmd, cwd=run_cwd, env=env, timeout=timeout)
 
 
 # ==================== MERGE REQUESTS ====================
@@ -149,10 +162,10 @@ async def _gitlab_ci_status_impl(project: str, branch: str = "") -> str:
 
 async def _gitlab_ci_trace_impl(project: str, job_id: int) -> str:
     """Implementation of gitlab_ci_trace tool."""
-    success, output = await run_glab(["ci", "trace", str(job_id)], repo=project, timeout=120)
+    success, output = await run_glab(["ci", "trace", str(job_id)], repo=project, timeout=120, max_length=15000)
     if not success:
         return f"❌ Failed: {output}"
-    return f"## Job {job_id} Log\n\n```\n{truncate_output(output, max_length=15000, mode='tail')}\n```"
+    return f"## Job {job_id} Log\n\n```\n{output}\n```"
 
 
 async def _gitlab_ci_view_impl(project: str, branch: str = "") -> str:
@@ -21,7 +21,7 @@ __project_root__ = PROJECT_ROOT  # Module initialization
 
 from server.auto_heal_decorator import auto_heal
 from server.tool_registry import ToolRegistry
-from server.utils import get_gitlab_host, get_section_config, run_cmd
+from server.utils import get_concurrency_limiter, get_gitlab_host, get_section_config, run_cmd
 
 # Use shared implementation from utils
 GITLAB_HOST = get_gitlab_host()
@@ -113,8 +113,9 @@ async def run_glab(
         else:
             cmd.extend(["--repo", repo])
 
-    # Use unified run_cmd with GITLAB_HOST env var
-    return await run_cmd(cmd, cwd=run_cwd, env={"GITLAB_HOST": GITLAB_HOST}, timeout=timeout)
+    # Use unified run_cmd with GITLAB_HOST env var, within the host's concurrency limit
+    async with get_concurrency_limiter().hold("gitlab_hosts", GITLAB_HOST):
+        return await run_cmd(cmd, cwd=run_cwd, env={"GITLAB_HOST": GITLAB_HOST}, timeout=timeout)
 
 
 # ==================== MERGE REQUESTS ====================
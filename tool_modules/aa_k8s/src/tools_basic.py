@@ -429,7 +429,7 @@ async def _kubectl_logs_impl(
     if since:
         args.append(f"--since={since}")
 
-    success, output = await run_kubectl(args, kubeconfig=kubeconfig, namespace=namespace, timeout=120)
+    success, output = await run_kubectl(args, kubeconfig=kubeconfig, namespace=namespace, timeout=120, max_length=20000)
 
     target = pod_name or f"selector {selector}"
     return f"## Logs: {target}\n\n```\n{output}\n```" if success else f"❌ Failed: {output}"
@@ -19,7 +19,7 @@ from server.auto_heal_decorator import auto_heal_konflux
 from server.tool_registry import ToolRegistry
 from server.utils import get_kubeconfig, load_config
 from server.utils import run_cmd as run_cmd_base
-from server.utils import truncate_output
+from server.utils import run_cmd_bounded, truncate_output
 
 # Setup project path for server imports
 
@@ -44,19 +44,25 @@ KONFLUX_KUBECONFIG = get_konflux_kubeconfig()
 DEFAULT_NAMESPACE = os.getenv("KONFLUX_NAMESPACE", "default")
 
 
-async def run_konflux_cmd(cmd: list[str], kubeconfig: str | None = None, timeout: int = 60) -> tuple[bool, str]:
+async def run_konflux_cmd(
+    cmd: list[str], kubeconfig: str | None = None, timeout: int = 60, max_length: int = 0
+) -> tuple[bool, str]:
     """Run command with Konflux kubeconfig.
 
     Args:
         cmd: Command and arguments
         kubeconfig: Optional kubeconfig path (defaults to Konflux kubeconfig)
         timeout: Timeout in seconds
+        max_length: If set, stream the output and keep only its last max_length
+                    characters (for logs)
 
     Returns:
         Tuple of (success, output)
     """
     kc = kubeconfig or KONFLUX_KUBECONFIG
     env = {"KUBECONFIG": kc}
+    if max_length:
+        return await run_cmd_bounded(cmd, env=env, timeout=timeout, max_length=max_length, mode="tail")
     return await run_cmd_base(cmd, env=env, timeout=timeout)
 
 
@@ -439,10 +445,10 @@ async def _tkn_pipelinerun_logs_impl(
         args.extend(["--task", task])
     elif all_tasks:
         args.append("--all")
-    success, output = await run_cmd(args, timeout=120)
+    success, output = await run_cmd(args, timeout=120, max_length=20000)
     if not success:
         return f"❌ Failed: {output}"
-    return f"## Logs: {run_name}\n\n```\n{truncate_output(output, max_length=20000, mode='tail')}\n```"
+    return f"## Logs: {run_name}\n\n```\n{output}\n```"
 
 
 @auto_heal_konflux()
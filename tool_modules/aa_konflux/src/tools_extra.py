@@ -19,7 +19,7 @@ from server.auto_heal_decorator import auto_heal_konflux
 from server.tool_registry import ToolRegistry
 from server.utils import get_kubeconfig, load_config
 from server.utils import run_cmd as run_cmd_base
-from server.utils import truncate_output
+from server.utils import run_cmd_bounded, truncate_output
 
 # Setup project path for server imports
 
@@ -44,19 +44,25 @@ KONFLUX_KUBECONFIG = get_konflux_kubeconfig()
 DEFAULT_NAMESPACE = os.getenv("KONFLUX_NAMESPACE", "default")
 
 
-async def run_konflux_cmd(cmd: list[str], kubeconfig: str | None = None, timeout: int = 60) -> tuple[bool, str]:
+async def run_konflux_cmd(
+    cmd: list[str], kubeconfig: str | None = None, timeout: int = 60, max_length: int = 0
+) -> tuple[bool, str]:
     """Run command with Konflux kubeconfig.
 
     Args:
         cmd: Command and arguments
         kubeconfig: Optional kubeconfig path (defaults to Konflux kubeconfig)
         timeout: Timeout in seconds
+        max_length: If set, stream the output and keep only its last max_length
+                    characters (for logs)
 
     Returns:
         Tuple of (success, output)
     """
     kc = kubeconfig or KONFLUX_KUBECONFIG
     env = {"KUBECONFIG": kc}
+    if max_length:
+        return await run_cmd_bounded(cmd, env=env, timeout=timeout, max_length=max_length, mode="tail")
     return await run_cmd_base(cmd, env=env, timeout=timeout)
 
 
@@ -128,10 +134,10 @@ async def _tkn_logs_impl(name: str, namespace: str, task: str) -> str:
     args = ["tkn", "pipelinerun", "logs", name, "-n", namespace]
     if task:
         args.extend(["--task", task])
-    success, output = await run_cmd(args, timeout=120)
+    success, output = await run_cmd(args, timeout=120, max_length=15000)
     if not success:
         return f"❌ Failed: {output}"
-    return f"## Logs: {name}\n\n```\n{truncate_output(output, max_length=15000, mode='tail')}\n```"
+    return f"## Logs: {name}\n\n```\n{output}\n```"
 
 
 async def _tkn_pipeline_describe_impl(pipeline_name: str, namespace: str) -> str:
@@ -188,10 +194,11 @@ async def _tkn_taskrun_describe_impl(run_name: str, namespace: str) -> str:
 
 async def _tkn_taskrun_logs_impl(run_name: str, namespace: str) -> str:
     """Implementation of tkn_taskrun_logs tool."""
-    success, output = await run_cmd(["tkn", "taskrun", "logs", run_name, "-n", namespace], timeout=120)
+    args = ["tkn", "taskrun", "logs", run_name, "-n", namespace]
+    success, output = await run_cmd(args, timeout=120, max_length=15000)
     if not success:
         return f"❌ Failed: {output}"
-    return f"## Logs: {run_name}\n\n```\n{truncate_output(output, max_length=15000, mode='tail')}\n```"
+    return f"## Logs: {run_name}\n\n```\n{output}\n```"
 
 
 def register_tools(server: "FastMCP") -> int:
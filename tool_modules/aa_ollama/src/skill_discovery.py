@@ -9,13 +9,17 @@ import re
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from scripts.common.skill_catalog import COMPUTE_MARKER, SkillCatalog, get_skill_catalog
 
 logger = logging.getLogger(__name__)
 
 
 class SkillToolDiscovery:
-    """Dynamically discover tools required by a skill from YAML."""
+    """Dynamically discover tools required by a skill from YAML.
+
+    Parsing and extraction are done once per file version by the shared
+    skill catalog (scripts/common/skill_catalog.py).
+    """
 
     def __init__(self, skills_dir: Optional[Path] = None):
         """Initialize skill discovery.
@@ -24,17 +28,13 @@ class SkillToolDiscovery:
             skills_dir: Path to skills directory (defaults to project root/skills)
         """
         if skills_dir is None:
-            # Path: tool_modules/aa_ollama/src/skill_discovery.py
-            # parents[0] = tool_modules/aa_ollama/src
-            # parents[1] = tool_modules/aa_ollama
-            # parents[2] = tool_modules
-            # parents[3] = project root (redhat-ai-workflow)
-            skills_dir = Path(__file__).parents[3] / "skills"
-        self.skills_dir = skills_dir
-        self._cache: dict[str, set[str]] = {}
+            self._catalog = get_skill_catalog()
+        else:
+            self._catalog = SkillCatalog(skills_dir)
+        self.skills_dir = self._catalog.skills_dir
 
     def discover_tools(self, skill_name: str) -> set[str]:
-        """Parse skill YAML and extract all tool references.
+        """Get all tool references in a skill.
 
         Looks for:
         - step.tool: direct tool calls
@@ -50,72 +50,16 @@ class SkillToolDiscovery:
         Returns:
             Set of tool names used by the skill
         """
-        if skill_name in self._cache:
-            return self._cache[skill_name]
-
-        skill_path = self.skills_dir / f"{skill_name}.yaml"
-        if not skill_path.exists():
-            logger.warning(f"Skill not found: {skill_path}")
+        entry = self._catalog.get(skill_name)
+        if entry is None:
+            logger.warning(f"Skill not found: {self.skills_dir / f'{skill_name}.yaml'}")
             return set()
-
-        try:
-            with open(skill_path) as f:
-                skill = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            logger.error(f"Failed to parse skill {skill_name}: {e}")
+        if entry.error:
+            logger.error(f"Failed to parse skill {skill_name}: {entry.error}")
             return set()
 
-        tools = set()
-
-        # Extract from steps
-        for step in skill.get("steps", []):
-            self._extract_tools_from_step(step, tools)
-
-        self._cache[skill_name] = tools
-        logger.info(f"Discovered {len(tools)} tools for skill {skill_name}: {sorted(tools)}")
-        return tools
-
-    def _extract_tools_from_step(self, step: dict, tools: set[str]) -> None:
-        """Recursively extract tools from a step.
-
-        Args:
-            step: Step dictionary from skill YAML
-            tools: Set to add discovered tools to
-        """
-        # Direct tool reference
-        if "tool" in step:
-            tools.add(step["tool"])
-
-        # List of tools
-        if "tools" in step:
-            tools.update(step["tools"])
-
-        # Parallel tools
-        if "parallel" in step:
-            for parallel_step in step["parallel"]:
-                if isinstance(parallel_step, dict):
-                    self._extract_tools_from_step(parallel_step, tools)
-
-        # Conditional branches
-        for branch in ["then", "else"]:
-            if branch in step:
-                branch_steps = step[branch]
-                if isinstance(branch_steps, list):
-                    for sub_step in branch_steps:
-                        if isinstance(sub_step, dict):
-                            self._extract_tools_from_step(sub_step, tools)
-
-        # Loop iterations
-        if "loop" in step:
-            loop_body = step.get("do", [])
-            if isinstance(loop_body, list):
-                for sub_step in loop_body:
-                    if isinstance(sub_step, dict):
-                        self._extract_tools_from_step(sub_step, tools)
-
-        # Compute blocks may call tools dynamically - flag for NPU
-        if "compute" in step:
-            tools.add("__has_compute_block__")
+        logger.debug(f"Discovered {len(entry.tools)} tools for skill {skill_name}: {sorted(entry.tools)}")
+        return set(entry.tools)
 
     def has_dynamic_tools(self, skill_name: str) -> bool:
         """Check if skill has compute blocks that may call tools dynamically.
@@ -127,7 +71,7 @@ class SkillToolDiscovery:
             True if skill has compute blocks
         """
         tools = self.discover_tools(skill_name)
-        return "__has_compute_block__" in tools
+        return COMPUTE_MARKER in tools
 
     def list_skills(self) -> list[str]:
         """List all available skills.
@@ -135,9 +79,7 @@ class SkillToolDiscovery:
         Returns:
             List of skill names
         """
-        if not self.skills_dir.exists():
-            return []
-        return [p.stem for p in self.skills_dir.glob("*.yaml")]
+        return self._catalog.names()
 
     def get_skill_metadata(self, skill_name: str) -> dict:
         """Get metadata about a skill for context display.
@@ -148,135 +90,32 @@ class SkillToolDiscovery:
         Returns:
             Dict with description, inputs, memory_ops, and other metadata
         """
-        skill_path = self.skills_dir / f"{skill_name}.yaml"
-        if not skill_path.exists():
-            return {}
-
-        try:
-            with open(skill_path) as f:
-                skill = yaml.safe_load(f)
-        except yaml.YAMLError:
+        entry = self._catalog.get(skill_name)
+        if entry is None or entry.error:
             return {}
 
         # Extract input definitions
-        inputs = []
-        for inp in skill.get("inputs", []):
-            if isinstance(inp, dict):
-                inputs.append(
-                    {
-                        "name": inp.get("name", ""),
-                        "description": inp.get("description", ""),
-                        "required": inp.get("required", False),
-                        "default": inp.get("default"),
-                    }
-                )
-
-        # Extract memory operations from steps
-        memory_ops = self._extract_memory_operations(skill.get("steps", []))
+        inputs = [
+            {
+                "name": inp.get("name", ""),
+                "description": inp.get("description", ""),
+                "required": inp.get("required", False),
+                "default": inp.get("default"),
+            }
+            for inp in entry.inputs
+        ]
 
         return {
             "name": skill_name,
-            "description": skill.get("description", ""),
+            "description": entry.description,
             "inputs": inputs,
-            "step_count": len(skill.get("steps", [])),
-            "memory_ops": memory_ops,
+            "step_count": entry.step_count,
+            "memory_ops": entry.memory_ops,
         }
 
-    def _extract_memory_operations(self, steps: list) -> dict:
-        """Extract memory read/write operations from skill steps.
-
-        Looks for:
-        - memory_* tool calls (memory_read, memory_write, memory_session_log, etc.)
-        - memory.read_memory() / memory.write_memory() in compute blocks
-        - check_known_issues / learn_tool_fix calls
-
-        Args:
-            steps: List of step dictionaries
-
-        Returns:
-            Dict with 'reads' and 'writes' lists
-        """
-        reads = []
-        writes = []
-
-        # Memory tool patterns
-        memory_read_tools = {"memory_read", "memory_query", "check_known_issues", "knowledge_query"}
-        memory_write_tools = {"memory_write", "memory_update", "memory_append", "memory_session_log", "learn_tool_fix"}
-
-        # Patterns for compute blocks
-        read_patterns = [
-            re.compile(r'memory\.read_memory\(["\']([^"\']+)["\']'),
-            re.compile(r"memory\.check_known_issues"),
-            re.compile(r'read_memory\(["\']([^"\']+)["\']'),
-        ]
-        write_patterns = [
-            re.compile(r'memory\.write_memory\(["\']([^"\']+)["\']'),
-            re.compile(r'memory\.append_to_list\(["\']([^"\']+)["\']'),
-            re.compile(r"memory_session_log"),
-            re.compile(r'write_memory\(["\']([^"\']+)["\']'),
-        ]
-
-        for step in steps:
-            if not isinstance(step, dict):
-                continue
-
-            # Check tool calls
-            tool = step.get("tool", "")
-            if tool in memory_read_tools:
-                key = step.get("args", {}).get("key", "")
-                reads.append({"tool": tool, "key": key, "step": step.get("name", "")})
-            elif tool in memory_write_tools:
-                key = step.get("args", {}).get("key", "")
-                writes.append({"tool": tool, "key": key, "step": step.get("name", "")})
-
-            # Check compute blocks for memory operations
-            compute = step.get("compute", "")
-            if compute:
-                for pattern in read_patterns:
-                    matches = pattern.findall(compute)
-                    for match in matches:
-                        if isinstance(match, str) and match:
-                            reads.append({"source": "compute", "key": match, "step": step.get("name", "")})
-                        elif pattern.pattern == r"memory\.check_known_issues":
-                            reads.append({"source": "compute", "key": "learned/patterns", "step": step.get("name", "")})
-
-                for pattern in write_patterns:
-                    matches = pattern.findall(compute)
-                    for match in matches:
-                        if isinstance(match, str) and match:
-                            writes.append({"source": "compute", "key": match, "step": step.get("name", "")})
-                        elif "memory_session_log" in pattern.pattern:
-                            writes.append({"source": "compute", "key": "sessions/today", "step": step.get("name", "")})
-
-            # Recursively check nested structures
-            for branch in ["then", "else", "parallel"]:
-                if branch in step and isinstance(step[branch], list):
-                    nested = self._extract_memory_operations(step[branch])
-                    reads.extend(nested.get("reads", []))
-                    writes.extend(nested.get("writes", []))
-
-        # Deduplicate
-        seen_reads = set()
-        unique_reads = []
-        for r in reads:
-            key = (r.get("tool", r.get("source", "")), r.get("key", ""))
-            if key not in seen_reads:
-                seen_reads.add(key)
-                unique_reads.append(r)
-
-        seen_writes = set()
-        unique_writes = []
-        for w in writes:
-            key = (w.get("tool", w.get("source", "")), w.get("key", ""))
-            if key not in seen_writes:
-                seen_writes.add(key)
-                unique_writes.append(w)
-
-        return {"reads": unique_reads, "writes": unique_writes}
-
     def clear_cache(self) -> None:
         """Clear the discovery cache."""
-        self._cache.clear()
+        self._catalog.clear()
 
 
 # ==================== Fast Skill Detection ====================
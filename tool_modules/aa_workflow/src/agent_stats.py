@@ -2,30 +2,46 @@
 Agent Statistics Tracking
 
 Tracks and persists agent activity metrics:
-- Tool calls (count, duration, success/failure)
-- Skill executions (count, duration, success/failure)
+- Tool calls (count, duration, latency histogram, success/failure)
+- Skill executions (count, duration, latency histogram, success/failure)
 - Memory operations (reads/writes)
 - Lines of code written (estimated from file edits)
 - Session activity
 
 Stats are persisted to: ~/.config/aa-workflow/agent_stats.json
 Daily stats are rolled up and historical data is kept for 30 days.
+
+Counters are updated in memory and written out in the background: at most
+FLUSH_INTERVAL seconds after the first unsaved change, immediately once
+FLUSH_THRESHOLD changes are pending, and once more at interpreter exit.
 """
 
+import atexit
 import json
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from threading import Lock
+from threading import Lock, RLock, Timer
 from typing import Any
 
+# Support both package import and direct loading
+try:
+    from .latency_histogram import merge_histograms, record_latency, summarize_histogram
+except ImportError:
+    from tool_modules.aa_workflow.src.latency_histogram import merge_histograms, record_latency, summarize_histogram
+
 logger = logging.getLogger(__name__)
 
 # Stats file path
 STATS_FILE = Path.home() / ".config" / "aa-workflow" / "agent_stats.json"
 STATS_DIR = STATS_FILE.parent
 
+# Write pending changes this many seconds after the first one...
+FLUSH_INTERVAL = 15.0
+# ...or as soon as this many are pending
+FLUSH_THRESHOLD = 200
+
 
 class AgentStats:
     """Tracks and persists agent activity statistics."""
@@ -46,9 +62,13 @@ class AgentStats:
         if self._initialized:
             return
         self._initialized = True
-        self._stats_lock = Lock()
+        self._stats_lock = RLock()  # get_summary() calls other getters
+        self._save_lock = Lock()
         self._stats = self._load_stats()
         self._ensure_today()
+        self._dirty = 0  # Changes not yet written to disk
+        self._flush_timer: Timer | None = None
+        atexit.register(self.flush)
 
     def _load_stats(self) -> dict[str, Any]:
         """Load stats from disk or create new."""
@@ -82,8 +102,8 @@ class AgentStats:
                 "sessions": 0,
             },
             "daily": {},  # date -> daily stats
-            "tools": {},  # tool_name -> {calls, successes, failures, duration_ms}
-            "skills": {},  # skill_name -> {executions, successes, failures, duration_ms}
+            "tools": {},  # tool_name -> {calls, successes, failures, duration_ms, latency}
+            "skills": {},  # skill_name -> {executions, successes, failures, duration_ms, latency}
             "current_session": {
                 "started": datetime.now().isoformat(),
                 "tool_calls": 0,
@@ -111,6 +131,8 @@ class AgentStats:
                 "sessions": 0,
                 "tools_used": {},  # tool_name -> count
                 "skills_run": {},  # skill_name -> count
+                "tool_latency": {},  # tool_name -> latency histogram
+                "skill_latency": {},  # skill_name -> latency histogram
             }
             # Cleanup old daily stats (keep 30 days)
             self._cleanup_old_daily()
@@ -123,17 +145,61 @@ class AgentStats:
         for date in old_dates:
             del self._stats["daily"][date]
 
-    def _save_stats(self) -> None:
-        """Save stats to disk."""
-        try:
-            STATS_DIR.mkdir(parents=True, exist_ok=True)
-            self._stats["last_updated"] = datetime.now().isoformat()
-            tmp_file = STATS_FILE.with_suffix(".tmp")
-            with open(tmp_file, "w") as f:
-                json.dump(self._stats, f, indent=2)
-            tmp_file.rename(STATS_FILE)
-        except Exception as e:
-            logger.warning(f"Failed to save stats: {e}")
+    def _mark_dirty(self) -> None:
+        """Record a change; the stats are written out by a later flush.
+
+        Must be called with _stats_lock held.
+        """
+        self._dirty += 1
+        if self._dirty >= FLUSH_THRESHOLD:
+            # Write from a thread so the caller doesn't pay for the I/O
+            self._schedule_flush(0)
+        elif self._flush_timer is None:
+            self._schedule_flush(FLUSH_INTERVAL)
+
+    def _schedule_flush(self, delay: float) -> None:
+        """Start the flush timer (must be called with _stats_lock held)."""
+        timer = self._flush_timer
+        if timer is not None:
+            if timer.interval <= delay:
+                return
+            timer.cancel()
+        self._flush_timer = Timer(delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush(self) -> bool:
+        """Write pending changes to disk now.
+
+        Returns:
+            True if anything was written
+        """
+        # One writer at a time, so an older snapshot never replaces a newer one.
+        # Recording only waits for the snapshot, not for the file write.
+        with self._save_lock:
+            with self._stats_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return False
+                self._stats["last_updated"] = datetime.now().isoformat()
+                data = json.dumps(self._stats)
+                pending = self._dirty
+                self._dirty = 0
+
+            try:
+                STATS_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_file = STATS_FILE.with_suffix(".tmp")
+                with open(tmp_file, "w") as f:
+                    f.write(data)
+                tmp_file.rename(STATS_FILE)
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to save stats: {e}")
+                with self._stats_lock:
+                    self._dirty += pending
+                return False
 
     # =========================================================================
     # Tool Tracking
@@ -185,10 +251,15 @@ class AgentStats:
                 self._stats["daily"][today]["tools_used"][tool_name] = 0
             self._stats["daily"][today]["tools_used"][tool_name] += 1
 
+            # Latency histograms (lifetime and daily)
+            record_latency(self._stats["tools"][tool_name].setdefault("latency", []), duration_ms)
+            daily_latency = self._stats["daily"][today].setdefault("tool_latency", {})
+            record_latency(daily_latency.setdefault(tool_name, []), duration_ms)
+
             # Session stats
             self._stats["current_session"]["tool_calls"] += 1
 
-            self._save_stats()
+            self._mark_dirty()
 
     # =========================================================================
     # Skill Tracking
@@ -242,10 +313,15 @@ class AgentStats:
                 self._stats["daily"][today]["skills_run"][skill_name] = 0
             self._stats["daily"][today]["skills_run"][skill_name] += 1
 
+            # Latency histograms (lifetime and daily)
+            record_latency(self._stats["skills"][skill_name].setdefault("latency", []), duration_ms)
+            daily_latency = self._stats["daily"][today].setdefault("skill_latency", {})
+            record_latency(daily_latency.setdefault(skill_name, []), duration_ms)
+
             # Session stats
             self._stats["current_session"]["skill_executions"] += 1
 
-            self._save_stats()
+            self._mark_dirty()
 
     # =========================================================================
     # Memory Tracking
@@ -258,7 +334,7 @@ class AgentStats:
             self._stats["lifetime"]["memory_reads"] += 1
             self._stats["daily"][today]["memory_reads"] += 1
             self._stats["current_session"]["memory_ops"] += 1
-            self._save_stats()
+            self._mark_dirty()
 
     def record_memory_write(self, key: str = "") -> None:
         """Record a memory write operation."""
@@ -267,7 +343,7 @@ class AgentStats:
             self._stats["lifetime"]["memory_writes"] += 1
             self._stats["daily"][today]["memory_writes"] += 1
             self._stats["current_session"]["memory_ops"] += 1
-            self._save_stats()
+            self._mark_dirty()
 
     # =========================================================================
     # Code Tracking
@@ -279,7 +355,7 @@ class AgentStats:
             today = self._ensure_today()
             self._stats["lifetime"]["lines_written"] += lines
             self._stats["daily"][today]["lines_written"] += lines
-            self._save_stats()
+            self._mark_dirty()
 
     # =========================================================================
     # Session Tracking
@@ -297,7 +373,7 @@ class AgentStats:
                 "skill_executions": 0,
                 "memory_ops": 0,
             }
-            self._save_stats()
+            self._mark_dirty()
 
     # =========================================================================
     # Getters
@@ -368,6 +444,31 @@ class AgentStats:
                     )
             return result
 
+    def get_latency_report(self, kind: str = "tools", days: int | None = None) -> dict[str, dict[str, Any]]:
+        """Get latency percentiles per tool or per skill.
+
+        Args:
+            kind: "tools" or "skills"
+            days: Merge the daily histograms of the last N days (None for lifetime)
+
+        Returns:
+            name -> {count, p50, p90, p99} in ms
+        """
+        if kind not in ("tools", "skills"):
+            raise ValueError(f"kind must be 'tools' or 'skills', got {kind!r}")
+        with self._stats_lock:
+            if days is None:
+                histograms = {name: data.get("latency", []) for name, data in self._stats[kind].items()}
+            else:
+                daily_key = "tool_latency" if kind == "tools" else "skill_latency"
+                per_name: dict[str, list[list[int]]] = defaultdict(list)
+                for i in range(days):
+                    date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
+                    for name, histogram in self._stats["daily"].get(date, {}).get(daily_key, {}).items():
+                        per_name[name].append(histogram)
+                histograms = {name: merge_histograms(*hists) for name, hists in per_name.items()}
+            return {name: summarize_histogram(h) for name, h in histograms.items() if any(h)}
+
     def get_summary(self) -> dict[str, Any]:
         """Get a summary suitable for display."""
         with self._stats_lock:
@@ -375,6 +476,10 @@ class AgentStats:
             lifetime = self._stats["lifetime"]
             today_stats = self._stats["daily"][today]
             session = self._stats["current_session"]
+            top_tools = self.get_top_tools(5)
+            top_skills = self.get_top_skills(5)
+            tool_latency = self.get_latency_report("tools")
+            skill_latency = self.get_latency_report("skills")
 
             return {
                 "lifetime": {
@@ -406,8 +511,10 @@ class AgentStats:
                     "skill_executions": session["skill_executions"],
                     "memory_ops": session["memory_ops"],
                 },
-                "top_tools": self.get_top_tools(5),
-                "top_skills": self.get_top_skills(5),
+                "top_tools": top_tools,
+                "top_skills": top_skills,
+                "tool_latency": {name: tool_latency[name] for name, _ in top_tools if name in tool_latency},
+                "skill_latency": {name: skill_latency[name] for name, _ in top_skills if name in skill_latency},
             }
 
 
@@ -423,6 +530,12 @@ def get_agent_stats() -> AgentStats:
     return _stats
 
 
+def flush_agent_stats() -> None:
+    """Write pending stats to disk (e.g. at shutdown), if stats were used."""
+    if _stats is not None:
+        _stats.flush()
+
+
 # Convenience functions
 def record_tool_call(tool_name: str, success: bool, duration_ms: int = 0) -> None:
     """Record a tool call."""
@@ -0,0 +1,79 @@
+"""Latency Histograms.
+
+Fixed-bucket latency histograms for agent stats. A histogram is a plain
+list of counts, one per bucket of LATENCY_BUCKETS_MS, so it stores in JSON
+as a short array and histograms merge by adding counts element-wise (e.g.
+per-day histograms into a 7-day one).
+
+Buckets grow roughly geometrically (1-2-3-5-7 steps per decade), so
+percentiles are accurate to about 40% of the value anywhere from 1ms to
+10 minutes. Trailing empty buckets are not stored: a tool that always
+answers in under 100ms keeps a histogram of about a dozen counts.
+
+This module is pure Python (no MCP imports) so it can be loaded directly.
+"""
+
+from bisect import bisect_left
+
+# Upper bound (inclusive, in ms) of each bucket; a final bucket catches the rest.
+# 1, 2, 3, 5, 7, 10, 20, ... 70_000, then 100_000 to 600_000.
+LATENCY_BUCKETS_MS = [m * 10**e for e in range(5) for m in (1, 2, 3, 5, 7)] + [100_000, 200_000, 300_000, 600_000]
+
+
+def bucket_index(duration_ms: float) -> int:
+    """Get the bucket a duration falls into."""
+    return bisect_left(LATENCY_BUCKETS_MS, duration_ms)
+
+
+def record_latency(histogram: list[int], duration_ms: float) -> None:
+    """Add one observation to a histogram in place."""
+    index = bucket_index(max(duration_ms, 0))
+    if index >= len(histogram):
+        histogram.extend([0] * (index + 1 - len(histogram)))
+    histogram[index] += 1
+
+
+def merge_histograms(*histograms: list[int]) -> list[int]:
+    """Add histograms together into a new one."""
+    merged: list[int] = []
+    for histogram in histograms:
+        if len(histogram) > len(merged):
+            merged.extend([0] * (len(histogram) - len(merged)))
+        for i, count in enumerate(histogram):
+            merged[i] += count
+    return merged
+
+
+def percentile(histogram: list[int], pct: float) -> float | None:
+    """Estimate a percentile, interpolating linearly inside its bucket.
+
+    Args:
+        histogram: Bucket counts
+        pct: Percentile, 0-100
+
+    Returns:
+        Latency in ms, or None for an empty histogram
+    """
+    total = sum(histogram)
+    if not total:
+        return None
+    rank = pct / 100 * total
+    seen = 0
+    for index, count in enumerate(histogram):
+        if count and seen + count >= rank:
+            low = LATENCY_BUCKETS_MS[index - 1] if index > 0 else 0
+            if index >= len(LATENCY_BUCKETS_MS):
+                return float(low)  # Open-ended last bucket
+            high = LATENCY_BUCKETS_MS[index]
+            return low + (high - low) * max(rank - seen, 0) / count
+        seen += count
+    return float(LATENCY_BUCKETS_MS[-1])
+
+
+def summarize_histogram(histogram: list[int]) -> dict:
+    """Get count and p50/p90/p99 (rounded ms) for a histogram."""
+    summary: dict = {"count": sum(histogram)}
+    for pct in (50, 90, 99):
+        value = percentile(histogram, pct)
+        summary[f"p{pct}"] = round(value, 1) if value is not None else None
+    return summary
@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING
 import yaml
 from mcp.types import TextContent
 
+from scripts.common.known_issues import get_known_issues_matcher
 from server.tool_registry import ToolRegistry
 
 # Support both package import and direct loading
@@ -36,55 +37,19 @@ if TYPE_CHECKING:
 # ==================== TOOL IMPLEMENTATIONS ====================
 
 
-def _check_pattern_matches(patterns: list, pattern_key: str, error_lower: str, tool_lower: str = "") -> list:
-    """Check a list of patterns for matches and return formatted results."""
-    matches = []
-    for pattern in patterns:
-        pattern_text = pattern.get("pattern", "").lower()
-        if not pattern_text:
-            continue
+def _pattern_match_data(pattern_key: str, pattern: dict) -> dict:
+    """Format a matched patterns.yaml entry for display."""
+    match_data = {"source": pattern_key, "pattern": pattern.get("pattern")}
 
-        if pattern_text in error_lower or (tool_lower and pattern_text in tool_lower):
-            match_data = {"source": pattern_key, "pattern": pattern.get("pattern")}
-
-            # Different patterns have different fields
-            if pattern_key == "jira_cli_patterns":
-                match_data["description"] = pattern.get("description", "")
-                match_data["solution"] = pattern.get("solution", "")
-            else:
-                match_data["meaning"] = pattern.get("meaning", "")
-                match_data["fix"] = pattern.get("fix", "")
-                match_data["commands"] = pattern.get("commands", [])
-
-            matches.append(match_data)
-    return matches
-
-
-def _load_patterns_from_memory() -> dict:
-    """Load patterns from memory/learned/patterns.yaml."""
-    patterns_file = MEMORY_DIR / "learned" / "patterns.yaml"
-    if not patterns_file.exists():
-        return {}
-
-    try:
-        with open(patterns_file) as f:
-            return yaml.safe_load(f) or {}
-    except Exception:
-        return {}
-
-
-def _load_tool_fixes_from_memory() -> list:
-    """Load tool fixes from memory/learned/tool_fixes.yaml."""
-    fixes_file = MEMORY_DIR / "learned" / "tool_fixes.yaml"
-    if not fixes_file.exists():
-        return []
-
-    try:
-        with open(fixes_file) as f:
-            fixes_data = yaml.safe_load(f) or {}
-            return fixes_data.get("tool_fixes", [])
-    except Exception:
-        return []
+    # Different patterns have different fields
+    if pattern_key == "jira_cli_patterns":
+        match_data["description"] = pattern.get("description", "")
+        match_data["solution"] = pattern.get("solution", "")
+    else:
+        match_data["meaning"] = pattern.get("meaning", "")
+        match_data["fix"] = pattern.get("fix", "")
+        match_data["commands"] = pattern.get("commands", [])
+    return match_data
 
 
 def _format_known_issue_matches(matches: list) -> list[str]:
@@ -634,52 +599,33 @@ async def _check_known_issues_impl(tool_name: str = "", error_text: str = "") ->
     Returns:
         Known issues and fixes, or empty if none found.
     """
-    matches = []
-    error_lower = error_text.lower() if error_text else ""
-    tool_lower = tool_name.lower() if tool_name else ""
-
-    # Load patterns from memory
-    patterns = _load_patterns_from_memory()
+    matcher = get_known_issues_matcher(MEMORY_DIR / "learned")
 
     # Check all pattern types
-    pattern_types = [
+    pattern_types = (
         "error_patterns",
         "auth_patterns",
         "bonfire_patterns",
         "pipeline_patterns",
         "jira_cli_patterns",
+    )
+    matches = [
+        _pattern_match_data(pattern_type, pattern)
+        for pattern_type, pattern in matcher.match_patterns(error_text, tool_name, pattern_types)
     ]
-    for pattern_type in pattern_types:
-        pattern_matches = _check_pattern_matches(patterns.get(pattern_type, []), pattern_type, error_lower, tool_lower)
-        matches.extend(pattern_matches)
-
-    # Load and check tool fixes
-    tool_fixes = _load_tool_fixes_from_memory()
-    for fix in tool_fixes:
-        if tool_name and fix.get("tool_name", "").lower() == tool_lower:
-            matches.append(
-                {
-                    "source": "tool_fixes",
-                    "tool_name": fix.get("tool_name"),
-                    "error_pattern": fix.get("error_pattern", ""),
-                    "root_cause": fix.get("root_cause", ""),
-                    "fix_applied": fix.get("fix_applied", ""),
-                    "date_learned": fix.get("date_learned", ""),
-                }
-            )
-        elif error_text:
-            fix_pattern = fix.get("error_pattern", "").lower()
-            if fix_pattern and fix_pattern in error_lower:
-                matches.append(
-                    {
-                        "source": "tool_fixes",
-                        "tool_name": fix.get("tool_name"),
-                        "error_pattern": fix.get("error_pattern", ""),
-                        "root_cause": fix.get("root_cause", ""),
-                        "fix_applied": fix.get("fix_applied", ""),
-                        "date_learned": fix.get("date_learned", ""),
-                    }
-                )
+
+    # Check tool fixes
+    for fix in matcher.match_tool_fixes(tool_name, error_text):
+        matches.append(
+            {
+                "source": "tool_fixes",
+                "tool_name": fix.get("tool_name"),
+                "error_pattern": fix.get("error_pattern", ""),
+                "root_cause": fix.get("root_cause", ""),
+                "fix_applied": fix.get("fix_applied", ""),
+                "date_learned": fix.get("date_learned", ""),
+            }
+        )
 
     if not matches:
         return [
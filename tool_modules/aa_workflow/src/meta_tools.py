@@ -4,9 +4,10 @@ Provides tools for:
 - tool_list: List all available tools across modules
 - tool_exec: Execute any tool from any module dynamically
 - context_filter: Get context-aware tool recommendations for a message
+- tool_latency_report: Latency percentiles per tool or skill from agent stats
+- concurrency_report: Queue waits and usage of the per-CLI concurrency limits
 """
 
-import importlib.util
 import json
 import logging
 from typing import TYPE_CHECKING
@@ -14,6 +15,8 @@ from typing import TYPE_CHECKING
 from mcp.server.fastmcp import FastMCP
 from mcp.types import TextContent
 
+from scripts.common.known_issues import check_known_issues, format_known_issues
+from server.module_servers import get_module_registry
 from server.tool_discovery import build_full_manifest, get_module_for_tool
 from server.tool_registry import ToolRegistry
 
@@ -39,96 +42,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-# Known issues checking - loads patterns from memory
-def _check_known_issues_sync(tool_name: str = "", error_text: str = "") -> list:
-    """Check memory for known issues matching this tool/error."""
-    import yaml
-
-    matches = []
-    error_lower = error_text.lower() if error_text else ""
-    tool_lower = tool_name.lower() if tool_name else ""
-
-    try:
-        memory_dir = PROJECT_ROOT / "memory" / "learned"
-
-        patterns_file = memory_dir / "patterns.yaml"
-        if patterns_file.exists():
-            with open(patterns_file) as f:
-                patterns = yaml.safe_load(f) or {}
-
-            # Check all pattern categories
-            for category in [
-                "error_patterns",
-                "auth_patterns",
-                "bonfire_patterns",
-                "pipeline_patterns",
-            ]:
-                for pattern in patterns.get(category, []):
-                    pattern_text = pattern.get("pattern", "").lower()
-                    if pattern_text and (pattern_text in error_lower or pattern_text in tool_lower):
-                        matches.append(
-                            {
-                                "source": category,
-                                "pattern": pattern.get("pattern"),
-                                "meaning": pattern.get("meaning", ""),
-                                "fix": pattern.get("fix", ""),
-                                "commands": pattern.get("commands", []),
-                            }
-                        )
-
-        # Check tool_fixes.yaml
-        fixes_file = memory_dir / "tool_fixes.yaml"
-        if fixes_file.exists():
-            with open(fixes_file) as f:
-                fixes = yaml.safe_load(f) or {}
-
-            for fix in fixes.get("tool_fixes", []):
-                if tool_name and fix.get("tool_name", "").lower() == tool_lower:
-                    matches.append(
-                        {
-                            "source": "tool_fixes",
-                            "tool_name": fix.get("tool_name"),
-                            "pattern": fix.get("error_pattern", ""),
-                            "fix": fix.get("fix_applied", ""),
-                        }
-                    )
-                elif error_text:
-                    fix_pattern = fix.get("error_pattern", "").lower()
-                    if fix_pattern and fix_pattern in error_lower:
-                        matches.append(
-                            {
-                                "source": "tool_fixes",
-                                "tool_name": fix.get("tool_name"),
-                                "pattern": fix.get("error_pattern", ""),
-                                "fix": fix.get("fix_applied", ""),
-                            }
-                        )
-
-    except Exception:
-        pass
-
-    return matches
-
-
-def _format_known_issues(matches: list) -> str:
-    """Format known issues for display."""
-    if not matches:
-        return ""
-
-    lines = ["\n## 💡 Known Issues Found!\n"]
-    for match in matches[:3]:  # Limit to 3
-        lines.append(f"**Pattern:** `{match.get('pattern', '?')}`")
-        if match.get("meaning"):
-            lines.append(f"*{match.get('meaning')}*")
-        if match.get("fix"):
-            lines.append(f"**Fix:** {match.get('fix')}")
-        if match.get("commands"):
-            lines.append("**Try:**")
-            for cmd in match.get("commands", [])[:2]:
-                lines.append(f"- `{cmd}`")
-        lines.append("")
-
-    return "\n".join(lines)
+# Known issues checking - shared matcher over learned patterns (reloaded when they change)
+_check_known_issues_sync = check_known_issues
+_format_known_issues = format_known_issues
 
 
 # ============== Dynamic Tool Discovery ==============
@@ -192,6 +108,57 @@ async def _tool_list_impl(module: str) -> list[TextContent]:
     return [TextContent(type="text", text="\n".join(lines))]
 
 
+def _tool_latency_report_impl(kind: str, days: int, limit: int) -> list[TextContent]:
+    """Implementation of tool_latency_report tool."""
+    from tool_modules.aa_workflow.src.agent_stats import get_agent_stats
+
+    try:
+        report = get_agent_stats().get_latency_report(kind, days if days > 0 else None)
+    except ValueError as e:
+        return [TextContent(type="text", text=f"❌ {e}")]
+
+    period = f"last {days} days" if days > 0 else "lifetime"
+    if not report:
+        return [TextContent(type="text", text=f"No {kind} latency recorded ({period}).")]
+
+    # Slowest tail first
+    rows = sorted(report.items(), key=lambda item: item[1]["p99"] or 0, reverse=True)[:limit]
+    lines = [
+        f"## ⏱️ {kind.capitalize()} Latency ({period})\n",
+        "| Name | Calls | p50 | p90 | p99 |",
+        "|------|------:|----:|----:|----:|",
+    ]
+    for name, latency in rows:
+        lines.append(
+            f"| `{name}` | {latency['count']} | {latency['p50']:g}ms | {latency['p90']:g}ms | {latency['p99']:g}ms |"
+        )
+    if len(report) > limit:
+        lines.append(f"\n*{len(report) - limit} more not shown*")
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
+def _concurrency_report_impl() -> list[TextContent]:
+    """Implementation of concurrency_report tool."""
+    from server.utils import get_concurrency_limiter
+
+    stats = get_concurrency_limiter().stats()
+    if not stats:
+        return [TextContent(type="text", text="No concurrency-limited commands have run yet.")]
+
+    lines = [
+        "## 🚦 Concurrency Limits\n",
+        "| Limit | Max | Running | Waiting | Runs | Queued | Avg wait | Max wait |",
+        "|-------|----:|--------:|--------:|-----:|-------:|---------:|---------:|",
+    ]
+    for name, limit in sorted(stats.items(), key=lambda item: item[1]["max_wait_ms"], reverse=True):
+        lines.append(
+            f"| `{name}` | {limit['limit']} | {limit['in_flight']} | {limit['waiting']} | {limit['acquired']} "
+            f"| {limit['queued']} | {limit['avg_wait_ms']:g}ms | {limit['max_wait_ms']:g}ms |"
+        )
+    lines.append('\n*Limits are set in the "concurrency" section of config.json.*')
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
 def _extract_tool_result(result) -> list[TextContent]:
     """Extract text content from tool execution result.
 
@@ -272,32 +239,14 @@ async def _tool_exec_impl(tool_name: str, args: str, create_issue_fn) -> list[Te
     except json.JSONDecodeError as e:
         return [TextContent(type="text", text=f"❌ Invalid JSON args: {e}")]
 
-    # Load and execute the tool module (try tools_basic.py first, then tools.py)
-    tools_file = TOOL_MODULES_DIR / f"aa_{module}" / "src" / "tools_basic.py"
-    if not tools_file.exists():
-        tools_file = TOOL_MODULES_DIR / f"aa_{module}" / "src" / "tools.py"
-
-    if not tools_file.exists():
+    # Resolve the module's cached server (tools_basic.py first, then tools.py)
+    registry = get_module_registry()
+    if registry.get_tools_file(module) is None:
         return [TextContent(type="text", text=f"❌ Module not found: {module}")]
 
     try:
-        # Create a temporary server to register tools
-        temp_server = FastMCP(f"temp-{module}")
-
-        # Load the module
-        spec = importlib.util.spec_from_file_location(f"aa_{module}_tools_exec", tools_file)
-        if spec is None or spec.loader is None:
-            return [TextContent(type="text", text=f"❌ Could not load module: {module}")]
-
-        loaded_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(loaded_module)
-
-        # Register tools with temp server
-        if hasattr(loaded_module, "register_tools"):
-            loaded_module.register_tools(temp_server)
-
-        # Execute the tool
-        result = await temp_server.call_tool(tool_name, tool_args)
+        # Module is imported and registered once per process, not per call
+        result = await registry.call_tool(module, tool_name, tool_args)
 
         # Extract text from result
         return _extract_tool_result(result)
@@ -347,6 +296,38 @@ def register_meta_tools(server: "FastMCP", create_issue_fn=None) -> int:
         """
         return await _tool_exec_impl(tool_name, args, create_issue_fn)
 
+    @registry.tool()
+    async def tool_latency_report(kind: str = "tools", days: int = 7, limit: int = 20) -> list[TextContent]:
+        """
+        Show latency percentiles (p50/p90/p99) per tool or per skill.
+
+        Use this to find slow integrations or a tool whose tail latency
+        is regressing. Slowest p99 first.
+
+        Args:
+            kind: "tools" or "skills"
+            days: Look at the last N days; 0 for all time
+            limit: Maximum rows to show
+
+        Returns:
+            Table of call counts and latency percentiles.
+        """
+        return _tool_latency_report_impl(kind, days, limit)
+
+    @registry.tool()
+    async def concurrency_report() -> list[TextContent]:
+        """
+        Show how long commands queued for the per-CLI concurrency limits.
+
+        Each limit caps concurrent runs of a binary (oc, bonfire, glab, ...),
+        of kubectl commands per cluster, or of glab commands per GitLab host.
+        Use this to see whether parallel skills are waiting on a limit.
+
+        Returns:
+            Table of limits with running, waiting and queued counts and wait times.
+        """
+        return _concurrency_report_impl()
+
     @registry.tool()
     async def context_filter(
         message: str,
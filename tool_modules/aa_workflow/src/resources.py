@@ -87,21 +87,17 @@ async def _get_personas() -> str:
 
 async def _get_skills() -> str:
     """Get available skill definitions resource."""
-    skills = []
-    if SKILLS_DIR.exists():
-        for f in SKILLS_DIR.glob("*.yaml"):
-            try:
-                with open(f) as fp:
-                    data = yaml.safe_load(fp)
-                skills.append(
-                    {
-                        "name": data.get("name", f.stem),
-                        "description": data.get("description", ""),
-                        "inputs": [i.get("name") for i in data.get("inputs", [])],
-                    }
-                )
-            except Exception:
-                pass
+    from scripts.common.skill_catalog import get_skill_catalog
+
+    skills = [
+        {
+            "name": entry.name,
+            "description": entry.description,
+            "inputs": entry.input_names,
+        }
+        for entry in get_skill_catalog().entries()
+        if not entry.error
+    ]
     return yaml.dump({"skills": skills}, default_flow_style=False)
 
 
@@ -181,6 +181,7 @@ class CronScheduler:
         cron_expr = job_config.get("cron", "")
         inputs = job_config.get("inputs", {})
         notify = job_config.get("notify", [])
+        timeout = job_config.get("timeout")
 
         if not skill or not cron_expr:
             logger.warning(f"Job {job_name} missing skill or cron expression")
@@ -201,6 +202,7 @@ class CronScheduler:
                     "skill": skill,
                     "inputs": inputs,
                     "notify": notify,
+                    "timeout": timeout,
                 },
                 replace_existing=True,
             )
@@ -236,8 +238,14 @@ class CronScheduler:
         skill: str,
         inputs: dict,
         notify: list[str],
+        timeout: float | str | None = None,
     ):
-        """Execute a scheduled job."""
+        """Execute a scheduled job.
+
+        Args:
+            timeout: Optional limit for the whole skill run (job ``timeout``,
+                overrides the skill's own ``timeout:``)
+        """
         import time
 
         start_time = time.time()
@@ -249,7 +257,7 @@ class CronScheduler:
 
         try:
             # Execute the skill
-            output = await self._run_skill(skill, inputs)
+            output = await self._run_skill(skill, inputs, timeout=timeout)
             success = True
             logger.info(f"Job {job_name} completed successfully")
 
@@ -280,18 +288,22 @@ class CronScheduler:
                 notify_channels=notify,
             )
 
-    async def _run_skill(self, skill_name: str, inputs: dict) -> str:
-        """Run a skill and return its output."""
-        import yaml
+    async def _run_skill(self, skill_name: str, inputs: dict, timeout: float | str | None = None) -> str:
+        """Run a skill and return its output.
+
+        Raises:
+            TimeoutError: If the skill was cancelled by its ``timeout``
+        """
+        from scripts.common.skill_catalog import get_skill_catalog
 
         from .skill_engine import SkillExecutor
 
-        skill_file = SKILLS_DIR / f"{skill_name}.yaml"
-        if not skill_file.exists():
+        entry = get_skill_catalog().get(skill_name)
+        if entry is None:
             raise FileNotFoundError(f"Skill not found: {skill_name}")
-
-        with open(skill_file) as f:
-            skill = yaml.safe_load(f)
+        if entry.error:
+            raise ValueError(f"Failed to load skill {skill_name}: {entry.error}")
+        skill = entry.data
 
         executor = SkillExecutor(
             skill=skill,
@@ -300,9 +312,13 @@ class CronScheduler:
             server=self.server,
             enable_interactive_recovery=False,  # No interactive recovery for scheduled jobs
             emit_events=False,  # No VS Code events for background jobs
+            timeout=timeout,
         )
 
         result = await executor.execute()
+        if executor.timeout_error:
+            # The transcript ends normally after a skill timeout; report it as a failure
+            raise TimeoutError(executor.timeout_error)
         return result
 
     async def _send_notifications(
@@ -394,6 +410,7 @@ class CronScheduler:
                 skill=skill,
                 inputs=inputs,
                 notify=notify,
+                timeout=job_config.get("timeout"),
             )
             return {"success": True, "message": f"Job {job_name} executed"}
         except Exception as e:
@@ -0,0 +1,164 @@
+"""Skill Checkpoints.
+
+Persists a running skill's context and step results after each step so a
+failed run can be resumed with ``skill_run(..., resume=True)`` instead of
+starting over. Long skills like ``test_mr_ephemeral`` spend most of their
+time reserving namespaces and deploying; resuming skips that work when a
+late step fails.
+
+A checkpoint records the index of the first step that has not completed.
+Steps complete in declaration order, so everything before that index is
+restored from the checkpoint and everything from it onwards runs again.
+Checkpoints are tied to the skill definition (a fingerprint of its steps)
+and are removed when the skill runs to the end. Each skill has one
+checkpoint per set of inputs, so overlapping runs of the same skill (Slack
+daemon, scheduler, IDE) with different inputs don't overwrite each other.
+
+Checkpoints are written to:
+~/.config/aa-workflow/skill_checkpoints/<skill>-<inputs hash>.json
+
+This module is pure Python (no MCP imports) so it can be loaded directly.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIR = Path.home() / ".config" / "aa-workflow" / "skill_checkpoints"
+
+# Context entries that are rebuilt on every run rather than checkpointed
+TRANSIENT_CONTEXT_KEYS = frozenset({"config", "inputs", "defaults"})
+
+
+@dataclass
+class SkillCheckpoint:
+    """Saved progress of a skill run."""
+
+    skill_name: str
+    fingerprint: str  # skill_fingerprint() of the definition that was running
+    inputs: dict
+    next_step: int  # Index of the first step that has not completed
+    context: dict = field(default_factory=dict)
+    step_results: list[dict] = field(default_factory=list)
+    updated: str = ""
+
+
+def skill_fingerprint(skill: dict) -> str:
+    """Hash a skill's steps so a checkpoint is only resumed by the same definition."""
+    payload = json.dumps(skill.get("steps", []), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _safe_name(skill_name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in skill_name)
+
+
+def inputs_hash(inputs: dict) -> str:
+    """Short hash of a run's inputs, used to key its checkpoint file."""
+    payload = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def checkpoint_path(skill_name: str, inputs: dict) -> Path:
+    """Get the checkpoint file for a skill run with these inputs."""
+    return CHECKPOINT_DIR / f"{_safe_name(skill_name)}-{inputs_hash(inputs)}.json"
+
+
+def split_context(context: dict[str, Any]) -> tuple[str, set[str]]:
+    """Serialize the JSON-serializable entries of a skill context.
+
+    Returns:
+        (JSON object of the entries that can be checkpointed, names of entries that cannot)
+    """
+    saved: list[str] = []
+    unsaved: set[str] = set()
+    for name, value in context.items():
+        if name in TRANSIENT_CONTEXT_KEYS:
+            continue
+        try:
+            saved.append(f"{json.dumps(name)}: {json.dumps(value)}")
+        except (TypeError, ValueError):
+            unsaved.add(name)
+    return "{" + ", ".join(saved) + "}", unsaved
+
+
+def save_checkpoint(checkpoint: SkillCheckpoint, context_json: str | None = None) -> bool:
+    """Write a checkpoint atomically.
+
+    Args:
+        checkpoint: Checkpoint to write
+        context_json: The context already serialized by split_context(), written
+            in place of checkpoint.context so it isn't serialized twice
+
+    Returns:
+        True if the checkpoint was written
+    """
+    path = checkpoint_path(checkpoint.skill_name, checkpoint.inputs)
+    checkpoint.updated = datetime.now().isoformat()
+    try:
+        if context_json is None:
+            context_json = json.dumps(checkpoint.context, default=str)
+        data = {f.name: getattr(checkpoint, f.name) for f in fields(checkpoint) if f.name != "context"}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            f.write(json.dumps(data, default=str)[:-1])
+            f.write(f', "context": {context_json}}}')
+        tmp_file.replace(path)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Failed to write checkpoint for {checkpoint.skill_name}: {e}")
+        return False
+
+
+def _read_checkpoint(path: Path) -> SkillCheckpoint | None:
+    try:
+        with open(path) as f:
+            return SkillCheckpoint(**json.load(f))
+    except FileNotFoundError:
+        return None
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
+
+
+def load_checkpoint(skill_name: str, inputs: dict | None = None) -> SkillCheckpoint | None:
+    """Load a skill's checkpoint, or None if there is no usable one.
+
+    Args:
+        skill_name: Skill name
+        inputs: Inputs of the run to resume; None loads the skill's most
+            recently updated checkpoint, whatever its inputs
+
+    Returns:
+        The checkpoint, or None
+    """
+    if inputs is not None:
+        saved = _read_checkpoint(checkpoint_path(skill_name, inputs))
+        return saved if saved is not None and saved.inputs == inputs else None
+
+    paths = []
+    for path in CHECKPOINT_DIR.glob(f"{_safe_name(skill_name)}-*.json"):
+        try:
+            paths.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    for _, path in sorted(paths, reverse=True):
+        saved = _read_checkpoint(path)
+        if saved is not None and saved.skill_name == skill_name:
+            return saved
+    return None
+
+
+def clear_checkpoint(skill_name: str, inputs: dict) -> None:
+    """Remove the checkpoint of a skill run with these inputs, if any."""
+    try:
+        checkpoint_path(skill_name, inputs).unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Failed to remove checkpoint for {skill_name}: {e}")
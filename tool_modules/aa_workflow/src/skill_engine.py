@@ -6,17 +6,27 @@ Provides:
 - SkillExecutor: Class that handles step-by-step execution
 """
 
+import copy
+import functools
 import json
 import logging
 import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
-import yaml
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from mcp.types import TextContent
 
+from scripts.common.known_issues import (
+    check_known_issues,
+    format_known_issues,
+    get_known_issues_matcher,
+    get_pattern_usage_stats,
+)
+from server.module_servers import get_module_registry
+from server.profiler import Profiler, profile_span
 from server.tool_registry import ToolRegistry
 from server.utils import load_config
 
@@ -31,8 +41,33 @@ except ImportError:
     PROJECT_DIR = TOOL_MODULES_DIR.parent
     SKILLS_DIR = PROJECT_DIR / "skills"
 
+try:
+    from .skill_checkpoint import (
+        SkillCheckpoint,
+        clear_checkpoint,
+        load_checkpoint,
+        save_checkpoint,
+        skill_fingerprint,
+        split_context,
+    )
+    from .skill_graph import StepNode, build_step_graph, is_read_only_tool
+    from .skill_preflight import SkillPreflight
+    from .tool_cache import get_tool_cache
+except ImportError:
+    from tool_modules.aa_workflow.src.skill_checkpoint import (
+        SkillCheckpoint,
+        clear_checkpoint,
+        load_checkpoint,
+        save_checkpoint,
+        skill_fingerprint,
+        split_context,
+    )
+    from tool_modules.aa_workflow.src.skill_graph import StepNode, build_step_graph, is_read_only_tool
+    from tool_modules.aa_workflow.src.skill_preflight import SkillPreflight
+    from tool_modules.aa_workflow.src.tool_cache import get_tool_cache
+
 if TYPE_CHECKING:
-    pass
+    import asyncio
 
 logger = logging.getLogger(__name__)
 
@@ -46,92 +81,259 @@ except ImportError:
     logger.warning("Layer 5 (Usage Pattern Learning) not available - errors won't be learned from")
 
 
-# Known issues checking - loads patterns from memory
-def _check_known_issues_sync(tool_name: str = "", error_text: str = "") -> list:
-    """Check memory for known issues matching this tool/error."""
-    matches = []
-    error_lower = error_text.lower() if error_text else ""
-    tool_lower = tool_name.lower() if tool_name else ""
+# Known issues checking - shared matcher over learned patterns (reloaded when they change)
+_check_known_issues_sync = check_known_issues
+_format_known_issues = format_known_issues
+
+
+# Default cap on concurrently running tool steps (config: skills.max_parallel_steps)
+DEFAULT_MAX_PARALLEL_STEPS = 4
+
+# Chrome traces of profiled runs (skill_run(..., profile=True))
+PROFILES_DIR = Path.home() / ".config" / "aa-workflow" / "profiles"
 
+_TIMEOUT_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+
+def parse_timeout(value: Any) -> float | None:
+    """Parse a step/skill ``timeout:`` value into seconds.
+
+    Accepts a number of seconds or a string like "90", "30s", "5m" or "1h".
+
+    Returns:
+        Seconds, or None for no timeout (missing, zero or unparseable)
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if value > 0 else None
+    text = str(value).strip().lower()
+    multiplier = _TIMEOUT_UNITS.get(text[-1:], None)
+    if multiplier is not None:
+        text = text[:-1]
     try:
-        patterns_file = SKILLS_DIR.parent / "memory" / "learned" / "patterns.yaml"
-        if patterns_file.exists():
-            with open(patterns_file) as f:
-                patterns = yaml.safe_load(f) or {}
-
-            # Check all pattern categories
-            for category in [
-                "error_patterns",
-                "auth_patterns",
-                "bonfire_patterns",
-                "pipeline_patterns",
-            ]:
-                for pattern in patterns.get(category, []):
-                    pattern_text = pattern.get("pattern", "").lower()
-                    if pattern_text and (pattern_text in error_lower or pattern_text in tool_lower):
-                        matches.append(
-                            {
-                                "source": category,
-                                "pattern": pattern.get("pattern"),
-                                "meaning": pattern.get("meaning", ""),
-                                "fix": pattern.get("fix", ""),
-                                "commands": pattern.get("commands", []),
-                            }
-                        )
-
-        # Check tool_fixes.yaml
-        fixes_file = SKILLS_DIR.parent / "memory" / "learned" / "tool_fixes.yaml"
-        if fixes_file.exists():
-            with open(fixes_file) as f:
-                fixes = yaml.safe_load(f) or {}
-
-            for fix in fixes.get("tool_fixes", []):
-                if tool_name and fix.get("tool_name", "").lower() == tool_lower:
-                    matches.append(
-                        {
-                            "source": "tool_fixes",
-                            "tool_name": fix.get("tool_name"),
-                            "pattern": fix.get("error_pattern", ""),
-                            "fix": fix.get("fix_applied", ""),
-                        }
-                    )
-                elif error_text:
-                    fix_pattern = fix.get("error_pattern", "").lower()
-                    if fix_pattern and fix_pattern in error_lower:
-                        matches.append(
-                            {
-                                "source": "tool_fixes",
-                                "tool_name": fix.get("tool_name"),
-                                "pattern": fix.get("error_pattern", ""),
-                                "fix": fix.get("fix_applied", ""),
-                            }
-                        )
-
-    except Exception:
-        pass
-
-    return matches
-
-
-def _format_known_issues(matches: list) -> str:
-    """Format known issues for display."""
-    if not matches:
-        return ""
-
-    lines = ["\n## 💡 Known Issues Found!\n"]
-    for match in matches[:3]:  # Limit to 3
-        lines.append(f"**Pattern:** `{match.get('pattern', '?')}`")
-        if match.get("meaning"):
-            lines.append(f"*{match.get('meaning')}*")
-        if match.get("fix"):
-            lines.append(f"**Fix:** {match.get('fix')}")
-        if match.get("commands"):
-            lines.append("**Try:**")
-            for cmd in match.get("commands", [])[:2]:
-                lines.append(f"- `{cmd}`")
-        lines.append("")
-
-    return "\n".join(lines)
+        seconds = float(text) * (multiplier or 1)
+    except ValueError:
+        logger.warning(f"Ignoring invalid timeout: {value!r}")
+        return None
+    return seconds if seconds > 0 else None
+
+
+# ==================== Template compilation cache ====================
+# Compiling a Jinja template (parse + codegen + compile) costs far more than
+# rendering it, and skills render the same strings on every run. Compiled
+# code is cached process-wide by source text; each executor binds it to its
+# own Environment, which carries the executor-specific filters.
+
+TEMPLATE_CACHE_SIZE = 2048
+_compile_env = None
+
+# Custom filters provided by SkillExecutor._create_jinja_filters(). Jinja
+# checks filter names at compile time; the functions are bound at render time.
+JINJA_FILTER_NAMES = ("jira_link", "mr_link", "length")
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _compile_template(source: str):
+    """Compile template source to a Jinja code object.
+
+    Raises:
+        ImportError: If Jinja2 is not installed
+        jinja2.TemplateSyntaxError: If the source is not a valid template
+    """
+    global _compile_env
+    if _compile_env is None:
+        from jinja2 import Environment
+
+        env = Environment(autoescape=True)
+        env.filters.update({name: str for name in JINJA_FILTER_NAMES})
+        _compile_env = env
+    return _compile_env.compile(source)
+
+
+def _condition_source(condition: str) -> str:
+    """Wrap a condition in {{ }} for Jinja evaluation if not already there."""
+    if "{{" not in condition:
+        return "{{ " + condition + " }}"
+    return condition
+
+
+# ==================== Compute block cache ====================
+# Compute blocks are compiled once per distinct source text (so once per
+# skill version, or per rendered text for the few blocks with templates),
+# and the import-heavy sandbox globals are built once per process.
+
+COMPUTE_CACHE_SIZE = 2048
+
+
+@dataclass(frozen=True)
+class _CompiledCompute:
+    """A compute block compiled for exec, plus its 'return' fallback."""
+
+    code: Any
+    # Expression of the last "return ..." line, used when the block sets
+    # neither its output name nor ``result``
+    return_expr: Any = None
+
+
+@functools.lru_cache(maxsize=COMPUTE_CACHE_SIZE)
+def _compile_compute(source: str) -> _CompiledCompute:
+    """Compile compute block source.
+
+    Raises:
+        SyntaxError: If the block is not valid Python
+    """
+    code = compile(source, "<compute>", "exec")
+    return_expr = None
+    if "return" in source:
+        for line in reversed(source.split("\n")):
+            if line.strip().startswith("return "):
+                expr = line.strip()[7:]
+                try:
+                    return_expr = compile(expr, "<compute>", "eval")
+                except SyntaxError:
+                    # e.g. a multi-line return; only an error if it is needed
+                    return_expr = expr
+                break
+    return _CompiledCompute(code, return_expr)
+
+
+@functools.lru_cache(maxsize=None)
+def _compute_globals() -> dict:
+    """Build the compute sandbox globals (imports run once per process).
+
+    Callers must copy the result, and its ``__builtins__`` dict, before
+    exec'ing into it.
+    """
+    import os
+    import re
+    from datetime import datetime, timedelta
+
+    try:
+        from zoneinfo import ZoneInfo
+    except ImportError:
+        ZoneInfo = None
+
+    # Use module-level PROJECT_ROOT
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+
+    try:
+        from scripts.common import config_loader, jira_utils, lint_utils
+        from scripts.common import memory as memory_helpers
+        from scripts.common import parsers, repo_utils, slack_utils
+        from scripts.common.config_loader import get_timezone
+        from scripts.common.config_loader import load_config as load_skill_config
+        from scripts.skill_hooks import emit_event_sync
+    except ImportError:
+        parsers = None
+        jira_utils = None
+        load_skill_config = None
+        get_timezone = None
+        emit_event_sync = None
+        memory_helpers = None
+        config_loader = None
+        lint_utils = None
+        repo_utils = None
+        slack_utils = None
+
+    try:
+        from google.oauth2.credentials import Credentials as GoogleCredentials
+        from googleapiclient.discovery import build as google_build
+    except ImportError:
+        GoogleCredentials = None
+        google_build = None
+
+    return {
+        "__builtins__": {
+            "len": len,
+            "str": str,
+            "int": int,
+            "float": float,
+            "list": list,
+            "dict": dict,
+            "bool": bool,
+            "tuple": tuple,
+            "set": set,
+            "range": range,
+            "enumerate": enumerate,
+            "zip": zip,
+            "map": map,
+            "filter": filter,
+            "sorted": sorted,
+            "min": min,
+            "max": max,
+            "sum": sum,
+            "any": any,
+            "all": all,
+            "isinstance": isinstance,
+            "type": type,
+            "hasattr": hasattr,
+            "getattr": getattr,
+            "repr": repr,
+            "print": print,
+            "dir": dir,
+            "vars": vars,
+            "Exception": Exception,
+            "ValueError": ValueError,
+            "TypeError": TypeError,
+            "KeyError": KeyError,
+            "AttributeError": AttributeError,
+            "IndexError": IndexError,
+            "ImportError": ImportError,
+            "True": True,
+            "False": False,
+            "None": None,
+            "open": open,
+            "__import__": __import__,
+        },
+        "re": re,
+        "os": os,
+        "Path": Path,
+        "datetime": datetime,
+        "timedelta": timedelta,
+        "ZoneInfo": ZoneInfo,
+        "parsers": parsers,
+        "jira_utils": jira_utils,
+        "memory": memory_helpers,
+        "emit_event": emit_event_sync,
+        "load_config": load_skill_config,
+        "get_timezone": get_timezone,
+        "GoogleCredentials": GoogleCredentials,
+        "google_build": google_build,
+        # New shared utilities
+        "config_loader": config_loader,
+        "lint_utils": lint_utils,
+        "repo_utils": repo_utils,
+        "slack_utils": slack_utils,
+    }
+
+
+@dataclass
+class _StepOutcome:
+    """Transcript and results produced by one step, flushed in step order."""
+
+    lines: list[str] = field(default_factory=list)
+    results: list[dict] = field(default_factory=list)
+    should_continue: bool = True
+    early_return: bool = False
+    skipped: bool = False  # Condition was false
+
+
+@dataclass
+class SkillProgress:
+    """A chunk of a skill's transcript, yielded by SkillExecutor.stream().
+
+    Joining the text of every chunk with newlines gives the transcript that
+    execute() returns.
+    """
+
+    text: str
+    kind: str  # "start", "step", "end" or "profile"
+    step_index: int | None = None
+    completed_steps: int = 0
+    total_steps: int = 0
+    message: str = ""
 
 
 class SkillExecutor:
@@ -147,6 +349,12 @@ class SkillExecutor:
         ask_question_fn=None,
         enable_interactive_recovery: bool = True,
         emit_events: bool = True,
+        max_parallel_steps: int | None = None,
+        checkpoint: bool = False,
+        resume: bool = False,
+        timeout: float | str | None = None,
+        profile: bool = False,
+        preflight: bool = False,
     ):
         self.skill = skill
         self.inputs = inputs
@@ -167,6 +375,46 @@ class SkillExecutor:
         self.start_time: float | None = None
         self.error_recovery = None  # Initialized when needed
 
+        # Checkpoint/resume: save progress after each step, or continue
+        # from the first incomplete step of a previous run
+        self.checkpoint = checkpoint or resume
+        self.resume = resume
+        self._resume_index = 0
+        self._checkpoint_next = 0
+        self._checkpoint_inputs: dict = {}  # Inputs as the run started; steps may modify self.inputs
+        self._stopped = False
+
+        # Jinja environment and bound templates, created on first use
+        self._jinja_env = None
+        self._templates: dict[str, Any] = {}
+        self._expressions: dict[str, Any] = {}
+        self._precompile()
+
+        # Concurrency cap for independent tool steps: explicit arg, then the
+        # skill's own max_parallel_steps, then config.json skills section.
+        if max_parallel_steps is None:
+            max_parallel_steps = skill.get(
+                "max_parallel_steps",
+                self.config.get("skills", {}).get("max_parallel_steps", DEFAULT_MAX_PARALLEL_STEPS),
+            )
+        self.max_parallel_steps = int(max_parallel_steps)
+
+        # Whole-skill time limit: explicit arg, then the skill's timeout:
+        self.timeout = parse_timeout(timeout if timeout is not None else skill.get("timeout"))
+        self.timeout_error: str | None = None  # Set when the whole-skill timeout cancelled the run
+
+        # Timing tree of this run, reported at the end when profile=True
+        self.profiler = Profiler(skill.get("name", "unknown")) if profile else None
+
+        # Warm up modules, cluster auth and connections before the first step
+        # (a skill can opt out with preflight: false)
+        self.preflight = preflight and skill.get("preflight", True)
+        self.preflight_report = None
+
+        # Transcript chunks for stream(), published as steps complete
+        self._progress: "asyncio.Queue[SkillProgress | None] | None" = None
+        self._completed_steps = 0
+
         # Event emitter for VS Code extension
         self.event_emitter = None
         if emit_events:
@@ -253,26 +501,11 @@ class SkillExecutor:
             (matched_pattern, pattern_category) tuple or (None, None)
         """
         try:
-            patterns_file = SKILLS_DIR.parent / "memory" / "learned" / "patterns.yaml"
-            if not patterns_file.exists():
-                return None, None
-
-            with open(patterns_file) as f:
-                patterns_data = yaml.safe_load(f) or {}
-
-            # Check each category for matches
-            for cat in [
-                "auth_patterns",
-                "error_patterns",
-                "bonfire_patterns",
-                "pipeline_patterns",
-            ]:
-                for pattern in patterns_data.get(cat, []):
-                    pattern_text = pattern.get("pattern", "").lower()
-                    if pattern_text and pattern_text in error_lower:
-                        # Track that pattern was matched
-                        self._update_pattern_usage_stats(cat, pattern_text, matched=True)
-                        return pattern, cat
+            categories = ("auth_patterns", "error_patterns", "bonfire_patterns", "pipeline_patterns")
+            for cat, pattern in get_known_issues_matcher().match_patterns(error_lower, categories=categories):
+                # Track that pattern was matched
+                self._update_pattern_usage_stats(cat, pattern["pattern"].lower(), matched=True)
+                return pattern, cat
         except Exception as e:
             self._debug(f"Pattern lookup failed: {e}")
 
@@ -412,71 +645,16 @@ class SkillExecutor:
     ) -> None:
         """Update usage statistics for a pattern.
 
+        Counts are kept in memory and written to patterns.yaml in batches
+        (see known_issues.PatternUsageStats).
+
         Args:
             category: Pattern category (e.g., "auth_patterns", "error_patterns")
             pattern_text: The pattern text to find
             matched: Whether the pattern was matched (default: True)
             fixed: Whether the fix succeeded (default: False)
         """
-        try:
-            import fcntl
-
-            patterns_file = SKILLS_DIR.parent / "memory" / "learned" / "patterns.yaml"
-            if not patterns_file.exists():
-                return
-
-            # Atomic read-modify-write with file locking
-            with open(patterns_file, "r+") as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-
-                try:
-                    f.seek(0)
-                    patterns_data = yaml.safe_load(f.read()) or {}
-
-                    if category not in patterns_data:
-                        return
-
-                    # Find and update the pattern
-                    for pattern in patterns_data[category]:
-                        if pattern.get("pattern", "").lower() == pattern_text.lower():
-                            # Initialize usage_stats if not present
-                            if "usage_stats" not in pattern:
-                                pattern["usage_stats"] = {
-                                    "times_matched": 0,
-                                    "times_fixed": 0,
-                                    "success_rate": 0.0,
-                                }
-
-                            stats = pattern["usage_stats"]
-
-                            # Update counters
-                            if matched:
-                                stats["times_matched"] = stats.get("times_matched", 0) + 1
-                                stats["last_matched"] = datetime.now().isoformat()
-
-                            if fixed:
-                                stats["times_fixed"] = stats.get("times_fixed", 0) + 1
-
-                            # Recalculate success rate
-                            if stats["times_matched"] > 0:
-                                stats["success_rate"] = round(stats["times_fixed"] / stats["times_matched"], 2)
-
-                            # Write back
-                            f.seek(0)
-                            f.truncate()
-                            yaml.dump(
-                                patterns_data,
-                                f,
-                                default_flow_style=False,
-                                sort_keys=False,
-                            )
-                            break
-
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-        except Exception as e:
-            self._debug(f"Failed to update pattern stats: {e}")
+        get_pattern_usage_stats().record(category, pattern_text, matched=matched, fixed=fixed)
 
     def _linkify_jira_keys(self, text):
         """Convert Jira keys to clickable links (Slack or Markdown format)."""
@@ -522,7 +700,7 @@ class SkillExecutor:
         return pattern.sub(replace, str(text))
 
     def _create_jinja_filters(self):
-        """Create Jinja2 custom filters for template rendering."""
+        """Create Jinja2 custom filters for template rendering (see JINJA_FILTER_NAMES)."""
         return {
             "jira_link": self._linkify_jira_keys,
             "mr_link": self._linkify_mr_ids,
@@ -571,90 +749,130 @@ class SkillExecutor:
     def _check_error_patterns(self, error: str) -> str | None:
         """Check if error matches known patterns and return fix suggestion."""
         try:
-            patterns_file = SKILLS_DIR.parent / "memory" / "learned" / "patterns.yaml"
-            if not patterns_file.exists():
+            matches = get_known_issues_matcher().match_patterns(error, categories=("error_patterns",))
+            if not matches:
                 return None
 
-            with open(patterns_file) as f:
-                patterns_data = yaml.safe_load(f) or {}
-
-            error_patterns = patterns_data.get("error_patterns", [])
-            error_lower = error.lower()
-
-            for pattern in error_patterns:
-                pattern_text = pattern.get("pattern", "").lower()
-                if pattern_text and pattern_text in error_lower:
-                    # Track pattern match
-                    self._update_pattern_usage_stats("error_patterns", pattern_text, matched=True)
-
-                    fix = pattern.get("fix", "")
-                    meaning = pattern.get("meaning", "")
-                    commands = pattern.get("commands", [])
-
-                    suggestion = f"\n   💡 **Known pattern: {pattern.get('pattern')}**"
-                    if meaning:
-                        suggestion += f"\n   *{meaning}*"
-                    if fix:
-                        suggestion += f"\n   **Fix:** {fix}"
-                    if commands:
-                        suggestion += "\n   **Try:**"
-                        for cmd in commands[:3]:
-                            suggestion += f"\n   - `{cmd}`"
-                    return suggestion
-
-            return None
+            _, pattern = matches[0]
+            # Track pattern match
+            self._update_pattern_usage_stats("error_patterns", pattern["pattern"].lower(), matched=True)
+
+            fix = pattern.get("fix", "")
+            meaning = pattern.get("meaning", "")
+            commands = pattern.get("commands", [])
+
+            suggestion = f"\n   💡 **Known pattern: {pattern.get('pattern')}**"
+            if meaning:
+                suggestion += f"\n   *{meaning}*"
+            if fix:
+                suggestion += f"\n   **Fix:** {fix}"
+            if commands:
+                suggestion += "\n   **Try:**"
+                for cmd in commands[:3]:
+                    suggestion += f"\n   - `{cmd}`"
+            return suggestion
         except Exception as e:
             self._debug(f"Pattern lookup failed: {e}")
             return None
 
-    def _template(self, text: str) -> str:
-        """Resolve {{ variable }} templates in text using Jinja2 if available."""
-        if not isinstance(text, str) or "{{" not in text:
-            return text
-
-        try:
+    def _get_jinja_env(self):
+        """Get this executor's Jinja2 environment (filters registered once)."""
+        if self._jinja_env is None:
             from jinja2 import Environment
 
             env = Environment(autoescape=True)
             env.filters.update(self._create_jinja_filters())
+            self._jinja_env = env
+        return self._jinja_env
+
+    def _get_template(self, source: str):
+        """Get a template for source text, reusing the process-wide compiled code."""
+        template = self._templates.get(source)
+        if template is None:
+            env = self._get_jinja_env()
+            code = _compile_template(source)
+            template = env.template_class.from_code(env, code, env.make_globals(None))
+            self._templates[source] = template
+        return template
+
+    def _precompile(self) -> None:
+        """Compile step conditions and static compute blocks up front.
+
+        Errors are ignored here; they are reported when the step runs.
+        """
+        for step in self.skill.get("steps", []):
+            condition = step.get("condition")
+            if isinstance(condition, str):
+                try:
+                    _compile_template(_condition_source(condition))
+                except Exception:
+                    pass
+
+            code = step.get("compute")
+            # Blocks with templates are compiled per rendered text at run time
+            if isinstance(code, str) and "{{" not in code:
+                try:
+                    _compile_compute(code)
+                except SyntaxError:
+                    pass
+
+    def _template(self, text: str, extra: dict | None = None) -> str:
+        """Resolve {{ variable }} templates in text using Jinja2 if available.
 
-            template = env.from_string(text)
-            return template.render(**self.context)
+        Args:
+            text: Text to render
+            extra: Additional variables (e.g. a foreach loop item) layered
+                over the context for this render only
+        """
+        if not isinstance(text, str) or "{{" not in text:
+            return text
+
+        try:
+            context = {**self.context, **extra} if extra else self.context
+            return self._get_template(text).render(**context)
         except ImportError:
             return self._template_with_regex_fallback(text)
         except Exception as e:
             self._debug(f"Template error: {e}")
             return text
 
-    def _template_dict(self, d: dict) -> dict:
+    def _template_dict(self, d: dict, extra: dict | None = None) -> dict:
         """Recursively template a dictionary."""
         result: dict = {}
         for k, v in d.items():
             if isinstance(v, str):
-                result[k] = self._template(v)
+                result[k] = self._template(v, extra)
             elif isinstance(v, dict):
-                result[k] = self._template_dict(v)
+                result[k] = self._template_dict(v, extra)
             elif isinstance(v, list):
-                result[k] = [self._template(i) if isinstance(i, str) else i for i in v]
+                result[k] = [self._template(i, extra) if isinstance(i, str) else i for i in v]
             else:
                 result[k] = v
         return result
 
+    def _eval_expression(self, expression: str) -> Any:
+        """Evaluate a Jinja2 expression against the context, returning the object.
+
+        Unlike _template this keeps the value's type, so a foreach source
+        can name a list in the context (``my_mrs``) or build one
+        (``{{ my_mrs[:5] }}``). Undefined names evaluate to None.
+        """
+        expression = expression.strip()
+        if expression.startswith("{{") and expression.endswith("}}"):
+            expression = expression[2:-2].strip()
+
+        compiled = self._expressions.get(expression)
+        if compiled is None:
+            compiled = self._get_jinja_env().compile_expression(expression)
+            self._expressions[expression] = compiled
+        return compiled(**self.context)
+
     def _eval_condition(self, condition: str) -> bool:
         """Safely evaluate a condition expression using Jinja2 if available."""
         self._debug(f"Evaluating condition: {condition}")
 
         try:
-            from jinja2 import Environment
-
-            env = Environment(autoescape=True)
-            # Wrap condition in {{ }} if not already there for Jinja evaluation
-            if "{{" not in condition:
-                expr = "{{ " + condition + " }}"
-            else:
-                expr = condition
-
-            result_str = env.from_string(expr).render(**self.context).strip()
+            result_str = self._get_template(_condition_source(condition)).render(**self.context).strip()
             # If it's a boolean-like string, convert it
             if result_str.lower() in ("true", "1", "yes"):
                 return True
@@ -869,135 +1087,22 @@ class SkillExecutor:
         local_vars["inputs"] = self.inputs
         local_vars["config"] = self.config
 
-        import os
-        import re
-        from datetime import datetime, timedelta
-        from pathlib import Path
-
-        try:
-            from zoneinfo import ZoneInfo
-        except ImportError:
-            ZoneInfo = None
-
-        # Use module-level PROJECT_ROOT
-        if str(PROJECT_ROOT) not in sys.path:
-            sys.path.insert(0, str(PROJECT_ROOT))
-
-        try:
-            from scripts.common import config_loader, jira_utils, lint_utils
-            from scripts.common import memory as memory_helpers
-            from scripts.common import parsers, repo_utils, slack_utils
-            from scripts.common.config_loader import get_timezone
-            from scripts.common.config_loader import load_config as load_skill_config
-            from scripts.skill_hooks import emit_event_sync
-        except ImportError:
-            parsers = None
-            jira_utils = None
-            load_skill_config = None
-            get_timezone = None
-            emit_event_sync = None
-            memory_helpers = None
-            config_loader = None
-            lint_utils = None
-            repo_utils = None
-            slack_utils = None
-
-        try:
-            from google.oauth2.credentials import Credentials as GoogleCredentials
-            from googleapiclient.discovery import build as google_build
-        except ImportError:
-            GoogleCredentials = None
-            google_build = None
-
-        safe_globals = {
-            "__builtins__": {
-                "len": len,
-                "str": str,
-                "int": int,
-                "float": float,
-                "list": list,
-                "dict": dict,
-                "bool": bool,
-                "tuple": tuple,
-                "set": set,
-                "range": range,
-                "enumerate": enumerate,
-                "zip": zip,
-                "map": map,
-                "filter": filter,
-                "sorted": sorted,
-                "min": min,
-                "max": max,
-                "sum": sum,
-                "any": any,
-                "all": all,
-                "isinstance": isinstance,
-                "type": type,
-                "hasattr": hasattr,
-                "getattr": getattr,
-                "repr": repr,
-                "print": print,
-                "dir": dir,
-                "vars": vars,
-                "Exception": Exception,
-                "ValueError": ValueError,
-                "TypeError": TypeError,
-                "KeyError": KeyError,
-                "AttributeError": AttributeError,
-                "IndexError": IndexError,
-                "ImportError": ImportError,
-                "True": True,
-                "False": False,
-                "None": None,
-                "open": open,
-                "__import__": __import__,
-            },
-            "re": re,
-            "os": os,
-            "Path": Path,
-            "datetime": datetime,
-            "timedelta": timedelta,
-            "ZoneInfo": ZoneInfo,
-            "parsers": parsers,
-            "jira_utils": jira_utils,
-            "memory": memory_helpers,
-            "emit_event": emit_event_sync,
-            "load_config": load_skill_config,
-            "get_timezone": get_timezone,
-            "GoogleCredentials": GoogleCredentials,
-            "google_build": google_build,
-            # New shared utilities
-            "config_loader": config_loader,
-            "lint_utils": lint_utils,
-            "repo_utils": repo_utils,
-            "slack_utils": slack_utils,
-        }
-
-        templated_code = self._template(code)
-        namespace = {**safe_globals, **local_vars}
-        exec(templated_code, namespace)
+        with profile_span("compute_compile", "compute"):
+            compiled = _compile_compute(self._template(code))
+        # The cached globals are shared; give each run its own builtins so a
+        # compute block can't change them for later steps or other skills
+        compute_globals = _compute_globals()
+        namespace = {**compute_globals, "__builtins__": dict(compute_globals["__builtins__"]), **local_vars}
+        with profile_span("compute_exec", "compute"):
+            exec(compiled.code, namespace)
 
         if output_name in namespace:
-            result = namespace[output_name]
-        elif "result" in namespace:
-            result = namespace["result"]
-        elif "return" in templated_code:
-            for line in reversed(templated_code.split("\n")):
-                if line.strip().startswith("return "):
-                    expr = line.strip()[7:]
-                    result = eval(expr, namespace)
-                    break
-            else:
-                result = None
-        else:
-            result = None
-
-        # Update context with any new variables defined in the code
-        for key in namespace:
-            if key not in safe_globals and not key.startswith("_"):
-                local_vars[key] = namespace[key]
-
-        return result
+            return namespace[output_name]
+        if "result" in namespace:
+            return namespace["result"]
+        if compiled.return_expr is not None:
+            return eval(compiled.return_expr, namespace)
+        return None
 
     def _exec_compute(self, code: str, output_name: str):
         """Execute a compute block (limited Python) with error recovery."""
@@ -1039,7 +1144,8 @@ class SkillExecutor:
         import time
 
         try:
-            result = await self.server.call_tool(tool_name, args)
+            with profile_span("call_tool", "tool"):
+                result = await self.server.call_tool(tool_name, args)
             duration = time.time() - start_time
             duration_ms = int(duration * 1000)
             self._debug(f"  → Completed in {duration:.2f}s")
@@ -1052,7 +1158,8 @@ class SkillExecutor:
             except Exception as stats_err:
                 logger.debug(f"Failed to record tool stats: {stats_err}")
 
-            return self._format_tool_result(result, duration)
+            with profile_span("parse_result", "parse"):
+                return self._format_tool_result(result, duration)
         except Exception as e:
             # Record failed tool call
             try:
@@ -1064,39 +1171,25 @@ class SkillExecutor:
             return {"success": False, "error": str(e)}
 
     async def _load_and_execute_module_tool(self, module: str, tool_name: str, args: dict, start_time: float) -> dict:
-        """Load a tool module and execute the specified tool."""
-        import importlib.util
+        """Execute a tool from a module via the process-wide module server registry.
+
+        Each module is imported and registered once per process (and again
+        only if its tools file changes), not once per step.
+        """
         import time
 
+        registry = get_module_registry()
         self._debug(f"  → Loading module: {module}")
-        self._debug(f"  → TOOL_MODULES_DIR: {TOOL_MODULES_DIR}")
-
-        # Try tools_basic.py first (new structure), then tools.py (legacy)
-        tools_file = TOOL_MODULES_DIR / f"aa_{module}" / "src" / "tools_basic.py"
-        self._debug(f"  → Trying: {tools_file} (exists: {tools_file.exists()})")
-        if not tools_file.exists():
-            tools_file = TOOL_MODULES_DIR / f"aa_{module}" / "src" / "tools.py"
-            self._debug(f"  → Fallback: {tools_file} (exists: {tools_file.exists()})")
-
-        if not tools_file.exists():
-            return {
-                "success": False,
-                "error": f"Module not found: {module} (checked {TOOL_MODULES_DIR / f'aa_{module}' / 'src'})",
-            }
 
         try:
-            temp_server = FastMCP(f"skill-{module}")
-            spec = importlib.util.spec_from_file_location(f"skill_{module}", tools_file)
-            if spec is None or spec.loader is None:
-                return {"success": False, "error": f"Could not load: {module}"}
-
-            loaded_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(loaded_module)
-
-            if hasattr(loaded_module, "register_tools"):
-                loaded_module.register_tools(temp_server)
+            with profile_span("module_load", "module", module=module):
+                server = registry.get_server(module)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
 
-            result = await temp_server.call_tool(tool_name, args)
+        try:
+            with profile_span("call_tool", "tool"):
+                result = await server.call_tool(tool_name, args)
             duration = time.time() - start_time
             duration_ms = int(duration * 1000)
             self._debug(f"  → Completed in {duration:.2f}s")
@@ -1109,7 +1202,8 @@ class SkillExecutor:
             except Exception as stats_err:
                 logger.debug(f"Failed to record tool stats: {stats_err}")
 
-            return self._format_tool_result(result, duration)
+            with profile_span("parse_result", "parse"):
+                return self._format_tool_result(result, duration)
 
         except Exception as e:
             # Record failed tool call
@@ -1119,11 +1213,7 @@ class SkillExecutor:
                 record_tool_call(tool_name, False, 0)
             except Exception:
                 pass
-            return {
-                "success": False,
-                "error": str(e),
-                "_temp_server": temp_server if "temp_server" in locals() else None,
-            }
+            return {"success": False, "error": str(e), "_retryable": True}
 
     async def _exec_tool(self, tool_name: str, args: dict) -> dict:
         """Execute a tool and return its result."""
@@ -1148,9 +1238,8 @@ class SkillExecutor:
         # If there was an error, try auto-fix and retry
         if not result.get("success"):
             error_msg = result["error"]
-            temp_server = result.get("_temp_server")
 
-            if temp_server:
+            if result.get("_retryable"):
                 self._debug(f"  → Error: {error_msg}")
 
                 # Check for known issues and attempt auto-fix
@@ -1177,7 +1266,7 @@ class SkillExecutor:
                                     self.event_emitter.current_step_index,
                                     1,  # First retry
                                 )
-                            retry_result = await temp_server.call_tool(tool_name, args)
+                            retry_result = await get_module_registry().call_tool(module, tool_name, args)
                             duration = time.time() - start
                             duration_ms = int(duration * 1000)
                             self._debug(f"  → Retry completed in {duration:.2f}s")
@@ -1199,8 +1288,47 @@ class SkillExecutor:
 
                 result["error"] = error_msg
 
-        # Remove internal _temp_server key if present
-        result.pop("_temp_server", None)
+        # Remove internal _retryable key if present
+        result.pop("_retryable", None)
+        return result
+
+    def _cache_ttl(self, step: dict) -> float:
+        """Get how long a tool step's result may be served from the cache (0 = never).
+
+        A step's own ``cache_ttl`` wins; otherwise read-only tools use the
+        per-tool default from config.json ``skills.cache_ttl``.
+        """
+        if "cache_ttl" in step:
+            return float(step["cache_ttl"] or 0)
+
+        tool = step["tool"]
+        defaults = self.config.get("skills", {}).get("cache_ttl") or {}
+        if isinstance(defaults, dict) and defaults.get(tool) and is_read_only_tool(tool):
+            return float(defaults[tool])
+        return 0.0
+
+    async def _exec_tool_cached(self, tool_name: str, args: dict, ttl: float, step_index: int) -> dict:
+        """Execute a tool, serving it from the tool result cache when ttl allows."""
+        with profile_span(f"tool {tool_name}", "tool"):
+            return await self._exec_tool_or_cache(tool_name, args, ttl, step_index)
+
+    async def _exec_tool_or_cache(self, tool_name: str, args: dict, ttl: float, step_index: int) -> dict:
+        if ttl <= 0:
+            return await self._exec_tool(tool_name, args)
+
+        cache = get_tool_cache()
+        cached = cache.get(tool_name, args, ttl)
+        if cached is not None:
+            self._debug(f"Cache hit: {tool_name} ({cached.age:.0f}s old)")
+            if self.event_emitter:
+                self.event_emitter.cache_hit(step_index, tool_name, cached.key, cached.age)
+            return {"success": True, "result": cached.result, "duration": 0.0, "cached": True, "age": cached.age}
+
+        result = await self._exec_tool(tool_name, args)
+        # Tools report many failures as a successful call whose text starts with ❌
+        # (the convention server.debuggable checks); never serve those from the cache.
+        if result.get("success") and not str(result["result"]).lstrip().startswith("❌"):
+            cache.put(tool_name, args, result["result"])
         return result
 
     def _detect_auto_heal_type(self, error_msg: str) -> tuple[str | None, str]:
@@ -1252,6 +1380,38 @@ class SkillExecutor:
 
         return None, cluster
 
+    async def _apply_auto_heal_fix(self, heal_type: str, cluster: str, output_lines: list[str]) -> bool:
+        """Run the fix for an auto-healable error (kube_login or vpn_connect).
+
+        Returns:
+            True if the fix ran successfully
+        """
+        if heal_type == "auth":
+            output_lines.append(f"   🔧 Auto-healing: running kube_login({cluster})...")
+            self._debug(f"Auto-heal: kube_login({cluster})")
+
+            # Call kube_login tool
+            heal_result = await self._exec_tool("kube_login", {"cluster": cluster})
+            if not heal_result.get("success"):
+                output_lines.append(f"   ⚠️ kube_login failed: {heal_result.get('error', 'unknown')}")
+                return False
+            output_lines.append("   ✅ kube_login successful")
+            return True
+
+        if heal_type == "network":
+            output_lines.append("   🔧 Auto-healing: running vpn_connect()...")
+            self._debug("Auto-heal: vpn_connect()")
+
+            # Call vpn_connect tool
+            heal_result = await self._exec_tool("vpn_connect", {})
+            if not heal_result.get("success"):
+                output_lines.append(f"   ⚠️ vpn_connect failed: {heal_result.get('error', 'unknown')}")
+                return False
+            output_lines.append("   ✅ vpn_connect successful")
+            return True
+
+        return False
+
     async def _attempt_auto_heal(
         self,
         heal_type: str,
@@ -1266,29 +1426,7 @@ class SkillExecutor:
             Retry result dict if successful, None if heal failed
         """
         try:
-            if heal_type == "auth":
-                output_lines.append(f"   🔧 Auto-healing: running kube_login({cluster})...")
-                self._debug(f"Auto-heal: kube_login({cluster})")
-
-                # Call kube_login tool
-                heal_result = await self._exec_tool("kube_login", {"cluster": cluster})
-                if not heal_result.get("success"):
-                    output_lines.append(f"   ⚠️ kube_login failed: {heal_result.get('error', 'unknown')}")
-                    return None
-                output_lines.append("   ✅ kube_login successful")
-
-            elif heal_type == "network":
-                output_lines.append("   🔧 Auto-healing: running vpn_connect()...")
-                self._debug("Auto-heal: vpn_connect()")
-
-                # Call vpn_connect tool
-                heal_result = await self._exec_tool("vpn_connect", {})
-                if not heal_result.get("success"):
-                    output_lines.append(f"   ⚠️ vpn_connect failed: {heal_result.get('error', 'unknown')}")
-                    return None
-                output_lines.append("   ✅ vpn_connect successful")
-
-            else:
+            if not await self._apply_auto_heal_fix(heal_type, cluster, output_lines):
                 return None
 
             # Retry the original tool
@@ -1304,6 +1442,36 @@ class SkillExecutor:
             output_lines.append(f"   ⚠️ Auto-heal exception: {e}")
             return None
 
+    async def _auto_heal_foreach_items(self, tool: str, results: list[dict], output_lines: list[str]) -> list[int]:
+        """Fix the auto-healable errors of a foreach step's failed items.
+
+        Each distinct fix (kube_login per cluster, vpn_connect) runs once,
+        however many items failed with it.
+
+        Returns:
+            Indexes of the failed items whose fix succeeded, to be retried
+        """
+        failed_by_fix: dict[tuple[str, str], list[int]] = {}
+        for index, result in enumerate(results):
+            if not result["success"]:
+                heal_type, cluster = self._detect_auto_heal_type(result["error"])
+                if heal_type:
+                    failed_by_fix.setdefault((heal_type, cluster), []).append(index)
+
+        retry: list[int] = []
+        for (heal_type, cluster), indexes in failed_by_fix.items():
+            output_lines.append(f"   🩹 Detected {heal_type} error on {len(indexes)} item(s), attempting auto-heal...")
+            try:
+                healed = await self._apply_auto_heal_fix(heal_type, cluster, output_lines)
+            except Exception as e:
+                self._debug(f"Auto-heal failed: {e}")
+                output_lines.append(f"   ⚠️ Auto-heal exception: {e}")
+                healed = False
+            await self._log_auto_heal_to_memory(tool, heal_type, results[indexes[0]]["error"][:100], success=healed)
+            if healed:
+                retry.extend(indexes)
+        return sorted(retry)
+
     async def _log_auto_heal_to_memory(
         self,
         tool: str,
@@ -1374,9 +1542,13 @@ class SkillExecutor:
         step_name: str,
         error_msg: str,
         output_lines: list[str],
+        step_results: list[dict],
     ) -> bool:
         """Handle tool execution error.
 
+        Step records are appended to ``step_results`` (the caller's per-step
+        buffer) so concurrently running steps do not interleave.
+
         Returns:
             True if processing should continue, False if skill should stop
         """
@@ -1408,7 +1580,7 @@ class SkillExecutor:
                     # Log success to memory
                     await self._log_auto_heal_to_memory(tool, heal_type, error_msg[:100], success=True)
 
-                    self.step_results.append(
+                    step_results.append(
                         {
                             "step": step_name,
                             "tool": tool,
@@ -1437,7 +1609,7 @@ class SkillExecutor:
 
             await self._learn_from_error(tool_name=tool, params=tool_params, error_msg=error_msg)
 
-            self.step_results.append(
+            step_results.append(
                 {
                     "step": step_name,
                     "tool": tool,
@@ -1480,7 +1652,7 @@ class SkillExecutor:
 
             await self._learn_from_error(tool_name=tool, params=tool_params, error_msg=error_msg)
 
-            self.step_results.append(
+            step_results.append(
                 {
                     "step": step_name,
                     "tool": tool,
@@ -1506,7 +1678,14 @@ class SkillExecutor:
         except Exception:
             pass
 
-    async def _process_tool_step(self, step: dict, step_num: int, step_name: str, output_lines: list[str]) -> bool:
+    async def _process_tool_step(
+        self,
+        step: dict,
+        step_num: int,
+        step_name: str,
+        output_lines: list[str],
+        step_results: list[dict],
+    ) -> bool:
         """Process a 'tool' step and append results to output_lines.
 
         Returns:
@@ -1514,37 +1693,173 @@ class SkillExecutor:
         """
         tool = step["tool"]
         raw_args = step.get("args", {})
-        args = self._template_dict(raw_args)
+        with profile_span("template_args", "template"):
+            args = self._template_dict(raw_args)
 
         output_lines.append(f"🔧 **Step {step_num}: {step_name}**")
         output_lines.append(f"   *Tool: `{tool}`*")
 
-        result = await self._exec_tool(tool, args)
+        result = await self._exec_tool_cached(tool, args, self._cache_ttl(step), step_num - 1)
 
         if result["success"]:
             output_name = step.get("output", step_name)
             self.context[output_name] = result["result"]
 
             # Try to parse key:value output
-            self._parse_and_store_tool_result(result["result"], output_name)
+            with profile_span("parse_result", "parse"):
+                self._parse_and_store_tool_result(result["result"], output_name)
 
             duration = result.get("duration", 0)
-            output_lines.append(f"   ✅ Success ({duration:.2f}s)")
+            if result.get("cached"):
+                output_lines.append(f"   ✅ Cached ({result['age']:.0f}s old)")
+            else:
+                output_lines.append(f"   ✅ Success ({duration:.2f}s)")
 
             result_preview = result["result"][:300]
             if len(result["result"]) > 300:
                 result_preview += "..."
             output_lines.append(f"   ```\n   {result_preview}\n   ```\n")
 
-            self.step_results.append({"step": step_name, "tool": tool, "success": True, "duration": duration})
+            step_results.append(
+                {
+                    "step": step_name,
+                    "tool": tool,
+                    "success": True,
+                    "duration": duration,
+                    "cached": bool(result.get("cached")),
+                }
+            )
             return True
 
         # Handle error
-        should_continue = await self._handle_tool_error(tool, step, step_name, result["error"], output_lines)
+        should_continue = await self._handle_tool_error(
+            tool, step, step_name, result["error"], output_lines, step_results
+        )
         if not should_continue:
             output_lines.append(f"\n⛔ **Skill failed at step {step_num}**")
         return should_continue
 
+    def _resolve_foreach_items(self, source: Any) -> list:
+        """Resolve a step's foreach source to the list of items to process.
+
+        Raises:
+            ValueError: If the source does not resolve to a list
+        """
+        items = self._eval_expression(source) if isinstance(source, str) else source
+        if items is None:
+            return []
+        if isinstance(items, (list, tuple)):
+            return list(items)
+        raise ValueError(f"foreach must resolve to a list, got {type(items).__name__}")
+
+    async def _process_foreach_step(
+        self,
+        step: dict,
+        step_num: int,
+        step_name: str,
+        output_lines: list[str],
+        step_results: list[dict],
+    ) -> bool:
+        """Process a 'foreach' step: run one tool per item, concurrently.
+
+        Args are rendered per item with the item bound to the step's ``as``
+        name (default ``item``) and its position to ``loop_index``. At most
+        ``max_concurrency`` calls run at once. The output is a list, in item
+        order, of {"item", "success", "result"} or {"item", "success": False,
+        "error"} dicts. A failing item never stops the others; the step only
+        stops the skill when it sets ``on_error: fail`` explicitly. With
+        ``on_error: auto_heal``, items that failed on auth or network errors
+        are retried once after the fix.
+
+        Returns:
+            True if processing should continue, False if skill should stop
+        """
+        import asyncio
+        import time
+
+        tool = step["tool"]
+        raw_args = step.get("args", {})
+        item_name = step.get("as", "item")
+        on_error = step.get("on_error", "continue")
+        limit = max(1, int(step.get("max_concurrency", self.max_parallel_steps)))
+
+        output_lines.append(f"🔁 **Step {step_num}: {step_name}**")
+
+        try:
+            items = self._resolve_foreach_items(step["foreach"])
+        except Exception as e:
+            error_msg = f"foreach: {e}"
+            output_lines.append(f"   *Tool: `{tool}`*")
+            output_lines.append(f"   ❌ Error: {error_msg}\n")
+            step_results.append({"step": step_name, "tool": tool, "success": False, "error": error_msg})
+            if on_error == "fail":
+                output_lines.append(f"\n⛔ **Skill failed at step {step_num}**")
+                return False
+            return True
+
+        output_lines.append(f"   *Tool: `{tool}` × {len(items)} (max {limit} concurrent)*")
+
+        semaphore = asyncio.Semaphore(limit)
+        ttl = self._cache_ttl(step)
+        cached_count = 0
+        start_time = time.time()
+
+        async def run_item(index: int, item: Any) -> dict:
+            nonlocal cached_count
+            try:
+                with profile_span("template_args", "template"):
+                    args = self._template_dict(raw_args, {item_name: item, "loop_index": index})
+                async with semaphore:
+                    result = await self._exec_tool_cached(tool, args, ttl, step_num - 1)
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+            if result["success"]:
+                cached_count += bool(result.get("cached"))
+                return {"item": item, "success": True, "result": result["result"]}
+            return {"item": item, "success": False, "error": result["error"]}
+
+        results = list(await asyncio.gather(*(run_item(i, item) for i, item in enumerate(items))))
+        if on_error == "auto_heal":
+            retry = await self._auto_heal_foreach_items(tool, results, output_lines)
+            if retry:
+                output_lines.append(f"   🔄 Retrying {len(retry)} item(s)...")
+                retried = await asyncio.gather(*(run_item(i, items[i]) for i in retry))
+                for index, result in zip(retry, retried):
+                    results[index] = result
+        duration = time.time() - start_time
+
+        output_name = step.get("output", step_name)
+        self.context[output_name] = results
+
+        failed = [r for r in results if not r["success"]]
+        cached_note = f", {cached_count} cached" if cached_count else ""
+        output_lines.append(
+            f"   ✅ {len(results) - len(failed)} succeeded, ❌ {len(failed)} failed ({duration:.2f}s{cached_note})"
+        )
+        for r in failed[:5]:
+            output_lines.append(f"   - `{str(r['item'])[:60]}`: {r['error'][:150]}")
+        if len(failed) > 5:
+            output_lines.append(f"   - ...and {len(failed) - 5} more")
+        output_lines.append("")
+
+        step_result = {
+            "step": step_name,
+            "tool": tool,
+            "success": not failed,
+            "duration": duration,
+            "items": len(results),
+            "failed": len(failed),
+            "cached": cached_count,
+        }
+        if failed:
+            step_result["error"] = f"{len(failed)} of {len(results)} items failed"
+        step_results.append(step_result)
+
+        if failed and on_error == "fail":
+            output_lines.append(f"\n⛔ **Skill failed at step {step_num}**")
+            return False
+        return True
+
     def _format_skill_outputs(self, output_lines: list[str]):
         """Format and append skill outputs section."""
         if not self.skill.get("outputs"):
@@ -1573,11 +1888,11 @@ class SkillExecutor:
                 result = self._exec_compute(out["compute"], out_name)
                 output_lines.append(f"**{out_name}:** {result}\n")
 
-    def _process_then_block(self, step: dict, output_lines: list[str]) -> str | None:
+    def _process_then_block(self, step: dict, output_lines: list[str]) -> bool:
         """Process a 'then' block with early return.
 
         Returns:
-            Final output string if early return, None to continue execution
+            True if the block returned early (the transcript is complete)
         """
         import time
 
@@ -1597,11 +1912,340 @@ class SkillExecutor:
                     output_lines.extend(self.log)
                     output_lines.append("```")
 
-                return "\n".join(output_lines)
-        return None
+                return True
+        return False
+
+    async def _run_step(self, step: dict, step_index: int) -> "_StepOutcome":  # noqa: C901
+        """Run a single step, writing its transcript into its own buffer."""
+        import time
+
+        step_num = step_index + 1
+        step_name = step.get("name", f"step_{step_num}")
+        step_start_time = time.time()
+        outcome = _StepOutcome()
+        lines = outcome.lines
+
+        if "condition" in step:
+            with profile_span("condition", "template"):
+                condition_met = self._eval_condition(step["condition"])
+            if not condition_met:
+                self._debug(f"Skipping step '{step_name}' - condition false")
+                lines.append(f"⏭️ **Step {step_num}: {step_name}** - *skipped (condition false)*\n")
+                # Emit step skipped event
+                if self.event_emitter:
+                    self.event_emitter.step_skipped(step_index, "condition false")
+                outcome.skipped = True
+                return outcome
+
+        # Emit step start event
+        if self.event_emitter:
+            self.event_emitter.step_start(step_index)
+
+        if "then" in step:
+            # The early return itself is rendered by _run_steps, in order
+            outcome.early_return = any("return" in item for item in step["then"])
+            outcome.should_continue = not outcome.early_return
+            return outcome
+
+        step_success = True
+        step_error = None
 
-    async def execute(self) -> str:  # noqa: C901
-        """Execute all steps and return the result."""
+        if "tool" in step:
+            # Check for memory operations
+            tool_name = step.get("tool", "")
+            if self.event_emitter:
+                self._emit_memory_events_for_tool(step_index, tool_name, step.get("args", {}))
+
+            if "foreach" in step:
+                should_continue = await self._process_foreach_step(step, step_num, step_name, lines, outcome.results)
+            else:
+                should_continue = await self._process_tool_step(step, step_num, step_name, lines, outcome.results)
+
+            # Check step result
+            if outcome.results:
+                last_result = outcome.results[-1]
+                step_success = last_result.get("success", True)
+                if not step_success:
+                    step_error = last_result.get("error", "Unknown error")
+
+            if not should_continue:
+                # Emit step failed event
+                if self.event_emitter:
+                    duration_ms = int((time.time() - step_start_time) * 1000)
+                    self.event_emitter.step_failed(step_index, duration_ms, step_error or "Step failed")
+                outcome.should_continue = False
+                return outcome
+
+        elif "compute" in step:
+            output_name = step.get("output", step_name)
+            lines.append(f"🧮 **Step {step_num}: {step_name}** (compute)")
+
+            try:
+                result = self._exec_compute(step["compute"], output_name)
+                self.context[output_name] = result
+                lines.append(f"   → `{output_name}` = {str(result)[:100]}\n")
+            except Exception as e:
+                step_success = False
+                step_error = str(e)
+                lines.append(f"   ❌ Error: {e}\n")
+
+        elif "description" in step:
+            lines.append(f"📝 **Step {step_num}: {step_name}** (manual)")
+            lines.append(f"   {self._template(step['description'])}\n")
+
+        # Emit step complete/failed event
+        if self.event_emitter:
+            duration_ms = int((time.time() - step_start_time) * 1000)
+            if step_success:
+                self.event_emitter.step_complete(step_index, duration_ms)
+            else:
+                self.event_emitter.step_failed(step_index, duration_ms, step_error or "Unknown error")
+
+        return outcome
+
+    async def _run_step_with_timeout(self, step: dict, node: StepNode) -> "_StepOutcome":
+        """Run a step, cancelling it if it exceeds its ``timeout:``.
+
+        Cancellation propagates into the running tool call, so commands
+        started through run_cmd are killed along with their process group.
+        A timed-out step is a failure and stops the skill when the step's
+        own errors would (``node.fatal``: foreach steps continue by default).
+        """
+        import asyncio
+        import time
+
+        step_index = node.index
+
+        step_timeout = parse_timeout(step.get("timeout"))
+        start = time.time()
+        step_label = f"step {step_index + 1}: {step.get('name', f'step_{step_index + 1}')}"
+        try:
+            with profile_span(step_label, "step", lane=step_index + 1):
+                return await asyncio.wait_for(self._run_step(step, step_index), step_timeout)
+        except asyncio.TimeoutError:
+            if step_timeout is None:
+                raise
+        except asyncio.CancelledError:
+            # Cancelled from outside (skill timeout or client cancel)
+            if self.event_emitter:
+                self.event_emitter.step_cancelled(step_index, int((time.time() - start) * 1000), "skill cancelled")
+            raise
+
+        step_num = step_index + 1
+        step_name = step.get("name", f"step_{step_num}")
+        error_msg = f"Timed out after {step_timeout:g}s"
+        self._debug(f"Step '{step_name}' {error_msg.lower()}")
+        if self.event_emitter:
+            self.event_emitter.step_cancelled(step_index, int((time.time() - start) * 1000), error_msg)
+
+        outcome = _StepOutcome()
+        outcome.lines.append(f"⏱️ **Step {step_num}: {step_name}** - {error_msg}, cancelled\n")
+        outcome.results.append(
+            {"step": step_name, "tool": step.get("tool"), "success": False, "error": error_msg, "timed_out": True}
+        )
+        if node.fatal:
+            outcome.lines.append(f"\n⛔ **Skill failed at step {step_num}**")
+            outcome.should_continue = False
+        return outcome
+
+    async def _run_preflight(self) -> None:
+        """Import modules, check cluster auth and open connections the steps will need."""
+        try:
+            self.preflight_report = await SkillPreflight(self.skill, render=self._template).run()
+            self._debug(self.preflight_report.summary())
+        except Exception as e:
+            self._debug(f"Pre-flight failed: {e}")
+
+    async def _run_steps(self, output_lines: list[str]) -> bool:  # noqa: C901
+        """Run all steps along their dependency graph.
+
+        Each step starts as soon as the steps it depends on (see skill_graph)
+        have finished, with at most ``max_parallel_steps`` tool calls in
+        flight. Step transcripts and results are flushed in declaration
+        order, so the output reads exactly like a serial run, and each is
+        published to stream() as soon as it is flushed.
+
+        Returns:
+            True if a 'then' block returned early
+        """
+        import asyncio
+
+        steps = self.skill.get("steps", [])
+        if self.preflight and self._resume_index < len(steps):
+            await self._run_preflight()
+        graph = build_step_graph(steps, serial=self.max_parallel_steps <= 1)
+        self._debug(
+            f"Step graph: {sum(1 for n in graph if n.concurrent)}/{len(graph)} steps may overlap "
+            f"(max_parallel_steps={self.max_parallel_steps})"
+        )
+
+        done = [asyncio.Event() for _ in steps]
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel_steps))
+        aborted = False
+
+        async def run_node(node: StepNode) -> _StepOutcome | None:
+            nonlocal aborted
+            try:
+                if node.index < self._resume_index:
+                    # Completed in the run being resumed
+                    if self.event_emitter:
+                        self.event_emitter.step_skipped(node.index, "completed in previous run")
+                    return _StepOutcome()
+                for dep in node.deps:
+                    await done[dep].wait()
+                if aborted:
+                    return None
+                if node.concurrent:
+                    async with semaphore:
+                        outcome = await self._run_step_with_timeout(steps[node.index], node)
+                else:
+                    outcome = await self._run_step_with_timeout(steps[node.index], node)
+                if not outcome.should_continue:
+                    aborted = True
+                return outcome
+            except BaseException:
+                aborted = True
+                raise
+            finally:
+                done[node.index].set()
+
+        tasks = [asyncio.ensure_future(run_node(node)) for node in graph]
+        try:
+            for node, task in zip(graph, tasks):
+                outcome = await task
+                if outcome is None:
+                    self._stopped = True
+                    break
+                output_lines.extend(outcome.lines)
+                self.step_results.extend(outcome.results)
+                if outcome.early_return:
+                    return self._process_then_block(steps[node.index], output_lines)
+                if not outcome.should_continue:
+                    self._stopped = True
+                    break
+                if self.checkpoint and node.index >= self._resume_index:
+                    self._save_checkpoint(node)
+                step_name = steps[node.index].get("name", "")
+                self._publish(output_lines, "step", node.index, f"Step {node.index + 1}: {step_name}")
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return False
+
+    def _save_checkpoint(self, completed: StepNode) -> None:
+        """Record progress after a step completes (steps complete in order).
+
+        The resume point only moves past a step if everything it wrote to
+        the context can be saved; otherwise resuming re-runs it.
+        """
+        context_json, unsaved = split_context(self.context)
+        if self._checkpoint_next == completed.index and not (completed.writes & unsaved):
+            self._checkpoint_next = completed.index + 1
+
+        save_checkpoint(
+            SkillCheckpoint(
+                skill_name=self.skill.get("name", "unknown"),
+                fingerprint=skill_fingerprint(self.skill),
+                inputs=self._checkpoint_inputs,
+                next_step=self._checkpoint_next,
+                step_results=self.step_results,
+            ),
+            context_json,
+        )
+
+    def _restore_checkpoint(self) -> str:
+        """Restore context and step results from the checkpoint of a run with these inputs.
+
+        Returns:
+            Transcript line describing what was resumed
+        """
+        skill_name = self.skill.get("name", "unknown")
+        saved = load_checkpoint(skill_name, self._checkpoint_inputs)
+        if saved is None:
+            return "⏩ *No checkpoint found for these inputs - running from the start*\n"
+        if saved.fingerprint != skill_fingerprint(self.skill):
+            return "⏩ *Skill changed since the checkpoint - running from the start*\n"
+
+        self.context.update(saved.context)
+        self.step_results = list(saved.step_results)
+        self._resume_index = self._checkpoint_next = saved.next_step
+        self._debug(f"Resuming {skill_name} at step {saved.next_step + 1} (checkpoint {saved.updated})")
+        return (
+            f"⏩ **Resumed at step {saved.next_step + 1}** "
+            f"({saved.next_step} completed steps restored from {saved.updated[:19]})\n"
+        )
+
+    async def execute(self) -> str:
+        """Execute all steps and return the whole transcript."""
+        return "\n".join([chunk.text async for chunk in self.stream()])
+
+    async def stream(self) -> AsyncIterator[SkillProgress]:
+        """Execute all steps, yielding the transcript as it is written.
+
+        Yields a chunk for the header, one per finished step (in step
+        order), one for the outputs and summary and, with profile=True, one
+        for the profile. Nothing is kept after it is yielded.
+        """
+        import asyncio
+
+        queue: asyncio.Queue[SkillProgress | None] = asyncio.Queue()
+        self._progress = queue
+        task = asyncio.ensure_future(self._execute_profiled())
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (chunk := await queue.get()) is not None:
+                yield chunk
+            task.result()  # Re-raise whatever stopped the run
+        finally:
+            self._progress = None
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    def _publish(self, lines: list[str], kind: str, step_index: int | None = None, message: str = "") -> None:
+        """Hand the transcript lines written so far to stream(), then clear them."""
+        if step_index is not None:
+            self._completed_steps = step_index + 1
+        if not lines:
+            return
+        chunk = SkillProgress(
+            text="\n".join(lines),
+            kind=kind,
+            step_index=step_index,
+            completed_steps=self._completed_steps,
+            total_steps=len(self.skill.get("steps", [])),
+            message=message,
+        )
+        lines.clear()
+        if self._progress is not None:
+            self._progress.put_nowait(chunk)
+
+    async def _execute_profiled(self) -> None:
+        """Run _execute, under the profiler when profiling."""
+        if self.profiler is None:
+            await self._execute()
+            return
+        with self.profiler.activate():
+            await self._execute()
+        self._publish([self._format_profile()], "profile")
+
+    def _format_profile(self) -> str:
+        """Render the profile tree and write the Chrome trace next to it."""
+        lines = ["\n### ⏱️ Profile\n```", self.profiler.render_tree(), "```"]
+        skill_name = self.skill.get("name", "unknown")
+        trace_file = PROFILES_DIR / f"{skill_name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.trace.json"
+        try:
+            self.profiler.write_chrome_trace(trace_file)
+            lines.append(f"Chrome trace: `{trace_file}` (open in chrome://tracing or ui.perfetto.dev)")
+        except OSError as e:
+            logger.warning(f"Failed to write profile trace: {e}")
+        return "\n".join(lines)
+
+    async def _execute(self) -> None:  # noqa: C901
+        import asyncio
         import time
 
         self.start_time = time.time()
@@ -1614,15 +2258,18 @@ class SkillExecutor:
         if self.event_emitter:
             self.event_emitter.skill_start()
 
+        # The skill dict is shared through the catalog, so copy anything a step could modify
         for inp in self.skill.get("inputs", []):
             name = inp["name"]
             if name not in self.inputs and "default" in inp:
-                self.inputs[name] = inp["default"]
+                self.inputs[name] = copy.deepcopy(inp["default"])
                 self.context["inputs"] = self.inputs
                 self._debug(f"Applied default: {name} = {inp['default']}")
 
-        defaults = self.skill.get("defaults", {})
+        defaults = copy.deepcopy(self.skill.get("defaults", {}))
         self.context["defaults"] = defaults
+        if self.checkpoint:
+            self._checkpoint_inputs = copy.deepcopy(self.inputs)
 
         output_lines = [f"## 🚀 Executing Skill: {skill_name}\n"]
         output_lines.append(f"*{self.skill.get('description', '')}*\n")
@@ -1635,87 +2282,38 @@ class SkillExecutor:
 
         output_lines.append("### 📝 Execution Log\n")
 
-        step_num = 0
-        for step in self.skill.get("steps", []):
-            step_index = step_num  # 0-based index for events
-            step_num += 1
-            step_name = step.get("name", f"step_{step_num}")
-            step_start_time = time.time()
-
-            if "condition" in step:
-                if not self._eval_condition(step["condition"]):
-                    self._debug(f"Skipping step '{step_name}' - condition false")
-                    output_lines.append(f"⏭️ **Step {step_num}: {step_name}** - *skipped (condition false)*\n")
-                    # Emit step skipped event
-                    if self.event_emitter:
-                        self.event_emitter.step_skipped(step_index, "condition false")
-                    continue
+        if self.resume:
+            output_lines.append(self._restore_checkpoint())
+        self._publish(output_lines, "start", message=f"Starting {skill_name}")
 
-            # Emit step start event
+        try:
+            early_return = await asyncio.wait_for(self._run_steps(output_lines), self.timeout)
+        except asyncio.TimeoutError:
+            if self.timeout is None:
+                raise
+            early_return = False
+            self._stopped = True
+            error_msg = self.timeout_error = f"Skill timed out after {self.timeout:g}s"
+            output_lines.append(f"\n⏱️ **{error_msg}** - running steps were cancelled")
+            self.step_results.append({"step": skill_name, "success": False, "error": error_msg, "timed_out": True})
             if self.event_emitter:
-                self.event_emitter.step_start(step_index)
-
-            if "then" in step:
-                early_return = self._process_then_block(step, output_lines)
-                if early_return is not None:
-                    # Emit skill complete (early return)
-                    if self.event_emitter:
-                        total_time = time.time() - (self.start_time or 0.0)
-                        self.event_emitter.skill_complete(True, int(total_time * 1000))
-                    return early_return
-                continue
-
-            step_success = True
-            step_error = None
-
-            if "tool" in step:
-                # Check for memory operations
-                tool_name = step.get("tool", "")
-                if self.event_emitter:
-                    self._emit_memory_events_for_tool(step_index, tool_name, step.get("args", {}))
-
-                should_continue = await self._process_tool_step(step, step_num, step_name, output_lines)
-
-                # Check step result
-                if self.step_results:
-                    last_result = self.step_results[-1]
-                    step_success = last_result.get("success", True)
-                    if not step_success:
-                        step_error = last_result.get("error", "Unknown error")
-
-                if not should_continue:
-                    # Emit step failed event
-                    if self.event_emitter:
-                        duration_ms = int((time.time() - step_start_time) * 1000)
-                        self.event_emitter.step_failed(step_index, duration_ms, step_error or "Step failed")
-                    break
-
-            elif "compute" in step:
-                output_name = step.get("output", step_name)
-                output_lines.append(f"🧮 **Step {step_num}: {step_name}** (compute)")
-
-                try:
-                    result = self._exec_compute(step["compute"], output_name)
-                    self.context[output_name] = result
-                    output_lines.append(f"   → `{output_name}` = {str(result)[:100]}\n")
-                except Exception as e:
-                    step_success = False
-                    step_error = str(e)
-                    output_lines.append(f"   ❌ Error: {e}\n")
-
-            elif "description" in step:
-                output_lines.append(f"📝 **Step {step_num}: {step_name}** (manual)")
-                output_lines.append(f"   {self._template(step['description'])}\n")
-
-            # Emit step complete/failed event
+                self.event_emitter.skill_cancelled(error_msg, int((time.time() - self.start_time) * 1000))
+        except asyncio.CancelledError:
             if self.event_emitter:
-                duration_ms = int((time.time() - step_start_time) * 1000)
-                if step_success:
-                    self.event_emitter.step_complete(step_index, duration_ms)
-                else:
-                    self.event_emitter.step_failed(step_index, duration_ms, step_error or "Unknown error")
+                self.event_emitter.skill_cancelled("cancelled", int((time.time() - self.start_time) * 1000))
+            raise
+        if self.checkpoint and not self._stopped:
+            clear_checkpoint(skill_name, self._checkpoint_inputs)
+        if early_return:
+            # Emit skill complete (early return)
+            if self.event_emitter:
+                total_time = time.time() - (self.start_time or 0.0)
+                self.event_emitter.skill_complete(True, int(total_time * 1000))
+            self._publish(output_lines, "end", message="Returned early")
+            return
 
-        self._format_skill_outputs(output_lines)
+        with profile_span("outputs", "template"):
+            self._format_skill_outputs(output_lines)
 
         total_time = time.time() - (self.start_time or 0.0)
         success_count = sum(1 for r in self.step_results if r.get("success"))
@@ -1738,19 +2336,7 @@ class SkillExecutor:
                 pass
 
         # Track skill execution in agent stats
-        try:
-            from .agent_stats import record_skill_execution
-
-            overall_success = fail_count == 0
-            record_skill_execution(
-                skill_name=skill_name,
-                success=overall_success,
-                duration_ms=int(total_time * 1000),
-                steps_completed=success_count,
-                total_steps=len(self.skill.get("steps", [])),
-            )
-        except Exception as e:
-            self._debug(f"Failed to record skill stats: {e}")
+        self._record_skill_stats(fail_count == 0, int(total_time * 1000), success_count)
 
         # Extract and save learnings from successful skill execution
         if fail_count == 0:
@@ -1761,7 +2347,22 @@ class SkillExecutor:
             output_lines.extend(self.log)
             output_lines.append("```")
 
-        return "\n".join(output_lines)
+        self._publish(output_lines, "end", message=f"Completed: {success_count} succeeded, {fail_count} failed")
+
+    def _record_skill_stats(self, success: bool, duration_ms: int, steps_completed: int) -> None:
+        """Record this run in agent stats."""
+        try:
+            from .agent_stats import record_skill_execution
+
+            record_skill_execution(
+                skill_name=self.skill.get("name", "unknown"),
+                success=success,
+                duration_ms=duration_ms,
+                steps_completed=steps_completed,
+                total_steps=len(self.skill.get("steps", [])),
+            )
+        except Exception as e:
+            self._debug(f"Failed to record skill stats: {e}")
 
     def _emit_memory_events_for_tool(self, step_index: int, tool_name: str, args: dict) -> None:
         """Emit memory read/write events based on tool being called."""
@@ -1905,23 +2506,20 @@ class SkillExecutor:
 
 def _skill_list_impl() -> list[TextContent]:
     """Implementation of skill_list tool."""
+    from scripts.common.skill_catalog import get_skill_catalog
+
     skills = []
-    if SKILLS_DIR.exists():
-        for f in SKILLS_DIR.glob("*.yaml"):
-            if f.name == "README.md":
-                continue
-            try:
-                with open(f) as fp:
-                    data = yaml.safe_load(fp)
-                skills.append(
-                    {
-                        "name": data.get("name", f.stem),
-                        "description": data.get("description", "No description"),
-                        "inputs": [i["name"] for i in data.get("inputs", [])],
-                    }
-                )
-            except Exception as e:
-                skills.append({"name": f.stem, "description": f"Error loading: {e}", "inputs": []})
+    for entry in get_skill_catalog().entries():
+        if entry.error:
+            skills.append({"name": entry.stem, "description": f"Error loading: {entry.error}", "inputs": []})
+            continue
+        skills.append(
+            {
+                "name": entry.name,
+                "description": entry.data.get("description", "No description"),
+                "inputs": entry.input_names,
+            }
+        )
 
     if not skills:
         return [
@@ -1965,7 +2563,11 @@ def _format_skill_plan(skill: dict, skill_name: str, input_data: dict) -> list[T
         step_num += 1
         name = step.get("name", f"step_{step_num}")
 
-        if "tool" in step:
+        if "foreach" in step:
+            lines.append(f"{step_num}. **{name}** → `{step['tool']}` for each of `{step['foreach']}`")
+            if step.get("condition"):
+                lines.append(f"   *Condition: {step['condition']}*")
+        elif "tool" in step:
             lines.append(f"{step_num}. **{name}** → `{step['tool']}`")
             if step.get("condition"):
                 lines.append(f"   *Condition: {step['condition']}*")
@@ -1978,6 +2580,32 @@ def _format_skill_plan(skill: dict, skill_name: str, input_data: dict) -> list[T
     return [TextContent(type="text", text="\n".join(lines))]
 
 
+async def _report_skill_progress(ctx: Context, chunk: SkillProgress) -> bool:
+    """Send an MCP progress notification for a transcript chunk.
+
+    Returns:
+        False if progress can't be reported (no client request in flight)
+    """
+    try:
+        await ctx.report_progress(chunk.completed_steps, chunk.total_steps or None, chunk.message or None)
+    except ValueError:
+        return False
+    except Exception as e:
+        logger.debug(f"Failed to report skill progress: {e}")
+        return False
+    return True
+
+
+async def _execute_with_progress(executor: SkillExecutor, ctx: Context | None) -> str:
+    """Run a skill, reporting progress per step, and return its transcript."""
+    transcript = []
+    async for chunk in executor.stream():
+        transcript.append(chunk.text)
+        if ctx is not None and not await _report_skill_progress(ctx, chunk):
+            ctx = None  # Stop trying for the rest of the run
+    return "\n".join(transcript)
+
+
 async def _skill_run_impl(
     skill_name: str,
     inputs: str,
@@ -1986,8 +2614,15 @@ async def _skill_run_impl(
     server: "FastMCP",
     create_issue_fn=None,
     ask_question_fn=None,
+    resume: bool = False,
+    profile: bool = False,
+    ctx: Context | None = None,
 ) -> list[TextContent]:
-    """Implementation of skill_run tool."""
+    """Implementation of skill_run tool.
+
+    With an MCP request context, a progress notification is sent as each
+    step finishes.
+    """
     # Debug: confirm this code path is reached
     from datetime import datetime
     from pathlib import Path
@@ -1997,9 +2632,12 @@ async def _skill_run_impl(
     with open(debug_file, "a") as f:
         f.write(f"{datetime.now().isoformat()} - _skill_run_impl called for {skill_name}\n")
 
-    skill_file = SKILLS_DIR / f"{skill_name}.yaml"
-    if not skill_file.exists():
-        available = [f.stem for f in SKILLS_DIR.glob("*.yaml")] if SKILLS_DIR.exists() else []
+    from scripts.common.skill_catalog import get_skill_catalog
+
+    catalog = get_skill_catalog()
+    entry = catalog.get(skill_name)
+    if entry is None:
+        available = catalog.names()
         return [
             TextContent(
                 type="text",
@@ -2008,14 +2646,21 @@ async def _skill_run_impl(
         ]
 
     try:
-        with open(skill_file) as f:
-            skill = yaml.safe_load(f)
+        if entry.error:
+            raise ValueError(entry.error)
+        skill = entry.data
 
         try:
             input_data = json.loads(inputs) if inputs else {}
         except json.JSONDecodeError:
             return [TextContent(type="text", text=f"❌ Invalid inputs JSON: {inputs}")]
 
+        # Resuming without inputs reuses the ones the checkpoint was made with
+        if resume and not input_data:
+            saved = load_checkpoint(skill.get("name", skill_name))
+            if saved is not None:
+                input_data = dict(saved.inputs)
+
         # Validate inputs
         missing = _validate_skill_inputs(skill, input_data)
         if missing:
@@ -2043,8 +2688,12 @@ async def _skill_run_impl(
             ask_question_fn=ask_question_fn,
             enable_interactive_recovery=True,
             emit_events=True,  # Enable VS Code extension events
+            checkpoint=True,
+            resume=resume,
+            profile=profile,
+            preflight=load_config().get("skills", {}).get("preflight", True),
         )
-        result = await executor.execute()
+        result = await _execute_with_progress(executor, ctx)
 
         return [TextContent(type="text", text=result)]
 
@@ -2080,7 +2729,13 @@ def register_skill_tools(server: "FastMCP", create_issue_fn=None, ask_question_f
 
     @registry.tool()
     async def skill_run(
-        skill_name: str, inputs: str = "{}", execute: bool = True, debug: bool = False
+        skill_name: str,
+        inputs: str = "{}",
+        execute: bool = True,
+        debug: bool = False,
+        resume: bool = False,
+        profile: bool = False,
+        ctx: Context | None = None,
     ) -> list[TextContent]:
         """
         Execute a skill (multi-step workflow).
@@ -2092,10 +2747,26 @@ def register_skill_tools(server: "FastMCP", create_issue_fn=None, ask_question_f
             inputs: JSON object with input parameters
             execute: If True (default), run the tools. If False, just show the plan.
             debug: If True, show detailed execution trace with timing.
+            resume: If True, continue a failed run from its first incomplete step.
+                Inputs default to the ones the failed run used.
+            profile: If True, append a timing tree of steps, tools, templating and
+                subprocesses, and save it as a Chrome trace.
+            ctx: MCP request context (injected); progress is reported per step.
 
         Returns:
             Execution results or plan preview.
         """
-        return await _skill_run_impl(skill_name, inputs, execute, debug, server, create_issue_fn, ask_question_fn)
+        return await _skill_run_impl(
+            skill_name,
+            inputs,
+            execute,
+            debug,
+            server,
+            create_issue_fn,
+            ask_question_fn,
+            resume=resume,
+            profile=profile,
+            ctx=ctx,
+        )
 
     return registry.count
@@ -1,22 +1,75 @@
 """
 Skill Execution Events
 
-Emits execution events to a JSON file that the VS Code extension watches.
+Emits execution events that the VS Code extension watches.
 This enables real-time flowchart updates when skills run in chat.
 
-Events are written to: ~/.config/aa-workflow/skill_execution.json
+Each run gets its own pair of files, so concurrent skills don't clobber
+each other:
+
+    ~/.config/aa-workflow/skill_executions/<execution_id>.jsonl
+        Append-only event log, one JSON event per line, numbered by "seq".
+        Readers keep their offset and only read what was appended since.
+    ~/.config/aa-workflow/skill_executions/<execution_id>.json
+        Small status header (skill, status, current step, log file name),
+        rewritten only when the status or current step changes.
+
+If the extension is listening on ~/.config/aa-workflow/skill_events.sock,
+each event line is also pushed there. The push is best-effort: it never
+blocks the skill, and the event log remains the source of truth.
 """
 
+import itertools
 import json
 import logging
+import os
+import socket
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 logger = logging.getLogger(__name__)
 
-# Event file path
-EXECUTION_FILE = Path.home() / ".config" / "aa-workflow" / "skill_execution.json"
+# Per-run event logs and status headers
+EXECUTIONS_DIR = Path.home() / ".config" / "aa-workflow" / "skill_executions"
+
+# Unix socket the extension listens on for pushed events (optional)
+EVENT_SOCKET = Path.home() / ".config" / "aa-workflow" / "skill_events.sock"
+
+# Finished runs kept on disk; older ones are removed when a new run starts
+MAX_KEPT_EXECUTIONS = 20
+
+_execution_counter = itertools.count(1)
+
+
+def _new_execution_id(skill_name: str) -> str:
+    """Build a unique, filename-safe id for a run."""
+    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in skill_name)
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_execution_counter)}-{safe_name}"
+
+
+def prune_executions(keep: int = MAX_KEPT_EXECUTIONS) -> int:
+    """Remove the files of all but the newest finished runs.
+
+    Returns:
+        Number of runs removed
+    """
+    removed = 0
+    try:
+        headers = sorted(EXECUTIONS_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    except OSError:
+        return 0
+    for header in headers[keep:]:
+        try:
+            with open(header) as f:
+                if json.load(f).get("status") == "running":
+                    continue
+        except (OSError, ValueError):
+            pass
+        header.unlink(missing_ok=True)
+        header.with_suffix(".jsonl").unlink(missing_ok=True)
+        removed += 1
+    return removed
 
 
 class SkillExecutionEmitter:
@@ -25,20 +78,45 @@ class SkillExecutionEmitter:
     def __init__(self, skill_name: str, steps: list[dict]):
         self.skill_name = skill_name
         self.steps = steps
-        self.events: list[dict] = []
+        self.execution_id = _new_execution_id(skill_name)
+        self.event_count = 0
         self.current_step_index = -1
         self.status = "running"
         self.start_time = datetime.now().isoformat()
         self.end_time: str | None = None
 
+        self.events_file = EXECUTIONS_DIR / f"{self.execution_id}.jsonl"
+        self.status_file = EXECUTIONS_DIR / f"{self.execution_id}.json"
+        self._log: IO[str] | None = None
+        self._push: socket.socket | None = None
+        self._written_status: tuple | None = None
+
         # Ensure directory exists
-        EXECUTION_FILE.parent.mkdir(parents=True, exist_ok=True)
+        EXECUTIONS_DIR.mkdir(parents=True, exist_ok=True)
+        prune_executions()
+        self._connect_push()
+
+    def _connect_push(self) -> None:
+        """Connect to the extension's event socket, if it is listening."""
+        if not hasattr(socket, "AF_UNIX") or not EVENT_SOCKET.exists():
+            return
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(0.1)
+            sock.connect(str(EVENT_SOCKET))
+            sock.setblocking(False)
+            self._push = sock
+        except OSError as e:
+            logger.debug(f"Skill event socket not available: {e}")
+            sock.close()
 
     def _emit(self, event_type: str, data: dict | None = None) -> None:
-        """Emit an event and write to file."""
+        """Emit an event: append it to the log and push it to the extension."""
         event = {
             "type": event_type,
             "timestamp": datetime.now().isoformat(),
+            "executionId": self.execution_id,
+            "seq": self.event_count + 1,
             "skillName": self.skill_name,
             "stepIndex": (self.current_step_index if self.current_step_index >= 0 else None),
             "stepName": (
@@ -48,29 +126,70 @@ class SkillExecutionEmitter:
             ),
             "data": data,
         }
-        self.events.append(event)
-        self._write_state()
+        self.event_count += 1
+        line = json.dumps(event, default=str) + "\n"
+        self._append(line)
+        self._write_status()
+        self._send(line)
+        if self.status != "running":
+            self.close()
+
+    def _append(self, line: str) -> None:
+        """Append one event line to the log (reopened if a final event closed it)."""
+        try:
+            if self._log is None:
+                self._log = open(self.events_file, "a", encoding="utf-8")
+            self._log.write(line)
+            self._log.flush()
+        except OSError as e:
+            logger.warning(f"Failed to append skill execution event: {e}")
 
-    def _write_state(self) -> None:
-        """Write current state to file."""
+    def _write_status(self) -> None:
+        """Rewrite the status header if the status or current step changed."""
+        key = (self.status, self.current_step_index)
+        if key == self._written_status:
+            return
         try:
             state = {
+                "executionId": self.execution_id,
                 "skillName": self.skill_name,
                 "status": self.status,
                 "currentStepIndex": self.current_step_index,
                 "totalSteps": len(self.steps),
                 "startTime": self.start_time,
                 "endTime": self.end_time,
-                "events": self.events,
+                "eventsFile": self.events_file.name,
             }
             # Write atomically
-            tmp_file = EXECUTION_FILE.with_suffix(".tmp")
+            tmp_file = self.status_file.with_suffix(".tmp")
             with open(tmp_file, "w") as f:
-                json.dump(state, f, indent=2)
-            tmp_file.rename(EXECUTION_FILE)
-            logger.debug(f"Wrote skill state: step={self.current_step_index}, events={len(self.events)}")
+                json.dump(state, f)
+            tmp_file.replace(self.status_file)
+            self._written_status = key
+            logger.debug(f"Wrote skill status: step={self.current_step_index}, events={self.event_count}")
         except Exception as e:
-            logger.warning(f"Failed to write skill execution state: {e}")
+            logger.warning(f"Failed to write skill execution status: {e}")
+
+    def _send(self, line: str) -> None:
+        """Push an event line to the extension socket without blocking."""
+        if self._push is None:
+            return
+        try:
+            self._push.sendall(line.encode())
+        except OSError as e:
+            # Reader gone or not keeping up; it can catch up from the log
+            logger.debug(f"Stopped pushing skill events: {e}")
+            self._push.close()
+            self._push = None
+
+    def close(self) -> None:
+        """Close the event log and the push socket."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if self._push is not None:
+            self._push.close()
+            self._push = None
 
     def skill_start(self) -> None:
         """Emit skill start event."""
@@ -114,6 +233,11 @@ class SkillExecutionEmitter:
             },
         )
 
+    def step_cancelled(self, step_index: int, duration_ms: int, reason: str) -> None:
+        """Emit step cancelled event (step timeout or skill cancellation)."""
+        self.current_step_index = step_index
+        self._emit("step_cancelled", {"duration": duration_ms, "reason": reason[:500]})
+
     def step_skipped(self, step_index: int, reason: str = "condition false") -> None:
         """Emit step skipped event."""
         self.current_step_index = step_index
@@ -139,6 +263,17 @@ class SkillExecutionEmitter:
         self.current_step_index = step_index
         self._emit("retry", {"retryCount": retry_count})
 
+    def cache_hit(self, step_index: int, tool: str, cache_key: str, age_seconds: float) -> None:
+        """Emit cache hit event (tool result served from the tool result cache)."""
+        self.current_step_index = step_index
+        self._emit("cache_hit", {"tool": tool, "cacheKey": cache_key[:16], "ageSeconds": round(age_seconds, 1)})
+
+    def skill_cancelled(self, reason: str, total_duration_ms: int) -> None:
+        """Emit skill cancelled event (skill timeout or client cancellation)."""
+        self.status = "cancelled"
+        self.end_time = datetime.now().isoformat()
+        self._emit("skill_cancelled", {"reason": reason[:500], "duration": total_duration_ms})
+
     def skill_complete(self, success: bool, total_duration_ms: int) -> None:
         """Emit skill complete event."""
         self.status = "success" if success else "failed"
@@ -0,0 +1,408 @@
+"""Skill Step Dependency Graph.
+
+Infers which steps of a skill can run concurrently. Each step is reduced to
+the context names it reads ({{ }} templates, conditions, compute code) and
+the names it writes (its ``output:``), and a step waits only for earlier
+steps it has a read/write hazard with.
+
+Steps whose effects are not visible through context names are ordering
+barriers: tools that change external state (anything not classified as
+read-only), ``then`` blocks, steps marked ``parallel: false`` and compute
+blocks that inspect their namespace dynamically. Tool steps that stop the
+skill on failure (``on_error: fail``) also gate every later step, so a
+failing step never has later work started ahead of it.
+
+This module is pure Python (no MCP imports) so it can be loaded directly.
+"""
+
+import ast
+import re
+from dataclasses import dataclass, field
+
+# Tool name tokens that indicate a read-only call (list/view/get/...).
+READ_ONLY_TOKENS = frozenset(
+    {
+        "alerts",
+        "approvers",
+        "blame",
+        "check",
+        "comments",
+        "describe",
+        "diff",
+        "digest",
+        "events",
+        "get",
+        "health",
+        "info",
+        "inspect",
+        "issues",
+        "labels",
+        "list",
+        "log",
+        "logs",
+        "query",
+        "read",
+        "rules",
+        "search",
+        "series",
+        "sha",
+        "show",
+        "stats",
+        "status",
+        "targets",
+        "trace",
+        "tree",
+        "view",
+        "whoami",
+    }
+)
+
+# Tool name tokens that indicate the call changes something.
+WRITE_TOKENS = frozenset(
+    {
+        "add",
+        "append",
+        "apply",
+        "approve",
+        "assign",
+        "cancel",
+        "checkout",
+        "clone",
+        "close",
+        "comment",
+        "connect",
+        "cp",
+        "create",
+        "delete",
+        "deploy",
+        "down",
+        "edit",
+        "exec",
+        "extend",
+        "fetch",
+        "fix",
+        "learn",
+        "login",
+        "mark",
+        "merge",
+        "post",
+        "push",
+        "rebase",
+        "reply",
+        "reserve",
+        "reset",
+        "restart",
+        "retry",
+        "revert",
+        "rollout",
+        "save",
+        "scale",
+        "send",
+        "session",
+        "set",
+        "silence",
+        "start",
+        "stop",
+        "sync",
+        "transition",
+        "up",
+        "update",
+        "upload",
+        "write",
+    }
+)
+
+# Tools that are read-only even though their name does not say so.
+READ_ONLY_TOOLS = frozenset(
+    {
+        "check_known_issues",
+        "code_search",
+        "knowledge_query",
+        "memory_query",
+        "memory_read",
+        "prometheus_alerts",
+        "alertmanager_alerts",
+    }
+)
+
+# Names that never refer to skill context variables
+_JINJA_KEYWORDS = frozenset(
+    {
+        "and",
+        "or",
+        "not",
+        "in",
+        "is",
+        "if",
+        "else",
+        "elif",
+        "endif",
+        "for",
+        "endfor",
+        "set",
+        "endset",
+        "true",
+        "false",
+        "none",
+        "True",
+        "False",
+        "None",
+        "defined",
+        "undefined",
+    }
+)
+
+# Method names that mutate their receiver in place
+_MUTATING_METHODS = frozenset(
+    {
+        "append",
+        "extend",
+        "insert",
+        "pop",
+        "popitem",
+        "remove",
+        "clear",
+        "update",
+        "setdefault",
+        "add",
+        "discard",
+        "sort",
+        "reverse",
+    }
+)
+
+# Builtins that expose the whole namespace to a compute block
+_OPAQUE_NAMES = frozenset({"globals", "locals", "vars", "eval", "exec"})
+
+_TEMPLATE_RE = re.compile(r"\{\{(.*?)\}\}|\{%(.*?)%\}", re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_FILTER_RE = re.compile(r"\|\s*[A-Za-z_]\w*")
+_IDENT_RE = re.compile(r"(?<![\w.])([A-Za-z_]\w*)")
+
+
+def is_read_only_tool(tool_name: str) -> bool:
+    """Classify a tool as read-only from its name.
+
+    A tool is read-only when it is listed in READ_ONLY_TOOLS, or when its
+    name contains a read token (list, get, view, ...) and no write token.
+
+    Args:
+        tool_name: Tool name (e.g., "gitlab_mr_list")
+
+    Returns:
+        True if the tool is not expected to change external state
+    """
+    if tool_name in READ_ONLY_TOOLS:
+        return True
+    tokens = set(tool_name.lower().split("_"))
+    return bool(tokens & READ_ONLY_TOKENS) and not tokens & WRITE_TOKENS
+
+
+def _expression_names(expr: str) -> set[str]:
+    """Extract identifiers from a Jinja/Python expression (over-approximates)."""
+    expr = _STRING_RE.sub(" ", expr)
+    expr = _FILTER_RE.sub(" ", expr)
+    return {name for name in _IDENT_RE.findall(expr) if name not in _JINJA_KEYWORDS}
+
+
+def template_names(text: str) -> set[str]:
+    """Get the context names referenced by {{ }} / {% %} blocks in text."""
+    if not isinstance(text, str) or ("{{" not in text and "{%" not in text):
+        return set()
+
+    names: set[str] = set()
+    for match in _TEMPLATE_RE.finditer(text):
+        names |= _expression_names(match.group(1) or match.group(2) or "")
+    return names
+
+
+def condition_names(condition: str) -> set[str]:
+    """Get the context names referenced by a step condition."""
+    if not isinstance(condition, str):
+        return set()
+    if "{{" in condition or "{%" in condition:
+        return template_names(condition)
+    return _expression_names(condition)
+
+
+def _value_names(value) -> set[str]:
+    """Collect template references from a (possibly nested) args value."""
+    if isinstance(value, str):
+        return template_names(value)
+    if isinstance(value, dict):
+        names: set[str] = set()
+        for v in value.values():
+            names |= _value_names(v)
+        return names
+    if isinstance(value, list):
+        names = set()
+        for v in value:
+            names |= _value_names(v)
+        return names
+    return set()
+
+
+def _root_name(node: ast.AST) -> str | None:
+    """Return the variable at the root of an attribute/subscript chain."""
+    while isinstance(node, (ast.Attribute, ast.Subscript)):
+        node = node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+
+def compute_names(code: str) -> tuple[set[str], set[str], bool]:
+    """Analyse a compute block.
+
+    Args:
+        code: Compute block source (may contain {{ }} templates)
+
+    Returns:
+        (reads, mutated, opaque) - names loaded, names mutated in place, and
+        whether the code inspects its namespace dynamically. If the code
+        cannot be parsed, every identifier is treated as read and mutated.
+    """
+    if not isinstance(code, str):
+        return set(), set(), False
+
+    reads = template_names(code)
+    source = _TEMPLATE_RE.sub("None", code)
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        names = _expression_names(source)
+        return reads | names, names, bool(names & _OPAQUE_NAMES)
+
+    mutated: set[str] = set()
+    opaque = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if isinstance(node.ctx, ast.Load):
+                reads.add(node.id)
+                if node.id in _OPAQUE_NAMES:
+                    opaque = True
+        elif isinstance(node, (ast.Attribute, ast.Subscript)) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            root = _root_name(node)
+            if root:
+                mutated.add(root)
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            if node.func.attr in _MUTATING_METHODS:
+                root = _root_name(node.func.value)
+                if root:
+                    mutated.add(root)
+        elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
+            reads.add(node.target.id)
+
+    return reads, mutated, opaque
+
+
+@dataclass
+class StepNode:
+    """A skill step reduced to what it reads and writes."""
+
+    index: int
+    name: str
+    kind: str  # "tool", "foreach", "compute", "then", "description" or "other"
+    reads: set[str] = field(default_factory=set)
+    writes: set[str] = field(default_factory=set)
+    barrier: bool = False
+    fatal: bool = False
+    deps: set[int] = field(default_factory=set)
+
+    @property
+    def concurrent(self) -> bool:
+        """Whether this step may overlap with other steps."""
+        return self.kind in ("tool", "foreach") and not self.barrier
+
+
+def analyze_step(step: dict, index: int) -> StepNode:
+    """Build the read/write summary for a single step."""
+    name = step.get("name", f"step_{index + 1}")
+    reads = condition_names(step.get("condition", ""))
+    parallel = step.get("parallel")
+
+    if "then" in step:
+        return StepNode(index, name, "then", reads=reads, barrier=True)
+
+    if "tool" in step and "foreach" in step:
+        # Loop variables are bound per item, not read from the context
+        loop_names = {step.get("as", "item"), "loop_index"}
+        source = step["foreach"]
+        reads |= condition_names(source) if isinstance(source, str) else _value_names(source)
+        reads |= _value_names(step.get("args", {})) - loop_names
+        barrier = parallel is False or (parallel is not True and not is_read_only_tool(step["tool"]))
+        return StepNode(
+            index,
+            name,
+            "foreach",
+            reads=reads,
+            writes={step.get("output", name)},
+            barrier=barrier,
+            fatal=step.get("on_error", "continue") == "fail",
+        )
+
+    if "tool" in step:
+        tool = step["tool"]
+        output = step.get("output", name)
+        reads |= _value_names(step.get("args", {}))
+        barrier = parallel is False or (parallel is not True and not is_read_only_tool(tool))
+        return StepNode(
+            index,
+            name,
+            "tool",
+            reads=reads,
+            writes={output, f"{output}_parsed"},
+            barrier=barrier,
+            fatal=step.get("on_error", "fail") not in ("continue", "auto_heal"),
+        )
+
+    if "compute" in step:
+        code_reads, mutated, opaque = compute_names(step["compute"])
+        return StepNode(
+            index,
+            name,
+            "compute",
+            reads=reads | code_reads,
+            writes={step.get("output", name)} | mutated,
+            barrier=opaque or parallel is False,
+        )
+
+    if "description" in step:
+        return StepNode(index, name, "description", reads=reads | template_names(step["description"]))
+
+    return StepNode(index, name, "other", reads=reads, barrier=True)
+
+
+def build_step_graph(steps: list[dict], serial: bool = False) -> list[StepNode]:
+    """Build the dependency graph for a list of skill steps.
+
+    Step j depends on an earlier step i when either is a barrier, when i
+    is fatal on error, or when they conflict on a context name (i writes
+    what j reads or writes, or i reads what j writes). Dependencies always
+    point backwards, so the graph is acyclic and step order is a valid
+    topological order.
+
+    Args:
+        steps: Skill steps in declaration order
+        serial: If True, chain every step to its predecessor
+
+    Returns:
+        One StepNode per step, with ``deps`` populated
+    """
+    nodes = [analyze_step(step, i) for i, step in enumerate(steps)]
+
+    for j, node in enumerate(nodes):
+        if serial:
+            node.deps = {j - 1} if j else set()
+            continue
+        for i in range(j):
+            prev = nodes[i]
+            if (
+                prev.barrier
+                or node.barrier
+                or prev.fatal
+                or prev.writes & (node.reads | node.writes)
+                or prev.reads & node.writes
+            ):
+                node.deps.add(i)
+
+    return nodes
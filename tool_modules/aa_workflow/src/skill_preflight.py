@@ -0,0 +1,236 @@
+"""Skill Pre-flight - warm up what a skill needs before its first step.
+
+Without pre-flight, steps find out what they need one at a time: the first
+gitlab step imports the gitlab module, each kubectl step runs ``oc whoami``
+and the first Prometheus query pays for DNS and TLS. The pre-flight phase
+reads the skill up front (tools via SkillToolDiscovery, cluster
+environments from tool arguments and defaults) and then, concurrently:
+
+- imports the tool modules through the module server registry,
+- checks cluster auth once per environment, refreshing it only for
+  environments an unconditional step needs (conditional steps may never
+  run, so they don't get to open an SSO browser window up front),
+- opens pooled HTTP connections to the services those tools call.
+
+Pre-flight never fails a skill. Anything it can't warm is left to the step
+that needs it, exactly as before.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from server.http_client import warm_connections
+from server.module_servers import ModuleServerRegistry, get_module_registry
+from server.profiler import profile_span
+from server.utils import check_cluster_auth, ensure_cluster_auth, get_service_url
+
+logger = logging.getLogger(__name__)
+
+# Tool arguments that name a cluster environment
+ENVIRONMENT_ARGS = ("environment", "env")
+
+# Modules whose tools check cluster auth for their environment argument
+CLUSTER_AUTH_MODULES = {"k8s", "prometheus", "alertmanager"}
+
+# Modules whose tools always authenticate against one cluster
+MODULE_ENVIRONMENTS = {"bonfire": "ephemeral"}
+
+# Modules whose tools call a per-environment service URL (config.json section)
+HTTP_SERVICES = {"prometheus": "prometheus", "alertmanager": "alertmanager", "kibana": "kibana"}
+
+# Modules whose tools call a fixed host
+HTTP_HOSTS = {"quay": "https://quay.io"}
+
+# Upper bound on connection warm-up; slow hosts are simply left cold
+WARM_TIMEOUT = 5.0
+
+
+@dataclass
+class PreflightReport:
+    """What the pre-flight phase warmed up."""
+
+    modules: dict[str, str | None] = field(default_factory=dict)  # module -> load error
+    auth: dict[str, bool] = field(default_factory=dict)  # environment -> auth valid
+    connections: dict[str, bool] = field(default_factory=dict)  # origin -> connected
+    duration_ms: int = 0
+
+    def summary(self) -> str:
+        """One-line summary for the debug log."""
+        loaded = sum(1 for error in self.modules.values() if error is None)
+        parts = [f"{loaded}/{len(self.modules)} modules"]
+        if self.auth:
+            parts.append("auth " + ", ".join(f"{env} {'✓' if ok else '✗'}" for env, ok in sorted(self.auth.items())))
+        if self.connections:
+            warmed = sum(1 for ok in self.connections.values() if ok)
+            parts.append(f"{warmed}/{len(self.connections)} connections")
+        return f"Pre-flight ({self.duration_ms}ms): " + " | ".join(parts)
+
+
+def iter_tool_steps(steps: list, conditional: bool = False):
+    """Yield (step, conditional) for every tool step, including nested ones.
+
+    A step is conditional if it has a condition or sits in a then/else
+    branch or loop body, i.e. it might not run.
+    """
+    for step in steps:
+        if not isinstance(step, dict):
+            continue
+        step_conditional = conditional or "condition" in step
+        if "tool" in step:
+            yield step, step_conditional
+        if isinstance(step.get("parallel"), list):
+            yield from iter_tool_steps(step["parallel"], step_conditional)
+        for branch in ("then", "else"):
+            if isinstance(step.get(branch), list):
+                yield from iter_tool_steps(step[branch], True)
+        if "loop" in step and isinstance(step.get("do", []), list):
+            yield from iter_tool_steps(step.get("do", []), True)
+
+
+class SkillPreflight:
+    """Warms up modules, cluster auth and HTTP connections for one skill."""
+
+    def __init__(
+        self,
+        skill: dict,
+        render: Callable[[str], str] | None = None,
+        registry: ModuleServerRegistry | None = None,
+        discovery: Any = None,
+    ):
+        """Initialize the pre-flight.
+
+        Args:
+            skill: Parsed skill definition
+            render: Renders templated tool arguments (e.g. "{{ inputs.env }}")
+                against the skill inputs
+            registry: Module server registry (defaults to the process-wide one)
+            discovery: SkillToolDiscovery (defaults to the shared instance)
+        """
+        self.skill = skill
+        self.render = render or (lambda text: text)
+        self.registry = registry or get_module_registry()
+        self.discovery = discovery
+
+        # State of the current run
+        self.report = PreflightReport()
+        self._checks: dict[str, asyncio.Task] = {}  # environment -> auth check
+        self._required: set[str] = set()  # environments an unconditional step needs
+        self._urls: set[str] = set()
+
+    def discover_tools(self) -> set[str]:
+        """Get the tools this skill calls, via SkillToolDiscovery."""
+        from scripts.common.skill_catalog import COMPUTE_MARKER
+
+        discovery = self.discovery
+        if discovery is None:
+            from tool_modules.aa_ollama.src.skill_discovery import get_skill_discovery
+
+            discovery = get_skill_discovery()
+        tools = discovery.discover_tools(self.skill.get("name", ""))
+        tools.discard(COMPUTE_MARKER)
+        return tools
+
+    def _step_environment(self, module: str, step: dict, defaults: dict[str, str]) -> str | None:
+        """Get the cluster environment a tool step will use, if it is known up front."""
+        if module in MODULE_ENVIRONMENTS:
+            return MODULE_ENVIRONMENTS[module]
+        args = step.get("args") or {}
+        for name in ENVIRONMENT_ARGS:
+            value = args.get(name)
+            if isinstance(value, str):
+                rendered = self.render(value).strip()
+                # Unresolved templates depend on earlier step outputs
+                return rendered.lower() if rendered and "{{" not in rendered else None
+        return defaults.get(step["tool"])
+
+    async def _environment_defaults(self, module: str) -> dict[str, str]:
+        """Get each tool's default environment argument from its schema."""
+        server = self.registry.get_server(module)
+        defaults = {}
+        for tool in await server.list_tools():
+            properties = (tool.inputSchema or {}).get("properties", {})
+            for name in ENVIRONMENT_ARGS:
+                default = properties.get(name, {}).get("default")
+                if isinstance(default, str) and default:
+                    defaults[tool.name] = default.lower()
+                    break
+        return defaults
+
+    def _steps_by_module(self) -> dict[str, list[tuple[dict, bool]]]:
+        """Group the skill's (step, conditional) tool steps by tool module."""
+        from server.tool_discovery import get_module_for_tool
+
+        tools = self.discover_tools()
+        steps_by_module: dict[str, list[tuple[dict, bool]]] = {}
+        for step, conditional in iter_tool_steps(self.skill.get("steps", [])):
+            if step["tool"] not in tools:
+                continue
+            module = get_module_for_tool(step["tool"])
+            if module and module != "workflow":
+                steps_by_module.setdefault(module, []).append((step, conditional))
+        return steps_by_module
+
+    async def _prepare(self, module: str, steps: list[tuple[dict, bool]]) -> None:
+        """Import a module, then start auth checks for the environments its steps use."""
+        self.report.modules.update(await self.registry.preload([module]))
+        if self.report.modules[module] is not None:
+            return
+        needs_environment = module in CLUSTER_AUTH_MODULES or module in HTTP_SERVICES
+        defaults = await self._environment_defaults(module) if needs_environment else {}
+        for step, conditional in steps:
+            environment = self._step_environment(module, step, defaults)
+            if not environment:
+                continue
+            if module in CLUSTER_AUTH_MODULES or module in MODULE_ENVIRONMENTS:
+                if environment not in self._checks:
+                    self._checks[environment] = asyncio.create_task(check_cluster_auth(environment))
+                if not conditional:
+                    self._required.add(environment)
+            if module in HTTP_SERVICES:
+                try:
+                    self._urls.add(get_service_url(HTTP_SERVICES[module], environment))
+                except ValueError:
+                    pass  # Not configured; the tool reports it
+        if module in HTTP_HOSTS:
+            self._urls.add(HTTP_HOSTS[module])
+
+    async def _authenticate(self, environment: str) -> None:
+        """Wait for an auth check; refresh if a step that will run needs it."""
+        ok = await self._checks[environment]
+        if not ok and environment in self._required:
+            ok, _ = await ensure_cluster_auth(environment, auto_refresh=True)
+        self.report.auth[environment] = ok
+
+    async def _warm(self) -> None:
+        """Open connections to every service URL found."""
+        if self._urls:
+            self.report.connections = await warm_connections(sorted(self._urls), timeout=WARM_TIMEOUT)
+
+    async def run(self) -> PreflightReport:
+        """Run the pre-flight phase.
+
+        Returns:
+            Report of the modules, environments and hosts warmed up
+        """
+        start = time.monotonic()
+        self.report = PreflightReport()
+        self._checks, self._required, self._urls = {}, set(), set()
+
+        with profile_span("preflight", "preflight"):
+            steps_by_module = self._steps_by_module()
+            results = await asyncio.gather(
+                *(self._prepare(module, steps) for module, steps in steps_by_module.items()),
+                return_exceptions=True,
+            )
+            for module, result in zip(steps_by_module, results):
+                if isinstance(result, Exception):
+                    logger.debug(f"Pre-flight for module {module} failed: {result}")
+
+            await asyncio.gather(*(self._authenticate(env) for env in self._checks), self._warm())
+
+        self.report.duration_ms = int((time.monotonic() - start) * 1000)
+        logger.debug(self.report.summary())
+        return self.report
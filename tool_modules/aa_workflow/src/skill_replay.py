@@ -0,0 +1,223 @@
+"""Skill Record/Replay - deterministic skill runs from recorded tool results.
+
+RecordingExecutor runs a skill for real and captures every tool call the
+engine makes (tool name, rendered arguments and the result) into a
+recording. ReplayExecutor runs the skill again with each tool call answered
+from the recording, after the recorded latency or none at all. What is left
+is the engine's own work: templating, conditions, compute blocks, result
+parsing and formatting. That can be measured offline, e.g. on CI.
+
+Recordings are JSON files, by default tests/fixtures/skill_replays/<skill>.json.
+
+Replay matches calls by tool name and arguments, then falls back to the
+next unused call of the same tool, so arguments that change between runs
+(timestamps, generated names) still replay. Replays never write to memory,
+learned patterns or agent stats.
+
+Usage:
+    recorder = RecordingExecutor(skill, {"issue_key": "AAP-12345"})
+    await recorder.execute()
+    recorder.recording.save(fixture_path("start_work"))
+
+    replay = ReplayExecutor(skill, SkillRecording.load(fixture_path("start_work")))
+    transcript = await replay.execute()
+"""
+
+import asyncio
+import copy
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+try:
+    from .skill_engine import SkillExecutor
+except ImportError:
+    from tool_modules.aa_workflow.src.skill_engine import SkillExecutor
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+FIXTURES_DIR = PROJECT_ROOT / "tests" / "fixtures" / "skill_replays"
+
+# Latency modes for ReplayExecutor
+LATENCY_ZERO = "zero"
+LATENCY_RECORDED = "recorded"
+
+
+def fixture_path(skill_name: str, fixtures_dir: Path | None = None) -> Path:
+    """Get the recording file for a skill."""
+    return (fixtures_dir or FIXTURES_DIR) / f"{skill_name}.json"
+
+
+def _jsonable(value: Any) -> Any:
+    """Round-trip a value through JSON (non-JSON values become strings)."""
+    return json.loads(json.dumps(value, default=str))
+
+
+def _args_key(tool_name: str, args: dict) -> str:
+    """Key for matching a call by tool and arguments."""
+    return tool_name + ":" + json.dumps(_jsonable(args), sort_keys=True)
+
+
+@dataclass
+class RecordedCall:
+    """One tool call made during a recorded run."""
+
+    tool: str
+    args: dict
+    result: dict  # As returned by SkillExecutor._exec_tool
+
+
+@dataclass
+class SkillRecording:
+    """Tool calls captured during one run of a skill."""
+
+    skill_name: str
+    inputs: dict = field(default_factory=dict)
+    calls: list[RecordedCall] = field(default_factory=list)
+    recorded_at: str = ""
+
+    def save(self, path: Path) -> None:
+        """Write the recording as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(self), indent=2, default=str) + "\n")
+
+    @classmethod
+    def load(cls, path: Path) -> "SkillRecording":
+        """Read a recording written by save().
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a valid recording
+        """
+        data = json.loads(path.read_text())
+        try:
+            return cls(
+                skill_name=data["skill_name"],
+                inputs=data.get("inputs", {}),
+                calls=[RecordedCall(**call) for call in data.get("calls", [])],
+                recorded_at=data.get("recorded_at", ""),
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid skill recording {path}: {e}") from e
+
+
+class RecordingExecutor(SkillExecutor):
+    """Runs a skill normally, recording every tool call and its result."""
+
+    def __init__(self, skill: dict, inputs: dict, **kwargs):
+        super().__init__(skill, inputs, **kwargs)
+        self.recording = SkillRecording(
+            skill_name=skill.get("name", "unknown"),
+            inputs=copy.deepcopy(_jsonable(inputs)),
+            recorded_at=datetime.now().isoformat(),
+        )
+
+    async def _exec_tool_or_cache(self, tool_name: str, args: dict, ttl: float, step_index: int) -> dict:
+        # Record real calls, not results served from the tool result cache
+        return await self._exec_tool(tool_name, args)
+
+    async def _exec_tool(self, tool_name: str, args: dict) -> dict:
+        result = await super()._exec_tool(tool_name, args)
+        self.recording.calls.append(RecordedCall(tool=tool_name, args=_jsonable(args), result=_jsonable(result)))
+        return result
+
+
+class ReplayExecutor(SkillExecutor):
+    """Runs a skill with tool calls answered from a recording."""
+
+    def __init__(
+        self,
+        skill: dict,
+        recording: SkillRecording | None,
+        inputs: dict | None = None,
+        latency: str | float = LATENCY_ZERO,
+        default_result: str | None = None,
+        **kwargs,
+    ):
+        """Initialize a replay.
+
+        Args:
+            skill: Parsed skill definition
+            recording: Recorded tool calls (None: answer every call with default_result)
+            inputs: Skill inputs (defaults to the recorded ones)
+            latency: LATENCY_ZERO, LATENCY_RECORDED, or a factor applied
+                to each recorded duration
+            default_result: Successful result text for calls the recording
+                doesn't have; None fails them instead
+            **kwargs: Passed to SkillExecutor (events are off by default)
+        """
+        kwargs.setdefault("emit_events", False)
+        if inputs is None:
+            inputs = copy.deepcopy(recording.inputs) if recording else {}
+        super().__init__(skill, inputs, **kwargs)
+
+        self.latency_factor = {LATENCY_ZERO: 0.0, LATENCY_RECORDED: 1.0}.get(latency, latency)
+        self.default_result = default_result
+        self.calls = list(recording.calls) if recording else []
+        self.misses: list[tuple[str, dict]] = []
+        self._unused: dict[str, list[int]] = {}  # args key -> call indices
+        self._unused_by_tool: dict[str, list[int]] = {}
+        for index, call in enumerate(self.calls):
+            self._unused.setdefault(_args_key(call.tool, call.args), []).append(index)
+            self._unused_by_tool.setdefault(call.tool, []).append(index)
+        self._used: set[int] = set()
+        self.steps_run: set[int] = set()  # Indexes of steps that ran (condition true)
+
+    @property
+    def unused_calls(self) -> list[RecordedCall]:
+        """Recorded calls the replay never asked for."""
+        return [call for index, call in enumerate(self.calls) if index not in self._used]
+
+    def _take(self, indices: list[int]) -> int | None:
+        """Pop the first call index not replayed yet."""
+        while indices:
+            index = indices.pop(0)
+            if index not in self._used:
+                self._used.add(index)
+                return index
+        return None
+
+    def _next_call(self, tool_name: str, args: dict) -> RecordedCall | None:
+        """Find the recorded call to answer this one with."""
+        index = self._take(self._unused.get(_args_key(tool_name, args), []))
+        if index is None:
+            index = self._take(self._unused_by_tool.get(tool_name, []))
+        return self.calls[index] if index is not None else None
+
+    async def _run_step(self, step: dict, step_index: int):
+        outcome = await super()._run_step(step, step_index)
+        if not outcome.skipped:
+            self.steps_run.add(step_index)
+        return outcome
+
+    async def _exec_tool_or_cache(self, tool_name: str, args: dict, ttl: float, step_index: int) -> dict:
+        # The shared tool result cache would make replays depend on earlier runs
+        return await self._exec_tool(tool_name, args)
+
+    async def _exec_tool(self, tool_name: str, args: dict) -> dict:
+        call = self._next_call(tool_name, args)
+        if call is None:
+            self.misses.append((tool_name, args))
+            if self.default_result is None:
+                return {"success": False, "error": f"No recorded result for {tool_name}"}
+            return {"success": True, "result": self.default_result, "duration": 0.0}
+
+        delay = float(call.result.get("duration") or 0) * self.latency_factor
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return copy.deepcopy(call.result)
+
+    # Replays are side-effect free: no memory, pattern or stats updates
+
+    async def _learn_from_error(self, tool_name: str, params: dict, error_msg: str):
+        pass
+
+    def _update_pattern_usage_stats(self, *args, **kwargs) -> None:
+        pass
+
+    async def _extract_and_save_learnings(self, output_lines: list[str]) -> None:
+        pass
+
+    def _record_skill_stats(self, success: bool, duration_ms: int, steps_completed: int) -> None:
+        pass
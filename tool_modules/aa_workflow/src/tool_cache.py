@@ -0,0 +1,137 @@
+"""Tool Result Cache.
+
+Content-addressed cache of successful tool results, shared by every skill
+run in the process. The scheduler re-runs skills like ``coffee`` on cron
+and the same read-only calls (``gitlab_mr_list``, ``jira_search``, ...)
+recur with identical args minutes apart; a step that opts in with
+``cache_ttl:`` (or a read-only tool with a configured default TTL) is
+served from here instead of hitting the backend again.
+
+Entries are keyed by a hash of the tool name and its templated args. The
+TTL is applied at lookup time, so steps with different TTLs share entries.
+
+This module is pure Python (no MCP imports) so it can be loaded directly.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_MAX_ENTRIES = 512
+
+
+@dataclass
+class CachedResult:
+    """A tool result served from the cache."""
+
+    key: str
+    tool: str
+    result: str
+    age: float  # Seconds since the result was stored
+
+
+def make_cache_key(tool: str, args: dict[str, Any]) -> str:
+    """Build the content address for a tool call.
+
+    Args:
+        tool: Tool name
+        args: Templated tool arguments
+
+    Returns:
+        Hex digest that is identical for identical calls
+    """
+    payload = json.dumps({"tool": tool, "args": args}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ToolResultCache:
+    """Bounded LRU cache of tool results with lookup-time TTLs."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum results kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        # key -> (tool, result, stored_at)
+        self._entries: OrderedDict[str, tuple[str, str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, tool: str, args: dict[str, Any], ttl: float) -> CachedResult | None:
+        """Look up a result no older than ttl seconds.
+
+        Args:
+            tool: Tool name
+            args: Templated tool arguments
+            ttl: Maximum acceptable age in seconds
+
+        Returns:
+            CachedResult, or None if there is no fresh entry
+        """
+        key = make_cache_key(tool, args)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[2] > ttl:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return CachedResult(key=key, tool=entry[0], result=entry[1], age=now - entry[2])
+
+    def put(self, tool: str, args: dict[str, Any], result: str) -> str:
+        """Store a successful tool result.
+
+        Returns:
+            The entry's cache key
+        """
+        key = make_cache_key(tool, args)
+        with self._lock:
+            self._entries[key] = (tool, result, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return key
+
+    def invalidate(self, tool: str | None = None) -> int:
+        """Drop cached results for one tool, or all of them.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if tool is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            stale = [key for key, entry in self._entries.items() if entry[0] == tool]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def get_stats(self) -> dict:
+        """Get cache statistics for diagnostics."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Global instance, shared by all skill runs in this process
+_cache: ToolResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_cache() -> ToolResultCache:
+    """Get the process-wide tool result cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ToolResultCache()
+    return _cache